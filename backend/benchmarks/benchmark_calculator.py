@@ -16,7 +16,8 @@ from pathlib import Path
 
 from backend.benchmarks.company_universe import get_tech_universe, CompanyInfo
 from backend.parsers.multi_file_xbrl_parser import MultiFileXBRLParser
-from backend.metrics import calculate_metrics
+from backend.metrics import calculate_metrics, MetricsResultCache
+from backend.signals.quantile_sketch import BenchmarkSketch
 
 
 @dataclass
@@ -66,27 +67,37 @@ class BenchmarkCalculator:
         calculator.export_to_json(benchmarks, 'tech_benchmarks_2025Q4.json')
     """
 
-    def __init__(self, data_dir: str = 'data', years: int = 4):
+    def __init__(
+        self,
+        data_dir: str = 'data',
+        years: int = 4,
+        result_cache: Optional[MetricsResultCache] = None
+    ):
         """
         Initialize benchmark calculator
 
         Args:
             data_dir: Directory containing XBRL files
             years: Number of years to analyze (default 4)
+            result_cache: Optional on-disk MetricsResultCache shared across runs
         """
         self.data_dir = Path(data_dir)
         self.years = years
+        self.result_cache = result_cache
         self._metrics_cache: Dict[str, Dict] = {}
 
     def calculate_tech_benchmarks(
         self,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        sketch_k: Optional[int] = None
     ) -> Dict[str, MetricBenchmark]:
         """
         Calculate benchmarks for S&P 500 Tech sector
 
         Args:
             progress_callback: Optional callback(ticker, current, total)
+            sketch_k: Approximate percentiles with a KLL sketch of this
+                      precision (None = exact)
 
         Returns:
             Dict mapping metric names to MetricBenchmark objects
@@ -122,7 +133,7 @@ class BenchmarkCalculator:
                 failed_tickers.append(company.ticker)
 
         # Step 2: Aggregate statistics
-        benchmarks = self._aggregate_statistics(all_metrics)
+        benchmarks = self._aggregate_statistics(all_metrics, sketch_k=sketch_k)
 
         # Step 3: Add metadata
         for benchmark in benchmarks.values():
@@ -156,7 +167,7 @@ class BenchmarkCalculator:
             timeseries = parser.extract_timeseries(years=self.years)
 
             # Calculate metrics
-            metrics = calculate_metrics(timeseries, parallel='never')
+            metrics = calculate_metrics(timeseries, parallel='never', cache=self.result_cache)
 
             # Cache result
             self._metrics_cache[ticker] = metrics
@@ -172,17 +183,23 @@ class BenchmarkCalculator:
 
     def _aggregate_statistics(
         self,
-        all_metrics: List[Dict]
+        all_metrics: List[Dict],
+        sketch_k: Optional[int] = None
     ) -> Dict[str, MetricBenchmark]:
         """
         Aggregate statistics across all companies
 
         Args:
             all_metrics: List of metrics dicts from all companies
+            sketch_k: If set, approximate percentiles with a mergeable KLL
+                      sketch of this precision (see build_sketch)
 
         Returns:
             Dict mapping metric names to MetricBenchmark objects
         """
+        if sketch_k is not None:
+            return self.build_sketch(all_metrics, k=sketch_k).metric_benchmarks()
+
         benchmarks = {}
 
         # Get all metric names from first company
@@ -227,6 +244,29 @@ class BenchmarkCalculator:
 
         return benchmarks
 
+    @staticmethod
+    def build_sketch(all_metrics: List[Dict], k: int = 200) -> BenchmarkSketch:
+        """
+        Mergeable quantile sketch of the most recent value (index 0) per company
+
+        Sketches from different workers/machines combine with merge() and
+        serialize with to_bytes(); metric_benchmarks() turns the merged
+        sketch into MetricBenchmark objects.
+
+        Args:
+            all_metrics: List of metrics dicts (one per company)
+            k: Sketch precision (rank error ≲ 1.7% at k=200)
+
+        Returns:
+            BenchmarkSketch
+
+        Example:
+            >>> shard_a = BenchmarkCalculator.build_sketch(metrics_a)
+            >>> shard_b = BenchmarkCalculator.build_sketch(metrics_b)
+            >>> benchmarks = shard_a.merge(shard_b).metric_benchmarks()
+        """
+        return BenchmarkSketch(k=k, position=0).add_companies(all_metrics)
+
     def export_to_json(
         self,
         benchmarks: Dict[str, MetricBenchmark],
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Download Throughput Benchmark - SECDownloader against the EDGAR stand-in
+
+Runs SECDownloader.download_batch against a local EdgarStandIn server
+(no network) and reports requests/s, bytes/s and status codes for
+different worker counts, latencies and rate budgets.
+
+Usage:
+    python backend/benchmarks/benchmark_downloads.py
+    python backend/benchmarks/benchmark_downloads.py --companies 70 --years 4 \\
+        --latency 0.2 --workers 1 4 8 16 --rate 8
+    python backend/benchmarks/benchmark_downloads.py --error-rate 0.05 --server-rate-limit 10
+
+Author: @franklin
+Sprint 7 - Data Platform
+"""
+
+import sys
+from pathlib import Path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import argparse
+import tempfile
+import time
+from typing import Dict, List
+
+from backend.parsers.batch_downloader import RateLimiter
+from backend.parsers.edgar_standin import EdgarFixtures, EdgarStandIn
+from backend.parsers.sec_downloader import SECDownloader
+
+
+def run_scenario(
+    server: EdgarStandIn,
+    tickers: List[str],
+    years: List[int],
+    workers: int,
+    rate: float
+) -> Dict:
+    """
+    One cold-cache batch download against the stand-in
+
+    Returns:
+        Dict with elapsed, requests, bytes, req/s, bytes/s, files, status
+    """
+    server.reset_stats()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        downloader = SECDownloader(
+            data_dir=data_dir,
+            verbose=False,
+            base_url=server.base_url,
+            rate_limiter=RateLimiter(rate)
+        )
+
+        start = time.perf_counter()
+        files = downloader.download_batch(tickers, years, max_workers=workers)
+        elapsed = time.perf_counter() - start
+
+    stats = server.stats
+    return {
+        'workers': workers,
+        'elapsed': elapsed,
+        'requests': stats['requests'],
+        'bytes': stats['bytes'],
+        'req_per_s': stats['requests'] / elapsed if elapsed > 0 else 0.0,
+        'bytes_per_s': stats['bytes'] / elapsed if elapsed > 0 else 0.0,
+        'files': sum(len(v) for v in files.values()),
+        'status': dict(stats['status']),
+    }
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark download throughput against a local EDGAR stand-in'
+    )
+    parser.add_argument('--companies', type=int, default=20, help='Synthetic companies (default: 20)')
+    parser.add_argument('--years', type=int, default=4, help='Fiscal years per company (default: 4)')
+    parser.add_argument('--facts', type=int, default=200, help='Filler facts per instance (size knob)')
+    parser.add_argument('--latency', type=float, default=0.05, help='Server latency in seconds')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8], help='Worker counts')
+    parser.add_argument('--rate', type=float, default=SECDownloader.MAX_REQUESTS_PER_SECOND,
+                        help='Client request budget (req/s)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Injected error probability')
+    parser.add_argument('--server-rate-limit', type=float, default=None,
+                        help='Server answers 429 above this req/s')
+
+    args = parser.parse_args()
+
+    tickers = [f"T{i:03d}" for i in range(args.companies)]
+    years = list(range(2025, 2025 - args.years, -1))
+    fixtures = EdgarFixtures.synthetic(tickers, years, n_facts=args.facts)
+
+    print(f"\n{'='*70}")
+    print(f"📥 DOWNLOAD BENCHMARK - EDGAR STAND-IN")
+    print(f"{'='*70}")
+    print(f"   Filings: {len(tickers)} companies × {len(years)} years = {len(tickers) * len(years)}")
+    print(f"   Server latency: {args.latency * 1000:.0f}ms | error rate: {args.error_rate:.0%}"
+          f" | server limit: {args.server_rate_limit or 'off'}")
+    print(f"   Client budget: {args.rate:.1f} req/s")
+    print()
+
+    with EdgarStandIn(
+        fixtures,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit=args.server_rate_limit
+    ) as server:
+        print(f"   {'Workers':>7s} {'Time':>8s} {'Req':>6s} {'Req/s':>7s} {'KB/s':>9s} {'Files':>6s}  Status")
+        print(f"   {'-'*64}")
+
+        for workers in args.workers:
+            result = run_scenario(server, tickers, years, workers, args.rate)
+            status = ' '.join(f"{code}:{n}" for code, n in sorted(result['status'].items()))
+            print(f"   {workers:7d} {result['elapsed']:7.2f}s {result['requests']:6d} "
+                  f"{result['req_per_s']:7.1f} {result['bytes_per_s'] / 1024:9.1f} "
+                  f"{result['files']:6d}  {status}")
+
+    print(f"\n   Throughput ceiling: {args.rate:.1f} req/s (shared rate budget)\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -5,6 +5,10 @@ Batch XBRL Downloader - S&P 500 Tech Sector (FIXED VERSION)
 Downloads XBRL instance documents directly from SEC EDGAR Archives.
 Uses correct URL pattern: /Archives/edgar/data/{CIK}/{ACCESSION}/{FILE}.xml
 
+Sprint 7 - Data Platform:
+- Concurrent mode (--workers N): ticker pipelines run in parallel under the
+  shared SEC rate budget, with a per-endpoint circuit breaker
+
 Author: @franklin
 Sprint 5: Micro-Tarea 3 - Data Collection (FIXED)
 """
@@ -17,13 +21,24 @@ if str(project_root) not in sys.path:
 
 import argparse
 import time
+import threading
 import requests
 from typing import List, Dict, Optional
 import json
 from datetime import datetime
+from urllib.parse import urlparse
 import re
 
 from backend.benchmarks.company_universe import get_tech_universe, CompanyInfo
+from backend.parsers.filing_store import FilingStore
+from backend.parsers.download_manifest import DownloadManifest
+from backend.parsers.batch_downloader import (
+    RateLimiter,
+    CircuitBreaker,
+    ProgressCallback,
+    guarded_request,
+    run_batch,
+)
 
 
 class SECDownloader:
@@ -58,16 +73,34 @@ class SECDownloader:
         'LRCX': '0000707549',
     }
 
-    def __init__(self, output_dir: str = 'data', rate_limit: float = 0.15):
+    def __init__(
+        self,
+        output_dir: str = 'data',
+        rate_limit: float = 0.15,
+        store: Optional[FilingStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        base_url: str = 'https://www.sec.gov',
+        data_base_url: Optional[str] = None
+    ):
         """
         Initialize downloader
 
         Args:
-            output_dir: Output directory for XBRL files
+            output_dir: Data directory (legacy files + FilingStore)
             rate_limit: Seconds between requests (SEC allows ~10/sec, we use 6/sec)
+            store: Shared FilingStore (default: FilingStore in output_dir)
+            rate_limiter: Request budget (default: process-wide SEC limiter
+                at 1/rate_limit req/s, shared across worker threads)
+            circuit_breaker: Per-endpoint breaker (default: one per downloader)
+            base_url: EDGAR archives root (override for a local stand-in)
+            data_base_url: Submissions API root (default: data.sec.gov, or
+                base_url when base_url is overridden)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.store = store or FilingStore.for_data_dir(self.output_dir)
+        self.manifest = DownloadManifest.for_data_dir(self.output_dir)
 
         self.rate_limit = rate_limit
         self.user_agent = "XBRL-Analyzer/1.0 (franklin@company.com)"  # Required by SEC
@@ -77,11 +110,44 @@ class SECDownloader:
             'Accept-Encoding': 'gzip, deflate',
         }
 
+        self.base_url = base_url.rstrip('/')
+        if data_base_url is None:
+            data_base_url = (
+                'https://data.sec.gov' if self.base_url == 'https://www.sec.gov' else self.base_url
+            )
+        self.data_base_url = data_base_url.rstrip('/')
+
+        self.rate_limiter = rate_limiter or RateLimiter.for_host(
+            urlparse(self.base_url).netloc, 1.0 / rate_limit
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._local = threading.local()
+
         self.stats = {
             'success': 0,
             'failed': 0,
             'skipped': 0
         }
+        self._stats_lock = threading.Lock()
+
+    def _count(self, outcome: str) -> None:
+        """Thread-safe stats increment"""
+        with self._stats_lock:
+            self.stats[outcome] += 1
+
+    def _request(self, method: str, url: str, endpoint: str, **kwargs) -> requests.Response:
+        """HTTP request on this thread's session, rate-limited and breaker-guarded"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            self._local.session = session
+
+        return guarded_request(
+            session, url, endpoint,
+            self.rate_limiter, self.circuit_breaker,
+            method=method, **kwargs
+        )
 
     def download_company_filings(
         self,
@@ -110,18 +176,13 @@ class SECDownloader:
         for year_offset in range(years):
             target_year = current_year - year_offset
 
-            # Check if file already exists (legacy format)
-            legacy_files = [
-                self.output_dir / f"{ticker.lower()}_10k_{target_year}_xbrl.xml",
-                self.output_dir / f"{ticker.lower()}_10k_xbrl.xml"  # Most recent
-            ]
-
-            for legacy_file in legacy_files:
-                if legacy_file.exists():
-                    print(f"   ⏭️  {ticker} {target_year}: Already exists (legacy)")
-                    downloaded_files[str(target_year)] = str(legacy_file)
-                    self.stats['skipped'] += 1
-                    continue
+            # Check if file already exists (store catalog or legacy format)
+            local_file = self._find_local_file(ticker, cik, target_year)
+            if local_file:
+                print(f"   ⏭️  {ticker} {target_year}: Already stored")
+                downloaded_files[str(target_year)] = str(local_file)
+                self._count('skipped')
+                continue
 
             # Find filing for target year
             try:
@@ -129,34 +190,70 @@ class SECDownloader:
 
                 if not filing_info:
                     print(f"   ❌ {ticker} {target_year}: 10-K not found")
-                    self.stats['failed'] += 1
+                    self._count('failed')
                     continue
 
                 # Download XBRL file
                 print(f"   📥 {ticker} {target_year}: Downloading...")
 
                 xbrl_url = filing_info['xbrl_url']
-                output_file = self.output_dir / f"{ticker.lower()}_10k_{target_year}_xbrl.xml"
 
-                success = self._download_file(xbrl_url, output_file)
-
-                if success:
+                # Same accession may already be stored by another tool
+                output_file = self.store.lookup(
+                    cik, target_year, accession=filing_info['accession']
+                )
+                if output_file is None:
+                    content = self._download_file(xbrl_url)
+                    if content is not None:
+                        output_file = self.store.put(
+                            content,
+                            cik=cik,
+                            fiscal_year=target_year,
+                            accession=filing_info['accession'],
+                            ticker=ticker,
+                            source_url=xbrl_url
+                        )
+
+                if output_file is not None:
                     downloaded_files[str(target_year)] = str(output_file)
+                    self.manifest.record_download(
+                        ticker, target_year, output_file,
+                        cik=cik, accession=filing_info['accession']
+                    )
                     print(f"   ✅ {ticker} {target_year}: Downloaded")
-                    self.stats['success'] += 1
+                    self._count('success')
                 else:
                     print(f"   ❌ {ticker} {target_year}: Download failed")
-                    self.stats['failed'] += 1
-
-                # Rate limiting
-                time.sleep(self.rate_limit)
+                    self.manifest.record_failure(ticker, 'Download failed', year=target_year)
+                    self._count('failed')
 
             except Exception as e:
                 print(f"   ❌ {ticker} {target_year}: Error - {e}")
-                self.stats['failed'] += 1
+                self._count('failed')
 
         return downloaded_files
 
+    def _find_local_file(self, ticker: str, cik: str, year: int) -> Optional[Path]:
+        """
+        Look for an already available filing
+
+        Order: FilingStore catalog (by CIK), download manifest, then legacy
+        filename in output_dir.
+        """
+        stored = self.store.lookup(cik, year)
+        if stored:
+            return stored
+
+        recorded = self.manifest.lookup(ticker, year)
+        if recorded and Path(recorded).exists():
+            return Path(recorded)
+
+        legacy_file = self.output_dir / f"{ticker.lower()}_10k_{year}_xbrl.xml"
+        if legacy_file.exists():
+            return legacy_file
+
+        return None
+
     def _find_10k_filing(self, cik: str, year: int) -> Optional[Dict]:
         """
         Find 10-K filing for a specific year using SEC submissions API
@@ -172,11 +269,10 @@ class SECDownloader:
         cik_no_zeros = cik.lstrip('0')
 
         # SEC submissions endpoint
-        url = f"https://data.sec.gov/submissions/CIK{cik}.json"
+        url = f"{self.data_base_url}/submissions/CIK{cik}.json"
 
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            response = self._request('GET', url, 'submissions', timeout=10)
             data = response.json()
 
             filings = data.get('filings', {}).get('recent', {})
@@ -204,7 +300,7 @@ class SECDownloader:
 
                     # Try instance document (ends in .xml or _htm.xml)
                     # Pattern: {ticker}-{date}.xml or {ticker}-{date}_htm.xml
-                    base_url = f"https://www.sec.gov/Archives/edgar/data/{cik_no_zeros}/{accession_no_dashes}"
+                    base_url = f"{self.base_url}/Archives/edgar/data/{cik_no_zeros}/{accession_no_dashes}"
 
                     # Try common naming patterns
                     possible_files = [
@@ -218,7 +314,7 @@ class SECDownloader:
 
                         # Quick HEAD request to check if file exists
                         try:
-                            head_response = requests.head(xbrl_url, headers=self.headers, timeout=5)
+                            head_response = self._request('HEAD', xbrl_url, 'archives', timeout=5)
                             if head_response.status_code == 200:
                                 return {
                                     'xbrl_url': xbrl_url,
@@ -234,42 +330,38 @@ class SECDownloader:
             print(f"      Error finding filing: {e}")
             return None
 
-    def _download_file(self, url: str, output_path: Path) -> bool:
+    def _download_file(self, url: str) -> Optional[bytes]:
         """
-        Download file from URL to output path
+        Download file from URL
 
         Args:
             url: Source URL
-            output_path: Destination path
 
         Returns:
-            True if successful
+            Document bytes if successful, None otherwise
         """
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
+            response = self._request('GET', url, 'archives', timeout=30)
 
             # Verify it's XML (not HTML)
             content = response.text
             if not content.strip().startswith('<?xml') and '<html' in content.lower():
                 print(f"      ERROR: Downloaded HTML instead of XML")
-                return False
-
-            # Save to disk
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+                return None
 
-            return True
+            return content.encode('utf-8')
 
         except Exception as e:
             print(f"      Download error: {e}")
-            return False
+            return None
 
     def download_universe(
         self,
         universe: List[CompanyInfo],
         years: int = 4,
-        max_companies: int = None
+        max_companies: int = None,
+        max_workers: int = 1,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Dict[str, Dict[str, str]]:
         """
         Download filings for entire universe
@@ -278,6 +370,8 @@ class SECDownloader:
             universe: List of CompanyInfo objects
             years: Number of years to download
             max_companies: Optional limit
+            max_workers: Concurrent company pipelines (1 = sequential)
+            progress_callback: Called as (ticker, done, total, eta_seconds)
 
         Returns:
             Dict mapping ticker to downloaded files
@@ -295,17 +389,32 @@ class SECDownloader:
         print(f"{'='*70}")
         print(f"   Universe: {total} companies (with CIKs)")
         print(f"   Years: {years}")
-        print(f"   Output: {self.output_dir}")
-        print(f"   Rate limit: {self.rate_limit}s/request")
+        print(f"   Output: {self.store.root}")
+        print(f"   Rate limit: {self.rate_limiter.rate:.1f} req/s (shared)")
+        print(f"   Workers: {max_workers}")
         print(f"\n")
 
-        results = {}
+        if max_workers > 1:
+            outcomes = run_batch(
+                [company.ticker for company in available_companies],
+                lambda ticker: self.download_company_filings(ticker, years=years),
+                max_workers=max_workers,
+                progress_callback=progress_callback
+            )
+            results = {ticker: files or {} for ticker, files in outcomes.items()}
+        else:
+            results = {}
+            start_time = time.time()
+
+            for idx, company in enumerate(available_companies, 1):
+                print(f"[{idx:3d}/{total:3d}] {company.ticker:6s} - {company.name}")
 
-        for idx, company in enumerate(available_companies, 1):
-            print(f"[{idx:3d}/{total:3d}] {company.ticker:6s} - {company.name}")
+                files = self.download_company_filings(company.ticker, years=years)
+                results[company.ticker] = files
 
-            files = self.download_company_filings(company.ticker, years=years)
-            results[company.ticker] = files
+                if progress_callback:
+                    elapsed = time.time() - start_time
+                    progress_callback(company.ticker, idx, total, elapsed / idx * (total - idx))
 
         # Summary
         print(f"\n{'='*70}")
@@ -343,6 +452,12 @@ def main():
         default=None,
         help='Maximum companies to download'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Concurrent company downloads under the shared rate limit (default: 1)'
+    )
     parser.add_argument(
         '--test',
         action='store_true',
@@ -365,7 +480,8 @@ def main():
     results = downloader.download_universe(
         universe=universe,
         years=args.years,
-        max_companies=args.max_companies
+        max_companies=args.max_companies,
+        max_workers=args.workers
     )
 
     # Save manifest
@@ -1,14 +1,21 @@
 # backend/engines/calculated_metric.py
 """
 CalculatedMetric: Métrica calculada con trazabilidad completa (audit trail).
+
+Sprint 8: `inputs` puede ser un FactInputs (fact ids en un TraceStore):
+el audit trail se materializa sólo en get_input_source(), list_input_tags()
+y to_dict(); to_dict(fact_refs=True) / export_audit_trail() serializan
+referencias + una fact table en vez de repetir cada SourceTrace.
+
 Author: @franklin
 Sprint: 3 - Metrics Factory + Transparency
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 from datetime import datetime
 from backend.engines.tracked_metric import SourceTrace
+from backend.engines.trace_store import FactInputs
 
 
 @dataclass
@@ -18,7 +25,7 @@ class CalculatedMetric:
 
     Encapsula resultado de cálculo financiero con:
     - Fórmula utilizada
-    - Inputs originales (SourceTrace)
+    - Inputs originales (SourceTrace, o FactInputs: referencias compactas)
     - Timestamp del cálculo
     - Metadata adicional
     """
@@ -26,13 +33,30 @@ class CalculatedMetric:
     metric_name: str
     value: float
     formula: str
-    inputs: Dict[str, SourceTrace]
+    inputs: Mapping[str, SourceTrace]
     unit: str = ""
     calculated_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serializa a dict para JSON/API/Dashboard"""
+    def to_dict(self, fact_refs: bool = False) -> Dict[str, Any]:
+        """
+        Serializa a dict para JSON/API/Dashboard.
+
+        Args:
+            fact_refs: Si True e inputs es FactInputs, serializa
+                       {input: fact_id} (ver export_audit_trail)
+        """
+        if fact_refs and isinstance(self.inputs, FactInputs):
+            return {
+                "metric": self.metric_name,
+                "value": round(self.value, 2),
+                "formula": self.formula,
+                "unit": self.unit,
+                "calculated_at": self.calculated_at.isoformat(),
+                "inputs": self.inputs.refs(),
+                "metadata": self.metadata
+            }
+
         return {
             "metric": self.metric_name,
             "value": round(self.value, 2),
@@ -100,6 +124,63 @@ class CalculatedMetric:
         return f"{self.metric_name}: {self.value:.2f}{self.unit}"
 
 
+def export_audit_trail(metrics: Mapping[Any, CalculatedMetric]) -> Dict[str, Any]:
+    """
+    Exporta audit trails como referencias + fact table compartida.
+
+    Cada SourceTrace se serializa una vez aunque lo usen varias métricas
+    y años. expand_audit_trail() reconstruye exactamente to_dict().
+
+    Args:
+        metrics: {key: CalculatedMetric} (ej: {2024: roe_2024, ...});
+                 los FactInputs deben compartir TraceStore
+
+    Returns:
+        {'facts': {fact_id: trace dict}, 'metrics': {key: to_dict(fact_refs=True)}}
+
+    Raises:
+        ValueError: Si algún CalculatedMetric no tiene FactInputs o usa
+                    otro TraceStore
+    """
+    store = None
+    for key, metric in metrics.items():
+        if not isinstance(metric.inputs, FactInputs):
+            raise ValueError(f"{key}: inputs are not fact references")
+        if store is None:
+            store = metric.inputs.store
+        elif metric.inputs.store is not store:
+            raise ValueError(f"{key}: inputs belong to a different TraceStore")
+
+    fact_ids = [i for metric in metrics.values() for i in metric.inputs.fact_ids]
+    return {
+        'facts': store.facts(fact_ids) if store is not None else {},
+        'metrics': {key: metric.to_dict(fact_refs=True) for key, metric in metrics.items()}
+    }
+
+
+def expand_audit_trail(export: Dict[str, Any]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Reconstruye {key: CalculatedMetric.to_dict()} desde export_audit_trail().
+
+    Acepta fact ids como int o str (JSON convierte las claves a str).
+    """
+    facts = {int(fact_id): trace for fact_id, trace in export['facts'].items()}
+    expanded = {}
+    for key, metric in export['metrics'].items():
+        expanded[key] = dict(metric)
+        expanded[key]['inputs'] = {
+            name: {
+                "value": facts[fact_id]['raw_value'],
+                "xbrl_tag": facts[fact_id]['xbrl_tag'],
+                "context_id": facts[fact_id]['context_id'],
+                "section": facts[fact_id]['section'],
+                "extracted_at": facts[fact_id]['extracted_at']
+            }
+            for name, fact_id in metric['inputs'].items()
+        }
+    return expanded
+
+
 if __name__ == "__main__":
     from backend.engines.tracked_metric import SourceTrace
 
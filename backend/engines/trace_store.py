@@ -0,0 +1,311 @@
+# backend/engines/trace_store.py
+"""
+TraceStore: SourceTraces en struct-of-arrays con strings internados.
+
+Cada valor extraído era un SourceTrace con su propio datetime.now() y
+copias propias de tag, contexto y sección. Un universo de 1,000 empresas
+× 10 años × 36 conceptos son ~360k objetos pesados (~400 bytes c/u).
+
+TraceStore guarda las mismas 5 columnas en arrays compactos:
+
+    values    array('d')   raw_value
+    tag       array('I')   → tabla de strings internados
+    context   array('I')   → tabla de strings internados
+    section   array('I')   → tabla de strings internados
+    filing    array('I')   → 1 timestamp de extracción por filing
+
+TraceView es la vista de una fila: es un SourceTrace (isinstance,
+to_dict(), atributos) así que CalculatedMetric y TrackedMetric funcionan
+sin cambios. El ahorro está en el store, no en la vista: las filas no
+tienen datetime ni strings propios y las vistas se crean bajo demanda.
+
+FactInputs guarda los inputs de un CalculatedMetric como fact ids (filas
+del store): unos pocos enteros por input en vez de objetos; los
+SourceTrace se materializan al acceder.
+
+Usage:
+    store = TraceStore()
+    filing = store.add_filing()                      # 1 datetime.now()
+    trace = store.append(filing, 'NetIncomeLoss', 93_736_000_000.0,
+                         'FY2024_Consolidated', 'income_statement')
+    trace.xbrl_tag, trace.to_dict()
+
+    compact = store.add_timeseries(timeseries)       # timeseries existente
+    inputs = compact_inputs({'NetIncome': trace})    # FactInputs {name: fact id}
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import sys
+from array import array
+from datetime import datetime
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from backend.engines.tracked_metric import SourceTrace
+
+
+class TraceStore:
+    """
+    Columnas de SourceTrace (struct-of-arrays) + tablas internadas.
+
+    Attributes:
+        values: raw_value de cada fila (array('d'))
+        filings: Timestamp de extracción por filing
+    """
+
+    def __init__(self):
+        self.values = array('d')
+        self._tag = array('I')
+        self._context = array('I')
+        self._section = array('I')
+        self._filing = array('I')
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self.filings: List[datetime] = []
+        self._filing_ids: Dict[datetime, int] = {}
+
+    def intern(self, text: str) -> int:
+        """Id del string en la tabla (lo agrega si es nuevo)."""
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(sys.intern(text))
+            self._string_ids[text] = string_id
+        return string_id
+
+    def add_filing(self, extracted_at: Optional[datetime] = None) -> int:
+        """
+        Registra un filing (un único timestamp para todos sus valores).
+
+        Returns:
+            Id del filing para append()
+        """
+        extracted_at = extracted_at or datetime.now()
+        self.filings.append(extracted_at)
+        self._filing_ids.setdefault(extracted_at, len(self.filings) - 1)
+        return len(self.filings) - 1
+
+    def append(
+        self,
+        filing: int,
+        xbrl_tag: str,
+        raw_value: float,
+        context_id: str,
+        section: str
+    ) -> 'TraceView':
+        """
+        Agrega un valor extraído.
+
+        Args:
+            filing: Id retornado por add_filing()
+            xbrl_tag: Tag XBRL resuelto
+            raw_value: Valor numérico
+            context_id: Context ID del XBRL
+            section: Sección del estado financiero
+
+        Returns:
+            TraceView de la fila nueva
+        """
+        if not 0 <= filing < len(self.filings):
+            raise ValueError(f"Unknown filing id: {filing}")
+
+        self.values.append(raw_value)
+        self._tag.append(self.intern(xbrl_tag))
+        self._context.append(self.intern(context_id))
+        self._section.append(self.intern(section))
+        self._filing.append(filing)
+        return TraceView(self, len(self.values) - 1)
+
+    def view(self, row: int) -> 'TraceView':
+        """Vista de una fila existente."""
+        if not 0 <= row < len(self.values):
+            raise IndexError(row)
+        return TraceView(self, row)
+
+    def add_trace(self, trace: SourceTrace) -> 'TraceView':
+        """
+        Copia un SourceTrace al store (exacto: mismo extracted_at).
+
+        Traces con el mismo timestamp comparten filing.
+        """
+        filing = self._filing_ids.get(trace.extracted_at)
+        if filing is None:
+            filing = self.add_filing(trace.extracted_at)
+        return self.append(
+            filing, trace.xbrl_tag, trace.raw_value, trace.context_id, trace.section
+        )
+
+    def add_timeseries(
+        self,
+        timeseries: Dict[int, Dict[str, SourceTrace]]
+    ) -> Dict[int, Dict[str, SourceTrace]]:
+        """
+        Compacta un timeseries existente (extract_timeseries()).
+
+        Args:
+            timeseries: {year: {concept: SourceTrace}}
+
+        Returns:
+            Mismo timeseries con TraceView (los traces sin raw_value se
+            conservan tal cual)
+        """
+        return {
+            year: {
+                concept: (
+                    trace if trace is None or trace.raw_value is None
+                    else self.add_trace(trace)
+                )
+                for concept, trace in year_data.items()
+            }
+            for year, year_data in timeseries.items()
+        }
+
+    def facts(self, fact_ids: Optional[Iterable[int]] = None) -> Dict[int, Dict]:
+        """
+        Fact table serializable: {fact_id: SourceTrace.to_dict()}.
+
+        Args:
+            fact_ids: Filas a exportar (None = todas)
+        """
+        if fact_ids is None:
+            fact_ids = range(len(self))
+        return {row: self.view(row).to_dict() for row in sorted(set(fact_ids))}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes de las columnas (sin tablas de strings ni timestamps)."""
+        columns = (self.values, self._tag, self._context, self._section, self._filing)
+        return sum(len(column) * column.itemsize for column in columns)
+
+
+class TraceView(SourceTrace):
+    """
+    Vista de una fila de TraceStore (slots propios: _store, _row).
+
+    Hereda de SourceTrace para que isinstance siga funcionando, así que
+    también carga sus 5 slots (vacíos): 88 bytes por vista vs 72 de un
+    SourceTrace. Conviene usarlas como transitorias; lo compacto es el
+    store. Expone los atributos de SourceTrace de sólo lectura. Al copiar
+    o picklear se materializa como SourceTrace (no arrastra el store).
+    """
+
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store: TraceStore, row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def fact_id(self) -> int:
+        """Fila en el TraceStore."""
+        return self._row
+
+    @property
+    def xbrl_tag(self) -> str:
+        return self._store._strings[self._store._tag[self._row]]
+
+    @property
+    def raw_value(self) -> float:
+        return self._store.values[self._row]
+
+    @property
+    def context_id(self) -> str:
+        return self._store._strings[self._store._context[self._row]]
+
+    @property
+    def extracted_at(self) -> datetime:
+        return self._store.filings[self._store._filing[self._row]]
+
+    @property
+    def section(self) -> str:
+        return self._store._strings[self._store._section[self._row]]
+
+    def to_source_trace(self) -> SourceTrace:
+        """Copia independiente como SourceTrace."""
+        return SourceTrace(
+            xbrl_tag=self.xbrl_tag,
+            raw_value=self.raw_value,
+            context_id=self.context_id,
+            extracted_at=self.extracted_at,
+            section=self.section
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SourceTrace):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return SourceTrace, (
+            self.xbrl_tag, self.raw_value, self.context_id,
+            self.extracted_at, self.section
+        )
+
+
+class FactInputs(Mapping):
+    """
+    {input: SourceTrace} guardado como referencias a un TraceStore.
+
+    Drop-in para CalculatedMetric.inputs: get(), items(), keys()
+    materializan TraceViews bajo demanda.
+    """
+
+    __slots__ = ('store', 'names', 'fact_ids')
+
+    def __init__(self, store: TraceStore, refs: Dict[str, int]):
+        """
+        Args:
+            store: TraceStore con las filas
+            refs: {input: fact_id}
+        """
+        self.store = store
+        self.names = tuple(refs)
+        self.fact_ids = tuple(refs.values())
+
+    def __getitem__(self, name: str) -> TraceView:
+        try:
+            return self.store.view(self.fact_ids[self.names.index(name)])
+        except ValueError:
+            raise KeyError(name) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def refs(self) -> Dict[str, int]:
+        """{input: fact_id}"""
+        return dict(zip(self.names, self.fact_ids))
+
+    def __reduce__(self):
+        # Pickle sin el store completo: dict de SourceTrace
+        return dict, (list(self.items()),)
+
+    def __repr__(self) -> str:
+        return f"FactInputs({self.refs()})"
+
+
+def compact_inputs(traces: Dict[str, SourceTrace]) -> Mapping:
+    """
+    FactInputs si todos los traces son filas de un mismo TraceStore.
+
+    Returns:
+        FactInputs o `traces` tal cual (traces sueltos / de varios stores)
+    """
+    traces_list = list(traces.values())
+    if not traces_list or not all(isinstance(t, TraceView) for t in traces_list):
+        return traces
+
+    store = traces_list[0]._store
+    if any(t._store is not store for t in traces_list):
+        return traces
+
+    return FactInputs(store, {name: trace.fact_id for name, trace in traces.items()})
@@ -5,7 +5,14 @@ from datetime import datetime
 
 @dataclass
 class SourceTrace:
-    """Metadata de origen de un valor financiero"""
+    """
+    Metadata de origen de un valor financiero.
+
+    __slots__: sin __dict__ por instancia (hay una por concepto × año ×
+    empresa). Para universos grandes ver backend.engines.trace_store.
+    """
+    __slots__ = ('xbrl_tag', 'raw_value', 'context_id', 'extracted_at', 'section')
+
     xbrl_tag: str                    # "us-gaap:NetIncomeLoss"
     raw_value: float                 # 112000000000
     context_id: str                  # "FY2025_Consolidated"
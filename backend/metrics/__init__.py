@@ -4,35 +4,45 @@ Financial Metrics Module - API Pública
 Optimizaciones implementadas:
 - Vectorización NumPy/Pandas (evita loops Python)
 - Memoización con @lru_cache (NetIncome usado 1 vez)
-- Paralelización automática (solo para datasets grandes)
+- Paralelización por shards de empresas en procesos (ShardedUniverseExecutor)
 
 Usage:
     from backend.metrics import calculate_metrics
 
     timeseries = parser.extract_timeseries(years=4)
-    metrics = calculate_metrics(timeseries)  # Auto-detect: sequential
-
-    # Para 20 años → auto usa parallel
-    timeseries_large = parser.extract_timeseries(years=20)
-    metrics = calculate_metrics(timeseries_large)  # Auto-detect: parallel
+    metrics = calculate_metrics(timeseries)  # Sequential (1 empresa)
 
     print(metrics['profitability']['ROE'])  # array([0.31, 0.28, ...])
 
+    # Universo completo (cientos de empresas) → un solo pase vectorizado
+    sector_data = calculate_universe_metrics({'AAPL': ts_aapl, 'MSFT': ts_msft})
+
+    # Miles de empresas → shards en procesos
+    sector_data = calculate_universe_metrics(universe, parallel='auto')
+
 Author: @franklin
 Sprint: 4 - Metrics Optimization with Auto-Detection
 """
 
-from backend.metrics.financial_dataframe import FinancialDataFrame
+from backend.metrics.financial_dataframe import FinancialDataFrame, CompactFinancialDataFrame
 from backend.metrics.metrics_calculator import MetricsCalculator
 from backend.metrics.parallel_engine import ParallelMetricsEngine
-from typing import Dict
+from backend.metrics.definitions import MetricDefinition, register_metric
+from backend.metrics.universe import UniverseFrame, calculate_universe_metrics
+from backend.metrics.lazy import LazyMetrics
+from backend.metrics.incremental import IncrementalMetrics
+from backend.metrics.sharded_executor import ShardedUniverseExecutor
+from backend.metrics.result_cache import MetricsResultCache
+from typing import Dict, Optional
 import numpy as np
 
 
 def calculate_metrics(
     timeseries: Dict,
     parallel: str = 'auto',
-    max_workers: int = 4
+    max_workers: int = 4,
+    lazy: bool = False,
+    cache: Optional[MetricsResultCache] = None
 ) -> Dict[str, Dict[str, np.ndarray]]:
     """
     API principal: Calcula 25 métricas financieras optimizadas.
@@ -40,10 +50,14 @@ def calculate_metrics(
     Args:
         timeseries: Output de XBRLParser.extract_timeseries()
         parallel: Modo de ejecución
-            - 'auto' (default): Sequential si <10 años, parallel si ≥10
+            - 'auto' (default): Sequential (ver Notes)
             - 'force': Siempre parallel (para debugging/benchmarking)
             - 'never': Siempre sequential
         max_workers: Número de threads (si parallel=True), default=4
+        lazy: Si True retorna LazyMetrics (mismo dict anidado, cada ratio
+              se calcula al primer acceso; ignora parallel y cache)
+        cache: MetricsResultCache opcional; un hit evita construir el
+               frame y evaluar los ratios
 
     Returns:
         {
@@ -54,12 +68,14 @@ def calculate_metrics(
         }
 
     Notes:
-        - Auto-detection usa threshold de 10 años
-        - Para <10 años: sequential es más rápido (evita threading overhead)
-        - Para ≥10 años: parallel compensa overhead con paralelismo
+        - Una empresa son ~25 ops NumPy sobre arrays de N años: el GIL
+          serializa los threads y el overhead domina para cualquier N,
+          así que 'auto' es siempre sequential
+        - Paralelismo real: calculate_universe_metrics(parallel='auto')
+          reparte empresas en procesos (ShardedUniverseExecutor)
 
     Example:
-        >>> # Single company, 4 años → auto usa sequential
+        >>> # Single company, 4 años → sequential
         >>> parser = MultiFileXBRLParser(ticker='AAPL')
         >>> timeseries = parser.extract_timeseries(years=4)
         >>> metrics = calculate_metrics(timeseries)
@@ -70,29 +86,35 @@ def calculate_metrics(
         >>>
         >>> # Force parallel mode (debugging)
         >>> metrics = calculate_metrics(timeseries, parallel='force')
+        >>>
+        >>> # Screen de 1 métrica → sólo calcula ROE
+        >>> metrics = calculate_metrics(timeseries, lazy=True)
+        >>> metrics['profitability']['ROE']
+        >>>
+        >>> # Corridas repetidas → resultado desde disco
+        >>> metrics = calculate_metrics(timeseries, cache=MetricsResultCache())
     """
-    # Paso 1: Convertir a DataFrame vectorizado
-    df = FinancialDataFrame(timeseries)
+    if lazy:
+        return LazyMetrics.from_timeseries(timeseries)
+
+    if cache is not None:
+        return cache.get_or_calculate(
+            timeseries,
+            lambda: calculate_metrics(timeseries, parallel=parallel, max_workers=max_workers)
+        )
+
+    # Paso 1: Convertir a array 2-D vectorizado (sin pandas)
+    df = CompactFinancialDataFrame(timeseries)
 
     # Paso 2: Crear calculator con memoización
     calculator = MetricsCalculator(df)
 
-    # Paso 3: Auto-detection de parallel mode
-    num_years = len(timeseries)
-
-    use_parallel = False
-    if parallel == 'auto':
-        # Threshold: 10 años
-        # Basado en benchmarks: overhead ~0.3ms, beneficio ~0.02ms/año
-        # Break-even: 0.3ms / 0.02ms = 15 años
-        # Usamos 10 como margen de seguridad
-        use_parallel = num_years >= 10
-    elif parallel == 'force':
-        use_parallel = True
-    elif parallel == 'never':
-        use_parallel = False
-    else:
+    # Paso 3: Modo de ejecución
+    # 'auto' → sequential: threads por categoría nunca compensan el GIL
+    # (el paralelismo vive a nivel universo, ver ShardedUniverseExecutor)
+    if parallel not in ('auto', 'force', 'never'):
         raise ValueError(f"Invalid parallel mode: {parallel}. Use 'auto', 'force', or 'never'")
+    use_parallel = parallel == 'force'
 
     # Paso 4: Ejecutar cálculos
     engine = ParallelMetricsEngine(calculator, max_workers=max_workers)
@@ -102,16 +124,23 @@ def calculate_metrics(
     else:
         # Sequential mode (evita threading overhead)
         return {
-            'profitability': engine._calculate_profitability(),
-            'liquidity': engine._calculate_liquidity(),
-            'efficiency': engine._calculate_efficiency(),
-            'leverage': engine._calculate_leverage(),
+            category: engine.calculate_category(category)
+            for category in calculator.plan.categories
         }
 
 
 __all__ = [
     'calculate_metrics',
     'FinancialDataFrame',
+    'CompactFinancialDataFrame',
     'MetricsCalculator',
     'ParallelMetricsEngine',
+    'MetricDefinition',
+    'register_metric',
+    'LazyMetrics',
+    'IncrementalMetrics',
+    'ShardedUniverseExecutor',
+    'MetricsResultCache',
+    'UniverseFrame',
+    'calculate_universe_metrics',
 ]
@@ -2,16 +2,25 @@
 """
 BaseMetric: Clase base para todas las métricas financieras.
 Implementa el patrón Strategy/Factory para cálculo de métricas.
+
+Sprint 8: calculate_batch() evalúa la métrica sobre arrays alineados
+(ej: empresas × años) con validación de rangos vectorizada, y materializa
+CalculatedMetric (con FactInputs) sólo para los valores que se piden.
+
 Author: @franklin
 Sprint: 3 - Metrics Factory
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List
+from dataclasses import dataclass
+from typing import Dict, Optional, List, Sequence, Tuple
 import logging
 
+import numpy as np
+
 from backend.engines.tracked_metric import SourceTrace
 from backend.engines.calculated_metric import CalculatedMetric
+from backend.engines.trace_store import FactInputs, TraceStore, TraceView, compact_inputs
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -32,6 +41,8 @@ class BaseMetric(ABC):
     - get_unit(): Unidad de medida
     - get_metadata(): Metadata adicional
     - validate_range(): Validación de rango
+    - calculate_values() / validate_ranges(): versiones vectorizadas para
+      calculate_batch() (default: loop sobre calculate_value/validate_range)
     """
 
     def __init__(self, financial_data: Dict[str, SourceTrace]):
@@ -66,6 +77,104 @@ class BaseMetric(ABC):
         """Override para validar rango"""
         return True
 
+    def calculate_values(self, inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Versión vectorizada de calculate_value (override con NumPy puro).
+
+        Default: calculate_value elemento a elemento; errores → NaN.
+        """
+        shape = np.broadcast(*inputs.values()).shape
+        values = np.full(shape, np.nan)
+        for index in np.ndindex(shape):
+            try:
+                values[index] = self.calculate_value(
+                    {field: float(array[index]) for field, array in inputs.items()}
+                )
+            except (ZeroDivisionError, ValueError):
+                continue
+        return values
+
+    def validate_ranges(self, values: np.ndarray) -> np.ndarray:
+        """Versión vectorizada de validate_range (NaN → False)."""
+        flags = np.zeros(values.shape, dtype=bool)
+        for index in zip(*np.nonzero(~np.isnan(values))):
+            flags[index] = self.validate_range(float(values[index]))
+        return flags
+
+    @classmethod
+    def calculate_batch(
+        cls,
+        inputs: Dict[str, np.ndarray],
+        fact_ids: Optional[Dict[str, np.ndarray]] = None,
+        store: Optional[TraceStore] = None
+    ) -> 'MetricBatch':
+        """
+        Calcula la métrica sobre arrays alineados en un pase vectorizado.
+
+        Args:
+            inputs: {field: array} (cualquier shape común, NaN = faltante)
+            fact_ids: {field: array int} filas de `store` (-1 = faltante)
+            store: TraceStore de los fact_ids (requerido para audit records)
+
+        Returns:
+            MetricBatch (values, valid, in_range; record() bajo demanda)
+
+        Raises:
+            ValueError: Si falta un campo requerido o fact_ids sin store
+
+        Example:
+            >>> batch = ROE.calculate_batch(inputs, fact_ids, store)
+            >>> batch.values            # (C × Y)
+            >>> batch.record((0, 1))    # CalculatedMetric de empresa 0, año 1
+        """
+        metric = cls({})
+        fields = metric.get_required_fields()
+
+        missing = [field for field in fields if field not in inputs]
+        if missing:
+            raise ValueError(f"{metric.metric_name}: Campos faltantes en batch: {missing}")
+        if fact_ids is not None and store is None:
+            raise ValueError(f"{metric.metric_name}: fact_ids requiere store")
+
+        arrays = {field: np.asarray(inputs[field], dtype=np.float64) for field in fields}
+        present = np.logical_and.reduce([~np.isnan(array) for array in arrays.values()])
+        if fact_ids is not None:
+            present &= np.logical_and.reduce([np.asarray(fact_ids[f]) >= 0 for f in fields])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = metric.calculate_values(arrays)
+        valid = present & np.isfinite(values)
+        values = np.where(valid, values, np.nan)
+        in_range = metric.validate_ranges(values)
+
+        out_of_range = int(np.count_nonzero(valid & ~in_range))
+        if out_of_range:
+            logger.warning(f"{metric.metric_name}: {out_of_range} valores fuera de rango")
+
+        return MetricBatch(metric, values, valid, in_range, fact_ids, store)
+
+    @classmethod
+    def batch_from_traces(
+        cls,
+        observations: Sequence[Dict[str, SourceTrace]],
+        store: Optional[TraceStore] = None
+    ) -> 'MetricBatch':
+        """
+        calculate_batch() sobre N financial_data (ej: empresa × año).
+
+        Traces que no son filas de `store` se copian a él (fact table).
+
+        Args:
+            observations: Lista de dicts {field: SourceTrace}
+            store: TraceStore destino (default: uno nuevo)
+
+        Returns:
+            MetricBatch de shape (N,)
+        """
+        store = store if store is not None else TraceStore()
+        inputs, fact_ids = gather_inputs(cls({}).get_required_fields(), observations, store)
+        return cls.calculate_batch(inputs, fact_ids, store)
+
     def validate_inputs(self) -> bool:
         """Valida que todos los campos requeridos existan"""
         for field in self._required_fields:
@@ -124,7 +233,7 @@ class BaseMetric(ABC):
             metric_name=self.metric_name,
             value=value,
             formula=self.get_formula(),
-            inputs=inputs_traces,
+            inputs=compact_inputs(inputs_traces),  # fact ids si vienen de un TraceStore
             unit=self.get_unit(),
             metadata=self.get_metadata()
         )
@@ -137,6 +246,98 @@ class BaseMetric(ABC):
         return f"{self.metric_name}(fields={self._required_fields})"
 
 
+def gather_inputs(
+    fields: List[str],
+    observations: Sequence[Dict[str, SourceTrace]],
+    store: TraceStore
+) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Alinea traces en arrays para calculate_batch().
+
+    Returns:
+        ({field: float array (N,)}, {field: fact id array (N,), -1 = faltante})
+    """
+    inputs = {field: np.full(len(observations), np.nan) for field in fields}
+    fact_ids = {field: np.full(len(observations), -1, dtype=np.int64) for field in fields}
+
+    for i, financial_data in enumerate(observations):
+        for field in fields:
+            trace = financial_data.get(field)
+            if trace is None or getattr(trace, 'raw_value', None) is None:
+                continue
+            if not (isinstance(trace, TraceView) and trace._store is store):
+                trace = store.add_trace(trace)
+            inputs[field][i] = trace.raw_value
+            fact_ids[field][i] = trace.fact_id
+
+    return inputs, fact_ids
+
+
+@dataclass
+class MetricBatch:
+    """
+    Resultado de BaseMetric.calculate_batch().
+
+    Attributes:
+        metric: Instancia de la métrica (fórmula, unidad, metadata)
+        values: Valores (NaN donde no hay resultado válido)
+        valid: Inputs presentes y resultado finito
+        in_range: valid y validate_range() OK
+        fact_ids: {field: fact ids} (None = batch sin audit trail)
+        store: TraceStore de los fact_ids
+    """
+
+    metric: BaseMetric
+    values: np.ndarray
+    valid: np.ndarray
+    in_range: np.ndarray
+    fact_ids: Optional[Dict[str, np.ndarray]] = None
+    store: Optional[TraceStore] = None
+
+    def record(self, index) -> Optional[CalculatedMetric]:
+        """
+        CalculatedMetric (inputs como FactInputs) de una posición.
+
+        Returns:
+            CalculatedMetric o None si no hay valor válido (mismo criterio
+            que calculate(): inputs faltantes o división por cero)
+
+        Raises:
+            ValueError: Si el batch no tiene fact_ids
+        """
+        if self.fact_ids is None:
+            raise ValueError(f"{self.metric.metric_name}: batch sin fact_ids (no audit trail)")
+        if not self.valid[index]:
+            return None
+
+        return CalculatedMetric(
+            metric_name=self.metric.metric_name,
+            value=float(self.values[index]),
+            formula=self.metric.get_formula(),
+            inputs=FactInputs(self.store, {
+                field: int(ids[index]) for field, ids in self.fact_ids.items()
+            }),
+            unit=self.metric.get_unit(),
+            metadata=self.metric.get_metadata()
+        )
+
+    def records(self, where: Optional[np.ndarray] = None) -> Dict[tuple, CalculatedMetric]:
+        """
+        CalculatedMetrics de las posiciones pedidas (default: todas las válidas).
+
+        Args:
+            where: Máscara booleana (ej: ~batch.in_range para auditar outliers)
+
+        Returns:
+            {index tuple: CalculatedMetric}
+        """
+        mask = self.valid if where is None else self.valid & where
+        return {
+            tuple(int(i) for i in index): self.record(index)
+            for index in zip(*np.nonzero(mask))
+        }
+
+
 if __name__ == "__main__":
     from backend.engines.tracked_metric import SourceTrace
     from datetime import datetime
@@ -5,6 +5,13 @@ Mide:
 - Tiempo de cálculo por categoría
 - Speedup por paralelización
 - Cache hit rate (@lru_cache)
+- Scaling report (--scaling): throughput vs workers para universos
+  sintéticos de 10, 100 y 1,000 empresas (ShardedUniverseExecutor)
+
+Usage:
+    python backend/metrics/benchmark_performance.py
+    python backend/metrics/benchmark_performance.py --scaling
+    python backend/metrics/benchmark_performance.py --scaling --companies 10 100 1000 --workers 1 2 4 8
 
 Author: @franklin
 Sprint: 4 - Metrics Optimization
@@ -13,6 +20,10 @@ Sprint: 4 - Metrics Optimization
 import sys
 import os
 import time
+import argparse
+from datetime import datetime
+
+import numpy as np
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
@@ -21,6 +32,10 @@ from backend.metrics import calculate_metrics
 from backend.metrics.financial_dataframe import FinancialDataFrame
 from backend.metrics.metrics_calculator import MetricsCalculator
 from backend.metrics.parallel_engine import ParallelMetricsEngine
+from backend.metrics.sharded_executor import ShardedUniverseExecutor
+from backend.metrics.universe import calculate_universe_metrics
+from backend.metrics.definitions import default_plan
+from backend.engines.tracked_metric import SourceTrace
 
 
 def benchmark_category(engine, category, iterations=10):
@@ -44,7 +59,83 @@ def benchmark_category(engine, category, iterations=10):
     }
 
 
+def synthetic_universe(n_companies, years=4, seed=0):
+    """Universo sintético {ticker: timeseries} con todos los conceptos del plan."""
+    rng = np.random.default_rng(seed)
+    concepts = default_plan().concepts
+    extracted_at = datetime(2025, 1, 1)
+    fiscal_years = list(range(2025 - years + 1, 2026))
+
+    universe = {}
+    for i in range(n_companies):
+        values = rng.uniform(1e8, 5e10, size=(years, len(concepts)))
+        universe[f"S{i:04d}"] = {
+            year: {
+                concept: SourceTrace(f"us-gaap:{concept}", float(values[y, k]),
+                                     f"FY{year}", extracted_at, "synthetic")
+                for k, concept in enumerate(concepts)
+            }
+            for y, year in enumerate(fiscal_years)
+        }
+    return universe
+
+
+def scaling_report(sizes=(10, 100, 1000), workers=(1, 2, 4, 8), iterations=3):
+    """
+    Throughput (empresas/s) vs número de procesos.
+
+    Baselines por tamaño:
+    - per-company: calculate_metrics() por empresa (Sprint 4)
+    - universe:    calculate_universe_metrics() in-process (1 pase)
+    """
+    print("="*70)
+    print("BENCHMARK: SCALING REPORT (ShardedUniverseExecutor)")
+    print("="*70)
+
+    def best_of(func):
+        times = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    for n in sizes:
+        universe = synthetic_universe(n)
+        print(f"\n{n:,} empresas × 4 años")
+        print("-"*70)
+        print(f"{'Modo':<22} {'Tiempo':>10} {'Empresas/s':>14} {'vs per-company':>16}")
+
+        per_company = best_of(lambda: [calculate_metrics(ts, parallel='never') for ts in universe.values()])
+        rows = [
+            ('per-company', per_company),
+            ('universe (1 pase)', best_of(lambda: calculate_universe_metrics(universe))),
+        ]
+
+        for w in workers:
+            with ShardedUniverseExecutor(max_workers=w) as executor:
+                executor.calculate(universe)  # warm-up: levanta el pool
+                rows.append((f"sharded × {w}", best_of(lambda: executor.calculate(universe))))
+
+        for label, elapsed in rows:
+            print(f"{label:<22} {elapsed * 1000:>8.1f}ms {n / elapsed:>14,.0f} "
+                  f"{per_company / elapsed:>15.1f}x")
+
+    print("="*70)
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Benchmark metrics performance')
+    parser.add_argument('--scaling', action='store_true',
+                        help='Throughput vs workers sobre universos sintéticos')
+    parser.add_argument('--companies', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    if args.scaling:
+        scaling_report(sizes=args.companies, workers=args.workers)
+        return
+
     print("="*70)
     print("BENCHMARK: PERFORMANCE COMPARISON")
     print("="*70)
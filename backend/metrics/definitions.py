@@ -0,0 +1,425 @@
+"""
+Metric Definitions: Ratios declarativos + plan de evaluación con CSE.
+
+Cada ratio se declara en una línea (nombre, categoría, fórmula sobre
+conceptos de la taxonomía, unidad, rango válido). Las fórmulas se compilan
+a un EvaluationPlan: una lista lineal de pasos donde cada subexpresión
+común (conceptos, sumas, ratios reusados por otros ratios) se calcula una
+sola vez. El plan corre vectorizado sobre cualquier shape
+(FinancialDataFrame → (Y,), UniverseFrame → (C × Y)).
+
+Fórmulas:
+    - Operadores: + - * / y paréntesis, constantes numéricas
+    - Nombres: otra métrica (ej: 'InventoryTurnover') o un concepto
+    - División por cero → NaN/inf (un solo np.errstate para todo el plan)
+
+Agregar una métrica:
+    register_metric(MetricDefinition('NetDebtToEquity', 'leverage',
+                                     '(LongTermDebt - CashAndEquivalents) / Equity'))
+
+Usage:
+    from backend.metrics.definitions import default_plan
+
+    plan = default_plan()
+    results = plan.evaluate(FinancialDataFrame(timeseries))
+    results['ROE']  # array([151.9, ...])
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import ast
+import hashlib
+import operator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+CATEGORIES = ('profitability', 'liquidity', 'efficiency', 'leverage')
+
+
+@dataclass(frozen=True)
+class MetricDefinition:
+    """
+    Definición declarativa de un ratio.
+
+    Attributes:
+        name: Nombre de la métrica (ej: 'ROE')
+        category: 'profitability', 'liquidity', 'efficiency' o 'leverage'
+        formula: Expresión sobre conceptos/métricas (ej: '(NetIncome / Equity) * 100')
+        unit: '%', 'ratio', 'days' o 'USD'
+        valid_range: (min, max) inclusivo, None = sin validación
+    """
+    name: str
+    category: str
+    formula: str
+    unit: str = 'ratio'
+    valid_range: Optional[Tuple[float, float]] = None
+
+    def validate_range(self, value: float) -> bool:
+        """Mismo contrato que BaseMetric.validate_range()."""
+        if self.valid_range is None:
+            return True
+        low, high = self.valid_range
+        return low <= value <= high
+
+    def in_range(self, values: np.ndarray) -> np.ndarray:
+        """Versión vectorizada de validate_range() (NaN → False)."""
+        values = np.asarray(values, dtype=np.float64)
+        if self.valid_range is None:
+            return ~np.isnan(values)
+        low, high = self.valid_range
+        with np.errstate(invalid='ignore'):
+            return (values >= low) & (values <= high)
+
+
+# ============================================================================
+# REGISTRY - 25 ratios (mismas fórmulas que MetricsCalculator Sprint 4)
+# ============================================================================
+
+METRIC_DEFINITIONS: List[MetricDefinition] = [
+    # Profitability (8)
+    MetricDefinition('ROE', 'profitability', '(NetIncome / Equity) * 100', '%', (-200.0, 500.0)),
+    MetricDefinition('ROA', 'profitability', '(NetIncome / Assets) * 100', '%'),
+    MetricDefinition('NetMargin', 'profitability', '(NetIncome / Revenue) * 100', '%'),
+    MetricDefinition('GrossMargin', 'profitability', '(GrossProfit / Revenue) * 100', '%'),
+    MetricDefinition('OperatingMargin', 'profitability', '(OperatingIncome / Revenue) * 100', '%'),
+    MetricDefinition('ROIC', 'profitability', '(OperatingIncome / (Equity + LongTermDebt)) * 100', '%'),
+    MetricDefinition('EPS', 'profitability', 'NetIncome', 'USD'),
+    MetricDefinition('OCFMargin', 'profitability', '(OperatingCashFlow / Revenue) * 100', '%'),
+
+    # Liquidity (5)
+    MetricDefinition('CurrentRatio', 'liquidity', 'CurrentAssets / CurrentLiabilities'),
+    MetricDefinition('QuickRatio', 'liquidity', '(CurrentAssets - Inventory) / CurrentLiabilities'),
+    MetricDefinition('CashRatio', 'liquidity', 'CashAndEquivalents / CurrentLiabilities'),
+    MetricDefinition('WorkingCapital', 'liquidity', 'CurrentAssets - CurrentLiabilities', 'USD'),
+    MetricDefinition('OCFRatio', 'liquidity', 'OperatingCashFlow / CurrentLiabilities'),
+
+    # Efficiency (6)
+    MetricDefinition('AssetTurnover', 'efficiency', 'Revenue / Assets'),
+    MetricDefinition('InventoryTurnover', 'efficiency', 'CostOfRevenue / Inventory'),
+    MetricDefinition('DIO', 'efficiency', '365 / InventoryTurnover', 'days'),
+    MetricDefinition('ReceivablesTurnover', 'efficiency', 'Revenue / AccountsReceivable'),
+    MetricDefinition('DSO', 'efficiency', '365 / ReceivablesTurnover', 'days'),
+    MetricDefinition('CCC', 'efficiency', 'DIO + DSO', 'days'),
+
+    # Leverage (6)
+    MetricDefinition('DebtToEquity', 'leverage', 'LongTermDebt / Equity'),
+    MetricDefinition('DebtToAssets', 'leverage', 'LongTermDebt / Assets'),
+    MetricDefinition('EquityMultiplier', 'leverage', 'Assets / Equity'),
+    MetricDefinition('InterestCoverage', 'leverage', 'OperatingIncome / InterestExpense'),
+    MetricDefinition('DSCR', 'leverage', 'OperatingCashFlow / InterestExpense'),
+    MetricDefinition('TotalDebtRatio', 'leverage', 'Liabilities / Assets'),
+]
+
+METRICS: Dict[str, MetricDefinition] = {d.name: d for d in METRIC_DEFINITIONS}
+
+
+def register_metric(definition: MetricDefinition) -> None:
+    """
+    Agrega (o reemplaza) una métrica en el registry global.
+
+    El plan por defecto se recompila en el próximo default_plan().
+
+    Raises:
+        ValueError: Si la categoría no existe o la fórmula no compila
+    """
+    if definition.category not in CATEGORIES:
+        raise ValueError(f"Invalid category: {definition.category}. Use one of {CATEGORIES}")
+
+    candidate = dict(METRICS)
+    candidate[definition.name] = definition
+    compile_plan(candidate.values())  # Falla antes de mutar el registry
+
+    if definition.name in METRICS:
+        index = next(i for i, d in enumerate(METRIC_DEFINITIONS) if d.name == definition.name)
+        METRIC_DEFINITIONS[index] = definition
+    else:
+        METRIC_DEFINITIONS.append(definition)
+    METRICS[definition.name] = definition
+    default_plan.cache_clear()
+
+
+# ============================================================================
+# COMPILER
+# ============================================================================
+
+_BINOPS = {
+    ast.Add: ('add', operator.add),
+    ast.Sub: ('sub', operator.sub),
+    ast.Mult: ('mul', operator.mul),
+    ast.Div: ('div', operator.truediv),
+}
+_OP_FUNCS = {name: func for name, func in _BINOPS.values()}
+_COMMUTATIVE = {'add', 'mul'}
+
+# Step: (op, a, b)
+#   ('load', concept, None) | ('const', value, None)
+#   ('neg', slot, None)     | ('add'|'sub'|'mul'|'div', slot, slot)
+Step = Tuple[str, object, object]
+
+
+class EvaluationPlan:
+    """
+    Plan lineal de evaluación con subexpresiones comunes deduplicadas.
+
+    Attributes:
+        steps: Lista de pasos en orden topológico
+        outputs: {metric: slot}
+        categories: {category: [metric, ...]} en orden de definición
+        definitions: {metric: MetricDefinition}
+    """
+
+    def __init__(
+        self,
+        steps: List[Step],
+        outputs: Dict[str, int],
+        definitions: Dict[str, MetricDefinition]
+    ):
+        self.steps = steps
+        self.outputs = outputs
+        self.definitions = definitions
+        self.categories: Dict[str, List[str]] = {}
+        for name, definition in definitions.items():
+            self.categories.setdefault(definition.category, []).append(name)
+
+        # Pasos necesarios por métrica (orden topológico = orden de slot)
+        self._dependencies = {name: self._closure(slot) for name, slot in outputs.items()}
+        self._load_slots = {a: i for i, (op, a, _) in enumerate(steps) if op == 'load'}
+
+    def _closure(self, slot: int) -> List[int]:
+        needed, stack = set(), [slot]
+        while stack:
+            i = stack.pop()
+            if i in needed:
+                continue
+            needed.add(i)
+            op, a, b = self.steps[i]
+            if op == 'neg':
+                stack.append(a)
+            elif op in _OP_FUNCS:
+                stack.extend((a, b))
+        return sorted(needed)
+
+    @staticmethod
+    def _inputs(step: Step) -> Tuple[int, ...]:
+        op, a, b = step
+        if op == 'neg':
+            return (a,)
+        if op in _OP_FUNCS:
+            return (a, b)
+        return ()
+
+    @property
+    def concepts(self) -> List[str]:
+        """Conceptos de la taxonomía que el plan lee."""
+        return list(self._load_slots)
+
+    @property
+    def fingerprint(self) -> str:
+        """Versión de las definiciones (cambia si cambia cualquier ratio)."""
+        payload = repr([
+            (d.name, d.category, d.formula, d.unit, d.valid_range)
+            for d in self.definitions.values()
+        ])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Grafo de dependencias (recomputación incremental)
+    # ------------------------------------------------------------------
+
+    def load_slot(self, concept: str) -> Optional[int]:
+        """Slot del paso que lee `concept` (None si el plan no lo usa)."""
+        return self._load_slots.get(concept)
+
+    def metric_concepts(self, metric: str) -> List[str]:
+        """Conceptos que `metric` lee (directa o vía otras métricas)."""
+        return [self.steps[i][1] for i in self._dependencies[metric] if self.steps[i][0] == 'load']
+
+    @property
+    def concept_dependents(self) -> Dict[str, List[str]]:
+        """{concept: [métricas que dependen de él]} en orden del registry."""
+        return {concept: self.affected_metrics([concept]) for concept in self._load_slots}
+
+    def downstream(self, concepts: Iterable[str]) -> List[int]:
+        """Slots que dependen (transitivamente) de alguno de `concepts`."""
+        dirty = {self._load_slots[c] for c in concepts if c in self._load_slots}
+        if not dirty:
+            return []
+        # Slots en orden topológico: basta un pase hacia adelante
+        for i in range(min(dirty), len(self.steps)):
+            if i not in dirty and any(src in dirty for src in self._inputs(self.steps[i])):
+                dirty.add(i)
+        return sorted(dirty)
+
+    def affected_metrics(self, concepts: Iterable[str]) -> List[str]:
+        """Métricas cuyo valor cambia si cambian `concepts`."""
+        dirty = set(self.downstream(concepts))
+        return [name for name, slot in self.outputs.items() if slot in dirty]
+
+    def invalidate(self, slots: Dict[int, np.ndarray], concepts: Iterable[str]) -> List[str]:
+        """
+        Elimina de `slots` los pasos afectados por `concepts`.
+
+        Returns:
+            Métricas afectadas (a recalcular)
+        """
+        concepts = list(concepts)
+        for i in self.downstream(concepts):
+            slots.pop(i, None)
+        return self.affected_metrics(concepts)
+
+    def evaluate(
+        self,
+        frame,
+        load: Optional[Callable[[str], np.ndarray]] = None,
+        metrics: Optional[Iterable[str]] = None,
+        slots: Optional[Dict[int, np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Ejecuta el plan (o sólo los pasos que requieren `metrics`).
+
+        Args:
+            frame: Objeto con __getitem__(concept) → ndarray
+                   (FinancialDataFrame, UniverseFrame)
+            load: Loader alternativo (ej: MetricsCalculator._get_concept)
+            metrics: Subconjunto de outputs (None = todos)
+            slots: Cache de pasos ya calculados; se completa in-place, así
+                   llamadas sucesivas no recalculan intermedios
+
+        Returns:
+            {metric: ndarray} con el shape de los conceptos
+        """
+        load = load or frame.__getitem__
+        slots = {} if slots is None else slots
+        names = list(self.outputs) if metrics is None else list(metrics)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for name in names:
+                for i in self._dependencies[name]:
+                    if i in slots:
+                        continue
+                    op, a, b = self.steps[i]
+                    if op == 'load':
+                        slots[i] = load(a)
+                    elif op == 'const':
+                        slots[i] = a
+                    elif op == 'neg':
+                        slots[i] = -slots[a]
+                    else:
+                        slots[i] = _OP_FUNCS[op](slots[a], slots[b])
+
+        return {name: slots[self.outputs[name]] for name in names}
+
+    def evaluate_by_category(self, frame, load=None) -> Dict[str, Dict[str, np.ndarray]]:
+        """evaluate() agrupado como calculate_metrics(): {category: {metric: ndarray}}"""
+        values = self.evaluate(frame, load)
+        return {
+            category: {name: values[name] for name in names}
+            for category, names in self.categories.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+class _Compiler:
+    """AST → pasos con hash-consing (CSE)."""
+
+    def __init__(self, definitions: Dict[str, MetricDefinition]):
+        self.definitions = definitions
+        self.steps: List[Step] = []
+        self._interned: Dict[Step, int] = {}
+        self._metric_slots: Dict[str, int] = {}
+
+    def _emit(self, step: Step) -> int:
+        slot = self._interned.get(step)
+        if slot is None:
+            slot = len(self.steps)
+            self.steps.append(step)
+            self._interned[step] = slot
+        return slot
+
+    def metric(self, name: str, stack: Tuple[str, ...] = ()) -> int:
+        if name in self._metric_slots:
+            return self._metric_slots[name]
+        if name in stack:
+            raise ValueError(f"Circular metric reference: {' → '.join(stack + (name,))}")
+
+        definition = self.definitions[name]
+        try:
+            tree = ast.parse(definition.formula, mode='eval').body
+        except SyntaxError as e:
+            raise ValueError(f"{name}: Invalid formula '{definition.formula}': {e}")
+
+        slot = self._node(tree, name, stack + (name,))
+        self._metric_slots[name] = slot
+        return slot
+
+    def _node(self, node: ast.AST, metric: str, stack: Tuple[str, ...]) -> int:
+        if isinstance(node, ast.Name):
+            if node.id in self.definitions:
+                return self.metric(node.id, stack)
+            return self._emit(('load', node.id, None))
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            return self._emit(('const', node.value, None))
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return self._emit(('neg', self._node(node.operand, metric, stack), None))
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+            op = _BINOPS[type(node.op)][0]
+            a = self._node(node.left, metric, stack)
+            b = self._node(node.right, metric, stack)
+            if op in _COMMUTATIVE and b < a:
+                a, b = b, a
+            return self._emit((op, a, b))
+
+        raise ValueError(f"{metric}: Unsupported expression: {ast.dump(node)}")
+
+
+def compile_plan(
+    definitions: Iterable[MetricDefinition],
+    metrics: Optional[Iterable[str]] = None
+) -> EvaluationPlan:
+    """
+    Compila definiciones a un EvaluationPlan.
+
+    Args:
+        definitions: MetricDefinitions (nombres únicos)
+        metrics: Subconjunto a calcular (None = todas). Las dependencias
+                 (ej: DIO → InventoryTurnover) se incluyen como pasos pero
+                 no como outputs.
+
+    Returns:
+        EvaluationPlan
+
+    Raises:
+        ValueError: Fórmula inválida, referencia circular o métrica desconocida
+    """
+    by_name = {d.name: d for d in definitions}
+    wanted = list(by_name) if metrics is None else list(metrics)
+
+    unknown = [name for name in wanted if name not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown metrics: {', '.join(unknown)}")
+
+    compiler = _Compiler(by_name)
+    outputs = {name: compiler.metric(name) for name in wanted}
+
+    return EvaluationPlan(
+        compiler.steps,
+        outputs,
+        {name: by_name[name] for name in wanted}
+    )
+
+
+@lru_cache(maxsize=1)
+def default_plan() -> EvaluationPlan:
+    """Plan compilado del registry global (cacheado hasta register_metric())."""
+    return compile_plan(METRIC_DEFINITIONS)
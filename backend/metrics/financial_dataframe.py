@@ -6,15 +6,24 @@ Optimizaciones:
 - Index por año (sorted desc)
 - Columnas como float64 (NumPy native)
 
+SPRINT 8 - Universe-Scale Metrics:
+- CompactFinancialDataFrame: backend sin pandas (1 array 2-D float64
+  contiguo por columna + índice concepto→columna, __slots__). Es el que
+  usa calculate_metrics(); construir el DataFrame costaba más que los ratios
+- pandas sólo se importa si alguien llama get_dataframe() (o usa el
+  FinancialDataFrame original)
+
 Author: @franklin
 Sprint: 4 - Metrics Optimization
 """
 
-import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 from backend.engines.tracked_metric import SourceTrace
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class FinancialDataFrame:
     """
@@ -39,13 +48,15 @@ class FinancialDataFrame:
         self._timeseries = timeseries
         self._df = self._build_dataframe()
 
-    def _build_dataframe(self) -> pd.DataFrame:
+    def _build_dataframe(self) -> 'pd.DataFrame':
         """
         Convierte time-series → DataFrame vectorizado.
 
         O(n*m) donde n=años, m=conceptos
         Pero ejecuta una sola vez (construcción)
         """
+        import pandas as pd
+
         rows = []
 
         for year in sorted(self._timeseries.keys(), reverse=True):
@@ -92,6 +103,81 @@ class FinancialDataFrame:
         """Lista de conceptos disponibles."""
         return self._df.columns.tolist()
 
-    def get_dataframe(self) -> pd.DataFrame:
+    def get_dataframe(self) -> 'pd.DataFrame':
         """Expone DataFrame subyacente."""
         return self._df.copy()
+
+
+class CompactFinancialDataFrame:
+    """
+    Backend sin pandas con la misma interfaz que FinancialDataFrame.
+
+    Layout:
+        _values   float64 (n_years × n_concepts), orden Fortran → cada
+                  columna es contigua y __getitem__ retorna una vista
+        _index    {concept: columna}
+        _years    años (sorted desc)
+
+    Usage:
+        df_wrapper = CompactFinancialDataFrame(timeseries)
+        revenue_array = df_wrapper['Revenue']  # vista, sin copia
+        df = df_wrapper.get_dataframe()        # importa pandas sólo aquí
+    """
+
+    __slots__ = ('_timeseries', '_values', '_index', '_years')
+
+    def __init__(self, timeseries: Dict[int, Dict[str, SourceTrace]]):
+        """
+        Args:
+            timeseries: Output de XBRLParser.extract_timeseries()
+        """
+        self._timeseries = timeseries
+        self._years = np.array(sorted(timeseries.keys(), reverse=True))
+
+        # Orden de columnas = primera aparición (igual que pd.DataFrame(rows))
+        index = {}
+        for year in self._years:
+            for concept in timeseries[year]:
+                if concept not in index:
+                    index[concept] = len(index)
+        self._index = index
+
+        values = np.full((len(self._years), len(index)), np.nan, order='F')
+        for row, year in enumerate(self._years):
+            for concept, trace in timeseries[year].items():
+                if trace is not None and trace.raw_value is not None:
+                    values[row, index[concept]] = trace.raw_value
+        self._values = values
+
+    def __getitem__(self, concept: str) -> np.ndarray:
+        """
+        Acceso vectorizado a conceptos.
+
+        Returns:
+            Vista de la columna (O(1), sin copia); NaN si el concepto no existe
+        """
+        column = self._index.get(concept)
+        if column is None:
+            return np.full(len(self._years), np.nan)
+        return self._values[:, column]
+
+    @property
+    def years(self) -> np.ndarray:
+        """Array de años (sorted desc)."""
+        return self._years
+
+    @property
+    def concepts(self) -> list:
+        """Lista de conceptos disponibles."""
+        return list(self._index)
+
+    def get_dataframe(self) -> 'pd.DataFrame':
+        """DataFrame (copia) con Year como index - importa pandas on demand."""
+        import pandas as pd
+
+        df = pd.DataFrame(self._values.copy(), index=self._years, columns=self.concepts)
+        df.index.name = 'Year'
+        return df
+
+    def __len__(self) -> int:
+        return len(self._years)
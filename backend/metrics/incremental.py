@@ -0,0 +1,212 @@
+"""
+IncrementalMetrics: Recalculo incremental por grafo de dependencias.
+
+Restatements (una empresa corrige Equity de FY2023) y ajustes de analista
+(what-if sobre Revenue) cambian 1 input; recalcular 25 ratios + audit
+trails completos es trabajo proporcional al universo, no al cambio.
+
+El EvaluationPlan ya es un DAG concepto → intermedios → métricas:
+
+    Equity ──┬──▶ ROE
+             ├──▶ (Equity + LongTermDebt) ──▶ ROIC
+             ├──▶ DebtToEquity
+             └──▶ EquityMultiplier
+
+update() invalida sólo los pasos aguas abajo del concepto, recalcula esas
+métricas y descarta sólo los CalculatedMetric (audit records) del año
+afectado.
+
+Los audit records guardan sus inputs como fact ids (FactInputs) en
+`facts`, el TraceStore de la empresa (inputs originales + ajustes).
+
+Usage:
+    from backend.metrics.incremental import IncrementalMetrics
+
+    inc = IncrementalMetrics(timeseries)
+    inc.record('ROE', 2024)                      # CalculatedMetric con inputs
+    inc.update(2024, 'Equity', 70_000_000_000)   # → ['ROE', 'ROIC', 'DebtToEquity', 'EquityMultiplier']
+    inc.record('ROE', 2024).value                # recalculado
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from backend.engines.calculated_metric import CalculatedMetric
+from backend.engines.trace_store import TraceStore, compact_inputs
+from backend.engines.tracked_metric import SourceTrace
+from backend.metrics.definitions import EvaluationPlan
+from backend.metrics.lazy import TimeseriesFrame
+from backend.metrics.metrics_calculator import MetricsCalculator
+
+
+class IncrementalMetrics:
+    """
+    Métricas + audit records de una empresa con updates incrementales.
+
+    Attributes:
+        timeseries: Copia (TraceViews sobre `facts`); update() la modifica
+        facts: TraceStore con inputs originales y ajustes (fact table)
+        calculator: MetricsCalculator con cache de pasos del plan
+        plan: EvaluationPlan (grafo de dependencias)
+    """
+
+    def __init__(
+        self,
+        timeseries: Dict[int, Dict[str, SourceTrace]],
+        plan: Optional[EvaluationPlan] = None
+    ):
+        """
+        Args:
+            timeseries: Output de extract_timeseries() (no se muta)
+            plan: EvaluationPlan (default: registry global)
+        """
+        self.facts = TraceStore()
+        self.timeseries = self.facts.add_timeseries(timeseries)
+        self.frame = TimeseriesFrame(self.timeseries)
+        self.calculator = MetricsCalculator(self.frame, plan=plan)
+        self.plan = self.calculator.plan
+        self._year_index = {int(year): i for i, year in enumerate(self.frame.years)}
+        self._records: Dict[Tuple[str, int], Optional[CalculatedMetric]] = {}
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    def value(self, metric: str) -> np.ndarray:
+        """Array de la métrica (años desc), calculado bajo demanda."""
+        return self.calculator.metric(metric)
+
+    def metrics(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Mismo formato que calculate_metrics()."""
+        return {
+            category: {name: self.value(name) for name in names}
+            for category, names in self.plan.categories.items()
+        }
+
+    def record(self, metric: str, year: int) -> Optional[CalculatedMetric]:
+        """
+        Audit record (CalculatedMetric) de una métrica para un año.
+
+        Returns:
+            CalculatedMetric o None si falta algún input (mismo criterio
+            que BaseMetric.validate_inputs)
+        """
+        key = (metric, year)
+        if key not in self._records:
+            self._records[key] = self._build_record(metric, year)
+        return self._records[key]
+
+    def records(self, year: int) -> Dict[str, CalculatedMetric]:
+        """Audit records disponibles de todas las métricas para un año."""
+        records = {}
+        for metric in self.plan.outputs:
+            record = self.record(metric, year)
+            if record is not None:
+                records[metric] = record
+        return records
+
+    def _build_record(self, metric: str, year: int) -> Optional[CalculatedMetric]:
+        if year not in self._year_index:
+            raise ValueError(f"Year {year} not in timeseries")
+
+        year_data = self.timeseries[year]
+        inputs = {}
+        for concept in self.plan.metric_concepts(metric):
+            trace = year_data.get(concept)
+            if trace is None or trace.raw_value is None:
+                return None
+            inputs[concept] = trace
+
+        definition = self.plan.definitions[metric]
+        value = float(self.value(metric)[self._year_index[year]])
+
+        return CalculatedMetric(
+            metric_name=metric,
+            value=value,
+            formula=definition.formula,
+            inputs=compact_inputs(inputs),
+            unit=definition.unit,
+            metadata={
+                'category': definition.category,
+                'fiscal_year': year,
+                'in_range': bool(definition.in_range(value)),
+            }
+        )
+
+    # ------------------------------------------------------------------
+    # Updates (restatements / ajustes)
+    # ------------------------------------------------------------------
+
+    def update(
+        self,
+        year: int,
+        concept: str,
+        value: Union[float, SourceTrace]
+    ) -> List[str]:
+        """
+        Actualiza 1 input y recalcula sólo lo afectado.
+
+        Args:
+            year: Año fiscal existente
+            concept: Concepto (ej: 'Equity')
+            value: Nuevo SourceTrace (restatement desde XBRL) o float
+                   (ajuste de analista: se conserva el trace original con
+                   raw_value nuevo y section='adjustment')
+
+        Returns:
+            Métricas afectadas (recalculadas)
+        """
+        return self.update_many({(year, concept): value})
+
+    def update_many(
+        self,
+        changes: Dict[Tuple[int, str], Union[float, SourceTrace]]
+    ) -> List[str]:
+        """
+        Aplica varios updates con una sola invalidación.
+
+        Args:
+            changes: {(year, concept): SourceTrace o float}
+
+        Returns:
+            Métricas afectadas (recalculadas)
+
+        Raises:
+            ValueError: Si un año no existe (cambiar el eje de años
+                        requiere reconstruir IncrementalMetrics)
+        """
+        for (year, concept), value in changes.items():
+            if year not in self._year_index:
+                raise ValueError(f"Year {year} not in timeseries (rebuild to add years)")
+            self.timeseries[year][concept] = self._as_trace(year, concept, value)
+
+        concepts = {concept for _, concept in changes}
+        recomputed = self.calculator.update_inputs(
+            {concept: self.frame[concept] for concept in concepts}
+        )
+
+        # Sólo los audit records de (métrica afectada, año cambiado)
+        years = {year for year, _ in changes}
+        for metric in recomputed:
+            for year in years:
+                self._records.pop((metric, year), None)
+
+        return list(recomputed)
+
+    def _as_trace(self, year: int, concept: str, value) -> SourceTrace:
+        if isinstance(value, SourceTrace):
+            return self.facts.add_trace(value)
+
+        original = self.timeseries[year].get(concept)
+        return self.facts.add_trace(SourceTrace(
+            xbrl_tag=original.xbrl_tag if original is not None else f"adjustment:{concept}",
+            raw_value=float(value),
+            context_id=original.context_id if original is not None else f"FY{year}_Adjusted",
+            extracted_at=datetime.now(),
+            section="adjustment"
+        ))
@@ -0,0 +1,142 @@
+"""
+LazyMetrics: Métricas calculadas bajo demanda (primer acceso).
+
+calculate_metrics() calcula los 25 ratios aunque el caller necesite uno
+(un screen) o sólo SectorConfig.key_metrics (un reporte sectorial).
+LazyMetrics mantiene la interfaz de dict anidado
+(metrics['profitability']['ROE']) pero:
+
+- Extrae del timeseries sólo los conceptos que la métrica requiere
+  (sin construir el DataFrame de ~30 conceptos)
+- Calcula cada ratio la primera vez que se accede, vía EvaluationPlan
+  (intermedios compartidos se reusan entre accesos)
+- `in`, keys() y len() no calculan nada
+
+Usage:
+    from backend.metrics import calculate_metrics
+
+    metrics = calculate_metrics(timeseries, lazy=True)
+    metrics['profitability']['ROE']     # extrae NetIncome, Equity → ROE
+    metrics.computed                    # ['ROE']
+    metrics.materialize()               # dict normal con los 25 ratios
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from backend.engines.tracked_metric import SourceTrace
+from backend.metrics.definitions import EvaluationPlan
+from backend.metrics.metrics_calculator import MetricsCalculator
+
+
+class TimeseriesFrame:
+    """
+    Frame mínimo sobre extract_timeseries(): columnas bajo demanda.
+
+    Mismo contrato que FinancialDataFrame.__getitem__ (años desc, float64,
+    NaN si el concepto falta) sin construir el DataFrame completo.
+    """
+
+    def __init__(self, timeseries: Dict[int, Dict[str, SourceTrace]]):
+        self._timeseries = timeseries
+        self._years = sorted(timeseries.keys(), reverse=True)
+
+    def __getitem__(self, concept: str) -> np.ndarray:
+        values = np.full(len(self._years), np.nan)
+        for i, year in enumerate(self._years):
+            trace = self._timeseries[year].get(concept)
+            if trace is not None and trace.raw_value is not None:
+                values[i] = trace.raw_value
+        return values
+
+    @property
+    def years(self) -> np.ndarray:
+        """Array de años (sorted desc)."""
+        return np.array(self._years)
+
+
+class LazyCategory(Mapping):
+    """Vista de una categoría: {metric: ndarray} calculado al acceder."""
+
+    def __init__(self, calculator: MetricsCalculator, names: List[str], accessed: set):
+        self._calc = calculator
+        self._names = names
+        self._accessed = accessed
+
+    def __getitem__(self, metric: str) -> np.ndarray:
+        if metric not in self._names:
+            raise KeyError(metric)
+        self._accessed.add(metric)
+        return self._calc.metric(metric)
+
+    def __contains__(self, metric) -> bool:
+        return metric in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"LazyCategory({self._names})"
+
+
+class LazyMetrics(Mapping):
+    """
+    {category: {metric: ndarray}} con evaluación bajo demanda.
+
+    Drop-in para el output de calculate_metrics() en SignalDetector,
+    PeerComparison y StatisticalBenchmarkEngine.
+    """
+
+    def __init__(self, frame, plan: Optional[EvaluationPlan] = None):
+        """
+        Args:
+            frame: TimeseriesFrame, FinancialDataFrame o UniverseFrame
+            plan: EvaluationPlan (default: registry global)
+        """
+        self.calculator = MetricsCalculator(frame, plan=plan)
+        self._accessed = set()
+        self._categories = {
+            category: LazyCategory(self.calculator, names, self._accessed)
+            for category, names in self.calculator.plan.categories.items()
+        }
+
+    @classmethod
+    def from_timeseries(
+        cls,
+        timeseries: Dict[int, Dict[str, SourceTrace]],
+        plan: Optional[EvaluationPlan] = None
+    ) -> 'LazyMetrics':
+        """LazyMetrics sobre el output de extract_timeseries()."""
+        return cls(TimeseriesFrame(timeseries), plan=plan)
+
+    def __getitem__(self, category: str) -> LazyCategory:
+        return self._categories[category]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._categories)
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    @property
+    def computed(self) -> List[str]:
+        """Métricas ya solicitadas/calculadas (en orden del registry)."""
+        return [name for name in self.calculator.plan.outputs if name in self._accessed]
+
+    def materialize(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Calcula todo y retorna el dict normal de calculate_metrics()."""
+        return {
+            category: dict(metrics.items())
+            for category, metrics in self._categories.items()
+        }
+
+    def __repr__(self) -> str:
+        return f"LazyMetrics(computed={self.computed})"
@@ -6,6 +6,11 @@ Optimizaciones:
 - Vectorized operations (evita loops Python)
 - Lazy evaluation (calcula solo lo solicitado)
 
+SPRINT 8 - Universe-Scale Metrics:
+- Fórmulas declarativas en definitions.py (METRIC_DEFINITIONS)
+- Cada método evalúa su métrica vía EvaluationPlan: intermedios
+  compartidos (InventoryTurnover para DIO/CCC, conceptos) se calculan 1 vez
+
 Author: @franklin
 Sprint: 4 - Metrics Optimization
 FIX: Métricas de porcentaje ahora retornan valores en % (multiplicado por 100)
@@ -15,6 +20,7 @@ import numpy as np
 from functools import lru_cache
 from typing import Dict, Optional
 from backend.metrics.financial_dataframe import FinancialDataFrame
+from backend.metrics.definitions import EvaluationPlan, default_plan
 
 
 class MetricsCalculator:
@@ -36,14 +42,16 @@ class MetricsCalculator:
         net_margin = calc.net_margin()  # Retorna % (ej: 26.9)
     """
 
-    def __init__(self, df: FinancialDataFrame):
+    def __init__(self, df: FinancialDataFrame, plan: Optional[EvaluationPlan] = None):
         """
         Args:
-            df: FinancialDataFrame wrapper
+            df: FinancialDataFrame wrapper (o UniverseFrame)
+            plan: EvaluationPlan (default: registry global de definitions.py)
         """
         self.df = df
+        self.plan = plan or default_plan()
 
-        # Cache explícito (además de @lru_cache)
+        # Cache explícito de pasos del plan (además de @lru_cache)
         self._cache = {}
 
     # ========================================================================
@@ -63,6 +71,48 @@ class MetricsCalculator:
         """
         return self.df[name]
 
+    def metric(self, name: str) -> np.ndarray:
+        """
+        Evalúa una métrica del plan (sólo los pasos que faltan en cache).
+
+        Args:
+            name: Nombre de la métrica (ej: 'ROE')
+
+        Returns:
+            Array con el shape de los conceptos
+        """
+        return self.plan.evaluate(
+            self.df, load=self._get_concept, metrics=[name], slots=self._cache
+        )[name]
+
+    def update_inputs(self, values: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Reemplaza conceptos y recalcula SÓLO las métricas que dependen de ellos.
+
+        Restatements / ajustes de analista: el resto del cache (conceptos e
+        intermedios no afectados) se conserva.
+
+        Args:
+            values: {concept: nuevo array (mismo shape)}
+
+        Returns:
+            {metric: array recalculado} de las métricas afectadas
+
+        Example:
+            >>> calc.update_inputs({'Equity': restated_equity})
+            {'ROE': array([...]), 'ROIC': array([...]), 'DebtToEquity': ..., 'EquityMultiplier': ...}
+        """
+        affected = self.plan.invalidate(self._cache, values)
+
+        for concept, array in values.items():
+            slot = self.plan.load_slot(concept)
+            if slot is not None:
+                self._cache[slot] = np.asarray(array, dtype=np.float64)
+
+        return self.plan.evaluate(
+            self.df, load=self._get_concept, metrics=affected, slots=self._cache
+        )
+
     # ========================================================================
     # CATEGORY 1: PROFITABILITY (8 ratios)
     # ========================================================================
@@ -77,14 +127,7 @@ class MetricsCalculator:
         Returns:
             Array de porcentajes (ej: 151.9 para 151.9%)
         """
-        net_income = self._get_concept('NetIncome')
-        equity = self._get_concept('Equity')
-
-        # Division-by-zero safe (retorna NaN)
-        with np.errstate(divide='ignore', invalid='ignore'):
-            roe = (net_income / equity) * 100
-
-        return roe
+        return self.metric('ROE')
 
     def return_on_assets(self) -> np.ndarray:
         """
@@ -95,13 +138,7 @@ class MetricsCalculator:
         Returns:
             Array de porcentajes (ej: 31.2 para 31.2%)
         """
-        net_income = self._get_concept('NetIncome')
-        assets = self._get_concept('Assets')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            roa = (net_income / assets) * 100
-
-        return roa
+        return self.metric('ROA')
 
     def net_margin(self) -> np.ndarray:
         """
@@ -112,13 +149,7 @@ class MetricsCalculator:
         Returns:
             Array de porcentajes (ej: 26.9 para 26.9%)
         """
-        net_income = self._get_concept('NetIncome')
-        revenue = self._get_concept('Revenue')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            margin = (net_income / revenue) * 100
-
-        return margin
+        return self.metric('NetMargin')
 
     def gross_margin(self) -> np.ndarray:
         """
@@ -127,13 +158,7 @@ class MetricsCalculator:
         Returns:
             Array de porcentajes (ej: 46.9 para 46.9%)
         """
-        gross_profit = self._get_concept('GrossProfit')
-        revenue = self._get_concept('Revenue')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            margin = (gross_profit / revenue) * 100
-
-        return margin
+        return self.metric('GrossMargin')
 
     def operating_margin(self) -> np.ndarray:
         """
@@ -142,13 +167,7 @@ class MetricsCalculator:
         Returns:
             Array de porcentajes (ej: 32.0 para 32.0%)
         """
-        operating_income = self._get_concept('OperatingIncome')
-        revenue = self._get_concept('Revenue')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            margin = (operating_income / revenue) * 100
-
-        return margin
+        return self.metric('OperatingMargin')
 
     def return_on_invested_capital(self) -> np.ndarray:
         """
@@ -157,16 +176,7 @@ class MetricsCalculator:
         Returns:
             Array de porcentajes (ej: 45.2 para 45.2%)
         """
-        operating_income = self._get_concept('OperatingIncome')
-        equity = self._get_concept('Equity')
-        long_term_debt = self._get_concept('LongTermDebt')
-
-        invested_capital = equity + long_term_debt
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            roic = (operating_income / invested_capital) * 100
-
-        return roic
+        return self.metric('ROIC')
 
     def earnings_per_share_proxy(self) -> np.ndarray:
         """
@@ -175,7 +185,7 @@ class MetricsCalculator:
         NOTA: EPS real requiere SharesOutstanding
         Este es un proxy simplificado (retorna valor absoluto, no %)
         """
-        return self._get_concept('NetIncome')
+        return self.metric('EPS')
 
     def operating_cash_flow_margin(self) -> np.ndarray:
         """
@@ -184,13 +194,7 @@ class MetricsCalculator:
         Returns:
             Array de porcentajes (ej: 31.5 para 31.5%)
         """
-        ocf = self._get_concept('OperatingCashFlow')
-        revenue = self._get_concept('Revenue')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            margin = (ocf / revenue) * 100
-
-        return margin
+        return self.metric('OCFMargin')
 
     # ========================================================================
     # CATEGORY 2: LIQUIDITY (5 ratios)
@@ -203,13 +207,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (ej: 0.89 para 0.89x, NO porcentaje)
         """
-        current_assets = self._get_concept('CurrentAssets')
-        current_liabilities = self._get_concept('CurrentLiabilities')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            ratio = current_assets / current_liabilities
-
-        return ratio
+        return self.metric('CurrentRatio')
 
     def quick_ratio(self) -> np.ndarray:
         """
@@ -218,16 +216,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (NO porcentaje)
         """
-        current_assets = self._get_concept('CurrentAssets')
-        inventory = self._get_concept('Inventory')
-        current_liabilities = self._get_concept('CurrentLiabilities')
-
-        quick_assets = current_assets - inventory
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            ratio = quick_assets / current_liabilities
-
-        return ratio
+        return self.metric('QuickRatio')
 
     def cash_ratio(self) -> np.ndarray:
         """
@@ -236,13 +225,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (NO porcentaje)
         """
-        cash = self._get_concept('CashAndEquivalents')
-        current_liabilities = self._get_concept('CurrentLiabilities')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            ratio = cash / current_liabilities
-
-        return ratio
+        return self.metric('CashRatio')
 
     def working_capital(self) -> np.ndarray:
         """
@@ -251,10 +234,7 @@ class MetricsCalculator:
         Returns:
             Array de valores absolutos (NO porcentaje)
         """
-        current_assets = self._get_concept('CurrentAssets')
-        current_liabilities = self._get_concept('CurrentLiabilities')
-
-        return current_assets - current_liabilities
+        return self.metric('WorkingCapital')
 
     def operating_cash_flow_ratio(self) -> np.ndarray:
         """
@@ -263,13 +243,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (NO porcentaje)
         """
-        ocf = self._get_concept('OperatingCashFlow')
-        current_liabilities = self._get_concept('CurrentLiabilities')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            ratio = ocf / current_liabilities
-
-        return ratio
+        return self.metric('OCFRatio')
 
     # ========================================================================
     # CATEGORY 3: EFFICIENCY (6 ratios)
@@ -282,13 +256,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (ej: 1.16 para 1.16x, NO porcentaje)
         """
-        revenue = self._get_concept('Revenue')
-        assets = self._get_concept('Assets')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            turnover = revenue / assets
-
-        return turnover
+        return self.metric('AssetTurnover')
 
     def inventory_turnover(self) -> np.ndarray:
         """
@@ -297,13 +265,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (NO porcentaje)
         """
-        cogs = self._get_concept('CostOfRevenue')
-        inventory = self._get_concept('Inventory')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            turnover = cogs / inventory
-
-        return turnover
+        return self.metric('InventoryTurnover')
 
     def days_inventory_outstanding(self) -> np.ndarray:
         """
@@ -312,12 +274,7 @@ class MetricsCalculator:
         Returns:
             Array de días (NO porcentaje)
         """
-        inventory_turnover = self.inventory_turnover()
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            dio = 365 / inventory_turnover
-
-        return dio
+        return self.metric('DIO')
 
     def receivables_turnover(self) -> np.ndarray:
         """
@@ -326,13 +283,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (NO porcentaje)
         """
-        revenue = self._get_concept('Revenue')
-        ar = self._get_concept('AccountsReceivable')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            turnover = revenue / ar
-
-        return turnover
+        return self.metric('ReceivablesTurnover')
 
     def days_sales_outstanding(self) -> np.ndarray:
         """
@@ -341,12 +292,7 @@ class MetricsCalculator:
         Returns:
             Array de días (NO porcentaje)
         """
-        receivables_turnover = self.receivables_turnover()
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            dso = 365 / receivables_turnover
-
-        return dso
+        return self.metric('DSO')
 
     def cash_conversion_cycle(self) -> np.ndarray:
         """
@@ -358,10 +304,7 @@ class MetricsCalculator:
         Returns:
             Array de días (NO porcentaje)
         """
-        dio = self.days_inventory_outstanding()
-        dso = self.days_sales_outstanding()
-
-        return dio + dso
+        return self.metric('CCC')
 
     # ========================================================================
     # CATEGORY 4: LEVERAGE (6 ratios)
@@ -374,13 +317,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (ej: 1.23 para 1.23x, NO porcentaje)
         """
-        debt = self._get_concept('LongTermDebt')
-        equity = self._get_concept('Equity')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            ratio = debt / equity
-
-        return ratio
+        return self.metric('DebtToEquity')
 
     def debt_to_assets(self) -> np.ndarray:
         """
@@ -389,13 +326,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (NO porcentaje)
         """
-        debt = self._get_concept('LongTermDebt')
-        assets = self._get_concept('Assets')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            ratio = debt / assets
-
-        return ratio
+        return self.metric('DebtToAssets')
 
     def equity_multiplier(self) -> np.ndarray:
         """
@@ -404,13 +335,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (NO porcentaje)
         """
-        assets = self._get_concept('Assets')
-        equity = self._get_concept('Equity')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            multiplier = assets / equity
-
-        return multiplier
+        return self.metric('EquityMultiplier')
 
     def interest_coverage(self) -> np.ndarray:
         """
@@ -419,13 +344,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (ej: 25.3 para 25.3x, NO porcentaje)
         """
-        operating_income = self._get_concept('OperatingIncome')
-        interest_expense = self._get_concept('InterestExpense')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            coverage = operating_income / interest_expense
-
-        return coverage
+        return self.metric('InterestCoverage')
 
     def debt_service_coverage(self) -> np.ndarray:
         """
@@ -437,13 +356,7 @@ class MetricsCalculator:
         Returns:
             Array de ratios (NO porcentaje)
         """
-        ocf = self._get_concept('OperatingCashFlow')
-        interest_expense = self._get_concept('InterestExpense')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            coverage = ocf / interest_expense
-
-        return coverage
+        return self.metric('DSCR')
 
     def total_debt_ratio(self) -> np.ndarray:
         """
@@ -452,10 +365,4 @@ class MetricsCalculator:
         Returns:
             Array de ratios (NO porcentaje)
         """
-        liabilities = self._get_concept('Liabilities')
-        assets = self._get_concept('Assets')
-
-        with np.errstate(divide='ignore', invalid='ignore'):
-            ratio = liabilities / assets
-
-        return ratio
+        return self.metric('TotalDebtRatio')
@@ -6,11 +6,17 @@ Optimizaciones:
 - I/O-bound eliminated (todo en memoria)
 - Expected speedup: ~3x
 
+SPRINT 8 - Universe-Scale Metrics:
+- Categorías vienen del registry (definitions.py)
+- Threads por categoría no escalan (GIL + arrays de 4 elementos);
+  el paralelismo entre empresas vive en ShardedUniverseExecutor (procesos)
+
 Author: @franklin
 Sprint: 4 - Metrics Optimization
 """
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from typing import Dict
 import numpy as np
 from backend.metrics.metrics_calculator import MetricsCalculator
@@ -47,60 +53,42 @@ class ParallelMetricsEngine:
         self.calc = calculator
         self.max_workers = max_workers
 
+    def _calculate(self, category: str) -> Dict[str, np.ndarray]:
+        """
+        Calcula los ratios de una categoría según el registry (definitions.py).
+
+        El plan compartido del calculator reusa intermedios entre categorías.
+        """
+        return {
+            name: self.calc.metric(name)
+            for name in self.calc.plan.categories.get(category, [])
+        }
+
     def _calculate_profitability(self) -> Dict[str, np.ndarray]:
         """
         Calcula 8 ratios de rentabilidad.
 
         Thread-safe (cada thread tiene su propio scope)
         """
-        return {
-            'ROE': self.calc.return_on_equity(),
-            'ROA': self.calc.return_on_assets(),
-            'NetMargin': self.calc.net_margin(),
-            'GrossMargin': self.calc.gross_margin(),
-            'OperatingMargin': self.calc.operating_margin(),
-            'ROIC': self.calc.return_on_invested_capital(),
-            'EPS': self.calc.earnings_per_share_proxy(),
-            'OCFMargin': self.calc.operating_cash_flow_margin(),
-        }
+        return self._calculate('profitability')
 
     def _calculate_liquidity(self) -> Dict[str, np.ndarray]:
         """
         Calcula 5 ratios de liquidez.
         """
-        return {
-            'CurrentRatio': self.calc.current_ratio(),
-            'QuickRatio': self.calc.quick_ratio(),
-            'CashRatio': self.calc.cash_ratio(),
-            'WorkingCapital': self.calc.working_capital(),
-            'OCFRatio': self.calc.operating_cash_flow_ratio(),
-        }
+        return self._calculate('liquidity')
 
     def _calculate_efficiency(self) -> Dict[str, np.ndarray]:
         """
         Calcula 6 ratios de eficiencia.
         """
-        return {
-            'AssetTurnover': self.calc.asset_turnover(),
-            'InventoryTurnover': self.calc.inventory_turnover(),
-            'DIO': self.calc.days_inventory_outstanding(),
-            'ReceivablesTurnover': self.calc.receivables_turnover(),
-            'DSO': self.calc.days_sales_outstanding(),
-            'CCC': self.calc.cash_conversion_cycle(),
-        }
+        return self._calculate('efficiency')
 
     def _calculate_leverage(self) -> Dict[str, np.ndarray]:
         """
         Calcula 6 ratios de apalancamiento.
         """
-        return {
-            'DebtToEquity': self.calc.debt_to_equity(),
-            'DebtToAssets': self.calc.debt_to_assets(),
-            'EquityMultiplier': self.calc.equity_multiplier(),
-            'InterestCoverage': self.calc.interest_coverage(),
-            'DSCR': self.calc.debt_service_coverage(),
-            'TotalDebtRatio': self.calc.total_debt_ratio(),
-        }
+        return self._calculate('leverage')
 
     def calculate_all(self) -> Dict[str, Dict[str, np.ndarray]]:
         """
@@ -119,12 +107,10 @@ class ParallelMetricsEngine:
             Parallel:   ~30ms (4 categories × 7.5ms)
             Speedup:    ~3.3x
         """
-        # Mapeo de categorías → funciones
+        # Mapeo de categorías → funciones (categorías del registry)
         tasks = {
-            'profitability': self._calculate_profitability,
-            'liquidity': self._calculate_liquidity,
-            'efficiency': self._calculate_efficiency,
-            'leverage': self._calculate_leverage,
+            category: partial(self._calculate, category)
+            for category in self.calc.plan.categories
         }
 
         results = {}
@@ -159,13 +145,7 @@ class ParallelMetricsEngine:
         Returns:
             Dict con ratios de la categoría
         """
-        if category == 'profitability':
-            return self._calculate_profitability()
-        elif category == 'liquidity':
-            return self._calculate_liquidity()
-        elif category == 'efficiency':
-            return self._calculate_efficiency()
-        elif category == 'leverage':
-            return self._calculate_leverage()
-        else:
+        if category not in self.calc.plan.categories:
             raise ValueError(f"Categoría inválida: {category}")
+
+        return self._calculate(category)
@@ -13,8 +13,11 @@ import sys
 import os
 from typing import Dict
 
+import numpy as np
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 from backend.metrics.base import BaseMetric
+from backend.metrics.definitions import METRICS
 
 
 class ROE(BaseMetric):
@@ -69,6 +72,11 @@ class ROE(BaseMetric):
 
         return (net_income / equity) * 100
 
+    def calculate_values(self, inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        # Vectorizado para calculate_batch(): equity == 0 → NaN (no record)
+        equity = inputs['StockholdersEquity']
+        return np.where(equity == 0, np.nan, (inputs['NetIncomeLoss'] / equity) * 100)
+
     def get_unit(self) -> str:
         return "%"
 
@@ -112,7 +120,11 @@ class ROE(BaseMetric):
         }
 
     def validate_range(self, value: float) -> bool:
-        return -200.0 <= value <= 500.0
+        # Rango único en definitions.py (también lo usa el plan vectorizado)
+        return METRICS['ROE'].validate_range(value)
+
+    def validate_ranges(self, values: np.ndarray) -> np.ndarray:
+        return METRICS['ROE'].in_range(values)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,266 @@
+"""
+MetricsResultCache: Memoización en disco de calculate_metrics().
+
+El mismo timeseries de una empresa pasa por calculate_metrics() en
+BenchmarkCalculator, load_sector_benchmarks, tests de peer comparison y
+cada corrida de reportes. El resultado sólo depende de:
+
+    (year, concept, raw_value) de los conceptos que el plan lee
+    + versión de las definiciones (EvaluationPlan.fingerprint)
+
+Ese fingerprint (SHA-256) es la clave de un cache content-addressed:
+
+    data/metrics_cache/
+    └── 3f/3fa1...e9.npz       # {'profitability/ROE': float64[Y], ...}
+
+Features:
+- Hit: sin CompactFinancialDataFrame ni evaluación de ratios
+- register_metric() cambia la versión → entradas viejas no se reusan
+- Escrituras atómicas (atomic_write)
+- LRU por tamaño: cada hit actualiza mtime; al superar max_bytes se
+  borran las entradas menos usadas
+- Contadores hits / misses / evictions (stats())
+
+Usage:
+    from backend.metrics import calculate_metrics, MetricsResultCache
+
+    cache = MetricsResultCache('data/metrics_cache', max_bytes=64 * 1024**2)
+    metrics = calculate_metrics(timeseries, cache=cache)   # miss → calcula
+    metrics = calculate_metrics(timeseries, cache=cache)   # hit → np.load
+    cache.stats()  # {'hits': 1, 'misses': 1, ...}
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import hashlib
+import os
+import struct
+import threading
+import zipfile
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+from backend.engines.tracked_metric import SourceTrace
+from backend.metrics.definitions import EvaluationPlan, default_plan
+from backend.utils.atomic_io import atomic_write
+
+
+Metrics = Dict[str, Dict[str, np.ndarray]]
+
+
+def timeseries_fingerprint(
+    timeseries: Dict[int, Dict[str, SourceTrace]],
+    plan: Optional[EvaluationPlan] = None
+) -> str:
+    """
+    Fingerprint estable de un timeseries para un plan.
+
+    Sólo cuentan los años y los conceptos que el plan lee (metadata de
+    SourceTrace y conceptos extra no cambian los ratios). Los valores se
+    hashean con sus bytes float64 exactos.
+
+    Returns:
+        SHA-256 hex
+    """
+    plan = plan or default_plan()
+    concepts = sorted(plan.concepts)
+
+    digest = hashlib.sha256(plan.fingerprint.encode())
+    for year in sorted(timeseries, reverse=True):
+        year_data = timeseries[year]
+        digest.update(struct.pack('<q', int(year)))
+        for concept in concepts:
+            trace = year_data.get(concept)
+            if trace is None or trace.raw_value is None:
+                continue
+            digest.update(concept.encode())
+            digest.update(struct.pack('<d', float(trace.raw_value)))
+    return digest.hexdigest()
+
+
+class MetricsResultCache:
+    """
+    Cache content-addressed de resultados de calculate_metrics().
+
+    Attributes:
+        root: Directorio del cache (default: 'data/metrics_cache')
+        max_bytes: Tamaño máximo en disco antes de evictar (LRU)
+        hits, misses, evictions: Contadores desde la creación
+    """
+
+    DEFAULT_DIRNAME = 'metrics_cache'
+    SUFFIX = '.npz'
+    DEFAULT_MAX_BYTES = 256 * 1024 ** 2
+
+    def __init__(
+        self,
+        root: Union[str, Path] = 'data/metrics_cache',
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Args:
+            root: Directorio del cache (se crea si no existe)
+            max_bytes: Límite de tamaño en disco
+
+        Raises:
+            ValueError: Si max_bytes <= 0
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._bytes = sum(path.stat().st_size for path in self._entries())
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{self.SUFFIX}"
+
+    def _entries(self):
+        return self.root.glob(f"*/*{self.SUFFIX}")
+
+    def get(
+        self,
+        timeseries: Dict[int, Dict[str, SourceTrace]],
+        plan: Optional[EvaluationPlan] = None
+    ) -> Optional[Metrics]:
+        """
+        Resultado cacheado para el timeseries, o None (miss).
+        """
+        path = self._path(timeseries_fingerprint(timeseries, plan))
+        metrics = self._load(path)
+
+        with self._lock:
+            if metrics is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return metrics
+
+    def _load(self, path: Path) -> Optional[Metrics]:
+        try:
+            with np.load(path) as data:
+                metrics: Metrics = {}
+                for name in data.files:
+                    category, metric = name.split('/', 1)
+                    metrics.setdefault(category, {})[metric] = data[name]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zipfile.BadZipFile):
+            # Entrada corrupta (ej: disco lleno a mitad de escritura previa)
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)  # LRU: marca como usada recientemente
+        except OSError:
+            pass
+        return metrics
+
+    def put(
+        self,
+        timeseries: Dict[int, Dict[str, SourceTrace]],
+        metrics: Metrics,
+        plan: Optional[EvaluationPlan] = None
+    ) -> str:
+        """
+        Guarda un resultado (escritura atómica).
+
+        Returns:
+            Clave (fingerprint) de la entrada
+        """
+        key = timeseries_fingerprint(timeseries, plan)
+        path = self._path(key)
+
+        arrays = {
+            f"{category}/{metric}": np.asarray(values, dtype=np.float64)
+            for category, category_metrics in metrics.items()
+            for metric, values in category_metrics.items()
+        }
+
+        previous = path.stat().st_size if path.exists() else 0
+        atomic_write(path, lambda f: np.savez(f, **arrays))
+
+        with self._lock:
+            self._bytes += path.stat().st_size - previous
+        if self._bytes > self.max_bytes:
+            self._evict()
+        return key
+
+    def get_or_calculate(
+        self,
+        timeseries: Dict[int, Dict[str, SourceTrace]],
+        calculate: Callable[[], Metrics],
+        plan: Optional[EvaluationPlan] = None
+    ) -> Metrics:
+        """Hit → resultado cacheado; miss → calculate() y lo guarda."""
+        metrics = self.get(timeseries, plan)
+        if metrics is None:
+            metrics = calculate()
+            self.put(timeseries, metrics, plan)
+        return metrics
+
+    # ------------------------------------------------------------------
+    # Eviction / stats
+    # ------------------------------------------------------------------
+
+    def _remove(self, path: Path) -> int:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return 0
+        with self._lock:
+            self._bytes -= size
+        return size
+
+    def _evict(self) -> None:
+        """Borra entradas menos usadas (mtime) hasta quedar bajo max_bytes."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        # Re-sincroniza el tamaño (otros procesos pueden compartir el cache)
+        with self._lock:
+            self._bytes = sum(size for _, size, _ in entries)
+
+        for _, _, path in sorted(entries, key=lambda entry: entry[0]):
+            if self._bytes <= self.max_bytes:
+                break
+            if self._remove(path):
+                with self._lock:
+                    self.evictions += 1
+
+    def clear(self) -> None:
+        """Borra todas las entradas (los contadores se conservan)."""
+        for path in list(self._entries()):
+            self._remove(path)
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores + tamaño actual del cache."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': sum(1 for _ in self._entries()),
+            'bytes': self._bytes,
+        }
+
+    def __repr__(self) -> str:
+        return (f"MetricsResultCache(root='{self.root}', hits={self.hits}, "
+                f"misses={self.misses}, bytes={self._bytes})")
@@ -0,0 +1,176 @@
+"""
+ShardedUniverseExecutor: Métricas de universo repartidas por empresa en procesos.
+
+ParallelMetricsEngine reparte 4 categorías en threads, pero cada categoría
+son pocas operaciones NumPy sobre arrays de 4 elementos: el GIL las
+serializa y el overhead de threads domina (por eso calculate_metrics()
+ya no usa threads en modo 'auto').
+
+Este executor paraleliza donde sí hay trabajo: shards de empresas.
+
+    parent                              worker (proceso)
+    ------                              ----------------
+    timeseries → raw floats             UniverseFrame.from_values(shard)
+    (sólo conceptos del plan)  ──────▶  EvaluationPlan vectorizado (Cs × Y)
+                               ◀──────  tickers, year_mask, {metric: ndarray}
+    split_by_company()
+
+El payload es compacto en ambos sentidos: floats sin SourceTrace hacia el
+worker, y un array (Cs × Y) por métrica de vuelta.
+
+Usage:
+    from backend.metrics.sharded_executor import ShardedUniverseExecutor
+
+    with ShardedUniverseExecutor(max_workers=4) as executor:
+        sector_data = executor.calculate(universe)  # {ticker: {category: {metric: arr}}}
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.engines.tracked_metric import SourceTrace
+from backend.metrics.definitions import METRIC_DEFINITIONS, MetricDefinition, compile_plan
+from backend.metrics.universe import (
+    UniverseFrame,
+    calculate_universe_tensor,
+    split_by_company,
+)
+
+
+@lru_cache(maxsize=8)
+def _shard_plan(definitions: Tuple[MetricDefinition, ...]):
+    """Plan compilado una vez por proceso worker (y por registry)."""
+    return compile_plan(definitions)
+
+
+def _evaluate_shard(
+    shard: Dict[str, Dict[int, Dict[str, float]]],
+    definitions: Tuple[MetricDefinition, ...]
+) -> Tuple[List[str], np.ndarray, Dict[str, Dict[str, np.ndarray]]]:
+    """
+    Worker: evalúa un shard de empresas en un pase vectorizado.
+
+    Returns:
+        (tickers, year_mask (Cs × Y), {category: {metric: ndarray (Cs × Y)}})
+    """
+    plan = _shard_plan(definitions)
+    frame = UniverseFrame.from_values(shard, concepts=plan.concepts)
+    results = calculate_universe_tensor(frame, plan=plan)
+    return frame.tickers, frame.year_mask, results
+
+
+class ShardedUniverseExecutor:
+    """
+    Process pool que calcula métricas por shards de empresas.
+
+    Attributes:
+        max_workers: Procesos (None = os.cpu_count())
+        shard_size: Empresas por shard (None = ~4 shards por worker)
+    """
+
+    # Debajo de esto el pase in-process es más rápido que levantar el pool
+    MIN_PARALLEL_COMPANIES = 200
+
+    SHARDS_PER_WORKER = 4
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+        mp_context=None
+    ):
+        """
+        Args:
+            max_workers: Número de procesos (None = os.cpu_count())
+            shard_size: Empresas por shard (None = automático)
+            mp_context: multiprocessing context (None = default de la plataforma)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.mp_context = mp_context
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Cierra el pool de procesos (si se creó)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self.mp_context
+            )
+        return self._pool
+
+    def shards(self, tickers: List[str]) -> List[List[str]]:
+        """Parte la lista de tickers en shards contiguos."""
+        if not tickers:
+            return []
+        size = self.shard_size or math.ceil(
+            len(tickers) / (self.max_workers * self.SHARDS_PER_WORKER)
+        )
+        size = max(1, size)
+        return [tickers[i:i + size] for i in range(0, len(tickers), size)]
+
+    def calculate(
+        self,
+        universe: Dict[str, Dict[int, Dict[str, SourceTrace]]]
+    ) -> Dict[str, Dict[str, Dict[str, np.ndarray]]]:
+        """
+        Calcula los ratios de todo el universo repartido en procesos.
+
+        Numéricamente idéntico a calculate_universe_metrics(parallel='never').
+
+        Args:
+            universe: {ticker: extract_timeseries() output}
+
+        Returns:
+            {ticker: {category: {metric: np.ndarray}}} (orden de `universe`)
+        """
+        definitions = tuple(METRIC_DEFINITIONS)
+        concepts = set(_shard_plan(definitions).concepts)
+        tickers = [t for t, ts in universe.items() if ts]
+
+        # Payload compacto: raw floats de los conceptos que el plan lee
+        payloads = [
+            {
+                ticker: {
+                    year: {
+                        concept: trace.raw_value
+                        for concept, trace in year_data.items()
+                        if concept in concepts and trace is not None
+                    }
+                    for year, year_data in universe[ticker].items()
+                }
+                for ticker in shard
+            }
+            for shard in self.shards(tickers)
+        ]
+
+        if self.max_workers <= 1 or len(payloads) <= 1:
+            outputs = [_evaluate_shard(payload, definitions) for payload in payloads]
+        else:
+            pool = self._get_pool()
+            outputs = pool.map(_evaluate_shard, payloads, [definitions] * len(payloads))
+
+        sector_data = {}
+        for shard_tickers, year_mask, results in outputs:
+            sector_data.update(split_by_company(shard_tickers, year_mask, results))
+
+        return sector_data
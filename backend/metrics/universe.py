@@ -0,0 +1,306 @@
+"""
+UniverseFrame: Métricas de todo un universo de empresas en un solo pase.
+
+calculate_metrics() construye un FinancialDataFrame + MetricsCalculator
+por empresa y ejecuta 25 métodos sobre arrays de ~4 elementos; en un
+universo de cientos de empresas domina el overhead de Python.
+
+UniverseFrame apila todo el universo en un tensor denso
+(company × year × concept) float64 con máscara de presencia. El mismo
+MetricsCalculator corre sobre él: cada concepto es una matriz (C × Y), así
+que los 25 ratios se calculan con 25 operaciones vectorizadas para todo el
+universo, con resultados bit a bit idénticos al cálculo por empresa.
+
+Layout:
+    tensor[c, y, k]   valor del concepto k, año y, empresa c (NaN si falta)
+    mask[c, y, k]     True si el concepto fue reportado
+    year_mask[c, y]   True si la empresa tiene ese año fiscal
+    years             eje común de años (sorted desc, igual que FinancialDataFrame)
+
+Usage:
+    from backend.metrics import calculate_universe_metrics
+
+    universe = {ticker: parser.extract_timeseries(years=4) for ...}
+    sector_data = calculate_universe_metrics(universe)
+
+    engine = StatisticalBenchmarkEngine(sector_data, sector_code='TECH')
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import os
+import numpy as np
+from typing import Dict, List, Optional
+from backend.engines.tracked_metric import SourceTrace
+from backend.metrics.definitions import EvaluationPlan
+from backend.metrics.metrics_calculator import MetricsCalculator
+from backend.metrics.parallel_engine import ParallelMetricsEngine
+from backend.metrics.result_cache import MetricsResultCache
+
+
+class UniverseFrame:
+    """
+    Tensor (company × year × concept) con interfaz de FinancialDataFrame.
+
+    __getitem__(concept) retorna una matriz (C × Y) en vez de un vector,
+    por lo que MetricsCalculator funciona sin cambios sobre todo el universo.
+
+    Usage:
+        frame = UniverseFrame.from_timeseries({'AAPL': ts_aapl, 'MSFT': ts_msft})
+        frame['NetIncome']           # shape (2, n_years)
+        frame.company_slice('AAPL')  # máscara de años de AAPL
+    """
+
+    def __init__(
+        self,
+        tensor: np.ndarray,
+        mask: np.ndarray,
+        year_mask: np.ndarray,
+        tickers: List[str],
+        years: np.ndarray,
+        concepts: List[str]
+    ):
+        """
+        Args:
+            tensor: float64 (C × Y × K)
+            mask: bool (C × Y × K) - concepto presente
+            year_mask: bool (C × Y) - año presente para la empresa
+            tickers: C tickers
+            years: Y años (desc)
+            concepts: K conceptos
+        """
+        self.tensor = tensor
+        self.mask = mask
+        self.year_mask = year_mask
+        self.tickers = list(tickers)
+        self._years = np.asarray(years)
+        self._concepts = list(concepts)
+        self._concept_index = {name: k for k, name in enumerate(self._concepts)}
+        self._ticker_index = {ticker: c for c, ticker in enumerate(self.tickers)}
+
+    @classmethod
+    def from_timeseries(
+        cls,
+        universe: Dict[str, Dict[int, Dict[str, SourceTrace]]],
+        concepts: Optional[List[str]] = None
+    ) -> 'UniverseFrame':
+        """
+        Construye el tensor desde {ticker: extract_timeseries()}.
+
+        O(facts) en construcción (una sola vez); todo lo demás es vectorizado.
+
+        Args:
+            universe: {ticker: {year: {concept: SourceTrace}}}
+            concepts: Conceptos a incluir (None = todos los reportados)
+
+        Returns:
+            UniverseFrame
+        """
+        return cls._build(universe, concepts, lambda trace: trace.raw_value)
+
+    @classmethod
+    def from_values(
+        cls,
+        universe: Dict[str, Dict[int, Dict[str, float]]],
+        concepts: Optional[List[str]] = None
+    ) -> 'UniverseFrame':
+        """
+        Igual que from_timeseries() pero con raw values (float) en vez de
+        SourceTrace - payload compacto para workers de ShardedUniverseExecutor.
+        """
+        return cls._build(universe, concepts, lambda value: value)
+
+    @classmethod
+    def _build(cls, universe, concepts, value_of) -> 'UniverseFrame':
+        tickers = [t for t, ts in universe.items() if ts]
+        years = sorted({y for t in tickers for y in universe[t]}, reverse=True)
+
+        if concepts is None:
+            seen = {}
+            for t in tickers:
+                for year_data in universe[t].values():
+                    for concept in year_data:
+                        seen.setdefault(concept, None)
+            concepts = list(seen)
+
+        concept_index = {name: k for k, name in enumerate(concepts)}
+        year_index = {year: y for y, year in enumerate(years)}
+
+        shape = (len(tickers), len(years), len(concepts))
+        tensor = np.full(shape, np.nan, dtype=np.float64)
+        mask = np.zeros(shape, dtype=bool)
+        year_mask = np.zeros(shape[:2], dtype=bool)
+
+        for c, ticker in enumerate(tickers):
+            for year, year_data in universe[ticker].items():
+                y = year_index[year]
+                year_mask[c, y] = True
+                for concept, item in year_data.items():
+                    k = concept_index.get(concept)
+                    if k is None or item is None:
+                        continue
+                    value = value_of(item)
+                    if value is None:
+                        continue
+                    tensor[c, y, k] = value
+                    mask[c, y, k] = True
+
+        return cls(tensor, mask, year_mask, tickers, np.array(years), concepts)
+
+    def __getitem__(self, concept: str) -> np.ndarray:
+        """
+        Matriz (C × Y) del concepto (NaN donde no fue reportado).
+
+        Returns:
+            Vista del tensor (sin copia)
+        """
+        k = self._concept_index.get(concept)
+        if k is None:
+            return np.full(self.tensor.shape[:2], np.nan)
+        return self.tensor[:, :, k]
+
+    @property
+    def years(self) -> np.ndarray:
+        """Eje común de años (sorted desc)."""
+        return self._years
+
+    @property
+    def concepts(self) -> list:
+        """Lista de conceptos del tensor."""
+        return list(self._concepts)
+
+    def company_slice(self, ticker: str) -> np.ndarray:
+        """Máscara booleana de los años que tiene la empresa (sobre el eje común)."""
+        return self.year_mask[self._ticker_index[ticker]]
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+
+def calculate_universe_tensor(
+    frame: UniverseFrame,
+    plan: Optional[EvaluationPlan] = None
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Calcula los 25 ratios para todo el universo (in-process).
+
+    Args:
+        frame: UniverseFrame
+        plan: EvaluationPlan (default: registry global)
+
+    Returns:
+        {category: {metric: ndarray (C × Y)}}
+    """
+    calculator = MetricsCalculator(frame, plan=plan)
+    engine = ParallelMetricsEngine(calculator)
+
+    return {
+        category: engine.calculate_category(category)
+        for category in calculator.plan.categories
+    }
+
+
+def split_by_company(
+    tickers: List[str],
+    year_mask: np.ndarray,
+    results: Dict[str, Dict[str, np.ndarray]]
+) -> Dict[str, Dict[str, Dict[str, np.ndarray]]]:
+    """
+    Convierte resultados (C × Y) al formato sector_data.
+
+    Cada empresa recibe sólo sus propios años (desc), igual que
+    calculate_metrics() sobre su timeseries.
+
+    Returns:
+        {ticker: {category: {metric: np.ndarray}}}
+    """
+    sector_data = {}
+    for c, ticker in enumerate(tickers):
+        years_present = year_mask[c]
+        sector_data[ticker] = {
+            category: {
+                metric: values[c, years_present]
+                for metric, values in metrics.items()
+            }
+            for category, metrics in results.items()
+        }
+    return sector_data
+
+
+def tensor_to_sector_data(
+    frame: UniverseFrame,
+    results: Dict[str, Dict[str, np.ndarray]]
+) -> Dict[str, Dict[str, Dict[str, np.ndarray]]]:
+    """split_by_company() para un UniverseFrame."""
+    return split_by_company(frame.tickers, frame.year_mask, results)
+
+
+def calculate_universe_metrics(
+    universe: Dict[str, Dict[int, Dict[str, SourceTrace]]],
+    parallel: str = 'never',
+    max_workers: Optional[int] = None,
+    cache: Optional[MetricsResultCache] = None
+) -> Dict[str, Dict[str, Dict[str, np.ndarray]]]:
+    """
+    API principal: 25 ratios para un universo de empresas en un solo pase.
+
+    Equivalente (numéricamente idéntico) a:
+        {ticker: calculate_metrics(ts) for ticker, ts in universe.items()}
+
+    Args:
+        universe: {ticker: extract_timeseries() output}
+        parallel: Modo de ejecución
+            - 'never' (default): un pase vectorizado in-process
+            - 'force': ShardedUniverseExecutor (shards de empresas en procesos)
+            - 'auto': procesos sólo si el universo supera
+                      ShardedUniverseExecutor.MIN_PARALLEL_COMPANIES y hay >1 CPU
+                      (el pool se crea por llamada; para llamadas repetidas
+                      usar ShardedUniverseExecutor directamente)
+        max_workers: Procesos si parallel != 'never' (None = os.cpu_count())
+        cache: MetricsResultCache opcional; sólo las empresas sin hit pasan
+               por el pase vectorizado (y se guardan)
+
+    Returns:
+        sector_data listo para StatisticalBenchmarkEngine:
+        {ticker: {category: {metric: np.ndarray}}}
+
+    Example:
+        >>> sector_data = calculate_universe_metrics({'AAPL': ts_aapl, 'MSFT': ts_msft})
+        >>> sector_data['AAPL']['profitability']['ROE']
+        array([151.9, 164.6, 156.1, 197.0])
+    """
+    from backend.metrics.sharded_executor import ShardedUniverseExecutor
+
+    if parallel == 'auto':
+        use_processes = (
+            len(universe) >= ShardedUniverseExecutor.MIN_PARALLEL_COMPANIES
+            and (os.cpu_count() or 1) > 1
+        )
+    elif parallel == 'force':
+        use_processes = True
+    elif parallel == 'never':
+        use_processes = False
+    else:
+        raise ValueError(f"Invalid parallel mode: {parallel}. Use 'auto', 'force', or 'never'")
+
+    if cache is not None:
+        cached = {ticker: cache.get(ts) for ticker, ts in universe.items() if ts}
+        misses = {ticker: universe[ticker] for ticker, metrics in cached.items() if metrics is None}
+        computed = calculate_universe_metrics(
+            misses, parallel=parallel, max_workers=max_workers
+        ) if misses else {}
+        for ticker, metrics in computed.items():
+            cache.put(universe[ticker], metrics)
+        return {
+            ticker: metrics if metrics is not None else computed[ticker]
+            for ticker, metrics in cached.items()
+            if metrics is not None or ticker in computed
+        }
+
+    if use_processes:
+        with ShardedUniverseExecutor(max_workers=max_workers) as executor:
+            return executor.calculate(universe)
+
+    frame = UniverseFrame.from_timeseries(universe)
+    return tensor_to_sector_data(frame, calculate_universe_tensor(frame))
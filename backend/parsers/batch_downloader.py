@@ -0,0 +1,301 @@
+"""
+backend/parsers/batch_downloader.py
+Batch Download Primitives - Shared rate budget, circuit breaker, worker pool
+
+Used by SECDownloader.download_sector_batch and
+download_tech_universe.SECDownloader.download_universe to run many
+ticker pipelines concurrently while keeping the *global* request rate
+under the SEC cap (10 req/s per host).
+
+Components:
+- RateLimiter: thread-safe token bucket, one shared instance per host
+- CircuitBreaker: per-endpoint failure counter (closed → open → half-open)
+- run_batch: bounded ThreadPoolExecutor with progress/ETA callback
+
+Throughput is bounded by the rate limiter, not by request latency:
+with 8 workers and ~300ms per request, the pool saturates the budget
+instead of idling between sequential requests.
+
+Author: @franklin
+Sprint 7 - Data Platform
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, TypeVar
+
+import requests
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# progress_callback(ticker, done, total, eta_seconds)
+ProgressCallback = Callable[[str, int, int, float], None]
+
+
+# ============================================================================
+# RATE LIMITER
+# ============================================================================
+
+class RateLimiter:
+    """
+    Thread-safe token bucket
+
+    Every request (from any worker, any downloader instance sharing the
+    limiter) consumes one token. Tokens refill at `rate` per second up to
+    `burst`.
+
+    Example:
+        >>> limiter = RateLimiter.for_host('www.sec.gov', rate=8)
+        >>> limiter.acquire()   # blocks until a token is available
+    """
+
+    _registry: Dict[str, 'RateLimiter'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum tokens accumulated while idle
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_host(cls, host: str, rate: float, burst: int = 1) -> 'RateLimiter':
+        """
+        Process-wide limiter for a host
+
+        All downloaders targeting the same host share one budget, so two
+        concurrent batch jobs cannot exceed the cap together.
+        """
+        with cls._registry_lock:
+            limiter = cls._registry.get(host)
+            if limiter is None:
+                limiter = cls(rate, burst)
+                cls._registry[host] = limiter
+            return limiter
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until available
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+
+                delay = (1 - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+
+# ============================================================================
+# CIRCUIT BREAKER
+# ============================================================================
+
+class CircuitOpenError(RuntimeError):
+    """Raised when an endpoint's circuit is open (request not attempted)"""
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker
+
+    After `failure_threshold` consecutive failures an endpoint is *open*:
+    requests fail fast with CircuitOpenError instead of hammering a
+    degraded service. After `reset_timeout` seconds one trial request is
+    let through (*half-open*); success closes the circuit, failure
+    re-opens it.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+        >>> breaker.before_request('browse-edgar')
+        >>> breaker.record_failure('browse-edgar')
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._trial_in_flight: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def state(self, endpoint: str) -> str:
+        """Current state for an endpoint"""
+        with self._lock:
+            return self._state(endpoint)
+
+    def _state(self, endpoint: str) -> str:
+        opened_at = self._opened_at.get(endpoint)
+        if opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_request(self, endpoint: str) -> None:
+        """
+        Gate a request
+
+        Raises:
+            CircuitOpenError: If the endpoint is open (or a half-open
+                trial is already running)
+        """
+        with self._lock:
+            state = self._state(endpoint)
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight.get(endpoint):
+                self._trial_in_flight[endpoint] = True
+                return
+
+        raise CircuitOpenError(f"Circuit open for endpoint '{endpoint}'")
+
+    def record_success(self, endpoint: str) -> None:
+        with self._lock:
+            self._failures[endpoint] = 0
+            self._opened_at.pop(endpoint, None)
+            self._trial_in_flight.pop(endpoint, None)
+
+    def record_failure(self, endpoint: str) -> None:
+        with self._lock:
+            self._failures[endpoint] = self._failures.get(endpoint, 0) + 1
+            self._trial_in_flight.pop(endpoint, None)
+            if self._failures[endpoint] >= self.failure_threshold:
+                self._opened_at[endpoint] = time.monotonic()
+
+
+def is_endpoint_failure(error: Exception) -> bool:
+    """
+    True if an error says the *endpoint* is unhealthy
+
+    Connection errors, timeouts, 429 and 5xx count against the circuit;
+    404 and other 4xx are normal "not found" answers from a healthy service.
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, requests.RequestException)
+
+
+def guarded_request(
+    session: requests.Session,
+    url: str,
+    endpoint: str,
+    limiter: RateLimiter,
+    breaker: CircuitBreaker,
+    method: str = 'GET',
+    **kwargs
+) -> requests.Response:
+    """
+    One HTTP request under the shared rate budget and circuit breaker
+
+    Args:
+        session: requests session (one per worker thread)
+        url: Target URL
+        endpoint: Circuit breaker key (e.g. 'browse-edgar', 'archives')
+        limiter: Shared RateLimiter
+        breaker: Shared CircuitBreaker
+        method: HTTP method
+        **kwargs: Passed to session.request (params, timeout, ...)
+
+    Returns:
+        Response (raise_for_status already applied)
+    """
+    breaker.before_request(endpoint)
+    limiter.acquire()
+
+    try:
+        response = session.request(method, url, **kwargs)
+        response.raise_for_status()
+    except Exception as e:
+        if is_endpoint_failure(e):
+            breaker.record_failure(endpoint)
+        else:
+            breaker.record_success(endpoint)
+        raise
+
+    breaker.record_success(endpoint)
+    return response
+
+
+# ============================================================================
+# WORKER POOL
+# ============================================================================
+
+def run_batch(
+    items: Iterable[T],
+    worker: Callable[[T], R],
+    max_workers: int = 8,
+    progress_callback: Optional[ProgressCallback] = None,
+    label: Callable[[T], str] = str
+) -> Dict[Hashable, Optional[R]]:
+    """
+    Run worker(item) for every item with bounded concurrency
+
+    Workers that raise yield None (the batch keeps going). Progress is
+    reported after each completion as (label, done, total, eta_seconds),
+    ETA from the observed completion rate.
+
+    Args:
+        items: Work items (e.g. tickers or (ticker, year) pairs)
+        worker: Function processing one item
+        max_workers: Concurrent pipelines (rate limiter bounds requests)
+        progress_callback: Optional progress hook
+        label: Item → display label for the callback
+
+    Returns:
+        {item: result}
+    """
+    items: List[T] = list(items)
+    total = len(items)
+    results: Dict[Hashable, Optional[R]] = {}
+
+    if total == 0:
+        return results
+
+    start_time = time.time()
+    done = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(worker, item): item for item in items}
+
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                results[item] = future.result()
+            except Exception:
+                results[item] = None
+
+            done += 1
+            if progress_callback:
+                elapsed = time.time() - start_time
+                eta = elapsed / done * (total - done)
+                progress_callback(label(item), done, total, eta)
+
+    return results
@@ -13,21 +13,25 @@ Email: negusnet101@gmail.com
 """
 
 import os
+import sys
 import requests
 from pathlib import Path
 from typing import Dict, Optional
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from backend.parsers.filing_store import FilingStore
+
 
 class HistoricalXBRLDownloader:
     """Descarga 10-K XBRL históricos desde SEC EDGAR"""
 
+    SEC_ROOT_URL = "https://www.sec.gov"
     BASE_URL = "https://www.sec.gov/Archives/edgar/data"
 
     # SEC requiere identificación en User-Agent
     HEADERS = {
         'User-Agent': 'FinancialAnalyzer/1.0 (negusnet101@gmail.com)',
-        'Accept-Encoding': 'gzip, deflate',
-        'Host': 'www.sec.gov'
+        'Accept-Encoding': 'gzip, deflate'
     }
 
     # Mapeo de años fiscales a accession numbers de Apple
@@ -56,13 +60,22 @@ class HistoricalXBRLDownloader:
 
     APPLE_CIK = '320193'
 
-    def __init__(self, output_dir: str = 'data'):
+    def __init__(
+        self,
+        output_dir: str = 'data',
+        store: Optional[FilingStore] = None,
+        base_url: str = SEC_ROOT_URL
+    ):
         """
         Args:
-            output_dir: Directorio donde guardar los archivos
+            output_dir: Directorio base de datos
+            store: FilingStore compartido (default: FilingStore en output_dir)
+            base_url: Raíz EDGAR (override para servidor local de pruebas)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.store = store or FilingStore.for_data_dir(self.output_dir)
+        self.archives_url = f"{base_url.rstrip('/')}/Archives/edgar/data"
 
     def _build_xbrl_url(self, year: int) -> Optional[str]:
         """
@@ -87,7 +100,7 @@ class HistoricalXBRLDownloader:
 
         # Construir URL
         url = (
-            f"{self.BASE_URL}/"
+            f"{self.archives_url}/"
             f"{self.APPLE_CIK}/"
             f"{accession_clean}/"
             f"{filing['xbrl_instance']}"
@@ -111,14 +124,21 @@ class HistoricalXBRLDownloader:
             return False
 
         filing = self.APPLE_FILINGS[year]
-        output_path = self.output_dir / filing['filename']
+        legacy_path = self.output_dir / filing['filename']
 
-        # Verificar si ya existe (cache)
-        if output_path.exists() and not force:
-            file_size_mb = output_path.stat().st_size / 1_000_000
-            print(f"✓ Ya existe: {filing['filename']} ({file_size_mb:.2f} MB)")
-            print(f"   (usa force=True para re-descargar)")
-            return True
+        # Verificar si ya existe (store compartido o archivo legacy)
+        if not force:
+            existing = self.store.lookup(
+                self.APPLE_CIK, year, accession=filing['accession']
+            )
+            if existing is None and legacy_path.exists():
+                existing = legacy_path
+
+            if existing is not None:
+                file_size_mb = existing.stat().st_size / 1_000_000
+                print(f"✓ Ya existe: {year} → {existing.name} ({file_size_mb:.2f} MB)")
+                print(f"   (usa force=True para re-descargar)")
+                return True
 
         # Construir URL
         url = self._build_xbrl_url(year)
@@ -128,7 +148,7 @@ class HistoricalXBRLDownloader:
 
         print(f"\n📥 Descargando {year} 10-K XBRL...")
         print(f"   URL: {url}")
-        print(f"   Destino: {output_path}")
+        print(f"   Destino: {self.store.root}")
 
         try:
             # Hacer request con timeout
@@ -151,11 +171,18 @@ class HistoricalXBRLDownloader:
                 print(f"   ✗ No parece ser XBRL válido")
                 return False
 
-            # Guardar archivo
-            output_path.write_text(content, encoding='utf-8')
+            # Guardar en store content-addressed (deduplicado)
+            output_path = self.store.put(
+                content.encode('utf-8'),
+                cik=self.APPLE_CIK,
+                fiscal_year=year,
+                accession=filing['accession'],
+                ticker='AAPL',
+                source_url=url
+            )
 
             file_size_mb = output_path.stat().st_size / 1_000_000
-            print(f"   ✓ Descargado: {file_size_mb:.2f} MB")
+            print(f"   ✓ Descargado: {file_size_mb:.2f} MB → {output_path.name}")
 
             return True
 
@@ -230,9 +257,7 @@ class HistoricalXBRLDownloader:
             print("\n🎯 TODAS LAS DESCARGAS COMPLETADAS")
             print("   Ahora tienes 4 años de datos XBRL:")
             print("   - data/apple_10k_xbrl.xml (2025)")
-            print("   - data/apple_10k_2024_xbrl.xml")
-            print("   - data/apple_10k_2023_xbrl.xml")
-            print("   - data/apple_10k_2022_xbrl.xml")
+            print(f"   - {self.store.root}/ (2022-2024, catálogo AAPL)")
             print("\n📋 SIGUIENTE PASO:")
             print("   python backend/parsers/xbrl_parser.py")
         elif successful > 0:
@@ -253,15 +278,13 @@ class HistoricalXBRLDownloader:
         print("📁 VERIFICACIÓN DE ARCHIVOS")
         print("="*60)
 
-        xbrl_files = sorted(self.output_dir.glob('apple_10k*xbrl.xml'))
-
-        if not xbrl_files:
-            print("   ✗ No se encontraron archivos XBRL")
-            return
-
-        for filepath in xbrl_files:
-            size_mb = filepath.stat().st_size / 1_000_000
+        # Archivos en store (por año fiscal) + legacy en output_dir
+        files_by_year = {
+            str(year): path
+            for year, path in self.store.files_for_ticker('AAPL').items()
+        }
 
+        for filepath in sorted(self.output_dir.glob('apple_10k*xbrl.xml')):
             # Extraer año del filename
             if '2024' in filepath.name:
                 year = "2024"
@@ -272,6 +295,17 @@ class HistoricalXBRLDownloader:
             else:
                 year = "2025"
 
+            files_by_year.setdefault(year, filepath)
+
+        if not files_by_year:
+            print("   ✗ No se encontraron archivos XBRL")
+            return
+
+        xbrl_files = []
+        for year in sorted(files_by_year, reverse=True):
+            filepath = files_by_year[year]
+            xbrl_files.append(filepath)
+            size_mb = filepath.stat().st_size / 1_000_000
             print(f"   ✓ [{year}] {filepath.name} ({size_mb:.2f} MB)")
 
         total_files = len(xbrl_files)
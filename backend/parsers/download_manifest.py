@@ -0,0 +1,321 @@
+"""
+backend/parsers/download_manifest.py
+Download Manifest - SQLite (WAL) journal of downloads and failures
+
+Replaces the JSON manifest that SECDownloader rewrote in full after every
+download (O(n²) I/O over a batch, last-writer-wins across workers).
+
+Every success/failure is a single-row upsert into a WAL-mode SQLite
+database, so concurrent threads *and* processes can record outcomes
+without clobbering each other. The WAL is checkpointed (compacted into
+the main database) every CHECKPOINT_EVERY writes.
+
+Layout:
+    data/download_manifest.sqlite       # downloads + failures (indexed)
+    data/download_manifest.json         # legacy, imported on first open
+
+Importable JSON formats:
+- SECDownloader:        {'downloads': {ticker: {...}}, 'failed': {ticker: reason}}
+- download_tech_universe: {'files': {ticker: {year: path}}, 'stats': {...}}
+
+Author: @franklin
+Sprint 7 - Data Platform
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+
+class DownloadManifest:
+    """
+    Concurrent, append-friendly download log
+
+    Attributes:
+        path: SQLite database file
+
+    Example:
+        >>> manifest = DownloadManifest.for_data_dir('data')
+        >>> manifest.record_download('AAPL', 2024, 'data/filings/blobs/3f/...xml',
+        ...                          cik='0000320193', accession='0000320193-24-000123')
+        >>> manifest.lookup('AAPL', 2024)
+        'data/filings/blobs/3f/...xml'
+        >>> manifest.record_failure('XYZ', 'CIK not found')
+    """
+
+    FILENAME = 'download_manifest.sqlite'
+    LEGACY_JSON = 'download_manifest.json'
+    VERSION = '2.0'
+
+    # WAL compaction interval (writes per connection)
+    CHECKPOINT_EVERY = 100
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS downloads (
+            ticker        TEXT NOT NULL,
+            year          INTEGER NOT NULL,
+            filepath      TEXT NOT NULL,
+            source        TEXT,
+            download_time REAL,
+            cik           TEXT,
+            accession     TEXT,
+            last_download TEXT NOT NULL,
+            PRIMARY KEY (ticker, year)
+        );
+        CREATE TABLE IF NOT EXISTS failures (
+            ticker    TEXT PRIMARY KEY,
+            year      INTEGER,
+            reason    TEXT NOT NULL,
+            failed_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS metadata (
+            key   TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (or create) a manifest database
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO metadata (key, value) VALUES ('created', ?)",
+            (datetime.now().isoformat(),)
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES ('version', ?)",
+            (self.VERSION,)
+        )
+        self._conn.commit()
+
+    @classmethod
+    def for_data_dir(cls, data_dir: Union[str, Path] = 'data') -> 'DownloadManifest':
+        """
+        Manifest at the conventional location, migrating the legacy JSON
+
+        The first time the SQLite manifest is created next to an existing
+        download_manifest.json, that JSON is imported.
+        """
+        data_dir = Path(data_dir)
+        path = data_dir / cls.FILENAME
+        is_new = not path.exists()
+
+        manifest = cls(path)
+
+        legacy = data_dir / cls.LEGACY_JSON
+        if is_new and legacy.exists():
+            manifest.import_json(legacy)
+
+        return manifest
+
+    # ========================================================================
+    # WRITES
+    # ========================================================================
+
+    def _write(self, *statements) -> None:
+        """Run (sql, params) statements in one transaction, checkpointing periodically"""
+        with self._lock:
+            for sql, params in statements:
+                self._conn.execute(sql, params)
+            self._conn.commit()
+            self._writes += 1
+            if self._writes % self.CHECKPOINT_EVERY == 0:
+                self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def record_download(
+        self,
+        ticker: str,
+        year: int,
+        filepath: Union[str, Path],
+        source: str = 'sec_edgar',
+        download_time: Optional[float] = None,
+        cik: Optional[str] = None,
+        accession: Optional[str] = None
+    ) -> None:
+        """
+        Record a successful download (clears any failure for the ticker)
+
+        Args:
+            ticker: Stock ticker
+            year: Fiscal year
+            filepath: Where the document lives
+            source: Origin ('sec_edgar', 'legacy_json', ...)
+            download_time: Seconds spent downloading
+            cik: Company CIK
+            accession: SEC accession number
+        """
+        ticker = ticker.upper()
+        self._write(
+            (
+                """
+                INSERT OR REPLACE INTO downloads
+                    (ticker, year, filepath, source, download_time, cik, accession, last_download)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (ticker, int(year), str(filepath), source,
+                 round(download_time, 2) if download_time is not None else None,
+                 cik, accession, datetime.now().isoformat())
+            ),
+            ("DELETE FROM failures WHERE ticker = ?", (ticker,))
+        )
+
+    def record_failure(self, ticker: str, reason: str, year: Optional[int] = None) -> None:
+        """Record a failed download (latest reason per ticker wins)"""
+        self._write((
+            "INSERT OR REPLACE INTO failures (ticker, year, reason, failed_at) VALUES (?, ?, ?, ?)",
+            (ticker.upper(), year, reason, datetime.now().isoformat())
+        ))
+
+    def compact(self) -> None:
+        """Fold the WAL into the main database and truncate it"""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    # ========================================================================
+    # READS
+    # ========================================================================
+
+    def lookup(self, ticker: str, year: int) -> Optional[str]:
+        """Recorded filepath for (ticker, year) - primary key lookup"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT filepath FROM downloads WHERE ticker = ? AND year = ?",
+                (ticker.upper(), int(year))
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_failure(self, ticker: str) -> Optional[str]:
+        """Last failure reason for a ticker"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT reason FROM failures WHERE ticker = ?", (ticker.upper(),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def count(self) -> Dict[str, int]:
+        """{'downloads': n, 'failed': n}"""
+        with self._lock:
+            downloads = self._conn.execute("SELECT COUNT(*) FROM downloads").fetchone()[0]
+            failed = self._conn.execute("SELECT COUNT(*) FROM failures").fetchone()[0]
+        return {'downloads': downloads, 'failed': failed}
+
+    def as_dict(self) -> Dict:
+        """
+        Legacy JSON-shaped view
+
+        'downloads' keeps the latest year per ticker (as the JSON manifest did).
+        """
+        with self._lock:
+            downloads = self._conn.execute(
+                "SELECT ticker, year, filepath, source, download_time, cik, accession, "
+                "last_download FROM downloads ORDER BY ticker, year"
+            ).fetchall()
+            failures = self._conn.execute("SELECT ticker, reason FROM failures").fetchall()
+            metadata = dict(self._conn.execute("SELECT key, value FROM metadata").fetchall())
+
+        result = {'downloads': {}, 'failed': dict(failures), 'metadata': metadata}
+        for ticker, year, filepath, source, seconds, cik, accession, last_download in downloads:
+            result['downloads'][ticker] = {
+                'last_download': last_download,
+                'year': year,
+                'filepath': filepath,
+                'source': source,
+                'download_time_seconds': seconds,
+                'cik': cik,
+                'accession': accession,
+            }
+        return result
+
+    # ========================================================================
+    # IMPORT / EXPORT
+    # ========================================================================
+
+    def import_json(self, json_path: Union[str, Path]) -> int:
+        """
+        Import a legacy JSON manifest (either known format)
+
+        Args:
+            json_path: SECDownloader or download_tech_universe manifest
+
+        Returns:
+            Number of download records imported
+        """
+        with open(json_path, 'r') as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError:
+                return 0
+
+        rows = []
+
+        # SECDownloader format
+        for ticker, entry in data.get('downloads', {}).items():
+            if entry.get('year') is None or not entry.get('filepath'):
+                continue
+            rows.append((
+                ticker.upper(), int(entry['year']), entry['filepath'],
+                entry.get('source', 'legacy_json'),
+                entry.get('download_time_seconds'),
+                entry.get('cik'), entry.get('accession'),
+                entry.get('last_download', datetime.now().isoformat())
+            ))
+
+        # download_tech_universe format
+        imported_at = data.get('downloaded_at', datetime.now().isoformat())
+        for ticker, files in data.get('files', {}).items():
+            for year, filepath in files.items():
+                rows.append((
+                    ticker.upper(), int(year), filepath, 'legacy_json',
+                    None, None, None, imported_at
+                ))
+
+        failures = [
+            (ticker.upper(), None, reason, datetime.now().isoformat())
+            for ticker, reason in data.get('failed', {}).items()
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO downloads
+                    (ticker, year, filepath, source, download_time, cik, accession, last_download)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO failures (ticker, year, reason, failed_at) VALUES (?, ?, ?, ?)",
+                failures
+            )
+            self._conn.commit()
+
+        return len(rows)
+
+    def export_json(self, json_path: Union[str, Path]) -> None:
+        """Write the legacy JSON view (for inspection / old tooling)"""
+        with open(json_path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def close(self) -> None:
+        """Checkpoint and close"""
+        self.compact()
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"DownloadManifest(path='{self.path}')"
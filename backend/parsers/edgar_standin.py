@@ -0,0 +1,546 @@
+"""
+backend/parsers/edgar_standin.py
+EDGAR Stand-In Server - Local HTTP server with EDGAR-shaped responses
+
+Lets every downloader (SECDownloader, HistoricalXBRLDownloader,
+download_tech_universe) run against localhost via their `base_url`
+override, so download throughput, circuit breaking and rate limiting can
+be benchmarked and regression-tested without network access.
+
+Served routes (same shapes the downloaders parse on www.sec.gov):
+    /cgi-bin/browse-edgar?action=getcompany&company=AAPL    company page (span.companyName)
+    /cgi-bin/browse-edgar?action=getcompany&CIK=...&type=10-K&dateb=YYYYMMDD
+                                                            filing list (table.tableFile2)
+    /Archives/edgar/data/{cik}/{acc}/{acc}-index.htm        filing index (table.tableFile)
+    /Archives/edgar/data/{cik}/{acc}/{doc}_htm.xml          XBRL instance document
+    /Archives/edgar/data/{cik}/{acc}/{doc}.htm              iXBRL primary document (optional)
+    /submissions/CIK{cik}.json                              submissions API (data.sec.gov)
+    anything else                                           static_dir/<path> if present
+
+Fault injection:
+- latency: seconds added to every response
+- error_rate / error_status: random failures (seeded, reproducible)
+- rate_limit: requests/second above which the server answers 429
+
+Example:
+    >>> fixtures = EdgarFixtures.synthetic(['AAPL', 'MSFT'], years=[2024, 2023])
+    >>> with EdgarStandIn(fixtures, latency=0.05) as server:
+    ...     downloader = SECDownloader(data_dir='tmp', base_url=server.base_url)
+    ...     downloader.get_or_download('AAPL', 2024)
+    ...     print(server.stats)
+
+Author: @franklin
+Sprint 7 - Data Platform
+"""
+
+import json
+import time
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import parse_qs, urlparse
+
+from backend.parsers.filing_store import normalize_cik
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@dataclass
+class FixtureFiling:
+    """One 10-K filing served by the stand-in"""
+    ticker: str
+    cik: str
+    fiscal_year: int
+    accession: str
+    period_end: str
+    filing_date: str
+    instance: bytes
+    ixbrl: Optional[bytes] = None
+    form: str = '10-K'
+
+    @property
+    def cik_int(self) -> str:
+        return self.cik.lstrip('0')
+
+    @property
+    def accession_nodash(self) -> str:
+        return self.accession.replace('-', '')
+
+    @property
+    def primary_document(self) -> str:
+        """e.g. 'aapl-20240928.htm'"""
+        return f"{self.ticker.lower()}-{self.period_end.replace('-', '')}.htm"
+
+    @property
+    def instance_document(self) -> str:
+        """e.g. 'aapl-20240928_htm.xml'"""
+        return self.primary_document.replace('.htm', '_htm.xml')
+
+    @property
+    def folder(self) -> str:
+        return f"/Archives/edgar/data/{self.cik_int}/{self.accession_nodash}"
+
+    @property
+    def index_url(self) -> str:
+        return f"{self.folder}/{self.accession}-index.htm"
+
+
+def synthetic_instance(
+    ticker: str,
+    cik: str,
+    fiscal_year: int,
+    period_end: str,
+    n_facts: int = 40
+) -> bytes:
+    """
+    Build a small but well-formed XBRL instance document
+
+    Contains dei cover facts plus core us-gaap facts and `n_facts`
+    filler facts (to control document size for throughput tests).
+    """
+    rng = random.Random(f"{ticker}-{fiscal_year}")
+    assets = rng.randint(50, 500) * 1_000_000_000
+    liabilities = int(assets * rng.uniform(0.3, 0.8))
+    revenue = int(assets * rng.uniform(0.4, 1.2))
+    net_income = int(revenue * rng.uniform(0.05, 0.3))
+
+    facts = {
+        'Assets': assets,
+        'Liabilities': liabilities,
+        'StockholdersEquity': assets - liabilities,
+        'LiabilitiesAndStockholdersEquity': assets,
+        'AssetsCurrent': int(assets * 0.35),
+        'LiabilitiesCurrent': int(liabilities * 0.4),
+        'Revenues': revenue,
+        'NetIncomeLoss': net_income,
+        'OperatingIncomeLoss': int(net_income * 1.25),
+        'NetCashProvidedByUsedInOperatingActivities': int(net_income * 1.1),
+    }
+
+    lines = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        '<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance" '
+        'xmlns:dei="http://xbrl.sec.gov/dei/2024" '
+        'xmlns:us-gaap="http://fasb.org/us-gaap/2024" '
+        'xmlns:iso4217="http://www.xbrl.org/2003/iso4217">',
+        f'<xbrli:context id="c-1"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">'
+        f'{cik}</xbrli:identifier></xbrli:entity><xbrli:period><xbrli:instant>{period_end}'
+        f'</xbrli:instant></xbrli:period></xbrli:context>',
+        '<xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>',
+        '<dei:DocumentType contextRef="c-1">10-K</dei:DocumentType>',
+        f'<dei:DocumentPeriodEndDate contextRef="c-1">{period_end}</dei:DocumentPeriodEndDate>',
+        f'<dei:DocumentFiscalYearFocus contextRef="c-1">{fiscal_year}</dei:DocumentFiscalYearFocus>',
+        f'<dei:EntityCentralIndexKey contextRef="c-1">{cik}</dei:EntityCentralIndexKey>',
+        f'<dei:TradingSymbol contextRef="c-1">{ticker.upper()}</dei:TradingSymbol>',
+    ]
+    for concept, value in facts.items():
+        lines.append(
+            f'<us-gaap:{concept} contextRef="c-1" unitRef="usd" decimals="-6">{value}</us-gaap:{concept}>'
+        )
+    for i in range(n_facts):
+        lines.append(
+            f'<us-gaap:OtherAssetsMiscellaneous{i} contextRef="c-1" unitRef="usd" decimals="-6">'
+            f'{rng.randint(1, 10**9)}</us-gaap:OtherAssetsMiscellaneous{i}>'
+        )
+    lines.append('</xbrli:xbrl>')
+
+    return '\n'.join(lines).encode('utf-8')
+
+
+class EdgarFixtures:
+    """
+    In-memory registry of companies and filings served by EdgarStandIn
+
+    Example:
+        >>> fixtures = EdgarFixtures()
+        >>> fixtures.add_company('AAPL', '320193', 'Apple Inc.')
+        >>> fixtures.add_filing('AAPL', 2024, accession='0000320193-24-000123',
+        ...                     period_end='2024-09-28')
+    """
+
+    def __init__(self):
+        self.companies: Dict[str, Dict[str, str]] = {}
+        self.filings: List[FixtureFiling] = []
+        self._by_path: Dict[str, bytes] = {}
+
+    @classmethod
+    def synthetic(
+        cls,
+        tickers: List[str],
+        years: List[int],
+        n_facts: int = 40,
+        ixbrl: bool = False
+    ) -> 'EdgarFixtures':
+        """
+        Fixtures for many tickers/years with generated CIKs and documents
+
+        Args:
+            tickers: Tickers to register
+            years: Fiscal years per ticker
+            n_facts: Filler facts per instance (document size knob)
+            ixbrl: Also serve an iXBRL primary document
+        """
+        fixtures = cls()
+        for i, ticker in enumerate(tickers, 1):
+            fixtures.add_company(ticker, str(1_000_000 + i))
+            for year in years:
+                fixtures.add_filing(ticker, year, n_facts=n_facts, ixbrl=ixbrl)
+        return fixtures
+
+    def add_company(self, ticker: str, cik: Union[str, int], name: Optional[str] = None) -> None:
+        self.companies[ticker.upper()] = {
+            'cik': normalize_cik(cik),
+            'name': name or f"{ticker.upper()} Corp",
+        }
+
+    def add_filing(
+        self,
+        ticker: str,
+        fiscal_year: int,
+        accession: Optional[str] = None,
+        period_end: Optional[str] = None,
+        filing_date: Optional[str] = None,
+        instance: Optional[bytes] = None,
+        ixbrl: bool = False,
+        n_facts: int = 40
+    ) -> FixtureFiling:
+        """
+        Register a 10-K filing (documents generated unless given)
+
+        Defaults: period end Sep 30 of the fiscal year, filed Nov 1 of the
+        same year (so both the browse-edgar and submissions flows find it).
+        """
+        company = self.companies[ticker.upper()]
+        cik = company['cik']
+        seq = len(self.filings) + 1
+
+        period_end = period_end or f"{fiscal_year}-09-30"
+        filing = FixtureFiling(
+            ticker=ticker.upper(),
+            cik=cik,
+            fiscal_year=fiscal_year,
+            accession=accession or f"{cik}-{str(fiscal_year)[2:]}-{seq:06d}",
+            period_end=period_end,
+            filing_date=filing_date or f"{fiscal_year}-11-01",
+            instance=instance or synthetic_instance(ticker, cik, fiscal_year, period_end, n_facts),
+        )
+        if ixbrl:
+            filing.ixbrl = (
+                f'<html xmlns:ix="http://www.xbrl.org/2013/inlineXBRL"><body>'
+                f'<ix:nonNumeric name="dei:DocumentType">10-K</ix:nonNumeric>'
+                f'<p>{escape(company["name"])} annual report {fiscal_year}</p></body></html>'
+            ).encode('utf-8')
+
+        self.filings.append(filing)
+        self._by_path[f"{filing.folder}/{filing.instance_document}"] = filing.instance
+        if filing.ixbrl:
+            self._by_path[f"{filing.folder}/{filing.primary_document}"] = filing.ixbrl
+        return filing
+
+    # ------------------------------------------------------------------------
+    # Renderers (EDGAR-shaped)
+    # ------------------------------------------------------------------------
+
+    def find_company(self, query: str) -> Optional[Dict[str, str]]:
+        """Company by ticker or CIK"""
+        company = self.companies.get(query.upper())
+        if company:
+            return company
+        cik = normalize_cik(query) if query.isdigit() else None
+        for company in self.companies.values():
+            if company['cik'] == cik:
+                return company
+        return None
+
+    def company_page(self, query: str) -> Optional[str]:
+        company = self.find_company(query)
+        if not company:
+            return None
+        return (
+            '<html><body><div class="companyInfo">'
+            f'<span class="companyName">{escape(company["name"])} CIK#: '
+            f'<a href="/cgi-bin/browse-edgar?action=getcompany&CIK={company["cik"]}&owner=exclude">'
+            f'{company["cik"]} (see all company filings)</a></span>'
+            '</div></body></html>'
+        )
+
+    def filing_list(self, cik: str, form: str = '10-K', dateb: str = '', count: int = 10) -> str:
+        cik = normalize_cik(cik)
+        matches = [
+            f for f in self.filings
+            if f.cik == cik and f.form == form
+            and (not dateb or f.filing_date.replace('-', '') <= dateb)
+        ]
+        matches.sort(key=lambda f: f.filing_date, reverse=True)
+
+        rows = ''.join(
+            '<tr>'
+            f'<td nowrap="nowrap">{f.form}</td>'
+            f'<td nowrap="nowrap"><a href="{f.index_url}" id="documentsbutton">Documents</a>'
+            f'&nbsp;<a href="{f.folder}" id="interactiveDataBtn">Interactive Data</a></td>'
+            f'<td class="small">Annual report [Section 13 and 15(d)]<br />Acc-no: {f.accession}</td>'
+            f'<td>{f.filing_date}</td>'
+            '<td><a href="#">001-00000</a></td>'
+            '</tr>'
+            for f in matches[:count]
+        )
+        return (
+            '<html><body><table class="tableFile2" summary="Results">'
+            '<tr><th>Filings</th><th>Format</th><th>Description</th>'
+            '<th>Filing Date</th><th>File/Film Number</th></tr>'
+            f'{rows}</table></body></html>'
+        )
+
+    def filing_index(self, folder: str) -> Optional[str]:
+        filing = next((f for f in self.filings if f.folder == folder), None)
+        if filing is None:
+            return None
+
+        documents = []
+        if filing.ixbrl:
+            documents.append(('10-K', filing.primary_document, filing.form, len(filing.ixbrl)))
+        documents.append(('XBRL INSTANCE DOCUMENT', filing.instance_document,
+                          'EX-101.INS', len(filing.instance)))
+
+        rows = ''.join(
+            '<tr>'
+            f'<td>{seq}</td><td>{description}</td>'
+            f'<td><a href="{filing.folder}/{name}">{name}</a></td>'
+            f'<td>{doc_type}</td><td>{size}</td>'
+            '</tr>'
+            for seq, (description, name, doc_type, size) in enumerate(documents, 1)
+        )
+        return (
+            '<html><body><table class="tableFile" summary="Document Format Files">'
+            '<tr><th>Seq</th><th>Description</th><th>Document</th><th>Type</th><th>Size</th></tr>'
+            f'{rows}</table></body></html>'
+        )
+
+    def submissions(self, cik: str) -> Optional[Dict]:
+        cik = normalize_cik(cik)
+        company = self.find_company(cik)
+        if company is None:
+            return None
+
+        filings = sorted(
+            (f for f in self.filings if f.cik == cik),
+            key=lambda f: f.filing_date, reverse=True
+        )
+        return {
+            'cik': cik.lstrip('0'),
+            'name': company['name'],
+            'filings': {
+                'recent': {
+                    'accessionNumber': [f.accession for f in filings],
+                    'filingDate': [f.filing_date for f in filings],
+                    'reportDate': [f.period_end for f in filings],
+                    'form': [f.form for f in filings],
+                    'primaryDocument': [f.primary_document for f in filings],
+                }
+            }
+        }
+
+    def document(self, path: str) -> Optional[bytes]:
+        return self._by_path.get(path)
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests to EdgarFixtures (server attribute: standin)"""
+
+    server_version = 'EdgarStandIn/1.0'
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self, send_body: bool) -> None:
+        standin: EdgarStandIn = self.server.standin
+        status, body, content_type, headers = standin._respond(self.path)
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        if send_body:
+            self.wfile.write(body)
+        standin._count(status, len(body) if send_body else 0)
+
+
+class EdgarStandIn:
+    """
+    Threaded local HTTP server impersonating EDGAR
+
+    Attributes:
+        base_url: http://127.0.0.1:<port> (pass as downloader base_url)
+        stats: {'requests', 'bytes', 'status': Counter}
+
+    Example:
+        >>> with EdgarStandIn(fixtures, error_rate=0.1, rate_limit=10) as server:
+        ...     run_downloads(server.base_url)
+        ...     server.stats['status'][429]
+    """
+
+    def __init__(
+        self,
+        fixtures: EdgarFixtures,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        rate_limit: Optional[float] = None,
+        static_dir: Optional[Union[str, Path]] = None,
+        seed: int = 0,
+        host: str = '127.0.0.1',
+        port: int = 0
+    ):
+        """
+        Args:
+            fixtures: Companies/filings to serve
+            latency: Seconds added to every response
+            error_rate: Probability [0, 1] of answering error_status
+            error_status: Status code for injected errors
+            rate_limit: Max requests/second before answering 429 (None = off)
+            static_dir: Optional directory of recorded responses (URL path → file)
+            seed: RNG seed for reproducible error injection
+            host: Bind address
+            port: Bind port (0 = ephemeral)
+        """
+        self.fixtures = fixtures
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.static_dir = Path(static_dir) if static_dir else None
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self.reset_stats()
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.standin = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'EdgarStandIn':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> 'EdgarStandIn':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = {'requests': 0, 'bytes': 0, 'status': Counter()}
+
+    def _count(self, status: int, n_bytes: int) -> None:
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['bytes'] += n_bytes
+            self.stats['status'][status] += 1
+
+    # ------------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------------
+
+    def _over_rate_limit(self) -> bool:
+        if not self.rate_limit:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            return self._window_count > self.rate_limit
+
+    def _inject_error(self) -> bool:
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < self.error_rate
+
+    def _respond(self, raw_path: str):
+        """Returns (status, body, content_type, extra_headers)"""
+        if self._over_rate_limit():
+            return 429, b'Request Rate Threshold Exceeded', 'text/plain', {'Retry-After': '1'}
+
+        if self._inject_error():
+            return self.error_status, b'Injected error', 'text/plain', {}
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlparse(raw_path)
+        path = url.path
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        html = 'text/html; charset=utf-8'
+
+        if path == '/cgi-bin/browse-edgar':
+            if 'CIK' in query:
+                body = self.fixtures.filing_list(
+                    query['CIK'], query.get('type', '10-K'),
+                    query.get('dateb', ''), int(query.get('count', 10))
+                )
+                return 200, body.encode('utf-8'), html, {}
+            page = self.fixtures.company_page(query.get('company', ''))
+            if page:
+                return 200, page.encode('utf-8'), html, {}
+            return 200, b'<html><body>No matching companies.</body></html>', html, {}
+
+        if path.startswith('/submissions/CIK') and path.endswith('.json'):
+            data = self.fixtures.submissions(path[len('/submissions/CIK'):-len('.json')])
+            if data is not None:
+                return 200, json.dumps(data).encode('utf-8'), 'application/json', {}
+
+        if path.endswith('-index.htm'):
+            page = self.fixtures.filing_index(path.rsplit('/', 1)[0])
+            if page:
+                return 200, page.encode('utf-8'), html, {}
+
+        document = self.fixtures.document(path)
+        if document is not None:
+            content_type = 'application/xml' if path.endswith('.xml') else html
+            return 200, document, content_type, {}
+
+        if self.static_dir:
+            candidate = (self.static_dir / path.lstrip('/')).resolve()
+            if candidate.is_file() and self.static_dir.resolve() in candidate.parents:
+                return 200, candidate.read_bytes(), 'application/octet-stream', {}
+
+        return 404, b'Not Found', 'text/plain', {}
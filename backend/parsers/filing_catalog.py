@@ -0,0 +1,520 @@
+"""
+backend/parsers/filing_catalog.py
+Filing Catalog - Persistent index of every XBRL file available locally
+
+Replaces repeated glob + regex discovery (MultiFileXBRLParser._discover_files,
+discover_available_tickers) with one SQLite index that is built once and
+updated incrementally. The index lives in its own sidecar database
+(data/.filing_catalog.sqlite), separate from the FilingStore catalog
+(data/filings/catalog.sqlite): discovery reads the store but never
+creates it, and the index persists with or without a store.
+
+Indexed sources (in precedence order per fiscal year):
+0. FilingStore blobs (content-addressed, cataloged by ticker)
+1. {TICKER}/{TICKER}_{YEAR}_10K.xml  (downloader - subdirectory)
+2. {TICKER}_{YEAR}_10K.xml           (downloader - flat)
+3. {ticker}_10k_{year}_xbrl.xml      (legacy Apple format)
+4. {ticker}_10k_xbrl.xml             (sin año - most recent)
+
+Columns: ticker, CIK, fiscal year, period end, form, path, size, hash,
+parse status. Incremental refresh only re-reads files whose (size, mtime)
+changed; discovery for a ticker or a sector is a single indexed query.
+Files that failed to parse are remembered and skipped until they change.
+
+Author: @franklin
+Sprint 7 - Data Platform
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from backend.parsers.filing_store import FilingStore, normalize_cik
+
+
+# Compiled once at import (previously recompiled per ticker per call)
+SUBDIR_PATTERN = re.compile(r'^(?P<ticker>[A-Za-z.\-]+)_(?P<year>\d{4})_10K\.xml$', re.IGNORECASE)
+FLAT_PATTERN = SUBDIR_PATTERN
+LEGACY_PATTERN = re.compile(r'^(?P<ticker>[A-Za-z.\-]+)_10k_(?P<year>\d{4})_xbrl\.xml$', re.IGNORECASE)
+UNDATED_PATTERN = re.compile(r'^(?P<ticker>[A-Za-z.\-]+)_10k_xbrl\.xml$', re.IGNORECASE)
+
+# Cheap metadata sniffing (no XML parse): dei facts in the instance document
+PERIOD_END_RE = re.compile(rb'DocumentPeriodEndDate[^>]*>\s*(\d{4}-\d{2}-\d{2})')
+FISCAL_YEAR_RE = re.compile(rb'DocumentFiscalYearFocus[^>]*>\s*(\d{4})')
+CIK_RE = re.compile(rb'EntityCentralIndexKey[^>]*>\s*(\d+)')
+FORM_RE = re.compile(rb'DocumentType[^>]*>\s*([0-9A-Za-z\-/]+)')
+
+# Source priority (lower wins when two files claim the same fiscal year)
+PRIORITY_STORE = 0
+PRIORITY_SUBDIR = 1
+PRIORITY_FLAT = 2
+PRIORITY_LEGACY = 3
+PRIORITY_UNDATED = 4
+
+# Parse status values
+STATUS_PENDING = 'pending'
+STATUS_OK = 'ok'
+STATUS_FAILED = 'failed'
+
+
+class FilingCatalog:
+    """
+    Incrementally maintained index of local XBRL files
+
+    Attributes:
+        data_dir: Directory scanned for legacy-named files
+        store: FilingStore whose database also holds the file index
+
+    Example:
+        >>> catalog = FilingCatalog.shared('data')
+        >>> catalog.files_for_ticker('AAPL')
+        {2025: PosixPath('data/filings/blobs/3f/...xml'), 2024: ...}
+        >>> catalog.tickers(['AAPL', 'MSFT', 'NVDA'])
+        ['AAPL', 'MSFT']
+        >>> catalog.mark_parsed(path, ok=False, error='Not XBRL')
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS files (
+            path         TEXT PRIMARY KEY,
+            ticker       TEXT NOT NULL,
+            cik          TEXT,
+            fiscal_year  INTEGER,
+            period_end   TEXT,
+            form         TEXT,
+            size         INTEGER NOT NULL,
+            mtime        REAL NOT NULL,
+            hash         TEXT,
+            priority     INTEGER NOT NULL,
+            parse_status TEXT NOT NULL DEFAULT 'pending',
+            parse_error  TEXT,
+            indexed_at   TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_files_ticker
+            ON files (ticker, fiscal_year);
+    """
+
+    INDEX_FILENAME = '.filing_catalog.sqlite'
+
+    # One catalog per data dir per process (see shared())
+    _shared: Dict[str, 'FilingCatalog'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        data_dir: Union[str, Path] = 'data',
+        store: Optional[FilingStore] = None
+    ):
+        """
+        Args:
+            data_dir: Directory with XBRL files
+            store: FilingStore to index (default: data_dir/filings if it
+                already exists - discovery never creates the store)
+        """
+        self.data_dir = Path(data_dir)
+        self._owns_store = store is None
+        self.store = store if store is not None else FilingStore.open_existing(self.data_dir)
+        self.index_path = self.data_dir / self.INDEX_FILENAME
+        self._lock = threading.Lock()
+
+        try:
+            self._conn = self._connect(str(self.index_path))
+        except sqlite3.Error:
+            # data_dir inexistente o de sólo lectura: índice en memoria
+            self._conn = self._connect(':memory:')
+
+        self._last_signature: Optional[Tuple] = None
+
+    def _connect(self, database: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(database, timeout=30, check_same_thread=False)
+        try:
+            if database != ':memory:':
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self.SCHEMA)
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    @classmethod
+    def shared(cls, data_dir: Union[str, Path] = 'data') -> 'FilingCatalog':
+        """
+        Process-wide catalog for a data dir
+
+        Repeated MultiFileXBRLParser / sector loads reuse the same index
+        instead of rescanning the directory per ticker. The directory is
+        only rescanned when its signature (data_dir and ticker subdirectory
+        mtimes + store catalog size) changed since the last refresh. Files
+        rewritten in place are picked up by refresh() / fingerprint().
+        """
+        key = str(Path(data_dir).resolve())
+        with cls._shared_lock:
+            catalog = cls._shared.get(key)
+            if catalog is None or (catalog.store is None and cls._store_exists(data_dir)):
+                # Store created since (e.g. by a downloader): re-attach to it.
+                # The old catalog is left to parsers still holding it.
+                catalog = cls(data_dir)
+                cls._shared[key] = catalog
+
+            signature = catalog._signature()
+            if signature != catalog._last_signature:
+                catalog.refresh()
+                catalog._last_signature = signature
+
+        return catalog
+
+    @staticmethod
+    def _store_exists(data_dir: Union[str, Path]) -> bool:
+        return (Path(data_dir) / FilingStore.DEFAULT_DIRNAME / FilingStore.CATALOG_FILENAME).exists()
+
+    def _signature(self) -> Tuple:
+        """Cheap change detector: data_dir + ticker subdir mtimes + store catalog rows"""
+        try:
+            dir_mtime = self.data_dir.stat().st_mtime_ns
+            with os.scandir(self.data_dir) as entries:
+                subdir_mtimes = tuple(sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in entries
+                    if entry.is_dir() and entry.name != FilingStore.DEFAULT_DIRNAME
+                ))
+        except OSError:
+            dir_mtime, subdir_mtimes = None, ()
+
+        store_rows: Tuple = ()
+        if self.store is not None:
+            with self.store._lock:
+                store_rows = tuple(self.store._conn.execute(
+                    "SELECT COUNT(*), MAX(recorded_at) FROM filings"
+                ).fetchone())
+
+        return (dir_mtime, subdir_mtimes, store_rows)
+
+    # ========================================================================
+    # INDEXING
+    # ========================================================================
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Incrementally synchronize the index with disk
+
+        - New or modified files (size/mtime changed) are read once to compute
+          hash and sniff dei metadata; their parse status resets to pending.
+        - Unchanged files are skipped after a stat() call.
+        - Rows for files that disappeared are removed.
+
+        Returns:
+            {'indexed': n_new_or_changed, 'unchanged': n, 'removed': n}
+        """
+        candidates = list(self._scan_legacy()) + list(self._scan_store())
+
+        with self._lock:
+            known = {
+                row[0]: (row[1], row[2])
+                for row in self._conn.execute("SELECT path, size, mtime FROM files")
+            }
+
+        indexed = unchanged = 0
+        seen = set()
+
+        for path, ticker, year, priority, meta in candidates:
+            key = str(path)
+            seen.add(key)
+
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            if known.get(key) == (stat.st_size, stat.st_mtime):
+                unchanged += 1
+                continue
+
+            self._index_file(path, ticker, year, priority, meta, stat)
+            indexed += 1
+
+        removed = [key for key in known if key not in seen]
+        with self._lock:
+            self._conn.executemany("DELETE FROM files WHERE path = ?", [(k,) for k in removed])
+            self._conn.commit()
+
+        return {'indexed': indexed, 'unchanged': unchanged, 'removed': len(removed)}
+
+    def _scan_legacy(self) -> Iterable[Tuple[Path, str, Optional[int], int, Dict]]:
+        """Single directory pass over data_dir (+ ticker subdirectories)"""
+        if not self.data_dir.exists():
+            return
+
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name == FilingStore.DEFAULT_DIRNAME:
+                        continue
+                    yield from self._scan_subdir(Path(entry.path))
+                    continue
+
+                if not entry.name.lower().endswith('.xml'):
+                    continue
+
+                match = FLAT_PATTERN.match(entry.name)
+                if match:
+                    yield (Path(entry.path), match['ticker'].upper(), int(match['year']),
+                           PRIORITY_FLAT, {})
+                    continue
+
+                match = LEGACY_PATTERN.match(entry.name)
+                if match:
+                    yield (Path(entry.path), match['ticker'].upper(), int(match['year']),
+                           PRIORITY_LEGACY, {})
+                    continue
+
+                match = UNDATED_PATTERN.match(entry.name)
+                if match:
+                    yield (Path(entry.path), match['ticker'].upper(), None,
+                           PRIORITY_UNDATED, {})
+
+    def _scan_subdir(self, subdir: Path) -> Iterable[Tuple[Path, str, Optional[int], int, Dict]]:
+        """{TICKER}/{TICKER}_{YEAR}_10K.xml files"""
+        ticker = subdir.name.upper()
+        with os.scandir(subdir) as entries:
+            for entry in entries:
+                match = SUBDIR_PATTERN.match(entry.name)
+                if match and match['ticker'].upper() == ticker:
+                    yield (Path(entry.path), ticker, int(match['year']),
+                           PRIORITY_SUBDIR, {})
+
+    def _scan_store(self) -> Iterable[Tuple[Path, str, Optional[int], int, Dict]]:
+        """Blobs registered in the FilingStore catalog under a ticker"""
+        if self.store is None:
+            return
+
+        with self.store._lock:
+            rows = self.store._conn.execute(
+                "SELECT ticker, cik, form, fiscal_year, blob_hash FROM filings "
+                "WHERE ticker IS NOT NULL ORDER BY recorded_at"
+            ).fetchall()
+
+        for ticker, cik, form, fiscal_year, blob_hash in rows:
+            yield (self.store.blob_path(blob_hash), ticker, fiscal_year, PRIORITY_STORE,
+                   {'cik': cik, 'form': form, 'hash': blob_hash})
+
+    def _index_file(
+        self,
+        path: Path,
+        ticker: str,
+        year: Optional[int],
+        priority: int,
+        meta: Dict,
+        stat: os.stat_result
+    ) -> None:
+        """Read file once: hash + dei metadata sniffing, then upsert"""
+        content = path.read_bytes()
+
+        sniffed_cik = CIK_RE.search(content)
+        sniffed_year = FISCAL_YEAR_RE.search(content)
+        sniffed_period = PERIOD_END_RE.search(content)
+        sniffed_form = FORM_RE.search(content)
+
+        cik = meta.get('cik') or (normalize_cik(sniffed_cik.group(1).decode()) if sniffed_cik else None)
+        form = meta.get('form') or (sniffed_form.group(1).decode().upper() if sniffed_form else '10-K')
+        blob_hash = meta.get('hash') or FilingStore.hash_content(content)
+        fiscal_year = year if year is not None else (
+            int(sniffed_year.group(1)) if sniffed_year else None
+        )
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO files
+                    (path, ticker, cik, fiscal_year, period_end, form, size, mtime,
+                     hash, priority, parse_status, parse_error, indexed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?)
+                """,
+                (
+                    str(path), ticker, cik, fiscal_year,
+                    sniffed_period.group(1).decode() if sniffed_period else None,
+                    form, stat.st_size, stat.st_mtime, blob_hash, priority,
+                    STATUS_PENDING, datetime.now().isoformat()
+                )
+            )
+            self._conn.commit()
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def files_for_ticker(
+        self,
+        ticker: str,
+        include_failed: bool = False
+    ) -> Dict[int, Path]:
+        """
+        Resolve {fiscal_year: path} for a ticker (indexed query)
+
+        Precedence per year follows the source priority (store first).
+        Undated files take their sniffed fiscal year if free, otherwise the
+        most recent year not already taken (legacy behaviour).
+
+        Args:
+            ticker: Stock ticker
+            include_failed: Also return files previously marked as failed
+
+        Returns:
+            Dict mapping fiscal year → filepath
+        """
+        query = (
+            "SELECT path, fiscal_year, priority FROM files "
+            "WHERE ticker = ?"
+        )
+        if not include_failed:
+            query += f" AND parse_status != '{STATUS_FAILED}'"
+        query += " ORDER BY priority, indexed_at DESC"
+
+        with self._lock:
+            rows = self._conn.execute(query, (ticker.upper(),)).fetchall()
+
+        files_by_year: Dict[int, Path] = {}
+        undated: List[Tuple[str, Optional[int]]] = []
+
+        for path, fiscal_year, priority in rows:
+            if priority == PRIORITY_UNDATED:
+                undated.append((path, fiscal_year))
+            elif fiscal_year is not None and fiscal_year not in files_by_year:
+                files_by_year[fiscal_year] = Path(path)
+
+        current_year = datetime.now().year
+        for path, fiscal_year in undated:
+            if fiscal_year is not None and fiscal_year not in files_by_year:
+                files_by_year[fiscal_year] = Path(path)
+                continue
+            for year in range(current_year, current_year - 5, -1):
+                if year not in files_by_year:
+                    files_by_year[year] = Path(path)
+                    break
+
+        return files_by_year
+
+    def tickers(self, universe: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Tickers with at least one dated, non-failed file
+
+        Args:
+            universe: Optional ticker list (e.g. sector companies) to intersect
+
+        Returns:
+            Sorted list of tickers (uppercase)
+        """
+        query = (
+            "SELECT DISTINCT ticker FROM files "
+            f"WHERE priority != {PRIORITY_UNDATED} AND parse_status != '{STATUS_FAILED}'"
+        )
+        params: List[str] = []
+
+        if universe is not None:
+            universe = [t.upper() for t in universe]
+            if not universe:
+                return []
+            query += f" AND ticker IN ({','.join('?' * len(universe))})"
+            params = universe
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        return sorted(row[0] for row in rows)
+
+    def get_record(self, path: Union[str, Path]) -> Optional[Dict]:
+        """Full index row for a file path (None if not indexed)"""
+        with self._lock:
+            cursor = self._conn.execute("SELECT * FROM files WHERE path = ?", (str(path),))
+            row = cursor.fetchone()
+            columns = [d[0] for d in cursor.description]
+
+        return dict(zip(columns, row)) if row else None
+
+    def fingerprint(self, tickers: Iterable[str]) -> str:
+        """
+        Content fingerprint of the filings available for a set of tickers
+
+        SHA-256 over (ticker, fiscal year, content hash) of every indexed
+        file, regardless of parse status (status is derived from content, so
+        a fresh catalog and one that already marked failures agree). Changes
+        when a filing is added, replaced or removed, so derived
+        artifacts (e.g. benchmark snapshots) can detect staleness without
+        re-parsing. Refreshes the index first (one stat() per file), so a
+        long-lived catalog never fingerprints a stale view of disk.
+
+        Args:
+            tickers: Tickers to include
+
+        Returns:
+            SHA-256 hex digest
+        """
+        tickers = sorted({t.upper() for t in tickers})
+        digest = hashlib.sha256()
+        if not tickers:
+            return digest.hexdigest()
+
+        self.refresh()
+
+        query = (
+            "SELECT ticker, fiscal_year, hash FROM files "
+            f"WHERE ticker IN ({','.join('?' * len(tickers))}) "
+            "ORDER BY ticker, fiscal_year, hash"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, tickers).fetchall()
+
+        for ticker, fiscal_year, blob_hash in rows:
+            digest.update(f"{ticker}|{fiscal_year}|{blob_hash}\n".encode())
+        return digest.hexdigest()
+
+    # ========================================================================
+    # PARSE STATUS
+    # ========================================================================
+
+    def mark_parsed(
+        self,
+        path: Union[str, Path],
+        ok: bool,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Record parse outcome for a file
+
+        Failed files are skipped by files_for_ticker() until their content
+        changes (refresh resets status) or reset_parse_status() is called.
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE files SET parse_status = ?, parse_error = ? WHERE path = ?",
+                (STATUS_OK if ok else STATUS_FAILED, None if ok else error, str(path))
+            )
+            self._conn.commit()
+
+    def reset_parse_status(self, ticker: Optional[str] = None) -> None:
+        """Mark files (all, or one ticker's) as pending again"""
+        query = f"UPDATE files SET parse_status = '{STATUS_PENDING}', parse_error = NULL"
+        params: Tuple = ()
+        if ticker:
+            query += " WHERE ticker = ?"
+            params = (ticker.upper(),)
+
+        with self._lock:
+            self._conn.execute(query, params)
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the index connection (and the store, if the catalog opened it)"""
+        with self._lock:
+            self._conn.close()
+        if self.store is not None and self._owns_store:
+            self.store.close()
+
+    def __repr__(self) -> str:
+        return f"FilingCatalog(data_dir='{self.data_dir}')"
@@ -0,0 +1,329 @@
+"""
+backend/parsers/filing_store.py
+Content-Addressed Filing Store - Single storage layer for every downloader
+
+Every XBRL instance document is stored exactly once, named by the SHA-256
+of its bytes. A SQLite catalog maps (CIK, form, fiscal year, accession)
+to the blob hash, so any tool (SECDownloader, HistoricalXBRLDownloader,
+download_tech_universe, MultiFileXBRLParser) can ask "do we already have
+this filing?" before touching the network or the filesystem.
+
+Layout:
+    data/filings/
+    ├── catalog.sqlite                 # (cik, form, fiscal_year, accession) → hash
+    └── blobs/
+        ├── 3f/3fa1...e9.xml           # content-addressed XBRL instance
+        └── a0/a07c...12.xml
+
+Features:
+- Deduplication: identical documents share one blob
+- Atomic writes: blobs land via atomic_write (temp file + os.replace)
+- Thread-safe catalog writes (shared by concurrent downloaders)
+- Ticker index for fast per-company lookups
+
+Author: @franklin
+Sprint 7 - Data Platform
+"""
+
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+from backend.utils.atomic_io import atomic_write
+
+
+def normalize_cik(cik: Union[str, int]) -> str:
+    """
+    Normalize CIK to SEC's 10-digit zero-padded form
+
+    Example:
+        >>> normalize_cik('320193')
+        '0000320193'
+    """
+    return str(cik).strip().lstrip('0').zfill(10)
+
+
+class FilingStore:
+    """
+    Content-addressed blob store with a (CIK, form, year, accession) catalog
+
+    Attributes:
+        root: Store root directory (default: 'data/filings')
+        blobs_dir: Directory holding content-addressed blobs
+        catalog_path: SQLite catalog file
+
+    Example:
+        >>> store = FilingStore('data/filings')
+        >>> path = store.put(xml_bytes, cik='320193', fiscal_year=2024,
+        ...                  accession='0000320193-24-000123', ticker='AAPL')
+        >>> store.lookup('320193', 2024)
+        PosixPath('data/filings/blobs/3f/3fa1...e9.xml')
+        >>> store.files_for_ticker('AAPL')
+        {2024: PosixPath('data/filings/blobs/3f/3fa1...e9.xml')}
+    """
+
+    DEFAULT_DIRNAME = 'filings'
+    CATALOG_FILENAME = 'catalog.sqlite'
+    BLOB_SUFFIX = '.xml'
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS blobs (
+            hash        TEXT PRIMARY KEY,
+            size        INTEGER NOT NULL,
+            stored_at   TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS filings (
+            cik         TEXT NOT NULL,
+            form        TEXT NOT NULL,
+            fiscal_year INTEGER NOT NULL,
+            accession   TEXT NOT NULL,
+            ticker      TEXT,
+            blob_hash   TEXT NOT NULL REFERENCES blobs(hash),
+            source_url  TEXT,
+            recorded_at TEXT NOT NULL,
+            PRIMARY KEY (cik, form, fiscal_year, accession)
+        );
+        CREATE INDEX IF NOT EXISTS idx_filings_ticker
+            ON filings (ticker, form, fiscal_year);
+    """
+
+    def __init__(self, root: Union[str, Path] = 'data/filings'):
+        """
+        Open (or create) a filing store
+
+        Args:
+            root: Store root directory. Created if missing.
+        """
+        self.root = Path(root)
+        self.blobs_dir = self.root / 'blobs'
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog_path = self.root / self.CATALOG_FILENAME
+
+        # Downloaders share one store across worker threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.catalog_path),
+            timeout=30,
+            check_same_thread=False
+        )
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def for_data_dir(cls, data_dir: Union[str, Path] = 'data') -> 'FilingStore':
+        """Store living at the conventional location inside a data dir"""
+        return cls(Path(data_dir) / cls.DEFAULT_DIRNAME)
+
+    @classmethod
+    def open_existing(cls, data_dir: Union[str, Path] = 'data') -> Optional['FilingStore']:
+        """
+        Open the store inside data_dir only if it was already created
+
+        Read-only consumers (parsers) use this so that merely looking for
+        files never creates an empty store as a side effect.
+        """
+        root = Path(data_dir) / cls.DEFAULT_DIRNAME
+        if not (root / cls.CATALOG_FILENAME).exists():
+            return None
+        return cls(root)
+
+    # ========================================================================
+    # BLOBS
+    # ========================================================================
+
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        """SHA-256 hex digest used as blob address"""
+        return hashlib.sha256(content).hexdigest()
+
+    def blob_path(self, blob_hash: str) -> Path:
+        """Filesystem path for a blob hash (2-char fan-out directory)"""
+        return self.blobs_dir / blob_hash[:2] / f"{blob_hash}{self.BLOB_SUFFIX}"
+
+    def has_blob(self, blob_hash: str) -> bool:
+        """True if blob is present on disk"""
+        return self.blob_path(blob_hash).exists()
+
+    def put_blob(self, content: bytes) -> str:
+        """
+        Store raw bytes, deduplicating by content hash
+
+        Args:
+            content: Document bytes
+
+        Returns:
+            Blob hash (SHA-256 hex)
+        """
+        blob_hash = self.hash_content(content)
+        path = self.blob_path(blob_hash)
+
+        if not path.exists():
+            atomic_write(path, lambda f: f.write(content))
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO blobs (hash, size, stored_at) VALUES (?, ?, ?)",
+                (blob_hash, len(content), datetime.now().isoformat())
+            )
+            self._conn.commit()
+
+        return blob_hash
+
+    # ========================================================================
+    # CATALOG
+    # ========================================================================
+
+    def put(
+        self,
+        content: bytes,
+        cik: Union[str, int],
+        fiscal_year: int,
+        accession: str,
+        form: str = '10-K',
+        ticker: Optional[str] = None,
+        source_url: Optional[str] = None
+    ) -> Path:
+        """
+        Store a filing document and register it in the catalog
+
+        Args:
+            content: Instance document bytes
+            cik: Company CIK (any padding)
+            fiscal_year: Fiscal year the filing covers
+            accession: SEC accession number ('0000320193-24-000123')
+            form: Filing form type (default: '10-K')
+            ticker: Optional ticker for per-company lookups
+            source_url: Optional URL the document came from
+
+        Returns:
+            Path to the stored blob
+        """
+        blob_hash = self.put_blob(content)
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO filings
+                    (cik, form, fiscal_year, accession, ticker,
+                     blob_hash, source_url, recorded_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    normalize_cik(cik),
+                    form.upper(),
+                    int(fiscal_year),
+                    accession,
+                    ticker.upper() if ticker else None,
+                    blob_hash,
+                    source_url,
+                    datetime.now().isoformat()
+                )
+            )
+            self._conn.commit()
+
+        return self.blob_path(blob_hash)
+
+    def lookup(
+        self,
+        cik: Union[str, int],
+        fiscal_year: int,
+        form: str = '10-K',
+        accession: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Find a stored filing by CIK (and optionally accession)
+
+        If several accessions exist for the same year (amendments), the
+        most recently recorded one wins.
+
+        Returns:
+            Blob path or None if not cataloged (or blob missing on disk)
+        """
+        query = (
+            "SELECT blob_hash FROM filings "
+            "WHERE cik = ? AND form = ? AND fiscal_year = ?"
+        )
+        params = [normalize_cik(cik), form.upper(), int(fiscal_year)]
+
+        if accession:
+            query += " AND accession = ?"
+            params.append(accession)
+
+        query += " ORDER BY recorded_at DESC LIMIT 1"
+
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+
+        return self._existing_blob(row)
+
+    def find(
+        self,
+        ticker: str,
+        fiscal_year: int,
+        form: str = '10-K'
+    ) -> Optional[Path]:
+        """Find a stored filing by ticker and fiscal year"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blob_hash FROM filings "
+                "WHERE ticker = ? AND form = ? AND fiscal_year = ? "
+                "ORDER BY recorded_at DESC LIMIT 1",
+                (ticker.upper(), form.upper(), int(fiscal_year))
+            ).fetchone()
+
+        return self._existing_blob(row)
+
+    def files_for_ticker(self, ticker: str, form: str = '10-K') -> Dict[int, Path]:
+        """
+        All stored fiscal years for a ticker
+
+        Returns:
+            {fiscal_year: blob_path} (latest recorded accession per year)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fiscal_year, blob_hash FROM filings "
+                "WHERE ticker = ? AND form = ? "
+                "ORDER BY fiscal_year, recorded_at",
+                (ticker.upper(), form.upper())
+            ).fetchall()
+
+        files = {}
+        for fiscal_year, blob_hash in rows:
+            path = self.blob_path(blob_hash)
+            if path.exists():
+                files[fiscal_year] = path  # later rows override (latest wins)
+
+        return files
+
+    def stats(self) -> Dict[str, int]:
+        """Catalog size and deduplication statistics"""
+        with self._lock:
+            filings = self._conn.execute("SELECT COUNT(*) FROM filings").fetchone()[0]
+            blobs, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs"
+            ).fetchone()
+
+        return {
+            'filings': filings,
+            'blobs': blobs,
+            'bytes': total_bytes,
+            'deduplicated': filings - blobs,
+        }
+
+    def close(self) -> None:
+        """Close the catalog connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _existing_blob(self, row) -> Optional[Path]:
+        if not row:
+            return None
+        path = self.blob_path(row[0])
+        return path if path.exists() else None
+
+    def __repr__(self) -> str:
+        return f"FilingStore(root='{self.root}')"
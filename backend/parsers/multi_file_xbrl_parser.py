@@ -17,6 +17,16 @@ Sprint 5 - Micro-Tarea 3:
 - MULTI-PATTERN: Soporta múltiples naming conventions
 - FLEXIBLE: No requiere hardcoded patterns por ticker
 
+Sprint 7 - Data Platform:
+- FILING STORE: Consulta primero el catálogo content-addressed (data/filings/)
+- Los naming conventions legacy quedan como fallback
+- FILING CATALOG: Discovery via índice SQLite persistente (sin glob/regex
+  por ticker); archivos que fallan al parsear quedan marcados y se omiten
+
+Sprint 8 - Universe-Scale Metrics:
+- TRACE STORE: Los parsers de todos los años comparten un TraceStore
+  (strings internados entre filings, 1 timestamp por filing)
+
 Author: @franklin
 Sprint: 5 - Micro-Tarea 3 (Benchmark Calculator) - AUTO-DISCOVERY
 """
@@ -25,12 +35,14 @@ import sys
 import os
 from pathlib import Path
 from typing import Dict, List, Optional
-import re
 
 # Add backend to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 from backend.parsers.xbrl_parser import XBRLParser
+from backend.parsers.filing_store import FilingStore
+from backend.parsers.filing_catalog import FilingCatalog
 from backend.engines.tracked_metric import SourceTrace
+from backend.engines.trace_store import TraceStore
 
 
 class MultiFileXBRLParser:
@@ -42,6 +54,7 @@ class MultiFileXBRLParser:
 
     SPRINT 5 - AUTO-DISCOVERY:
     - Detecta automáticamente archivos XBRL de cualquier ticker
+    - Consulta primero el FilingStore (catálogo por ticker/año fiscal)
     - Soporta múltiples naming conventions:
       1. {TICKER}_{YEAR}_10K.xml (nuevo - downloader)
       2. {ticker}_10k_{year}_xbrl.xml (legacy - Apple)
@@ -64,21 +77,41 @@ class MultiFileXBRLParser:
         # }
     """
 
-    def __init__(self, ticker: str = 'AAPL', data_dir: str = 'data'):
+    def __init__(
+        self,
+        ticker: str = 'AAPL',
+        data_dir: str = 'data',
+        store: Optional[FilingStore] = None,
+        catalog: Optional[FilingCatalog] = None
+    ):
         """
         Args:
             ticker: Símbolo bursátil (e.g., 'AAPL', 'MSFT', 'NVDA')
             data_dir: Directorio con archivos XBRL
+            store: FilingStore a indexar (default: data_dir/filings)
+            catalog: FilingCatalog a consultar (default: compartido por data_dir)
         """
         self.ticker = ticker.upper()
         self.data_dir = Path(data_dir)
+        self.store = store
+        self.catalog = catalog
 
         # Almacenar parsers para acceder a mapping gaps
         self.parsers: Dict[int, XBRLParser] = {}
 
+        # SourceTraces de todos los filings (struct-of-arrays)
+        self.trace_store = TraceStore()
+
         if not self.data_dir.exists():
             raise ValueError(f"Directorio no existe: {data_dir}")
 
+        if self.catalog is None:
+            if store is not None:
+                self.catalog = FilingCatalog(self.data_dir, store=store)
+                self.catalog.refresh()
+            else:
+                self.catalog = FilingCatalog.shared(self.data_dir)
+
         # Descubrir archivos disponibles (AUTO-DISCOVERY)
         self.files = self._discover_files()
 
@@ -96,63 +129,20 @@ class MultiFileXBRLParser:
         """
         AUTO-DISCOVERY: Detecta archivos XBRL automáticamente.
 
-        Soporta múltiples naming conventions:
+        Un solo query indexado al FilingCatalog (sin glob por ticker).
+        El catálogo indexa, en orden de precedencia:
+        0. FilingStore blobs (content-addressed)
         1. {TICKER}/{TICKER}_{YEAR}_10K.xml  (downloader - subdirectory)
         2. {TICKER}_{YEAR}_10K.xml           (downloader - flat)
         3. {ticker}_10k_{year}_xbrl.xml      (legacy Apple format)
         4. {ticker}_10k_xbrl.xml             (sin año - most recent)
 
+        Archivos que fallaron al parsear se omiten hasta que cambien.
+
         Returns:
             Dict mapeando año fiscal → filepath
         """
-        files_by_year = {}
-        ticker_lower = self.ticker.lower()
-        ticker_upper = self.ticker.upper()
-
-        # Pattern 1: {TICKER}/{TICKER}_{YEAR}_10K.xml (subdirectory)
-        ticker_subdir = self.data_dir / ticker_upper
-        if ticker_subdir.exists():
-            pattern1 = re.compile(rf'{ticker_upper}_(\d{{4}})_10K\.xml', re.IGNORECASE)
-            for filepath in ticker_subdir.glob('*.xml'):
-                match = pattern1.match(filepath.name)
-                if match:
-                    year = int(match.group(1))
-                    files_by_year[year] = filepath
-
-        # Pattern 2: {TICKER}_{YEAR}_10K.xml (flat directory)
-        pattern2 = re.compile(rf'{ticker_upper}_(\d{{4}})_10K\.xml', re.IGNORECASE)
-        for filepath in self.data_dir.glob('*.xml'):
-            match = pattern2.match(filepath.name)
-            if match:
-                year = int(match.group(1))
-                if year not in files_by_year:  # Don't override subdirectory files
-                    files_by_year[year] = filepath
-
-        # Pattern 3: {ticker}_10k_{year}_xbrl.xml (legacy Apple format)
-        pattern3 = re.compile(rf'{ticker_lower}_10k_(\d{{4}})_xbrl\.xml', re.IGNORECASE)
-        for filepath in self.data_dir.glob('*.xml'):
-            match = pattern3.match(filepath.name)
-            if match:
-                year = int(match.group(1))
-                if year not in files_by_year:
-                    files_by_year[year] = filepath
-
-        # Pattern 4: {ticker}_10k_xbrl.xml (sin año - assume most recent)
-        pattern4 = re.compile(rf'{ticker_lower}_10k_xbrl\.xml', re.IGNORECASE)
-        for filepath in self.data_dir.glob('*.xml'):
-            match = pattern4.match(filepath.name)
-            if match:
-                # Assign to most recent year not already taken
-                from datetime import datetime
-                current_year = datetime.now().year
-
-                # Try current year and previous years
-                for year in range(current_year, current_year - 5, -1):
-                    if year not in files_by_year:
-                        files_by_year[year] = filepath
-                        break
-
-        return files_by_year
+        return self.catalog.files_for_ticker(self.ticker)
 
     def get_available_years(self) -> List[int]:
         """
@@ -217,11 +207,12 @@ class MultiFileXBRLParser:
 
             try:
                 # Crear parser individual
-                parser = XBRLParser(str(filepath))
+                parser = XBRLParser(str(filepath), trace_store=self.trace_store)
 
                 # Cargar archivo (inicializa fuzzy mapper)
                 if not parser.load():
                     print(f"   ✗ Error cargando archivo")
+                    self.catalog.mark_parsed(filepath, ok=False, error='load failed')
                     continue
 
                 # Almacenar parser para mapping gaps
@@ -250,6 +241,7 @@ class MultiFileXBRLParser:
                     continue
 
                 result[year] = year_data
+                self.catalog.mark_parsed(filepath, ok=True)
                 print(f"   ✓ {len(year_data)} campos extraídos")
 
                 # Mostrar campos clave
@@ -268,6 +260,7 @@ class MultiFileXBRLParser:
 
             except Exception as e:
                 print(f"   ✗ Error procesando: {e}")
+                self.catalog.mark_parsed(filepath, ok=False, error=str(e))
                 continue
 
         print(f"\n{'='*60}")
@@ -6,15 +6,17 @@ Features:
 - Local-first: Check data/ directory before downloading
 - Auto-download: Fetch from SEC EDGAR if file missing
 - Batch processing: Download entire sectors efficiently
-- Manifest tracking: JSON log of downloads
+- Concurrent batches: N ticker pipelines under one shared per-host
+  rate budget, with per-endpoint circuit breaker and progress/ETA callback
+- Manifest tracking: SQLite (WAL) log of downloads, safe across processes
 - Error handling: Skip failed downloads, continue batch
 - Real SEC EDGAR integration: Parses filing pages, extracts XBRL URLs
 
 Architecture:
-1. Check local cache (data/ directory)
+1. Check local cache (FilingStore catalog, then legacy data/ filenames)
 2. If missing, query SEC EDGAR API
 3. Parse HTML response to find XBRL instance file
-4. Download and save to data/
+4. Download and save to the content-addressed FilingStore
 5. Update manifest for tracking
 
 Author: @franklin
@@ -23,14 +25,24 @@ Micro-Tarea 2.2: SEC Downloader (Hybrid Strategy)
 """
 
 import os
-import json
 import time
+import threading
 import requests
 from typing import Dict, Optional, List, Tuple
 from pathlib import Path
-from datetime import datetime
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 
+from backend.parsers.filing_store import FilingStore
+from backend.parsers.download_manifest import DownloadManifest
+from backend.parsers.batch_downloader import (
+    RateLimiter,
+    CircuitBreaker,
+    ProgressCallback,
+    guarded_request,
+    run_batch,
+)
+
 
 class SECDownloader:
     """
@@ -39,12 +51,15 @@ class SECDownloader:
     SEC EDGAR API Documentation:
     - Base URL: https://www.sec.gov/cgi-bin/browse-edgar
     - Requires User-Agent header with contact info
-    - Rate limit: 10 requests/second (we use 0.15s delays = ~6 req/s)
+    - Rate limit: 10 requests/second per host (we budget 8 req/s globally,
+      shared by every worker thread and downloader instance)
     - Response: HTML page with filing links
 
     Attributes:
         data_dir: Local cache directory (default: 'data/')
-        manifest_path: Download log (default: 'data/download_manifest.json')
+        store: Content-addressed FilingStore (default: 'data/filings/')
+        manifest: DownloadManifest (default: 'data/download_manifest.sqlite')
+        base_url: EDGAR root (override to point at a local stand-in server)
         sec_base_url: SEC EDGAR endpoint
         user_agent: Required by SEC (your email)
 
@@ -57,20 +72,32 @@ class SECDownloader:
         >>> # Batch download (sector)
         >>> files = downloader.download_sector_batch('MINING')
         >>> print(f"Downloaded {len(files)}/41 companies")
+        >>>
+        >>> # Concurrent batch (rate-limited, not latency-limited)
+        >>> files = downloader.download_sector_batch('MINING', max_workers=8)
     """
 
     # SEC EDGAR endpoints
+    SEC_ROOT_URL = "https://www.sec.gov"
     SEC_BASE_URL = "https://www.sec.gov/cgi-bin/browse-edgar"
     SEC_ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data"
 
-    # Rate limiting (SEC allows 10 req/s, we use 6-7 req/s to be safe)
-    REQUEST_DELAY = 0.15  # 150ms between requests
+    # Rate limiting (SEC allows 10 req/s per host, keep headroom)
+    MAX_REQUESTS_PER_SECOND = 8.0
+
+    # Circuit breaker: consecutive endpoint failures before failing fast
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_SECONDS = 30.0
 
     def __init__(
         self,
         data_dir: str = 'data',
         user_agent: str = 'financial-analyzer/1.0 (contact@xbrl-analyzer.com)',
-        verbose: bool = True
+        verbose: bool = True,
+        store: Optional[FilingStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        base_url: str = SEC_ROOT_URL
     ):
         """
         Initialize SEC downloader
@@ -79,6 +106,10 @@ class SECDownloader:
             data_dir: Directory for cached XBRL files
             user_agent: SEC requires User-Agent with contact info
             verbose: Print progress messages
+            store: Shared FilingStore (default: FilingStore in data_dir)
+            rate_limiter: Request budget (default: process-wide SEC limiter)
+            circuit_breaker: Per-endpoint breaker (default: one per downloader)
+            base_url: EDGAR root URL (e.g. a local EdgarStandIn for tests)
 
         Note:
             SEC EDGAR requires User-Agent header with email/contact.
@@ -89,69 +120,82 @@ class SECDownloader:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
 
-        self.manifest_path = self.data_dir / 'download_manifest.json'
+        self.store = store or FilingStore.for_data_dir(self.data_dir)
         self.user_agent = user_agent
         self.verbose = verbose
 
-        # Session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': self.user_agent,
-            'Accept-Encoding': 'gzip, deflate',
-            'Host': 'www.sec.gov'
-        })
+        # Endpoints (base_url override → stand-in server)
+        self.base_url = base_url.rstrip('/')
+        self.sec_base_url = f"{self.base_url}/cgi-bin/browse-edgar"
+        self.sec_archives_url = f"{self.base_url}/Archives/edgar/data"
+
+        # Shared request budget (per host) + endpoint health
+        self.rate_limiter = rate_limiter or RateLimiter.for_host(
+            urlparse(self.base_url).netloc, self.MAX_REQUESTS_PER_SECOND
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            self.CIRCUIT_FAILURE_THRESHOLD, self.CIRCUIT_RESET_SECONDS
+        )
+
+        # One session per worker thread (connection pooling, thread-safe)
+        self._local = threading.local()
 
-        # Load existing manifest
-        self.manifest = self._load_manifest()
+        # Download log (imports legacy download_manifest.json on first use)
+        self.manifest = DownloadManifest.for_data_dir(self.data_dir)
+        self.manifest_path = self.manifest.path
 
         if self.verbose:
             print(f"✓ SECDownloader initialized")
             print(f"  Data dir: {self.data_dir}")
             print(f"  User-Agent: {self.user_agent}")
-            print(f"  Manifest: {len(self.manifest.get('downloads', {}))} entries")
-
-    def _load_manifest(self) -> Dict:
+            print(f"  Manifest: {self.manifest.count()['downloads']} entries")
+
+    def _record_failure(self, ticker: str, reason: str, year: Optional[int] = None) -> None:
+        """Log a failed download in the manifest (single-row write)"""
+        self.manifest.record_failure(ticker, reason, year=year)
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for the calling thread (connection pooling)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': self.user_agent,
+                'Accept-Encoding': 'gzip, deflate'
+            })
+            self._local.session = session
+        return session
+
+    def _get(self, url: str, endpoint: str, **kwargs) -> requests.Response:
         """
-        Load download manifest from JSON
+        GET under the shared rate budget and the endpoint circuit breaker
 
-        Manifest tracks:
-        - Download history (timestamp, source)
-        - Failed downloads (for debugging)
-        - Performance metrics (download times)
+        Args:
+            url: Target URL
+            endpoint: Breaker key ('browse-edgar', 'archives')
+            **kwargs: params, timeout, ...
 
-        Returns:
-            Dict with 'downloads' and 'failed' keys
+        Raises:
+            CircuitOpenError: Endpoint tripped after repeated failures
+            requests.HTTPError: Non-2xx response
         """
-        if self.manifest_path.exists():
-            try:
-                with open(self.manifest_path, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                if self.verbose:
-                    print(f"⚠️  Corrupt manifest, creating new one")
-
-        # Default empty manifest
-        return {
-            'downloads': {},
-            'failed': {},
-            'metadata': {
-                'created': datetime.now().isoformat(),
-                'version': '1.0'
-            }
-        }
-
-    def _save_manifest(self) -> None:
-        """Save manifest to JSON"""
-        with open(self.manifest_path, 'w') as f:
-            json.dump(self.manifest, f, indent=2)
+        return guarded_request(
+            self.session, url, endpoint,
+            self.rate_limiter, self.circuit_breaker,
+            **kwargs
+        )
 
     def get_local_file(self, ticker: str, year: int = 2025) -> Optional[str]:
         """
         Check if XBRL file exists locally
 
-        Naming convention (observed from your data/):
-        - Pattern: {ticker.lower()}_10k_{year}_xbrl.xml
-        - Examples: aapl_10k_2025_xbrl.xml, msft_10k_2024_xbrl.xml
+        Lookup order:
+        1. FilingStore catalog (ticker + fiscal year)
+        2. Download manifest (indexed by ticker + year)
+        3. Legacy naming convention in data/:
+           {ticker.lower()}_10k_{year}_xbrl.xml
+           (e.g. aapl_10k_2025_xbrl.xml, msft_10k_2024_xbrl.xml)
 
         Args:
             ticker: Stock ticker (e.g., 'AAPL', 'BHP')
@@ -163,8 +207,20 @@ class SECDownloader:
         Example:
             >>> downloader = SECDownloader()
             >>> path = downloader.get_local_file('AAPL', 2025)
-            >>> # Returns: 'data/aapl_10k_2025_xbrl.xml' (if exists)
+            >>> # Returns: 'data/filings/blobs/3f/3fa1...e9.xml' (if cataloged)
         """
+        stored = self.store.find(ticker, year)
+        if stored:
+            if self.verbose:
+                print(f"  ✓ Store hit: {ticker} {year} ({stored.name[:12]}…)")
+            return str(stored)
+
+        recorded = self.manifest.lookup(ticker, year)
+        if recorded and Path(recorded).exists():
+            if self.verbose:
+                print(f"  ✓ Manifest hit: {ticker} {year} ({Path(recorded).name})")
+            return recorded
+
         filename = f"{ticker.lower()}_10k_{year}_xbrl.xml"
         filepath = self.data_dir / filename
 
@@ -194,7 +250,7 @@ class SECDownloader:
         """
         try:
             # SEC company search endpoint
-            url = f"https://www.sec.gov/cgi-bin/browse-edgar"
+            url = self.sec_base_url
             params = {
                 'action': 'getcompany',
                 'company': ticker,
@@ -204,9 +260,7 @@ class SECDownloader:
                 'count': '1'
             }
 
-            time.sleep(self.REQUEST_DELAY)  # Rate limiting
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            response = self._get(url, 'browse-edgar', params=params, timeout=10)
 
             # Parse HTML to extract CIK
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -252,7 +306,7 @@ class SECDownloader:
         """
         try:
             # Get filings for company
-            url = self.SEC_BASE_URL
+            url = self.sec_base_url
             params = {
                 'action': 'getcompany',
                 'CIK': cik,
@@ -262,9 +316,7 @@ class SECDownloader:
                 'count': '10'  # Last 10 filings
             }
 
-            time.sleep(self.REQUEST_DELAY)
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            response = self._get(url, 'browse-edgar', params=params, timeout=10)
 
             soup = BeautifulSoup(response.text, 'html.parser')
 
@@ -299,7 +351,7 @@ class SECDownloader:
                 href = doc_link['href']
                 accession = href.split('/')[-1]
 
-                filing_url = f"https://www.sec.gov{href}"
+                filing_url = f"{self.base_url}{href}"
 
                 return (accession, filing_url)
 
@@ -328,9 +380,7 @@ class SECDownloader:
             >>> # Returns: 'https://sec.gov/.../aapl-20250928_htm.xml'
         """
         try:
-            time.sleep(self.REQUEST_DELAY)
-            response = self.session.get(filing_url, timeout=10)
-            response.raise_for_status()
+            response = self._get(filing_url, 'archives', timeout=10)
 
             soup = BeautifulSoup(response.text, 'html.parser')
 
@@ -359,7 +409,7 @@ class SECDownloader:
                     doc_link = cols[2].find('a')
                     if doc_link:
                         href = doc_link['href']
-                        xbrl_url = f"https://www.sec.gov{href}"
+                        xbrl_url = f"{self.base_url}{href}"
                         return xbrl_url
 
                 # Alternative: Check filename pattern
@@ -368,7 +418,7 @@ class SECDownloader:
                     doc_link = cols[2].find('a')
                     if doc_link:
                         href = doc_link['href']
-                        xbrl_url = f"https://www.sec.gov{href}"
+                        xbrl_url = f"{self.base_url}{href}"
                         return xbrl_url
 
             return None
@@ -386,8 +436,8 @@ class SECDownloader:
         1. Get CIK number for ticker
         2. Find latest 10-K filing for year
         3. Parse filing page to find XBRL instance URL
-        4. Download XBRL file
-        5. Save to data/ directory
+        4. Download XBRL file (skipped if accession already stored)
+        5. Save to FilingStore (content-addressed, deduplicated)
         6. Update manifest
 
         Args:
@@ -399,7 +449,7 @@ class SECDownloader:
 
         Example:
             >>> filepath = downloader.download_from_sec('BHP', 2025)
-            >>> # Returns: 'data/bhp_10k_2025_xbrl.xml'
+            >>> # Returns: 'data/filings/blobs/a0/a07c...12.xml'
         """
         start_time = time.time()
 
@@ -412,10 +462,7 @@ class SECDownloader:
             if not cik:
                 if self.verbose:
                     print(f"  ✗ CIK not found for {ticker}")
-                if 'failed' not in self.manifest:
-                    self.manifest['failed'] = {}
-                self.manifest['failed'][ticker] = f"CIK not found"
-                self._save_manifest()
+                self._record_failure(ticker, "CIK not found")
                 return None
 
             if self.verbose:
@@ -426,58 +473,57 @@ class SECDownloader:
             if not filing_info:
                 if self.verbose:
                     print(f"  ✗ No 10-K filing found for {year}")
-                if 'failed' not in self.manifest:
-                    self.manifest['failed'] = {}
-                self.manifest['failed'][ticker] = f"No 10-K for {year}"
-                self._save_manifest()
+                self._record_failure(ticker, f"No 10-K for {year}", year=year)
                 return None
 
             accession, filing_url = filing_info
             if self.verbose:
                 print(f"    Accession: {accession}")
 
+            # Another tool may already have stored this exact filing
+            stored = self.store.lookup(cik, year, accession=accession)
+            if stored:
+                if self.verbose:
+                    print(f"  ✓ Already in store: {accession}")
+                return str(stored)
+
             # Step 3: Extract XBRL URL
             xbrl_url = self._extract_xbrl_url(filing_url)
             if not xbrl_url:
                 if self.verbose:
                     print(f"  ✗ XBRL instance not found in filing")
-                if 'failed' not in self.manifest:
-                    self.manifest['failed'] = {}
-                self.manifest['failed'][ticker] = f"XBRL not found in filing"
-                self._save_manifest()
+                self._record_failure(ticker, "XBRL not found in filing", year=year)
                 return None
 
             if self.verbose:
                 print(f"    XBRL URL: {xbrl_url.split('/')[-1]}")
 
             # Step 4: Download XBRL
-            time.sleep(self.REQUEST_DELAY)
-            response = self.session.get(xbrl_url, timeout=30)
-            response.raise_for_status()
-
-            # Step 5: Save to data/
-            filename = f"{ticker.lower()}_10k_{year}_xbrl.xml"
-            filepath = self.data_dir / filename
-
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            response = self._get(xbrl_url, 'archives', timeout=30)
+
+            # Step 5: Save to content-addressed store
+            filepath = self.store.put(
+                response.content,
+                cik=cik,
+                fiscal_year=year,
+                accession=accession,
+                ticker=ticker,
+                source_url=xbrl_url
+            )
 
             download_time = time.time() - start_time
 
             # Step 6: Update manifest
-            self.manifest['downloads'][ticker] = {
-                'last_download': datetime.now().isoformat(),
-                'year': year,
-                'filepath': str(filepath),
-                'source': 'sec_edgar',
-                'download_time_seconds': round(download_time, 2),
-                'cik': cik,
-                'accession': accession
-            }
-            self._save_manifest()
+            self.manifest.record_download(
+                ticker, year, filepath,
+                source='sec_edgar',
+                download_time=download_time,
+                cik=cik,
+                accession=accession
+            )
 
             if self.verbose:
-                print(f"  ✓ Downloaded: {filename} ({download_time:.2f}s)")
+                print(f"  ✓ Downloaded: {ticker} {year} → {filepath.name[:12]}… ({download_time:.2f}s)")
 
             return str(filepath)
 
@@ -485,10 +531,7 @@ class SECDownloader:
             if self.verbose:
                 print(f"  ✗ Download failed: {e}")
 
-            if 'failed' not in self.manifest:
-                self.manifest['failed'] = {}
-            self.manifest['failed'][ticker] = str(e)
-            self._save_manifest()
+            self._record_failure(ticker, str(e), year=year)
             return None
 
     def get_or_download(self, ticker: str, year: int = 2025) -> Optional[str]:
@@ -512,7 +555,7 @@ class SECDownloader:
         Example:
             >>> downloader = SECDownloader()
             >>> filepath = downloader.get_or_download('AAPL', 2025)
-            >>> # Returns: 'data/aapl_10k_2025_xbrl.xml'
+            >>> # Returns: 'data/filings/blobs/3f/3fa1...e9.xml'
             >>> # (from cache if exists, otherwise downloads)
         """
         # Try local first
@@ -526,32 +569,83 @@ class SECDownloader:
 
         return self.download_from_sec(ticker, year)
 
+    def download_batch(
+        self,
+        tickers: List[str],
+        years: List[int],
+        max_workers: int = 8,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Dict[int, str]]:
+        """
+        Concurrent hybrid download of (ticker, year) pairs
+
+        Every pair runs get_or_download() in a worker thread. All requests
+        go through the shared RateLimiter, so throughput is bounded by the
+        SEC rate cap instead of one-request-at-a-time latency. Endpoints
+        that keep failing trip the circuit breaker and fail fast.
+
+        Args:
+            tickers: Stock tickers
+            years: Fiscal years to fetch per ticker
+            max_workers: Concurrent ticker pipelines
+            progress_callback: Called as (ticker, done, total, eta_seconds)
+                after each (ticker, year) completes
+
+        Returns:
+            {ticker: {year: filepath}} for successful downloads
+
+        Example:
+            >>> files = downloader.download_batch(['AAPL', 'MSFT'], [2024, 2023])
+            >>> files['AAPL'][2024]
+            'data/filings/blobs/3f/3fa1...e9.xml'
+        """
+        tasks = [(ticker, year) for ticker in tickers for year in years]
+
+        outcomes = run_batch(
+            tasks,
+            lambda task: self.get_or_download(*task),
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+            label=lambda task: task[0]
+        )
+
+        results: Dict[str, Dict[int, str]] = {}
+        for (ticker, year), filepath in outcomes.items():
+            if filepath:
+                results.setdefault(ticker, {})[year] = filepath
+
+        return results
+
     def download_sector_batch(
         self,
         sector_code: str,
         year: int = 2025,
-        max_companies: Optional[int] = None
+        max_companies: Optional[int] = None,
+        max_workers: int = 1,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Dict[str, str]:
         """
         Download all companies in a sector (batch processing)
 
         Features:
-        - Progress tracking
+        - Progress tracking (stdout or progress_callback)
         - Error resilience (continues on failures)
         - Performance metrics
-        - Respects SEC rate limits
+        - Respects SEC rate limits (shared budget across workers)
 
         Args:
             sector_code: 'TECH', 'MINING', 'OIL_GAS', 'RETAIL'
             year: Fiscal year (default: 2025)
             max_companies: Limit number of downloads (for testing)
+            max_workers: Concurrent ticker pipelines (1 = sequential)
+            progress_callback: Called as (ticker, done, total, eta_seconds)
 
         Returns:
             {ticker: filepath} for successful downloads
 
         Example:
             >>> downloader = SECDownloader()
-            >>> files = downloader.download_sector_batch('MINING')
+            >>> files = downloader.download_sector_batch('MINING', max_workers=8)
             >>> print(f"Downloaded {len(files)}/41 MINING companies")
         """
         from backend.config import get_sector_companies
@@ -568,32 +662,41 @@ class SECDownloader:
             print(f"{'='*60}")
             print(f"Companies: {len(companies)}")
             print(f"Year: {year}")
-            print(f"Rate limit: {1/self.REQUEST_DELAY:.1f} req/s")
+            print(f"Workers: {max_workers}")
+            print(f"Rate limit: {self.rate_limiter.rate:.1f} req/s")
             print()
 
-        results = {}
-        failed = []
+        def report_progress(ticker: str, done: int, total: int, eta: float) -> None:
+            if progress_callback:
+                progress_callback(ticker, done, total, eta)
+            if self.verbose and done % 5 == 0:
+                print(f"  Progress: {done}/{total} ({done/total*100:.1f}%) | "
+                      f"ETA: {eta/60:.1f}m")
+
         start_time = time.time()
 
-        for i, ticker in enumerate(companies, 1):
-            if self.verbose:
-                print(f"[{i}/{len(companies)}] {ticker}")
+        if max_workers > 1:
+            downloaded = self.download_batch(
+                companies, [year],
+                max_workers=max_workers,
+                progress_callback=report_progress
+            )
+            results = {ticker: files[year] for ticker, files in downloaded.items()}
+        else:
+            results = {}
+            for i, ticker in enumerate(companies, 1):
+                if self.verbose:
+                    print(f"[{i}/{len(companies)}] {ticker}")
 
-            filepath = self.get_or_download(ticker, year)
+                filepath = self.get_or_download(ticker, year)
 
-            if filepath:
-                results[ticker] = filepath
-            else:
-                failed.append(ticker)
+                if filepath:
+                    results[ticker] = filepath
 
-            # Progress indicator
-            if self.verbose and i % 5 == 0:
                 elapsed = time.time() - start_time
-                rate = i / elapsed if elapsed > 0 else 0
-                eta = (len(companies) - i) / rate if rate > 0 else 0
-                print(f"  Progress: {i}/{len(companies)} ({i/len(companies)*100:.1f}%) | "
-                      f"Rate: {rate:.1f} co/s | ETA: {eta/60:.1f}m")
+                report_progress(ticker, i, len(companies), elapsed / i * (len(companies) - i))
 
+        failed = [ticker for ticker in companies if ticker not in results]
         total_time = time.time() - start_time
 
         if self.verbose:
@@ -635,23 +738,35 @@ def download_company(ticker: str, year: int = 2025, **kwargs) -> Optional[str]:
     return downloader.get_or_download(ticker, year)
 
 
-def download_sector(sector_code: str, year: int = 2025, **kwargs) -> Dict[str, str]:
+def download_sector(
+    sector_code: str,
+    year: int = 2025,
+    max_workers: int = 1,
+    progress_callback: Optional[ProgressCallback] = None,
+    **kwargs
+) -> Dict[str, str]:
     """
     Convenience function to download entire sector
 
     Args:
         sector_code: Sector code from sectors.py
         year: Fiscal year
+        max_workers: Concurrent ticker pipelines (1 = sequential)
+        progress_callback: Called as (ticker, done, total, eta_seconds)
         **kwargs: Additional args for SECDownloader
 
     Returns:
         {ticker: filepath} dict
 
     Example:
-        >>> files = download_sector('MINING', 2025)
+        >>> files = download_sector('MINING', 2025, max_workers=8)
     """
     downloader = SECDownloader(**kwargs)
-    return downloader.download_sector_batch(sector_code, year)
+    return downloader.download_sector_batch(
+        sector_code, year,
+        max_workers=max_workers,
+        progress_callback=progress_callback
+    )
 
 
 # ============================================================================
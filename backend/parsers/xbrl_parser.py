@@ -27,6 +27,11 @@ Cambios Sprint 6 - Issue #001 FIX:
 - FIX: Manejo graceful de años sin income context
 - MEJORA: Logging detallado de core fields faltantes
 
+Cambios Sprint 8 - Universe-Scale Metrics:
+- SourceTraces se guardan en un TraceStore (struct-of-arrays): tag,
+  contexto y sección internados, 1 timestamp de extracción por filing
+- Los valores retornados son TraceView (isinstance SourceTrace)
+
 Cambios Transparency Engine:
 - Retorna SourceTrace en lugar de floats
 - Metadata completa de origen XBRL (tag, context, timestamp)
@@ -38,7 +43,6 @@ Sprint: 6 - Multi-Sector Expansion - Issue #001 Fix
 
 from lxml import etree
 from typing import Dict, Optional, List, Any
-from datetime import datetime
 import time
 import sys
 import os
@@ -47,6 +51,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 from backend.engines.context_manager import ContextManager
 from backend.engines.tracked_metric import SourceTrace
+from backend.engines.trace_store import TraceStore
 from backend.parsers.taxonomy_resolver import TaxonomyResolver
 from backend.parsers.fuzzy_mapper import FuzzyMapper
 
@@ -135,12 +140,16 @@ class XBRLParser:
         'CapitalExpenditures': ['PaymentsToAcquirePropertyPlantAndEquipment'],
     }
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, trace_store: Optional[TraceStore] = None):
         """
         Args:
             filepath: Ruta al archivo XBRL
+            trace_store: TraceStore compartido (ej: todos los filings de una
+                         empresa); default: uno propio
         """
         self.filepath = filepath
+        self.trace_store = trace_store if trace_store is not None else TraceStore()
+        self._filing = None  # Id en trace_store (1 timestamp por filing)
         self.tree = None
         self.root = None
         self.namespaces = {}
@@ -353,15 +362,16 @@ class XBRLParser:
                     raw_value = float(elem.text)
 
                     if raw_value > 1000:  # Filtro básico para valores grandes
-                        # Crear SourceTrace con metadata completa
-                        trace = SourceTrace(
-                            xbrl_tag=tag_name,  # Tag resuelto (sin namespace)
-                            raw_value=raw_value,
-                            context_id=target_context,
-                            extracted_at=datetime.now(),
-                            section=section
+                        # SourceTrace (TraceView) con metadata completa
+                        if self._filing is None:
+                            self._filing = self.trace_store.add_filing()
+                        return self.trace_store.append(
+                            self._filing,
+                            tag_name,  # Tag resuelto (sin namespace)
+                            raw_value,
+                            target_context,
+                            section
                         )
-                        return trace
 
                 except ValueError:
                     continue
@@ -0,0 +1,28 @@
+"""
+Pipeline Module - End-to-end orchestration
+DAG de stages (parse → metrics → signals / peers / stories → report)
+con cache de outputs por fingerprint de inputs.
+"""
+from backend.pipeline.orchestrator import (
+    Pipeline,
+    PipelineRun,
+    Stage,
+    StageStore,
+    StageTiming,
+)
+from backend.pipeline.report_pipeline import (
+    build_report_pipeline,
+    run_report_pipeline,
+    sector_peers,
+)
+
+__all__ = [
+    'Pipeline',
+    'PipelineRun',
+    'Stage',
+    'StageStore',
+    'StageTiming',
+    'build_report_pipeline',
+    'run_report_pipeline',
+    'sector_peers',
+]
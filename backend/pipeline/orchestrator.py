@@ -0,0 +1,454 @@
+"""
+Pipeline Orchestrator - DAG de stages con cache por fingerprint
+
+Cada stage declara sus dependencias; el orchestrator calcula una clave
+por stage antes de ejecutar nada:
+
+    key(stage) = sha256(name, version, params, source fingerprint,
+                        key(dep) for dep in deps)
+
+Las claves sólo dependen de los inputs (filings, parámetros, versión del
+código del stage), no de los outputs, así que se conocen de antemano:
+
+- Output persistido con esa clave → se carga de disco y sus dependencias
+  ni siquiera se ejecutan (ej: reporte cacheado = 0 parsing)
+- Stages listos (deps resueltas) corren en paralelo en un thread pool
+  (ej: signals, peers y stories sólo dependen de metrics + benchmarks)
+- Timing por stage (segundos, cached o no) en PipelineRun
+
+Usage:
+    pipeline = Pipeline([
+        Stage('parse', parse, fingerprint=lambda: catalog.fingerprint(tickers)),
+        Stage('metrics', metrics, deps=('parse',)),
+        Stage('signals', signals, deps=('metrics',)),
+        Stage('stories', stories, deps=('metrics',)),
+        Stage('report', report, deps=('signals', 'stories')),
+    ], store=StageStore('data/pipeline_cache'))
+
+    run = pipeline.run()
+    print(run.summary())
+    report = run.outputs['report']
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from backend.utils.atomic_io import atomic_write
+
+
+@dataclass
+class Stage:
+    """
+    Nodo del DAG
+
+    Attributes:
+        name: Nombre único (también el kwarg con que recibe su output cada dependiente)
+        func: Callable(**{dep: output}) → output
+        deps: Stages de los que depende
+        params: Parámetros JSON-serializables que afectan el output (van a la clave)
+        fingerprint: Opcional - callable() → str del input externo (ej: filings)
+        version: Subir cuando cambia la lógica del stage (invalida el cache)
+        persist: Guardar el output en el StageStore (False = siempre se ejecuta)
+    """
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    params: Dict = field(default_factory=dict)
+    fingerprint: Optional[Callable[[], str]] = None
+    version: int = 1
+    persist: bool = True
+
+
+@dataclass
+class StageTiming:
+    """Resultado de un stage en una corrida."""
+    name: str
+    key: str
+    seconds: float
+    cached: bool
+
+
+@dataclass
+class PipelineRun:
+    """
+    Resultado de Pipeline.run()
+
+    Attributes:
+        outputs: {stage: output} de los stages ejecutados o cargados
+        timings: StageTiming en orden de finalización
+        elapsed: Segundos totales (wall clock)
+    """
+    outputs: Dict[str, Any]
+    timings: List[StageTiming]
+    elapsed: float
+
+    def timing(self, name: str) -> Optional[StageTiming]:
+        """StageTiming de un stage (None si no se necesitó)."""
+        return next((t for t in self.timings if t.name == name), None)
+
+    def summary(self) -> str:
+        """Tabla de timings por stage."""
+        lines = [f"{'Stage':<12} {'Time':>8}  Source", "-" * 32]
+        for timing in self.timings:
+            source = "cache" if timing.cached else "run"
+            lines.append(f"{timing.name:<12} {timing.seconds:>7.2f}s  {source}")
+        lines.append("-" * 32)
+        lines.append(f"{'TOTAL':<12} {self.elapsed:>7.2f}s")
+        return '\n'.join(lines)
+
+
+class StageStore:
+    """
+    Outputs de stages en disco: root/{stage}/{key[:2]}/{key}.pkl
+
+    Escrituras atómicas (atomic_write). LRU por tamaño, como
+    MetricsResultCache: cada load actualiza mtime; al superar max_bytes
+    se borran las entradas menos usadas.
+
+    Attributes:
+        root: Directorio del store (default: 'data/pipeline_cache')
+        max_bytes: Tamaño máximo en disco antes de evictar (LRU)
+        evictions: Entradas borradas por el límite desde la creación
+    """
+
+    SUFFIX = '.pkl'
+    DEFAULT_MAX_BYTES = 1024 ** 3
+
+    def __init__(
+        self,
+        root: Union[str, Path] = 'data/pipeline_cache',
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Args:
+            root: Directorio del store (se crea si no existe)
+            max_bytes: Límite de tamaño en disco
+
+        Raises:
+            ValueError: Si max_bytes <= 0
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._bytes = sum(path.stat().st_size for path in self._entries())
+
+    def _path(self, name: str, key: str) -> Path:
+        return self.root / name / key[:2] / f"{key}{self.SUFFIX}"
+
+    def _entries(self):
+        return self.root.glob(f"*/*/*{self.SUFFIX}")
+
+    def has(self, name: str, key: str) -> bool:
+        return self._path(name, key).exists()
+
+    def load(self, name: str, key: str) -> Any:
+        """
+        Output guardado
+
+        Raises:
+            KeyError: Si no existe o está corrupto (la entrada se borra)
+        """
+        path = self._path(name, key)
+        try:
+            with open(path, 'rb') as f:
+                output = pickle.load(f)
+        except FileNotFoundError:
+            raise KeyError(f"{name}:{key}") from None
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self._remove(path)
+            raise KeyError(f"{name}:{key}") from None
+
+        try:
+            os.utime(path)  # LRU: marca como usada recientemente
+        except OSError:
+            pass
+        return output
+
+    def save(self, name: str, key: str, output: Any) -> Path:
+        """Guarda un output (escritura atómica)."""
+        path = self._path(name, key)
+        previous = path.stat().st_size if path.exists() else 0
+        atomic_write(path, lambda f: pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+        with self._lock:
+            self._bytes += path.stat().st_size - previous
+        if self._bytes > self.max_bytes:
+            self._evict()
+        return path
+
+    def _remove(self, path: Path) -> int:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return 0
+        with self._lock:
+            self._bytes -= size
+        return size
+
+    def _evict(self) -> None:
+        """Borra entradas menos usadas (mtime) hasta quedar bajo max_bytes."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        # Re-sincroniza el tamaño (otros procesos pueden compartir el store)
+        with self._lock:
+            self._bytes = sum(size for _, size, _ in entries)
+
+        for _, _, path in sorted(entries, key=lambda entry: entry[0]):
+            if self._bytes <= self.max_bytes:
+                break
+            if self._remove(path):
+                with self._lock:
+                    self.evictions += 1
+
+
+class Pipeline:
+    """
+    DAG de Stages con cache por fingerprint de inputs
+
+    Attributes:
+        stages: {name: Stage} en orden topológico
+        store: StageStore opcional (None = sin persistencia)
+        max_workers: Threads para stages independientes
+    """
+
+    def __init__(
+        self,
+        stages: Iterable[Stage],
+        store: Optional[StageStore] = None,
+        max_workers: int = 4,
+        verbose: bool = False
+    ):
+        """
+        Args:
+            stages: Stages del DAG (cualquier orden)
+            store: StageStore para persistir outputs
+            max_workers: Threads para stages independientes
+            verbose: Imprimir cada stage al terminar
+
+        Raises:
+            ValueError: Nombres duplicados, dependencias desconocidas o ciclos
+        """
+        stages = list(stages)
+        by_name: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in by_name:
+                raise ValueError(f"Duplicate stage: {stage.name}")
+            by_name[stage.name] = stage
+
+        for stage in stages:
+            unknown = [dep for dep in stage.deps if dep not in by_name]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {unknown}")
+
+        self.stages = {name: by_name[name] for name in self._topological_order(by_name)}
+        self.store = store
+        self.max_workers = max(1, max_workers)
+        self.verbose = verbose
+
+    @staticmethod
+    def _topological_order(stages: Dict[str, Stage]) -> List[str]:
+        order: List[str] = []
+        state: Dict[str, int] = {}   # 1 = visiting, 2 = done
+
+        def visit(name: str, path: Tuple[str, ...]):
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Cycle in pipeline: {' → '.join(path + (name,))}")
+            state[name] = 1
+            for dep in stages[name].deps:
+                visit(dep, path + (name,))
+            state[name] = 2
+            order.append(name)
+
+        for name in stages:
+            visit(name, ())
+        return order
+
+    def keys(self) -> Dict[str, str]:
+        """Clave (sha256) de cada stage, en orden topológico."""
+        keys: Dict[str, str] = {}
+        for name, stage in self.stages.items():
+            payload = json.dumps({
+                'name': name,
+                'version': stage.version,
+                'params': stage.params,
+                'source': stage.fingerprint() if stage.fingerprint else None,
+                'deps': [keys[dep] for dep in stage.deps],
+            }, sort_keys=True, default=str)
+            keys[name] = hashlib.sha256(payload.encode()).hexdigest()
+        return keys
+
+    def _cached(self, name: str, key: str, force: Set[str]) -> bool:
+        stage = self.stages[name]
+        return (
+            self.store is not None and stage.persist and name not in force
+            and self.store.has(name, key)
+        )
+
+    def plan(
+        self,
+        targets: Optional[Iterable[str]] = None,
+        force: Iterable[str] = ()
+    ) -> Tuple[Dict[str, str], List[str], Set[str]]:
+        """
+        Stages necesarios para producir targets
+
+        Un stage cacheado no arrastra a sus dependencias. El store se
+        consulta una sola vez por stage: run() ejecuta exactamente este plan.
+
+        Returns:
+            (keys, needed, hits) - needed en orden topológico, hits = stages
+            de needed que se cargan del cache
+        """
+        keys = self.keys()
+        force = set(force)
+        targets = list(targets) if targets is not None else [
+            name for name in self.stages
+            if not any(name in other.deps for other in self.stages.values())
+        ]
+        unknown = [t for t in targets if t not in self.stages]
+        if unknown:
+            raise ValueError(f"Unknown target stages: {unknown}")
+
+        needed, hits = set(targets), set()
+        for name in reversed(list(self.stages)):
+            if name not in needed:
+                continue
+            if self._cached(name, keys[name], force):
+                hits.add(name)
+            else:
+                needed.update(self.stages[name].deps)
+
+        return keys, [name for name in self.stages if name in needed], hits
+
+    def run(
+        self,
+        targets: Optional[Iterable[str]] = None,
+        force: Iterable[str] = ()
+    ) -> PipelineRun:
+        """
+        Ejecuta (o carga del cache) los stages necesarios para targets
+
+        Args:
+            targets: Stages a producir (None = los que no tienen dependientes)
+            force: Stages a re-ejecutar aunque estén cacheados
+
+        Returns:
+            PipelineRun
+
+        Raises:
+            RuntimeError: Si un stage falla (con el error original como causa)
+        """
+        start = time.perf_counter()
+        force = set(force)
+        while True:
+            keys, needed, hits = self.plan(targets, force)
+            try:
+                outputs, timings = self._execute(keys, needed, hits)
+                break
+            except _CacheMiss as miss:
+                # Entrada borrada/corrupta entre plan() y load(): re-planificar
+                # forzando ese stage para que arrastre a sus dependencias
+                if self.verbose:
+                    print(f"   ⚠️  {miss.name}: cached output unreadable, re-planning")
+                force.add(miss.name)
+
+        return PipelineRun(outputs=outputs, timings=timings, elapsed=time.perf_counter() - start)
+
+    def _execute(
+        self,
+        keys: Dict[str, str],
+        needed: List[str],
+        hits: Set[str]
+    ) -> Tuple[Dict[str, Any], List[StageTiming]]:
+        """
+        Ejecuta un plan: hits se cargan del store, el resto corre cuando sus deps están listas
+
+        Raises:
+            _CacheMiss: Si un hit planificado ya no se puede cargar
+            RuntimeError: Si un stage falla
+        """
+        outputs: Dict[str, Any] = {}
+        timings: List[StageTiming] = []
+        remaining = list(needed)
+        running = {}
+
+        def execute(name: str) -> Tuple[Any, StageTiming]:
+            stage, key = self.stages[name], keys[name]
+            stage_start = time.perf_counter()
+            if name in hits:
+                try:
+                    output = self.store.load(name, key)
+                except KeyError:
+                    raise _CacheMiss(name) from None
+                return output, StageTiming(name, key, time.perf_counter() - stage_start, True)
+
+            output = stage.func(**{dep: outputs[dep] for dep in stage.deps})
+            if self.store is not None and stage.persist:
+                self.store.save(name, key, output)
+            return output, StageTiming(name, key, time.perf_counter() - stage_start, False)
+
+        def ready(name: str) -> bool:
+            # Hit: sus deps no están en needed
+            return name in hits or all(dep in outputs for dep in self.stages[name].deps)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while remaining or running:
+                for name in [n for n in remaining if ready(n)]:
+                    remaining.remove(name)
+                    running[pool.submit(execute, name)] = name
+
+                if not running:
+                    raise RuntimeError(f"Pipeline stalled: stages {remaining} have unresolved inputs")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        output, timing = future.result()
+                    except Exception as e:
+                        for other in running:
+                            other.cancel()
+                        if isinstance(e, _CacheMiss):
+                            raise
+                        raise RuntimeError(f"Stage '{name}' failed: {e}") from e
+
+                    outputs[name] = output
+                    timings.append(timing)
+                    if self.verbose:
+                        source = "cache" if timing.cached else "run"
+                        print(f"   ✓ {name:<10} {timing.seconds:6.2f}s ({source})")
+
+        return outputs, timings
+
+
+class _CacheMiss(Exception):
+    """Un hit del plan ya no está en el store (borrado o corrupto)."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.name = name
@@ -0,0 +1,231 @@
+"""
+Report Pipeline - parse → metrics → signals / peers / stories → report
+
+Conecta los componentes reales como un DAG de Stages:
+
+    parse ──▶ metrics ──▶ benchmarks ──┬──▶ signals ──┐
+                  │                    └──▶ peers ────┼──▶ report ──▶ export
+                  └──────────────────────▶ stories ───┘
+
+    parse       MultiFileXBRLParser.extract_timeseries (empresa + peers)
+    metrics     calculate_metrics por empresa (MetricsResultCache opcional)
+    benchmarks  StatisticalBenchmarkEngine del grupo
+    signals     SignalDetector.detect_all()
+    peers       PeerComparison.compare_all()
+    stories     StoryGenerator (company_stories)
+    report      ReportBuilder.build_report
+    export      export_markdown → {output_dir}/{ticker}.md (no se cachea)
+
+La clave de parse es el fingerprint del FilingCatalog de los tickers: si
+ningún filing cambió, una segunda corrida carga el reporte del cache sin
+parsear ni calcular nada.
+
+Usage:
+    from backend.pipeline import run_report_pipeline
+
+    run = run_report_pipeline('AAPL', sector_code='TECH', output_dir='outputs/reports')
+    print(run.summary())
+    report = run.outputs['report']
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+from pathlib import Path
+from typing import List, Optional, Union
+
+from backend.config import get_sector_companies
+from backend.metrics import calculate_metrics
+from backend.metrics.definitions import default_plan
+from backend.metrics.result_cache import MetricsResultCache
+from backend.parsers.filing_catalog import FilingCatalog
+from backend.parsers.multi_file_xbrl_parser import MultiFileXBRLParser
+from backend.pipeline.orchestrator import Pipeline, PipelineRun, Stage, StageStore
+from backend.reports.batch_runner import company_stories
+from backend.reports.report_builder import ReportBuilder
+from backend.signals.peer_comparison import PeerComparison
+from backend.signals.signal_detector import SignalDetector
+from backend.signals.statistical_engine import StatisticalBenchmarkEngine
+
+
+def sector_peers(
+    ticker: str,
+    sector_code: str,
+    data_dir: str = 'data',
+    max_peers: Optional[int] = None
+) -> List[str]:
+    """
+    Peers del sector con filings disponibles (sin la empresa).
+
+    Args:
+        ticker: Empresa analizada
+        sector_code: 'TECH', 'MINING', 'OIL_GAS', 'RETAIL'
+        data_dir: Directorio con archivos XBRL
+        max_peers: Opcional - limitar cantidad de peers
+
+    Returns:
+        Lista de tickers
+    """
+    companies = get_sector_companies(sector_code)
+    available = set(FilingCatalog.shared(data_dir).tickers(companies)) if Path(data_dir).exists() else set()
+    peers = [t for t in companies if t in available and t != ticker.upper()]
+    return peers[:max_peers] if max_peers else peers
+
+
+def build_report_pipeline(
+    ticker: str,
+    peers: List[str],
+    sector_code: str = 'TECH',
+    data_dir: str = 'data',
+    years: int = 4,
+    min_years: int = 3,
+    output_dir: Optional[Union[str, Path]] = None,
+    store: Optional[StageStore] = None,
+    metrics_cache: Optional[MetricsResultCache] = None,
+    max_workers: int = 3,
+    verbose: bool = False
+) -> Pipeline:
+    """
+    Pipeline de reporte de una empresa contra sus peers
+
+    Args:
+        ticker: Empresa a reportar
+        peers: Tickers del grupo de comparación
+        sector_code: Sector (benchmarks y metadata)
+        data_dir: Directorio con archivos XBRL
+        years: Años a extraer por empresa
+        min_years: Mínimo de años para incluir un peer
+        output_dir: Opcional - escribir {ticker}.md (stage export)
+        store: StageStore para cachear outputs (None = sin cache)
+        metrics_cache: MetricsResultCache opcional para calculate_metrics
+        max_workers: Threads para stages independientes
+        verbose: Imprimir cada stage
+
+    Returns:
+        Pipeline (run() para ejecutar)
+    """
+    ticker = ticker.upper()
+    tickers = [ticker] + [p for p in peers if p != ticker]
+
+    def parse():
+        universe = {}
+        for t in tickers:
+            try:
+                timeseries = MultiFileXBRLParser(ticker=t, data_dir=data_dir).extract_timeseries(years=years)
+            except Exception as e:
+                if t == ticker:
+                    raise
+                if verbose:
+                    print(f"   ⚠️  {t}: {e}")
+                continue
+
+            if t == ticker and not timeseries:
+                raise ValueError(f"No timeseries data extracted for {ticker}")
+            if t == ticker or len(timeseries) >= min_years:
+                universe[t] = timeseries
+        return universe
+
+    def metrics(parse):
+        return {t: calculate_metrics(timeseries, cache=metrics_cache) for t, timeseries in parse.items()}
+
+    def benchmarks(metrics):
+        engine = StatisticalBenchmarkEngine(metrics, sector_code=sector_code)
+        engine.calculate_all_benchmarks()
+        return engine
+
+    def signals(metrics, benchmarks):
+        detected = SignalDetector(metrics[ticker], ticker, benchmarks).detect_all()
+        return detected['buy'] + detected['watch'] + detected['red_flag']
+
+    def peers_stage(metrics, benchmarks):
+        peer_metrics = {t: m for t, m in metrics.items() if t != ticker}
+        comparison = PeerComparison(metrics[ticker], peer_metrics, ticker, benchmarks)
+        return {
+            benchmark.metric_name: benchmark
+            for category_benchmarks in comparison.compare_all().values()
+            for benchmark in category_benchmarks
+        }
+
+    def stories(metrics):
+        return company_stories(metrics[ticker])
+
+    def report(signals, peers, stories):
+        return ReportBuilder().build_report(
+            ticker, signals, peers, stories,
+            metadata={
+                'sector': sector_code,
+                'peers_count': len(tickers) - 1,
+                'data_source': 'SEC EDGAR XBRL',
+            }
+        )
+
+    stages = [
+        Stage('parse', parse,
+              params={'tickers': tickers, 'years': years, 'min_years': min_years},
+              fingerprint=lambda: FilingCatalog.shared(data_dir).fingerprint(tickers)),
+        Stage('metrics', metrics, deps=('parse',),
+              params={'plan': default_plan().fingerprint}),
+        Stage('benchmarks', benchmarks, deps=('metrics',), params={'sector': sector_code}),
+        Stage('signals', signals, deps=('metrics', 'benchmarks')),
+        Stage('peers', peers_stage, deps=('metrics', 'benchmarks')),
+        Stage('stories', stories, deps=('metrics',)),
+        Stage('report', report, deps=('signals', 'peers', 'stories')),
+    ]
+
+    if output_dir is not None:
+        def export(report):
+            path = Path(output_dir) / f"{ticker}.md"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(ReportBuilder().export_markdown(report), encoding='utf-8')
+            return path
+
+        stages.append(Stage('export', export, deps=('report',), persist=False))
+
+    return Pipeline(stages, store=store, max_workers=max_workers, verbose=verbose)
+
+
+def run_report_pipeline(
+    ticker: str,
+    peers: Optional[List[str]] = None,
+    sector_code: str = 'TECH',
+    data_dir: str = 'data',
+    cache_dir: Optional[Union[str, Path]] = None,
+    output_dir: Optional[Union[str, Path]] = None,
+    force: bool = False,
+    verbose: bool = True,
+    **kwargs
+) -> PipelineRun:
+    """
+    Reporte end-to-end de una empresa (parse → ... → report)
+
+    Args:
+        ticker: Empresa a reportar
+        peers: Peers (None = sector_peers del sector)
+        sector_code: Sector
+        data_dir: Directorio con archivos XBRL
+        cache_dir: Opcional - StageStore (ej: 'data/pipeline_cache')
+        output_dir: Opcional - directorio del markdown
+        force: Re-ejecutar todos los stages
+        verbose: Imprimir progreso y timings
+        **kwargs: build_report_pipeline (years, min_years, metrics_cache, max_workers)
+
+    Returns:
+        PipelineRun (outputs['report'] = DecisionReport)
+    """
+    if peers is None:
+        peers = sector_peers(ticker, sector_code, data_dir)
+
+    store = StageStore(cache_dir) if cache_dir is not None else None
+    pipeline = build_report_pipeline(
+        ticker, peers, sector_code=sector_code, data_dir=data_dir,
+        output_dir=output_dir, store=store, verbose=verbose, **kwargs
+    )
+
+    if verbose:
+        print(f"🚀 Report pipeline: {ticker.upper()} vs {len(peers)} peers ({sector_code})")
+
+    run = pipeline.run(force=pipeline.stages if force else ())
+
+    if verbose:
+        print(run.summary())
+    return run
@@ -5,9 +5,27 @@ Generates comprehensive investment analysis reports.
 from backend.reports.report_builder import (
     DecisionReport,
     ReportBuilder,
+    report_to_dict,
+    report_to_json_line,
+)
+from backend.reports.batch_runner import (
+    BatchReportResult,
+    BatchReportRunner,
+    build_company_report,
+)
+from backend.reports.report_site import (
+    PublishResult,
+    ReportSite,
 )
 
 __all__ = [
     'DecisionReport',
     'ReportBuilder',
+    'report_to_dict',
+    'report_to_json_line',
+    'BatchReportResult',
+    'BatchReportRunner',
+    'build_company_report',
+    'PublishResult',
+    'ReportSite',
 ]
@@ -0,0 +1,409 @@
+"""
+Batch Report Runner - DecisionReports de un sector en procesos
+
+ReportBuilder arma un reporte por empresa (build_report + export_markdown /
+export_json) y el caller tiene que reunir signals, peers y stories a mano.
+Para un sector completo el runner reparte tickers en chunks sobre un
+process pool y escribe cada reporte apenas termina:
+
+    parent                                  worker (proceso)
+    ------                                  ----------------
+    tickers → chunks            ──────▶     BenchmarkSnapshot (memmap, 1 vez)
+    (≤ max_pending en vuelo)                BatchSignalDetector (chunk)
+                                            LeaveOneOutPeers (1 vez)
+                                            StoryGenerator.generate_stories_batch
+                                            ReportBuilder.build_report
+                                ◀──────     (ticker, JSON line, markdown)
+    reports.jsonl  (append + flush)
+    markdown/{ticker}.md
+
+- Los workers abren el snapshot binario del sector: sector_data son
+  vistas del memmap, páginas compartidas entre procesos
+- El payload de vuelta son strings ya serializados (report_to_json_line),
+  no dataclasses pickleadas
+- Memoria acotada: nunca hay más de max_pending chunks en vuelo y ningún
+  reporte se retiene después de escribirlo
+
+Usage:
+    from backend.reports.batch_runner import BatchReportRunner
+
+    runner = BatchReportRunner('data/snapshots/TECH.sbs', max_workers=4)
+    result = runner.run('outputs/reports/TECH.jsonl', markdown_dir='outputs/reports/TECH')
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from backend.reports.report_builder import DecisionReport, ReportBuilder, report_to_json_line
+from backend.signals.batch_signal_detector import BatchSignalDetector
+from backend.signals.benchmark_snapshot import BenchmarkSnapshot, write_snapshot
+from backend.signals.peer_comparison import LeaveOneOutPeers, PeerBenchmark, PeerComparison, PeerGroup
+from backend.signals.signal_detector import SignalDetector
+from backend.signals.signal_taxonomy import Signal
+from backend.signals.statistical_engine import StatisticalBenchmarkEngine
+from backend.signals.story_generator import StoryArc, StoryGenerator
+
+
+# (ticker, JSON line, markdown, error) - strings listos para escribir
+ReportRecord = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
+def company_stories(
+    metrics: Dict[str, Dict[str, np.ndarray]],
+    story_generator: Optional[StoryGenerator] = None,
+    metric_names: Optional[Iterable[str]] = None
+) -> Dict[str, StoryArc]:
+    """
+    Story arcs de una empresa a partir de sus arrays de métricas.
+
+    Los arrays vienen del año más reciente al más antiguo (calculate_metrics);
+    StoryGenerator espera oldest → newest, sin NaN.
+
+    Args:
+        metrics: {category: {metric: np.ndarray}}
+        story_generator: Opcional - reutilizar un StoryGenerator
+        metric_names: Opcional - sólo estas métricas
+
+    Returns:
+        {metric: StoryArc} (métricas con ≥ 2 años válidos)
+    """
+    story_generator = story_generator or StoryGenerator()
+    wanted = set(metric_names) if metric_names is not None else None
+
+    series, categories = {}, {}
+    for category, metrics_dict in metrics.items():
+        for metric_name in metrics_dict.keys():
+            if wanted is not None and metric_name not in wanted:
+                continue
+            values = np.asarray(metrics_dict[metric_name], dtype=np.float64)
+            series[metric_name] = values[~np.isnan(values)][::-1].tolist()
+            categories[metric_name] = category
+
+    return story_generator.generate_stories_batch(series, categories)
+
+
+def build_company_report(
+    ticker: str,
+    metrics: Dict[str, Dict[str, np.ndarray]],
+    engine: StatisticalBenchmarkEngine,
+    peer_group: Optional[PeerGroup] = None,
+    signals: Optional[Dict[str, List[Signal]]] = None,
+    peer_benchmarks: Optional[Dict[str, List[PeerBenchmark]]] = None,
+    builder: Optional[ReportBuilder] = None,
+    story_generator: Optional[StoryGenerator] = None,
+    metric_names: Optional[Iterable[str]] = None,
+    metadata: Optional[Dict] = None
+) -> DecisionReport:
+    """
+    DecisionReport de una empresa: signals + peers + stories → ReportBuilder
+
+    Args:
+        ticker: Empresa
+        metrics: {category: {metric: np.ndarray}} de la empresa
+        engine: StatisticalBenchmarkEngine del sector
+        peer_group: PeerGroup de los peers (sin la empresa)
+        signals: Opcional - detect_all() ya calculado (ej: BatchSignalDetector)
+        peer_benchmarks: Opcional - compare_all() ya calculado
+                         (ej: LeaveOneOutPeers); reemplaza a peer_group
+        builder: Opcional - ReportBuilder a reutilizar
+        story_generator: Opcional - StoryGenerator a reutilizar
+        metric_names: Opcional - sólo estas métricas
+        metadata: Opcional - metadata del reporte
+
+    Returns:
+        DecisionReport
+    """
+    builder = builder or ReportBuilder()
+
+    if signals is None:
+        signals = SignalDetector(metrics, ticker, engine, metric_names=metric_names).detect_all()
+    signal_list = signals['buy'] + signals['watch'] + signals['red_flag']
+
+    if peer_benchmarks is None:
+        if peer_group is None:
+            raise ValueError("build_company_report needs peer_group or peer_benchmarks")
+        comparison = PeerComparison(
+            metrics, peer_group.peer_metrics, ticker, engine, peer_group=peer_group
+        )
+        peer_benchmarks = comparison.compare_all(metric_names)
+    peer_benchmarks = {
+        benchmark.metric_name: benchmark
+        for benchmarks in peer_benchmarks.values()
+        for benchmark in benchmarks
+    }
+
+    stories = company_stories(metrics, story_generator, metric_names)
+
+    return builder.build_report(ticker, signal_list, peer_benchmarks, stories, metadata)
+
+
+@lru_cache(maxsize=2)
+def _worker_state(snapshot_path: str, stamp: Tuple[int, int]):
+    """Snapshot + componentes compartidos, una vez por proceso (y por versión del archivo)."""
+    snapshot = BenchmarkSnapshot(snapshot_path)
+    peers = LeaveOneOutPeers.from_packed(snapshot.packed())
+    return snapshot, snapshot.engine(), peers, ReportBuilder(), StoryGenerator()
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _build_chunk(
+    snapshot_path: str,
+    stamp: Tuple[int, int],
+    tickers: List[str],
+    metric_names: Optional[Tuple[str, ...]],
+    markdown: bool
+) -> List[ReportRecord]:
+    """
+    Worker: reportes de un chunk de tickers, ya serializados.
+
+    Un error en una empresa no corta el chunk: se retorna en el record.
+    """
+    snapshot, engine, peers, builder, story_generator = _worker_state(snapshot_path, stamp)
+    sector_data = engine.sector_data
+
+    detector = BatchSignalDetector(engine, metric_names=metric_names)
+    signals = detector.detect({ticker: sector_data[ticker] for ticker in tickers})
+    metadata = {'sector': engine.sector_code, 'snapshot_created_at': snapshot.created_at}
+
+    records: List[ReportRecord] = []
+    for ticker in tickers:
+        try:
+            metrics = sector_data[ticker]
+            report = build_company_report(
+                ticker,
+                metrics,
+                engine,
+                signals=signals[ticker],
+                peer_benchmarks=peers.compare_all(ticker, metrics, engine, metric_names),
+                builder=builder,
+                story_generator=story_generator,
+                metric_names=metric_names,
+                metadata=dict(metadata)
+            )
+            records.append((
+                ticker,
+                report_to_json_line(report),
+                builder.export_markdown(report) if markdown else None,
+                None
+            ))
+        except Exception as e:
+            records.append((ticker, None, None, f"{type(e).__name__}: {e}"))
+    return records
+
+
+@dataclass
+class BatchReportResult:
+    """
+    Resumen de una corrida de BatchReportRunner.run()
+
+    Attributes:
+        jsonl_path: Archivo JSONL (un reporte por línea, orden de llegada)
+        markdown_dir: Directorio de markdown (None si no se pidió)
+        written: Tickers escritos
+        failed: {ticker: error}
+        elapsed: Segundos de la corrida
+    """
+    jsonl_path: Path
+    markdown_dir: Optional[Path]
+    written: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
+class BatchReportRunner:
+    """
+    Genera DecisionReports de un sector en un process pool y los escribe
+    en streaming (JSONL + markdown por empresa).
+
+    Cada empresa se compara contra el resto del snapshot (leave-one-out).
+
+    Attributes:
+        snapshot_path: Snapshot del sector (write_snapshot / load_sector_benchmarks)
+        max_workers: Procesos (None = os.cpu_count(); 1 = in-process)
+        chunk_size: Tickers por tarea
+        max_pending: Chunks en vuelo como máximo (None = 2 × max_workers)
+        metric_names: Opcional - sólo estas métricas en signals, peers y stories
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Union[str, Path],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 16,
+        max_pending: Optional[int] = None,
+        metric_names: Optional[Iterable[str]] = None,
+        mp_context=None,
+        verbose: bool = False
+    ):
+        """
+        Args:
+            snapshot_path: Snapshot binario del sector
+            max_workers: Número de procesos (None = os.cpu_count())
+            chunk_size: Tickers por tarea del pool
+            max_pending: Límite de chunks en vuelo (acota la memoria)
+            metric_names: Opcional - sólo reportar estas métricas
+            mp_context: multiprocessing context (None = default de la plataforma)
+            verbose: Imprimir progreso
+
+        Raises:
+            ValueError: Si chunk_size o max_pending no son positivos
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        if max_pending is not None and max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got {max_pending}")
+
+        self.snapshot_path = Path(snapshot_path)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or 2 * self.max_workers
+        self.metric_names = tuple(metric_names) if metric_names is not None else None
+        self.mp_context = mp_context
+        self.verbose = verbose
+
+    @classmethod
+    def from_engine(
+        cls,
+        engine: StatisticalBenchmarkEngine,
+        snapshot_path: Union[str, Path],
+        provenance: Optional[Dict] = None,
+        **kwargs
+    ) -> 'BatchReportRunner':
+        """
+        Escribe el snapshot del engine y crea el runner sobre él.
+
+        Raises:
+            ValueError: Si el engine no tiene sector_data
+        """
+        write_snapshot(engine, snapshot_path, provenance)
+        return cls(snapshot_path, **kwargs)
+
+    def chunks(self, tickers: List[str]) -> List[List[str]]:
+        """Parte la lista de tickers en chunks de chunk_size."""
+        return [tickers[i:i + self.chunk_size] for i in range(0, len(tickers), self.chunk_size)]
+
+    def _tickers(self, tickers: Optional[Iterable[str]]) -> List[str]:
+        available = BenchmarkSnapshot(self.snapshot_path).tickers
+        if tickers is None:
+            return list(available)
+
+        tickers = list(tickers)
+        unknown = sorted(set(tickers) - set(available))
+        if unknown:
+            raise ValueError(f"Tickers not in snapshot: {', '.join(unknown)}")
+        return tickers
+
+    def iter_records(
+        self,
+        tickers: Optional[Iterable[str]] = None,
+        markdown: bool = True
+    ) -> Iterator[ReportRecord]:
+        """
+        (ticker, JSON line, markdown, error) a medida que terminan los chunks
+
+        Args:
+            tickers: Empresas a reportar (None = todo el snapshot)
+            markdown: Incluir export_markdown() en cada record
+
+        Raises:
+            ValueError: Si algún ticker no está en el snapshot
+        """
+        chunks = self.chunks(self._tickers(tickers))
+        args = (str(self.snapshot_path), _file_stamp(self.snapshot_path))
+
+        if self.max_workers <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                yield from _build_chunk(*args, chunk, self.metric_names, markdown)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.mp_context) as pool:
+            remaining = iter(chunks)
+            pending = set()
+
+            def submit_next():
+                chunk = next(remaining, None)
+                if chunk is not None:
+                    pending.add(pool.submit(_build_chunk, *args, chunk, self.metric_names, markdown))
+
+            for _ in range(self.max_pending):
+                submit_next()
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    submit_next()
+                    yield from future.result()
+
+    def run(
+        self,
+        jsonl_path: Union[str, Path],
+        markdown_dir: Optional[Union[str, Path]] = None,
+        tickers: Optional[Iterable[str]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> BatchReportResult:
+        """
+        Genera los reportes y los escribe apenas llegan.
+
+        Args:
+            jsonl_path: Archivo JSONL de salida (se sobrescribe)
+            markdown_dir: Opcional - un {ticker}.md por empresa
+            tickers: Empresas a reportar (None = todo el snapshot)
+            progress_callback: Opcional - callback(done, total)
+
+        Returns:
+            BatchReportResult
+
+        Example:
+            >>> result = runner.run('outputs/TECH.jsonl', markdown_dir='outputs/TECH')
+            >>> len(result.written), result.failed
+            (512, {})
+        """
+        start = time.perf_counter()
+        tickers = self._tickers(tickers)
+
+        jsonl_path = Path(jsonl_path)
+        jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        if markdown_dir is not None:
+            markdown_dir = Path(markdown_dir)
+            markdown_dir.mkdir(parents=True, exist_ok=True)
+
+        result = BatchReportResult(jsonl_path=jsonl_path, markdown_dir=markdown_dir)
+        if self.verbose:
+            print(f"📝 Building {len(tickers)} reports ({self.max_workers} workers)")
+
+        with open(jsonl_path, 'w', encoding='utf-8') as jsonl:
+            records = self.iter_records(tickers, markdown=markdown_dir is not None)
+            for done, (ticker, json_line, markdown, error) in enumerate(records, 1):
+                if error is not None:
+                    result.failed[ticker] = error
+                    if self.verbose:
+                        print(f"   ❌ {ticker}: {error}")
+                else:
+                    jsonl.write(json_line + '\n')
+                    jsonl.flush()
+                    if markdown_dir is not None:
+                        (markdown_dir / f"{ticker}.md").write_text(markdown, encoding='utf-8')
+                    result.written.append(ticker)
+
+                if progress_callback:
+                    progress_callback(done, len(tickers))
+
+        result.elapsed = time.perf_counter() - start
+        if self.verbose:
+            print(f"✅ {len(result.written)} reports in {result.elapsed:.1f}s "
+                  f"({len(result.failed)} failed)")
+        return result
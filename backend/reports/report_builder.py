@@ -12,11 +12,14 @@ This module generates comprehensive investment analysis reports combining:
 Author: @franklin (CTO)
 Sprint 5 - Micro-Tarea 5: Decision Report Builder
 """
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from enum import Enum
 from typing import Dict, List, Optional
 from datetime import datetime
 import json
 
+import numpy as np
+
 from backend.signals.signal_taxonomy import Signal, SignalType, SignalCategory
 from backend.signals.peer_comparison import PeerBenchmark
 from backend.signals.story_generator import StoryArc, StoryPattern
@@ -49,6 +52,87 @@ class DecisionReport:
     metadata: Optional[Dict] = None
 
 
+def report_to_dict(report: DecisionReport) -> Dict:
+    """
+    JSON-ready dict of a report (export_json schema).
+
+    Reads the dataclass attributes directly: no dataclasses.asdict()
+    deep copy of signals, peer benchmarks and story arcs.
+
+    Args:
+        report: DecisionReport object
+
+    Returns:
+        Dict with plain str/float/int/bool values
+    """
+    return {
+        'company': report.company,
+        'date': report.date,
+        'executive_summary': report.executive_summary,
+        'recommendation': report.recommendation,
+        'confidence': report.confidence,
+        'signal_breakdown': {
+            category: [
+                {
+                    'type': s.type.value,
+                    'category': s.category.value,
+                    'metric': s.metric,
+                    'value': s.value,
+                    'threshold': s.threshold,
+                    'message': s.message
+                }
+                for s in signals
+            ]
+            for category, signals in report.signal_breakdown.items()
+        },
+        'peer_analysis': {
+            metric: {
+                'company_value': b.company_value,
+                'peer_median': b.peer_median,
+                'percentile': b.percentile,
+                'beats_peers': b.beats_peers,
+                'interpretation': b.interpretation
+            }
+            for metric, b in report.peer_analysis.items()
+        },
+        'story_arcs': {
+            metric: {
+                'pattern': s.pattern.value,
+                'cagr': s.cagr,
+                'narrative': s.narrative,
+                'confidence': s.confidence.value
+            }
+            for metric, s in report.story_arcs.items()
+        },
+        'metadata': report.metadata
+    }
+
+
+def _json_default(obj):
+    """numpy scalars / Enums en metadata → tipos JSON nativos."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def report_to_json_line(report: DecisionReport) -> str:
+    """
+    Compact single-line JSON of a report (one JSONL record, no newline).
+
+    Example:
+        >>> with open('reports.jsonl', 'a') as f:
+        ...     f.write(report_to_json_line(report) + '\n')
+    """
+    return json.dumps(
+        report_to_dict(report),
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=_json_default
+    )
+
+
 class ReportBuilder:
     """
     Builds comprehensive investment decision reports.
@@ -513,47 +597,4 @@ class ReportBuilder:
         Returns:
             JSON formatted report
         """
-        # Convert dataclass to dict
-        report_dict = {
-            'company': report.company,
-            'date': report.date,
-            'executive_summary': report.executive_summary,
-            'recommendation': report.recommendation,
-            'confidence': report.confidence,
-            'signal_breakdown': {
-                category: [
-                    {
-                        'type': s.type.value,
-                        'category': s.category.value,
-                        'metric': s.metric,
-                        'value': s.value,
-                        'threshold': s.threshold,
-                        'message': s.message
-                    }
-                    for s in signals
-                ]
-                for category, signals in report.signal_breakdown.items()
-            },
-            'peer_analysis': {
-                metric: {
-                    'company_value': b.company_value,
-                    'peer_median': b.peer_median,
-                    'percentile': b.percentile,
-                    'beats_peers': b.beats_peers,
-                    'interpretation': b.interpretation
-                }
-                for metric, b in report.peer_analysis.items()
-            },
-            'story_arcs': {
-                metric: {
-                    'pattern': s.pattern.value,
-                    'cagr': s.cagr,
-                    'narrative': s.narrative,
-                    'confidence': s.confidence.value
-                }
-                for metric, s in report.story_arcs.items()
-            },
-            'metadata': report.metadata
-        }
-
-        return json.dumps(report_dict, indent=2)
+        return json.dumps(report_to_dict(report), indent=2, default=_json_default)
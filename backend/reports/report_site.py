@@ -0,0 +1,323 @@
+"""
+Report Site - Publicación incremental de reportes markdown
+
+Publicar el sitio de reportes (un export_markdown por empresa) re-generaba
+todo el universo en cada corrida. ReportSite guarda un fingerprint de los
+inputs de cada reporte y sólo re-genera los que cambiaron:
+
+    site/
+    ├── index.md          links por empresa (recommendation, confidence)
+    ├── manifest.json     {ticker: fingerprint, sector, path, ...}
+    └── reports/
+        └── {ticker}.md
+
+Fingerprint por empresa (sha256) de lo que el markdown muestra:
+
+    metrics        arrays de la empresa (valores + largos)
+    signals        BUY / WATCH / RED_FLAG por métrica (BatchSignalDetector)
+    story arcs     pattern, confidence, CAGR, narrative
+    peers          percentil y beats_peers vs el resto del sector (leave-one-out)
+    snapshot       versión del formato, sector, plan_fingerprint, SITE_VERSION
+
+El fingerprint del snapshot entero (source_fingerprint) no entra: cambia
+con cualquier filing del sector. Un 10-K nuevo cambia los arrays de esa
+empresa (y los peers sólo si cruza un percentil o una mediana), así que el
+publish nocturno re-escribe ese reporte y no el universo.
+
+Usage:
+    from backend.reports.report_site import ReportSite
+
+    site = ReportSite('outputs/site', max_workers=4)
+    result = site.publish('data/snapshots/TECH.sbs')
+    print(result.built, len(result.unchanged))
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from backend.reports.batch_runner import BatchReportRunner, company_stories
+from backend.signals.batch_signal_detector import BatchSignalDetector
+from backend.signals.benchmark_snapshot import SNAPSHOT_VERSION, BenchmarkSnapshot
+from backend.signals.peer_comparison import leave_one_out_ranks
+from backend.signals.story_generator import StoryGenerator
+from backend.utils.atomic_io import atomic_write
+
+
+# Subir para forzar la re-generación de todo el sitio (ej: cambia ReportBuilder)
+SITE_VERSION = 1
+
+MANIFEST_NAME = 'manifest.json'
+INDEX_NAME = 'index.md'
+REPORTS_DIR = 'reports'
+
+
+@dataclass
+class PublishResult:
+    """
+    Resumen de ReportSite.publish()
+
+    Attributes:
+        built: Tickers re-generados (fingerprint nuevo o distinto)
+        unchanged: Tickers sin cambios (reporte no se tocó)
+        removed: Tickers que ya no están en el sector (reporte borrado)
+        failed: {ticker: error} (se reintentan en el próximo publish)
+        elapsed: Segundos
+    """
+    built: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
+class ReportSite:
+    """
+    Sitio estático de reportes markdown con rebuild incremental.
+
+    Attributes:
+        site_dir: Directorio del sitio (index.md, manifest.json, reports/)
+        max_workers: Procesos para BatchReportRunner (1 = in-process)
+        chunk_size: Tickers por tarea del runner
+    """
+
+    def __init__(
+        self,
+        site_dir: Union[str, Path],
+        max_workers: Optional[int] = 1,
+        chunk_size: int = 16,
+        verbose: bool = False
+    ):
+        """
+        Args:
+            site_dir: Directorio del sitio (se crea si no existe)
+            max_workers: Procesos para generar reportes (None = os.cpu_count())
+            chunk_size: Tickers por tarea del runner
+            verbose: Imprimir progreso
+        """
+        self.site_dir = Path(site_dir)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.verbose = verbose
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.site_dir / MANIFEST_NAME
+
+    @property
+    def index_path(self) -> Path:
+        return self.site_dir / INDEX_NAME
+
+    def report_path(self, ticker: str) -> Path:
+        """Markdown de una empresa dentro del sitio."""
+        return self.site_dir / REPORTS_DIR / f"{ticker}.md"
+
+    def load_manifest(self) -> Dict[str, Dict]:
+        """{ticker: entry} del último publish ({} si no hay sitio)."""
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, encoding='utf-8') as f:
+            return json.load(f)
+
+    # ------------------------------------------------------------------
+    # Fingerprints
+    # ------------------------------------------------------------------
+
+    def fingerprints(
+        self,
+        snapshot_path: Union[str, Path],
+        tickers: Optional[Iterable[str]] = None,
+        metric_names: Optional[Iterable[str]] = None
+    ) -> Dict[str, str]:
+        """
+        Fingerprint de los inputs del reporte de cada empresa
+
+        Args:
+            snapshot_path: Snapshot del sector
+            tickers: Opcional - sólo estas empresas (peers = todo el snapshot)
+            metric_names: Opcional - sólo estas métricas
+
+        Returns:
+            {ticker: sha256 hex}
+        """
+        snapshot = BenchmarkSnapshot(snapshot_path)
+        engine = snapshot.engine()
+        detector = BatchSignalDetector(engine, metric_names=metric_names)
+
+        packed = detector.pack(snapshot.packed())
+        codes = detector.classify(packed)
+        percentiles, beats = leave_one_out_ranks(packed.value_at(-1))
+        has_metric = packed.lengths > 0
+
+        header = hashlib.sha256(json.dumps({
+            'site_version': SITE_VERSION,
+            'snapshot_version': SNAPSHOT_VERSION,
+            'sector_code': snapshot.sector_code,
+            'plan_fingerprint': snapshot.provenance.get('plan_fingerprint'),
+            'keys': [list(key) for key in packed.keys],
+        }, sort_keys=True).encode())
+
+        rows = {ticker: row for row, ticker in enumerate(packed.tickers)}
+        wanted = list(tickers) if tickers is not None else packed.tickers
+        sector_data = engine.sector_data
+        story_generator = StoryGenerator()
+
+        fingerprints = {}
+        for ticker in wanted:
+            row = rows[ticker]
+            stories = company_stories(sector_data[ticker], story_generator, metric_names)
+
+            digest = header.copy()
+            digest.update(np.ascontiguousarray(packed.values[row]).tobytes())
+            digest.update(np.ascontiguousarray(packed.lengths[row]).tobytes())
+            digest.update(codes[row].tobytes())
+            digest.update(np.where(has_metric[row], percentiles[row], -1).tobytes())
+            digest.update((beats[row] & has_metric[row]).tobytes())
+            digest.update(json.dumps([
+                (name, arc.pattern.value, arc.confidence.value, repr(arc.cagr), arc.narrative)
+                for name, arc in stories.items()
+            ]).encode())
+            fingerprints[ticker] = digest.hexdigest()
+
+        return fingerprints
+
+    # ------------------------------------------------------------------
+    # Publish
+    # ------------------------------------------------------------------
+
+    def publish(
+        self,
+        snapshot_path: Union[str, Path],
+        tickers: Optional[Iterable[str]] = None,
+        metric_names: Optional[Iterable[str]] = None,
+        force: bool = False
+    ) -> PublishResult:
+        """
+        Re-genera sólo los reportes cuyo fingerprint cambió
+
+        Args:
+            snapshot_path: Snapshot del sector
+            tickers: Opcional - publicar sólo estas empresas (no borra otras)
+            metric_names: Opcional - sólo estas métricas
+            force: Re-generar todos los reportes
+
+        Returns:
+            PublishResult
+
+        Raises:
+            ValueError: Si algún ticker no está en el snapshot
+        """
+        start = time.perf_counter()
+        result = PublishResult()
+
+        snapshot = BenchmarkSnapshot(snapshot_path)
+        if tickers is not None:
+            tickers = list(tickers)
+            unknown = sorted(set(tickers) - set(snapshot.tickers))
+            if unknown:
+                raise ValueError(f"Tickers not in snapshot: {', '.join(unknown)}")
+
+        fingerprints = self.fingerprints(snapshot_path, tickers, metric_names)
+        manifest = self.load_manifest()
+
+        stale = [
+            ticker for ticker, fingerprint in fingerprints.items()
+            if force
+            or manifest.get(ticker, {}).get('fingerprint') != fingerprint
+            or not self.report_path(ticker).exists()
+        ]
+        result.unchanged = [ticker for ticker in fingerprints if ticker not in set(stale)]
+
+        # Empresas que salieron del sector (sólo en un publish completo)
+        if tickers is None:
+            for ticker, entry in list(manifest.items()):
+                if entry.get('sector') == snapshot.sector_code and ticker not in fingerprints:
+                    self.report_path(ticker).unlink(missing_ok=True)
+                    del manifest[ticker]
+                    result.removed.append(ticker)
+
+        if self.verbose:
+            print(f"📝 {snapshot.sector_code}: {len(stale)} reports to build, "
+                  f"{len(result.unchanged)} unchanged")
+
+        if stale:
+            self.report_path(stale[0]).parent.mkdir(parents=True, exist_ok=True)
+            runner = BatchReportRunner(
+                snapshot_path,
+                max_workers=self.max_workers,
+                chunk_size=self.chunk_size,
+                metric_names=metric_names
+            )
+            for ticker, json_line, markdown, error in runner.iter_records(stale):
+                if error is not None:
+                    result.failed[ticker] = error
+                    if self.verbose:
+                        print(f"   ❌ {ticker}: {error}")
+                    continue
+
+                record = json.loads(json_line)
+                self.report_path(ticker).write_text(markdown, encoding='utf-8')
+                manifest[ticker] = {
+                    'fingerprint': fingerprints[ticker],
+                    'sector': snapshot.sector_code,
+                    'path': f"{REPORTS_DIR}/{ticker}.md",
+                    'recommendation': record['recommendation'],
+                    'confidence': record['confidence'],
+                    'updated_at': record['date'],
+                }
+                result.built.append(ticker)
+
+        if result.built or result.removed or not self.index_path.exists():
+            self._write_manifest(manifest)
+            self.index_path.write_text(self.render_index(manifest), encoding='utf-8')
+
+        result.elapsed = time.perf_counter() - start
+        if self.verbose:
+            print(f"✅ Site updated: {len(result.built)} built, {len(result.removed)} removed "
+                  f"({result.elapsed:.1f}s)")
+        return result
+
+    def _write_manifest(self, manifest: Dict[str, Dict]):
+        atomic_write(
+            self.manifest_path,
+            lambda f: json.dump(manifest, f, indent=2, sort_keys=True),
+            mode='w'
+        )
+
+    @staticmethod
+    def render_index(manifest: Dict[str, Dict]) -> str:
+        """
+        index.md: una fila por empresa con link a su reporte
+
+        Args:
+            manifest: {ticker: entry} (load_manifest)
+
+        Returns:
+            Markdown del índice
+        """
+        md = []
+        md.append("# 📊 INVESTMENT DECISION REPORTS")
+        md.append(f"*Updated: {datetime.now().isoformat()[:10]} - {len(manifest)} companies*\n")
+        md.append("| Company | Sector | Recommendation | Confidence | Updated |")
+        md.append("|---------|--------|----------------|------------|---------|")
+
+        for ticker in sorted(manifest, key=lambda t: (manifest[t].get('sector', ''), t)):
+            entry = manifest[ticker]
+            md.append(
+                f"| [{ticker}]({entry['path']}) | {entry.get('sector', '')} | "
+                f"{entry['recommendation']} | {entry['confidence']} | {entry['updated_at'][:10]} |"
+            )
+
+        md.append("")
+        md.append("---")
+        md.append("*Report generated by XBRL Financial Analyzer*")
+        return '\n'.join(md)
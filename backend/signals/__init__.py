@@ -14,21 +14,38 @@ from backend.signals.signal_taxonomy import (
     list_thresholds_by_category
 )
 from backend.signals.signal_detector import SignalDetector
+from backend.signals.batch_signal_detector import BatchSignalDetector
 from backend.signals.peer_comparison import (
+    LeaveOneOutPeers,
     PeerBenchmark,
     PeerComparison,
+    PeerDistribution,
+    PeerGroup,
+    PeerRankMatrix,
     calculate_percentile,
-    compare_to_peers
+    compare_to_peers,
+    leave_one_out_ranks
 )
 # Franklin Framework - Statistical Engine
 from backend.signals.statistical_engine import (
     IndustryBenchmark,
+    PackedSectorData,
     StatisticalBenchmarkEngine,
+    pack_sector_data,
+)
+from backend.signals.quantile_sketch import (
+    KLLSketch,
+    BenchmarkSketch,
+)
+from backend.signals.benchmark_snapshot import (
+    BenchmarkSnapshot,
+    write_snapshot,
 )
 # Franklin Framework - Interpretation Engine
 from backend.signals.franklin_interpretation import (
     PerformanceZone,
     FranklinInterpretation,
+    ZoneClassification,
 )
 # Story Arc Generator - Narrative Intelligence
 from backend.signals.story_generator import (
@@ -50,17 +67,30 @@ __all__ = [
     'list_thresholds_by_category',
     # Signal detector
     'SignalDetector',
+    'BatchSignalDetector',
     # Peer comparison
+    'LeaveOneOutPeers',
     'PeerBenchmark',
     'PeerComparison',
+    'PeerDistribution',
+    'PeerGroup',
+    'PeerRankMatrix',
     'calculate_percentile',
     'compare_to_peers',
+    'leave_one_out_ranks',
     # Franklin Framework - Statistical
     'IndustryBenchmark',
+    'PackedSectorData',
     'StatisticalBenchmarkEngine',
+    'pack_sector_data',
+    'KLLSketch',
+    'BenchmarkSketch',
+    'BenchmarkSnapshot',
+    'write_snapshot',
     # Franklin Framework - Interpretation
     'PerformanceZone',
     'FranklinInterpretation',
+    'ZoneClassification',
     # Story Arc Generator
     'StoryPattern',
     'ConfidenceLevel',
@@ -0,0 +1,295 @@
+"""
+Batch Signal Detector - Screening de un universo completo
+
+SignalDetector se construye por empresa y recorre métricas en Python:
+calculate_benchmarks + get_signal_type + _calculate_trend + Signal por
+métrica. Para un screening de 1,000 empresas son ~25,000 iteraciones.
+
+BatchSignalDetector empaqueta el universo (PackedSectorData, C × K × Y) y
+evalúa todo con operaciones de arrays:
+
+    thresholds   p25 / p50 / p75 por métrica   (K,)
+    latest       values[:, :, 0]                (C × K)
+    signal code  BUY / WATCH / RED_FLAG         (C × K)  np.where sobre thresholds
+    trend        CAGR primer/último no-NaN      (C × K)
+
+Sólo los hits (signal types pedidos) se materializan como Signal, con el
+mismo contenido que SignalDetector.detect_all() (mensaje, threshold, trend).
+
+Usage:
+    from backend.signals.batch_signal_detector import BatchSignalDetector
+
+    detector = BatchSignalDetector(engine)
+    buys = detector.screen(universe_metrics, 'BUY')     # {ticker: [Signal]}
+    signals = detector.detect(universe_metrics)         # {ticker: detect_all()}
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from backend.signals.signal_detector import (
+    CATEGORY_ENUMS, INVERSE_METRICS, format_trend, generate_signal_message
+)
+from backend.signals.signal_taxonomy import Signal, SignalCategory, SignalType
+from backend.signals.statistical_engine import (
+    PackedSectorData, StatisticalBenchmarkEngine, pack_sector_data
+)
+
+
+# Códigos de la matriz de señales (orden = keys de detect_all())
+NO_SIGNAL = -1
+BUY, WATCH, RED_FLAG = 0, 1, 2
+
+SIGNAL_CODES = {
+    SignalType.BUY: BUY,
+    SignalType.WATCH: WATCH,
+    SignalType.RED_FLAG: RED_FLAG,
+}
+_CODE_TYPES = {code: signal_type for signal_type, code in SIGNAL_CODES.items()}
+_CODE_KEYS = {BUY: 'buy', WATCH: 'watch', RED_FLAG: 'red_flag'}
+
+
+class BatchSignalDetector:
+    """
+    SignalDetector vectorizado sobre todas las empresas de un universo
+
+    Attributes:
+        benchmark_engine: Engine con los benchmarks del sector
+        metric_names: Opcional - sólo estas métricas (None = todas)
+    """
+
+    def __init__(
+        self,
+        benchmark_engine: StatisticalBenchmarkEngine,
+        metric_names: Optional[Iterable[str]] = None
+    ):
+        """
+        Args:
+            benchmark_engine: StatisticalBenchmarkEngine (dict, snapshot o sketch)
+            metric_names: Opcional - sólo detectar estas métricas
+        """
+        self.benchmark_engine = benchmark_engine
+        self.metric_names = set(metric_names) if metric_names is not None else None
+
+    # ------------------------------------------------------------------
+    # Array evaluation
+    # ------------------------------------------------------------------
+
+    def pack(
+        self,
+        universe: Union[Dict[str, Dict], PackedSectorData]
+    ) -> PackedSectorData:
+        """
+        Empaqueta {ticker: metrics} (o filtra un PackedSectorData existente)
+        a las métricas seleccionadas.
+        """
+        if isinstance(universe, PackedSectorData):
+            if self.metric_names is None:
+                return universe
+            cols = [i for i, (_, metric) in enumerate(universe.keys) if metric in self.metric_names]
+            return PackedSectorData(
+                universe.tickers, [universe.keys[i] for i in cols],
+                universe.values[:, cols], universe.lengths[:, cols]
+            )
+
+        packed = pack_sector_data(universe)
+        if self.metric_names is None:
+            return packed
+        return self.pack(packed)
+
+    def thresholds(self, keys: List[Tuple[str, str]]) -> Tuple[list, np.ndarray]:
+        """
+        Benchmarks por columna.
+
+        Returns:
+            (benchmarks, thresholds): lista de IndustryBenchmark (o None) y
+            array (K × 3) con p25, p50, p75 (NaN sin benchmark)
+        """
+        benchmarks = [self.benchmark_engine.calculate_benchmarks(c, m) for c, m in keys]
+        thresholds = np.array([
+            (b.p25, b.p50, b.p75) if b else (np.nan, np.nan, np.nan)
+            for b in benchmarks
+        ], dtype=np.float64).reshape(len(keys), 3)
+        return benchmarks, thresholds
+
+    def classify(self, packed: PackedSectorData) -> np.ndarray:
+        """
+        Matriz (C × K) de códigos BUY / WATCH / RED_FLAG / NO_SIGNAL.
+
+        Misma lógica que FranklinInterpretation.get_signal_type sobre el
+        valor más reciente (index 0); NO_SIGNAL sin benchmark o sin valor.
+        """
+        _, thresholds = self.thresholds(packed.keys)
+        return self._classify(packed, thresholds)
+
+    def _classify(self, packed: PackedSectorData, thresholds: np.ndarray) -> np.ndarray:
+        latest = packed.value_at(0)
+        p25, p75 = thresholds[:, 0], thresholds[:, 2]
+        inverse = np.array([metric in INVERSE_METRICS for _, metric in packed.keys], dtype=bool)
+
+        normal_codes = np.where(latest >= p75, BUY, np.where(latest >= p25, WATCH, RED_FLAG))
+        inverse_codes = np.where(latest <= p25, BUY, np.where(latest <= p75, WATCH, RED_FLAG))
+        codes = np.where(inverse, inverse_codes, normal_codes).astype(np.int8)
+
+        codes[np.isnan(latest) | np.isnan(p25)] = NO_SIGNAL
+        return codes
+
+    @staticmethod
+    def trends(packed: PackedSectorData) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        CAGR (%) entre el primer y el último valor no-NaN de cada array.
+
+        Returns:
+            (cagr, has_trend): cagr (C × K) y máscara de celdas donde
+            SignalDetector._calculate_trend retorna un CAGR (no "")
+        """
+        values, lengths = packed.values, packed.lengths
+        n_years = values.shape[2]
+
+        valid = ~np.isnan(values) & (np.arange(n_years) < lengths[..., np.newaxis])
+        count = valid.sum(axis=2)
+        first = np.argmax(valid, axis=2)
+        last = n_years - 1 - np.argmax(valid[..., ::-1], axis=2)
+
+        most_recent = np.take_along_axis(values, first[..., np.newaxis], axis=2)[..., 0]
+        oldest = np.take_along_axis(values, last[..., np.newaxis], axis=2)[..., 0]
+
+        has_trend = (count >= 2) & (oldest > 0)
+        years = np.where(has_trend, count - 1, 1)
+        with np.errstate(all='ignore'):
+            ratio = np.where(has_trend, most_recent / np.where(has_trend, oldest, 1.0), 1.0)
+            cagr = (np.power(ratio, 1 / years) - 1) * 100
+        return np.where(has_trend, cagr, np.nan), has_trend
+
+    # ------------------------------------------------------------------
+    # Signals (sólo hits)
+    # ------------------------------------------------------------------
+
+    def detect(
+        self,
+        universe: Union[Dict[str, Dict], PackedSectorData],
+        signal_types: Optional[Iterable[SignalType]] = None
+    ) -> Dict[str, Dict[str, List[Signal]]]:
+        """
+        SignalDetector.detect_all() para cada empresa del universo
+
+        Args:
+            universe: {ticker: metrics} o PackedSectorData
+            signal_types: Tipos a materializar (default: los 3)
+
+        Returns:
+            {ticker: {'buy': [...], 'watch': [...], 'red_flag': [...]}}
+        """
+        packed = self.pack(universe)
+        wanted = [SIGNAL_CODES[t] for t in (signal_types or SIGNAL_CODES)]
+
+        result = {
+            ticker: {_CODE_KEYS[code]: [] for code in (BUY, WATCH, RED_FLAG)}
+            for ticker in packed.tickers
+        }
+        for row, code, signal in self._signals(packed, wanted, self._metric_order(universe, packed)):
+            result[packed.tickers[row]][_CODE_KEYS[code]].append(signal)
+        return result
+
+    def screen(
+        self,
+        universe: Union[Dict[str, Dict], PackedSectorData],
+        signal_type: Union[SignalType, str] = SignalType.BUY
+    ) -> Dict[str, List[Signal]]:
+        """
+        Empresas con al menos una señal del tipo pedido
+
+        Args:
+            universe: {ticker: metrics} o PackedSectorData
+            signal_type: SignalType o 'BUY' / 'WATCH' / 'RED_FLAG'
+
+        Returns:
+            {ticker: [Signal, ...]} (sólo tickers con hits)
+
+        Example:
+            >>> detector.screen(universe_metrics, 'RED_FLAG')
+            {'XYZ': [Signal(RED_FLAG: CurrentRatio = 0.6 vs 1.1)], ...}
+        """
+        if isinstance(signal_type, str):
+            signal_type = SignalType[signal_type.upper()]
+
+        packed = self.pack(universe)
+        order = self._metric_order(universe, packed)
+        hits: Dict[str, List[Signal]] = {}
+        for row, _, signal in self._signals(packed, [SIGNAL_CODES[signal_type]], order):
+            hits.setdefault(packed.tickers[row], []).append(signal)
+        return hits
+
+    @staticmethod
+    def _metric_order(
+        universe: Union[Dict[str, Dict], PackedSectorData],
+        packed: PackedSectorData
+    ) -> Optional[np.ndarray]:
+        """
+        (C × K) posición de cada métrica en el dict de su empresa
+
+        Las columnas de pack_sector_data son la unión en orden de aparición;
+        una empresa a la que le falta una métrica que otra tiene más adelante
+        deja las columnas en otro orden que su propio dict, que es el orden
+        de SignalDetector.detect_all(). None para un PackedSectorData (no
+        hay dicts: se usa el orden de columnas).
+        """
+        if isinstance(universe, PackedSectorData):
+            return None
+
+        columns = {key: col for col, key in enumerate(packed.keys)}
+        order = np.tile(np.arange(len(packed.keys)), (len(packed.tickers), 1))
+        for row, ticker in enumerate(packed.tickers):
+            position = 0
+            for category, metrics_dict in universe[ticker].items():
+                for metric in metrics_dict.keys():
+                    col = columns.get((category, metric))
+                    if col is not None:
+                        order[row, col] = position
+                        position += 1
+        return order
+
+    def _signals(
+        self,
+        packed: PackedSectorData,
+        wanted: List[int],
+        order: Optional[np.ndarray] = None
+    ):
+        """(row, code, Signal) por hit, en orden empresa → métrica (order o columnas)."""
+        benchmarks, thresholds = self.thresholds(packed.keys)
+        codes = self._classify(packed, thresholds)
+        cagr, has_trend = self.trends(packed)
+        latest = packed.value_at(0)
+        multi_year = packed.lengths >= 2
+
+        categories = [CATEGORY_ENUMS.get(c, SignalCategory.PROFITABILITY) for c, _ in packed.keys]
+        inverse = [metric in INVERSE_METRICS for _, metric in packed.keys]
+
+        rows, cols = np.nonzero(np.isin(codes, wanted))
+        if order is not None:
+            by_company = np.lexsort((order[rows, cols], rows))
+            rows, cols = rows[by_company], cols[by_company]
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            code = int(codes[row, col])
+            signal_type = _CODE_TYPES[code]
+            benchmark = benchmarks[col]
+            metric = packed.keys[col][1]
+            value = float(latest[row, col])
+
+            trend = None
+            if multi_year[row, col]:
+                trend = format_trend(cagr[row, col]) if has_trend[row, col] else ""
+
+            yield row, code, Signal(
+                signal_type,
+                categories[col],
+                metric,
+                value,
+                float(thresholds[col, 2 - code]),  # BUY → p75, WATCH → p50, RED_FLAG → p25
+                generate_signal_message(metric, value, benchmark, signal_type, inverse[col]),
+                trend
+            )
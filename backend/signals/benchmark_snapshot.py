@@ -0,0 +1,279 @@
+"""
+Benchmark Snapshots - Estado binario de StatisticalBenchmarkEngine
+
+load_sector_benchmarks() re-parsea cada filing del sector en cada arranque
+(MultiFileXBRLParser + 25 ratios) sólo para reconstruir el mismo engine.
+Un snapshot guarda ese estado en un archivo binario versionado que se
+abre con memory-map:
+
+    ┌──────────────────────────────┐
+    │ header  '<4sII'              │ magic 'SBS1', versión, len(meta)
+    │ meta    JSON (utf-8)         │ sector, tickers, keys, shape, provenance
+    │ ── padding (64 bytes) ──     │
+    │ values      float64[C, K, Y] │ sector matrix (NaN padding)
+    │ lengths     int32[C, K]      │ largo del array (-1 = métrica ausente)
+    │ benchmarks  float64[K, 8]    │ p10..p90, mean, std, sample_size
+    └──────────────────────────────┘
+
+- Abrir lee sólo header + meta; las matrices son np.memmap (páginas bajo
+  demanda, compartidas entre procesos)
+- sector_data se reconstruye lazy por ticker como vistas del memmap
+- Benchmarks precalculados → IndustryBenchmark sin recalcular percentiles
+- provenance (sector, tickers, parámetros, fingerprint de filings y de
+  definiciones de métricas) permite validar el snapshot antes de usarlo
+
+Usage:
+    engine = load_sector_benchmarks('TECH')                  # ingesta completa
+    write_snapshot(engine, 'data/snapshots/TECH.sbs', provenance)
+
+    snapshot = BenchmarkSnapshot('data/snapshots/TECH.sbs')  # ~ms
+    if snapshot.matches(expected_provenance):
+        engine = snapshot.engine()
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import json
+import struct
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from backend.signals.statistical_engine import (
+    IndustryBenchmark, PackedSectorData, StatisticalBenchmarkEngine, pack_sector_data
+)
+from backend.utils.atomic_io import atomic_write
+
+
+SNAPSHOT_VERSION = 1
+
+_MAGIC = b'SBS1'
+_HEADER = struct.Struct('<4sII')  # magic, version, len(meta)
+_ALIGN = 64
+
+BENCHMARK_FIELDS = ('p10', 'p25', 'p50', 'p75', 'p90', 'mean', 'std', 'sample_size')
+
+
+def _align(offset: int, alignment: int = _ALIGN) -> int:
+    return -(-offset // alignment) * alignment
+
+
+def write_snapshot(
+    engine: StatisticalBenchmarkEngine,
+    path: Union[str, Path],
+    provenance: Optional[Dict] = None
+) -> Path:
+    """
+    Escribe el estado del engine como snapshot binario (escritura atómica).
+
+    Args:
+        engine: StatisticalBenchmarkEngine con sector_data
+        path: Archivo destino (ej: 'data/snapshots/TECH.sbs')
+        provenance: Metadata JSON-serializable para validar el snapshot
+                    (ver BenchmarkSnapshot.matches)
+
+    Returns:
+        Path del snapshot
+
+    Raises:
+        ValueError: Si el engine no tiene sector_data (ej: modo sketch)
+    """
+    if not engine.sector_data:
+        raise ValueError("Cannot snapshot an engine without sector_data")
+
+    packed = pack_sector_data(engine.sector_data)
+    tickers, keys, values, lengths = packed.tickers, packed.keys, packed.values, packed.lengths
+
+    computed = engine._benchmarks_from_matrix(keys, packed.value_at(-1))
+    benchmarks = np.full((len(keys), len(BENCHMARK_FIELDS)), np.nan)
+    for col, key in enumerate(keys):
+        benchmark = computed.get(key)
+        if benchmark is not None:
+            benchmarks[col] = [getattr(benchmark, field) for field in BENCHMARK_FIELDS]
+
+    lengths_offset = values.nbytes
+    benchmarks_offset = _align(lengths_offset + lengths.nbytes, 8)
+    meta = json.dumps({
+        'sector_code': engine.sector_code,
+        'tickers': tickers,
+        'keys': [list(key) for key in keys],
+        'shape': list(values.shape),
+        'offsets': {'values': 0, 'lengths': lengths_offset, 'benchmarks': benchmarks_offset},
+        'created_at': datetime.now().isoformat(),
+        'provenance': provenance or {},
+    }).encode()
+
+    header = _HEADER.pack(_MAGIC, SNAPSHOT_VERSION, len(meta))
+    data_start = _align(len(header) + len(meta))
+
+    def write(f):
+        f.write(header)
+        f.write(meta)
+        f.write(b'\0' * (data_start - len(header) - len(meta)))
+        f.write(values.tobytes())
+        f.write(lengths.tobytes())
+        f.write(b'\0' * (benchmarks_offset - lengths_offset - lengths.nbytes))
+        f.write(benchmarks.tobytes())
+
+    return atomic_write(path, write)
+
+
+class SnapshotSectorData(Mapping):
+    """
+    sector_data {ticker: {category: {metric: np.ndarray}}} sobre un snapshot
+
+    Cada empresa se materializa al accederla (vistas read-only del memmap,
+    sin copiar valores).
+    """
+
+    def __init__(self, snapshot: 'BenchmarkSnapshot'):
+        self._snapshot = snapshot
+        self._rows = {ticker: row for row, ticker in enumerate(snapshot.tickers)}
+        self._companies: Dict[str, Dict] = {}
+
+    def __getitem__(self, ticker: str) -> Dict[str, Dict[str, np.ndarray]]:
+        company = self._companies.get(ticker)
+        if company is None:
+            row = self._rows[ticker]
+            values, lengths = self._snapshot.values[row], self._snapshot.lengths[row]
+            company = {}
+            for col, (category, metric) in enumerate(self._snapshot.keys):
+                if lengths[col] >= 0:
+                    company.setdefault(category, {})[metric] = values[col, :lengths[col]]
+            self._companies[ticker] = company
+        return company
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class BenchmarkSnapshot:
+    """
+    Snapshot abierto con memory-map.
+
+    Attributes:
+        path: Archivo del snapshot
+        sector_code: Sector del engine original
+        tickers: Empresas (orden de filas)
+        keys: [(category, metric), ...] (orden de columnas)
+        provenance: Metadata pasada a write_snapshot()
+        created_at: Timestamp ISO de escritura
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Lee header + meta (las matrices se mapean bajo demanda).
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            ValueError: Si el formato o la versión no son válidos
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"Invalid benchmark snapshot: {self.path}")
+            magic, version, meta_size = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError(f"Invalid benchmark snapshot (bad magic): {self.path}")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(
+                    f"Unsupported snapshot version {version} (expected {SNAPSHOT_VERSION})"
+                )
+            try:
+                meta = json.loads(f.read(meta_size))
+            except ValueError as e:
+                raise ValueError(f"Invalid benchmark snapshot metadata: {e}") from None
+
+        self.sector_code: str = meta['sector_code']
+        self.tickers: List[str] = meta['tickers']
+        self.keys: List[Tuple[str, str]] = [tuple(key) for key in meta['keys']]
+        self.provenance: Dict = meta['provenance']
+        self.created_at: str = meta['created_at']
+        self._shape = tuple(meta['shape'])
+        self._offsets = meta['offsets']
+        self._data_start = _align(_HEADER.size + meta_size)
+
+        expected = self._data_start + self._offsets['benchmarks'] + \
+            len(self.keys) * len(BENCHMARK_FIELDS) * 8
+        if self.path.stat().st_size < expected:
+            raise ValueError(f"Truncated benchmark snapshot: {self.path}")
+
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def _map(self, name: str, dtype, shape: Tuple[int, ...]) -> np.ndarray:
+        array = self._arrays.get(name)
+        if array is None:
+            array = np.asarray(np.memmap(
+                self.path, dtype=dtype, mode='r',
+                offset=self._data_start + self._offsets[name], shape=shape
+            ))
+            self._arrays[name] = array
+        return array
+
+    @property
+    def values(self) -> np.ndarray:
+        """float64[C, K, Y] (memmap, read-only)"""
+        return self._map('values', np.float64, self._shape)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """int32[C, K]: largo de cada array, -1 si la empresa no tiene la métrica"""
+        return self._map('lengths', np.int32, self._shape[:2])
+
+    def packed(self) -> PackedSectorData:
+        """Matrices del snapshot como PackedSectorData (sin copiar)."""
+        return PackedSectorData(list(self.tickers), list(self.keys), self.values, self.lengths)
+
+    def latest_matrix(self) -> np.ndarray:
+        """(C × K) valores del último año, mismo criterio que el engine."""
+        return self.packed().value_at(-1)
+
+    def benchmarks(self) -> Dict[Tuple[str, str], IndustryBenchmark]:
+        """{(category, metric): IndustryBenchmark} precalculados (n ≥ 3)."""
+        table = self._map('benchmarks', np.float64, (len(self.keys), len(BENCHMARK_FIELDS)))
+
+        benchmarks = {}
+        for (category, metric), row in zip(self.keys, table):
+            if np.isnan(row[-1]):
+                continue
+            fields = dict(zip(BENCHMARK_FIELDS, (float(v) for v in row)))
+            fields['sample_size'] = int(fields['sample_size'])
+            benchmarks[(category, metric)] = IndustryBenchmark(
+                metric_name=metric, sector=self.sector_code, **fields
+            )
+        return benchmarks
+
+    def sector_data(self) -> SnapshotSectorData:
+        """sector_data lazy (vistas del memmap)."""
+        return SnapshotSectorData(self)
+
+    def engine(self) -> StatisticalBenchmarkEngine:
+        """
+        StatisticalBenchmarkEngine con sector_data lazy y cache de
+        benchmarks precargado (sin recalcular percentiles).
+        """
+        engine = StatisticalBenchmarkEngine(self.sector_data(), sector_code=self.sector_code)
+        for (category, metric), benchmark in self.benchmarks().items():
+            engine._benchmarks_cache[f"{category}:{metric}"] = benchmark
+        return engine
+
+    def matches(self, expected: Dict) -> bool:
+        """
+        True si cada entrada de `expected` coincide con la provenance.
+
+        Example:
+            >>> snapshot.matches({'sector_code': 'TECH', 'source_fingerprint': fp})
+        """
+        return all(self.provenance.get(key) == value for key, value in expected.items())
+
+    def __repr__(self) -> str:
+        return (f"BenchmarkSnapshot({self.sector_code}, companies={len(self.tickers)}, "
+                f"metrics={len(self.keys)}, created_at={self.created_at})")
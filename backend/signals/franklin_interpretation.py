@@ -9,13 +9,17 @@ Features:
 - Context-aware interpretations
 - Sector-relative scoring
 - Human-readable messages
+- Batch zones: np.searchsorted over (P25, P50, P75, P90) breakpoints →
+  zone indices + 5 shared PerformanceZone per benchmark (Sprint 8)
 
 Author: @franklin (CTO)
 Sprint 5 - Franklin Framework
+Sprint 8 - Universe-Scale Metrics (batch zone classification)
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
+import numpy as np
 from backend.signals.statistical_engine import IndustryBenchmark
 
 
@@ -47,6 +51,117 @@ class PerformanceZone:
     percentile_range: str
 
 
+# Zone index → (name, icon, relative_position, percentile_range)
+# Index = number of breakpoints (P25, P50, P75, P90) at or below the value
+ZONE_SPECS = (
+    ("Underperformance", "🔻", "bottom", "P0-P24"),
+    ("Below Median", "↘️", "below_avg", "P25-P49"),
+    ("Above Median", "✅", "avg", "P50-P74"),
+    ("Strong Performance", "↗️", "above_avg", "P75-P89"),
+    ("Elite Performance", "🏆", "top", "P90-P100"),
+)
+
+# Percentile breakpoints for interpret_percentile
+PERCENTILE_BREAKPOINTS = np.array([25, 50, 75, 90], dtype=np.float64)
+
+
+def _value_description(index: int, benchmark: IndustryBenchmark, metric_str: str) -> str:
+    """Description of a value-based zone (interpret_value)."""
+    if index == 4:
+        return (f"{metric_str}in top 10% of sector "
+                f"(P90: {benchmark.p90:.1f}, n={benchmark.sample_size})")
+    elif index == 3:
+        return (f"{metric_str}in top quartile "
+                f"(P75: {benchmark.p75:.1f}, P90: {benchmark.p90:.1f})")
+    elif index == 2:
+        return (f"{metric_str}above sector median "
+                f"(P50: {benchmark.p50:.1f}, P75: {benchmark.p75:.1f})")
+    elif index == 1:
+        return (f"{metric_str}below sector median "
+                f"(P25: {benchmark.p25:.1f}, P50: {benchmark.p50:.1f})")
+    else:
+        return (f"{metric_str}in bottom quartile "
+                f"(P10: {benchmark.p10:.1f}, P25: {benchmark.p25:.1f})")
+
+
+def _percentile_description(index: int, percentile: int, metric_str: str) -> str:
+    """Description of a percentile-based zone (interpret_percentile)."""
+    return f"{metric_str}" + (
+        f"in top 10% ({percentile}th percentile)",
+        f"in top quartile ({percentile}th percentile)",
+        f"above median ({percentile}th percentile)",
+        f"below median ({percentile}th percentile)",
+        f"in bottom quartile ({percentile}th percentile)",
+    )[4 - index]
+
+
+def _zone(index: int, description: str) -> PerformanceZone:
+    name, icon, relative_position, percentile_range = ZONE_SPECS[index]
+    return PerformanceZone(
+        name=name,
+        icon=icon,
+        description=description,
+        relative_position=relative_position,
+        percentile_range=percentile_range
+    )
+
+
+def benchmark_breakpoints(benchmark: IndustryBenchmark) -> np.ndarray:
+    """(P25, P50, P75, P90) as a float64 array for np.searchsorted."""
+    return np.array([benchmark.p25, benchmark.p50, benchmark.p75, benchmark.p90], dtype=np.float64)
+
+
+def zone_indices(values, breakpoints: np.ndarray) -> np.ndarray:
+    """
+    Zone index (0 = Underperformance … 4 = Elite) for every value
+
+    Same result as the interpret_value / interpret_percentile ladders
+    (value >= breakpoint), including NaN → 0.
+
+    Args:
+        values: Values (any shape)
+        breakpoints: Ascending breakpoints (4,)
+
+    Returns:
+        int8 array with the shape of values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    indices = np.searchsorted(breakpoints, values, side='right').astype(np.int8)
+    indices[np.isnan(values)] = 0
+    return indices
+
+
+@dataclass
+class ZoneClassification:
+    """
+    Batch zone result: indices into shared, pre-built zones
+
+    Attributes:
+        indices: int8 array (shape of the input values)
+        zones: 5 PerformanceZone (index 0 = Underperformance … 4 = Elite),
+               shared by every value (treat as read-only)
+
+    Example:
+        >>> result = FranklinInterpretation.interpret_values(roe_matrix, roe_benchmark, 'ROE')
+        >>> result[3, 0].name            # PerformanceZone of row 3, column 0
+        >>> result.names()               # object array of zone names
+    """
+    indices: np.ndarray
+    zones: Tuple[PerformanceZone, ...]
+
+    def __getitem__(self, index) -> PerformanceZone:
+        return self.zones[int(self.indices[index])]
+
+    def names(self) -> np.ndarray:
+        """Zone name per value (object array, shape of indices)."""
+        return np.array([zone.name for zone in self.zones], dtype=object)[self.indices]
+
+    def counts(self) -> dict:
+        """{zone name: number of values}"""
+        counts = np.bincount(self.indices.ravel(), minlength=len(self.zones))
+        return {zone.name: int(n) for zone, n in zip(self.zones, counts)}
+
+
 class FranklinInterpretation:
     """
     Dynamic interpretation engine using real sector benchmarks
@@ -101,70 +216,20 @@ class FranklinInterpretation:
         """
         metric_str = f"{metric_name} " if metric_name else ""
 
-        # Elite Performance: Above P90
+        # Elite (>= P90), Strong (P75-P90), Above Median (P50-P75),
+        # Below Median (P25-P50), Underperformance (< P25)
         if value >= benchmark.p90:
-            return PerformanceZone(
-                name="Elite Performance",
-                icon="🏆",
-                description=(
-                    f"{metric_str}in top 10% of sector "
-                    f"(P90: {benchmark.p90:.1f}, n={benchmark.sample_size})"
-                ),
-                relative_position="top",
-                percentile_range="P90-P100"
-            )
-
-        # Strong Performance: P75-P90
+            index = 4
         elif value >= benchmark.p75:
-            return PerformanceZone(
-                name="Strong Performance",
-                icon="↗️",
-                description=(
-                    f"{metric_str}in top quartile "
-                    f"(P75: {benchmark.p75:.1f}, P90: {benchmark.p90:.1f})"
-                ),
-                relative_position="above_avg",
-                percentile_range="P75-P89"
-            )
-
-        # Above Median: P50-P75
+            index = 3
         elif value >= benchmark.p50:
-            return PerformanceZone(
-                name="Above Median",
-                icon="✅",
-                description=(
-                    f"{metric_str}above sector median "
-                    f"(P50: {benchmark.p50:.1f}, P75: {benchmark.p75:.1f})"
-                ),
-                relative_position="avg",
-                percentile_range="P50-P74"
-            )
-
-        # Below Median: P25-P50
+            index = 2
         elif value >= benchmark.p25:
-            return PerformanceZone(
-                name="Below Median",
-                icon="↘️",
-                description=(
-                    f"{metric_str}below sector median "
-                    f"(P25: {benchmark.p25:.1f}, P50: {benchmark.p50:.1f})"
-                ),
-                relative_position="below_avg",
-                percentile_range="P25-P49"
-            )
-
-        # Underperformance: Below P25
+            index = 1
         else:
-            return PerformanceZone(
-                name="Underperformance",
-                icon="🔻",
-                description=(
-                    f"{metric_str}in bottom quartile "
-                    f"(P10: {benchmark.p10:.1f}, P25: {benchmark.p25:.1f})"
-                ),
-                relative_position="bottom",
-                percentile_range="P0-P24"
-            )
+            index = 0
+
+        return _zone(index, _value_description(index, benchmark, metric_str))
 
     @staticmethod
     def interpret_percentile(
@@ -194,45 +259,76 @@ class FranklinInterpretation:
         metric_str = f"{metric_name} " if metric_name else ""
 
         if percentile >= 90:
-            return PerformanceZone(
-                name="Elite Performance",
-                icon="🏆",
-                description=f"{metric_str}in top 10% ({percentile}th percentile)",
-                relative_position="top",
-                percentile_range="P90-P100"
-            )
+            index = 4
         elif percentile >= 75:
-            return PerformanceZone(
-                name="Strong Performance",
-                icon="↗️",
-                description=f"{metric_str}in top quartile ({percentile}th percentile)",
-                relative_position="above_avg",
-                percentile_range="P75-P89"
-            )
+            index = 3
         elif percentile >= 50:
-            return PerformanceZone(
-                name="Above Median",
-                icon="✅",
-                description=f"{metric_str}above median ({percentile}th percentile)",
-                relative_position="avg",
-                percentile_range="P50-P74"
-            )
+            index = 2
         elif percentile >= 25:
-            return PerformanceZone(
-                name="Below Median",
-                icon="↘️",
-                description=f"{metric_str}below median ({percentile}th percentile)",
-                relative_position="below_avg",
-                percentile_range="P25-P49"
-            )
+            index = 1
         else:
-            return PerformanceZone(
-                name="Underperformance",
-                icon="🔻",
-                description=f"{metric_str}in bottom quartile ({percentile}th percentile)",
-                relative_position="bottom",
-                percentile_range="P0-P24"
-            )
+            index = 0
+
+        return _zone(index, _percentile_description(index, percentile, metric_str))
+
+    # ------------------------------------------------------------------
+    # Batch API (Sprint 8)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def benchmark_zones(
+        benchmark: IndustryBenchmark,
+        metric_name: Optional[str] = None
+    ) -> Tuple[PerformanceZone, ...]:
+        """
+        The 5 zones interpret_value can return for a benchmark, built once
+
+        Returns:
+            Tuple indexed by zone index (0 = Underperformance … 4 = Elite)
+        """
+        metric_str = f"{metric_name} " if metric_name else ""
+        return tuple(
+            _zone(index, _value_description(index, benchmark, metric_str))
+            for index in range(len(ZONE_SPECS))
+        )
+
+    @staticmethod
+    def interpret_values(
+        values,
+        benchmark: IndustryBenchmark,
+        metric_name: Optional[str] = None
+    ) -> ZoneClassification:
+        """
+        interpret_value for an array of values in one vectorized call
+
+        Args:
+            values: Array of any shape (e.g. companies × years of one metric)
+            benchmark: IndustryBenchmark with calculated percentiles
+            metric_name: Optional metric name for context
+
+        Returns:
+            ZoneClassification (result[i] == interpret_value(values[i], ...))
+
+        Example:
+            >>> roe = np.array([[164.6, 151.9], [12.0, 15.3]])
+            >>> zones = FranklinInterpretation.interpret_values(roe, roe_benchmark, 'ROE')
+            >>> zones.indices
+            array([[4, 4], [0, 1]], dtype=int8)
+        """
+        return ZoneClassification(
+            indices=zone_indices(values, benchmark_breakpoints(benchmark)),
+            zones=FranklinInterpretation.benchmark_zones(benchmark, metric_name)
+        )
+
+    @staticmethod
+    def percentile_zone_indices(percentiles) -> np.ndarray:
+        """
+        Zone index per percentile rank (same cuts as interpret_percentile)
+
+        Descriptions of percentile zones include the percentile itself, so
+        only indices are returned; use interpret_percentile for the text.
+        """
+        return zone_indices(percentiles, PERCENTILE_BREAKPOINTS)
 
     @staticmethod
     def get_signal_type(
@@ -4,14 +4,25 @@ Peer Comparison Engine - Dynamic Benchmarking (Franklin Framework)
 Uses StatisticalBenchmarkEngine and FranklinInterpretation for context-aware
 peer comparison without hardcoded percentile cuts.
 
+Sprint 8 - Universe-Scale Metrics:
+- PeerDistribution: valores de peers ordenados y sin NaN por métrica
+  (se construyen una vez, lazy); percentil por searchsorted O(log n)
+- PeerGroup.rank_matrix(): todas las empresas × todas las métricas en una
+  llamada → matriz de percentiles (mismo valor que calculate_percentile)
+- LeaveOneOutPeers: cada empresa contra el resto del grupo en forma
+  cerrada (columna ordenada una vez), sin un grupo por empresa
+
 Author: @franklin (CTO)
 Sprint 5 - Franklin Framework Refactor
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import numpy as np
-from backend.signals.statistical_engine import StatisticalBenchmarkEngine, IndustryBenchmark
+from backend.signals.statistical_engine import (
+    IndustryBenchmark, PackedSectorData, StatisticalBenchmarkEngine
+)
 from backend.signals.franklin_interpretation import FranklinInterpretation
 
 
@@ -69,6 +80,480 @@ def calculate_percentile(value: float, peer_values: np.ndarray) -> int:
     return percentile
 
 
+def percentiles_from_sorted(values: np.ndarray, sorted_peers: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_percentile over a sorted, NaN-free peer array
+
+    Same definition: int(count(peers < value) / n * 100), 50 when there are
+    no peers, 0 for a NaN value (no peer compares below NaN).
+
+    Args:
+        values: Values to rank (any shape)
+        sorted_peers: Ascending peer values without NaN
+
+    Returns:
+        int64 array with the shape of values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(sorted_peers) == 0:
+        return np.full(values.shape, 50, dtype=np.int64)
+
+    below = np.searchsorted(sorted_peers, values, side='left')
+    below = np.where(np.isnan(values), 0, below)
+    return (below / len(sorted_peers) * 100).astype(np.int64)
+
+
+@dataclass
+class PeerDistribution:
+    """
+    Latest-year peer values for one metric, sorted once for rank lookups
+
+    Attributes:
+        sorted_values: Ascending peer values (NaN removed)
+        peer_count: Peers with a value (NaN included, as PeerBenchmark)
+        median: Median of valid values
+        mean: Mean of valid values
+    """
+    sorted_values: np.ndarray
+    peer_count: int
+    median: float
+    mean: float
+
+    @classmethod
+    def from_values(cls, peer_values: np.ndarray) -> Optional['PeerDistribution']:
+        """None si no hay ningún valor válido."""
+        peer_values = np.asarray(peer_values, dtype=np.float64)
+        valid = peer_values[~np.isnan(peer_values)]
+        if len(valid) == 0:
+            return None
+        return cls(
+            sorted_values=np.sort(valid),
+            peer_count=len(peer_values),
+            median=float(np.median(valid)),
+            mean=float(np.mean(valid))
+        )
+
+    def percentile(self, value: float) -> int:
+        """Same result as calculate_percentile(value, peer_values)."""
+        return int(percentiles_from_sorted(value, self.sorted_values))
+
+    def percentiles(self, values: np.ndarray) -> np.ndarray:
+        """Vectorized percentile() (int64 array)."""
+        return percentiles_from_sorted(values, self.sorted_values)
+
+
+@dataclass
+class PeerRankMatrix:
+    """
+    Percentile rank of every company on every metric
+
+    Attributes:
+        tickers: Row labels
+        keys: Column labels [(category, metric), ...]
+        percentiles: float64 (company × metric); NaN where the company
+                     lacks the metric or there are no valid peers
+    """
+    tickers: List[str]
+    keys: List[Tuple[str, str]]
+    percentiles: np.ndarray
+
+    def get(self, ticker: str, category: str, metric: str) -> Optional[int]:
+        """Percentil de una empresa en una métrica (None si no aplica)."""
+        value = self.percentiles[self.tickers.index(ticker), self.keys.index((category, metric))]
+        return None if np.isnan(value) else int(value)
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """{ticker: {category: {metric: percentile}}} (sin NaN)"""
+        result: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for row, ticker in enumerate(self.tickers):
+            company = result.setdefault(ticker, {})
+            for col, (category, metric) in enumerate(self.keys):
+                value = self.percentiles[row, col]
+                if not np.isnan(value):
+                    company.setdefault(category, {})[metric] = int(value)
+        return result
+
+
+class _ExcludingView(Mapping):
+    """peer_metrics de un grupo sin un ticker, sin copiar el dict (O(1))."""
+
+    __slots__ = ('_base', '_excluded')
+
+    def __init__(self, base: Mapping, excluded: str):
+        self._base = base
+        self._excluded = excluded
+
+    def __getitem__(self, ticker: str) -> Dict:
+        if ticker == self._excluded:
+            raise KeyError(ticker)
+        return self._base[ticker]
+
+    def __iter__(self) -> Iterator[str]:
+        return (ticker for ticker in self._base if ticker != self._excluded)
+
+    def __len__(self) -> int:
+        return len(self._base) - (self._excluded in self._base)
+
+
+def _latest_value(metrics: Dict, category: str, metric: str) -> Optional[float]:
+    """Último valor (index -1) o None si la empresa no tiene la métrica."""
+    if category not in metrics or metric not in metrics[category]:
+        return None
+    values = metrics[category][metric]
+    if len(values) == 0:
+        return None
+    return float(values[-1])
+
+
+class PeerGroup:
+    """
+    Peer metrics with per-metric sorted distributions (built lazily)
+
+    Only the metrics that are queried are read, so LazyMetrics peers stay
+    lazy.
+
+    Example:
+        >>> peers = PeerGroup({'MSFT': msft_metrics, 'GOOGL': googl_metrics})
+        >>> peers.percentile('profitability', 'ROE', 151.9)
+        >>> ranks = peers.rank_matrix({'AAPL': aapl_metrics, 'NVDA': nvda_metrics})
+        >>> ranks.get('AAPL', 'profitability', 'ROE')
+    """
+
+    def __init__(self, peer_metrics: Dict[str, Dict]):
+        """
+        Args:
+            peer_metrics: {ticker: metrics} (output de calculate_metrics)
+        """
+        self.peer_metrics = peer_metrics
+        self._distributions: Dict[Tuple[str, str], Optional[PeerDistribution]] = {}
+        self._columns: Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray]] = {}
+        self._parent: Optional[Tuple['PeerGroup', str]] = None
+
+    def excluding(self, ticker: str) -> 'PeerGroup':
+        """
+        Mismo grupo sin `ticker` (leave-one-out)
+
+        O(1): peer_metrics es una vista del dict padre (no se copia) y los
+        valores por métrica se leen una sola vez en el grupo padre; cada
+        grupo derivado sólo filtra ese array (O(N) por métrica consultada).
+
+        Example:
+            >>> sector = PeerGroup(sector_data)
+            >>> peers = sector.excluding('AAPL')   # == PeerGroup(sector_data sin AAPL)
+        """
+        group = PeerGroup(_ExcludingView(self.peer_metrics, ticker))
+        group._parent = (self, ticker)
+        return group
+
+    def _column(self, category: str, metric: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(tickers, latest values) de los peers con la métrica, en orden de peer_metrics."""
+        key = (category, metric)
+        if key not in self._columns:
+            if self._parent is not None:
+                parent, excluded = self._parent
+                tickers, values = parent._column(category, metric)
+                keep = tickers != excluded
+                self._columns[key] = (tickers[keep], values[keep])
+            else:
+                tickers, values = [], []
+                for ticker, peer_metric_dict in self.peer_metrics.items():
+                    value = _latest_value(peer_metric_dict, category, metric)
+                    if value is not None:
+                        tickers.append(ticker)
+                        values.append(value)
+                self._columns[key] = (np.array(tickers, dtype=object), np.array(values))
+        return self._columns[key]
+
+    def distribution(self, category: str, metric: str) -> Optional[PeerDistribution]:
+        """
+        Distribución de peers para una métrica (cacheada)
+
+        Returns:
+            PeerDistribution o None si ningún peer tiene un valor válido
+        """
+        key = (category, metric)
+        if key not in self._distributions:
+            _, values = self._column(category, metric)
+            self._distributions[key] = PeerDistribution.from_values(values)
+        return self._distributions[key]
+
+    def percentile(self, category: str, metric: str, value: float) -> Optional[int]:
+        """Percentil de value contra los peers (None sin peers válidos)."""
+        distribution = self.distribution(category, metric)
+        return None if distribution is None else distribution.percentile(value)
+
+    def rank_matrix(
+        self,
+        companies: Dict[str, Dict],
+        keys: Optional[Iterable[Tuple[str, str]]] = None
+    ) -> PeerRankMatrix:
+        """
+        Rank every company on every metric in one call
+
+        Args:
+            companies: {ticker: metrics} to rank (may be the peers themselves)
+            keys: [(category, metric), ...] (default: union in first-seen order)
+
+        Returns:
+            PeerRankMatrix (company × metric)
+
+        Example:
+            >>> universe = calculate_universe_metrics(timeseries_by_ticker)
+            >>> ranks = PeerGroup(universe).rank_matrix(universe)
+        """
+        tickers = list(companies)
+        if keys is None:
+            seen: Dict[Tuple[str, str], None] = {}
+            for metrics in companies.values():
+                for category, metrics_dict in metrics.items():
+                    for metric in metrics_dict.keys():
+                        seen.setdefault((category, metric))
+            keys = list(seen)
+        else:
+            keys = list(keys)
+
+        percentiles = np.full((len(tickers), len(keys)), np.nan)
+        for col, (category, metric) in enumerate(keys):
+            distribution = self.distribution(category, metric)
+            if distribution is None:
+                continue
+
+            rows, values = [], []
+            for row, metrics in enumerate(companies.values()):
+                value = _latest_value(metrics, category, metric)
+                if value is not None:
+                    rows.append(row)
+                    values.append(value)
+            if rows:
+                percentiles[rows, col] = distribution.percentiles(np.array(values))
+
+        return PeerRankMatrix(tickers=tickers, keys=keys, percentiles=percentiles)
+
+
+def _leave_one_out_column(
+    values: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (percentile, median, mean, beats, valid peers) de cada fila contra el
+    resto de la columna, con la columna ordenada una sola vez
+    """
+    valid = ~np.isnan(values)
+    sorted_values = np.sort(values[valid])
+    n = len(sorted_values)
+
+    # Peers válidos sin la empresa (si la empresa tiene valor)
+    peer_count = np.where(valid, n - 1, n)
+    has_peers = peer_count > 0
+    position = np.searchsorted(sorted_values, values, side='left')
+
+    with np.errstate(all='ignore'):
+        ranks = np.where(valid, position, 0) / np.where(has_peers, peer_count, 1) * 100
+    percentiles = np.where(has_peers, ranks.astype(np.int64), -1)
+
+    if n == 0:
+        empty = np.full(values.shape, np.nan)
+        return percentiles, empty, empty, np.zeros(values.shape, dtype=bool), peer_count
+
+    # Mediana de los peers: índices de la columna ordenada sin `position`
+    def peer_value(j):
+        j = np.clip(j, 0, max(n - 1, 0))
+        shifted = np.where(valid & (j >= position), j + 1, j)
+        return sorted_values[np.clip(shifted, 0, n - 1)]
+
+    middle = peer_count // 2
+    odd = peer_count % 2 == 1
+    median = np.where(
+        odd,
+        peer_value(middle),
+        (peer_value(middle - 1) + peer_value(middle)) / 2
+    )
+    median = np.where(has_peers, median, np.nan)
+
+    # Media de los peers: suma finita menos la empresa; ±inf por conteo
+    finite = np.isfinite(values)
+    own = np.where(finite, values, 0.0)
+    positive_inf = np.sum(sorted_values == np.inf) - (values == np.inf)
+    negative_inf = np.sum(sorted_values == -np.inf) - (values == -np.inf)
+    with np.errstate(all='ignore'):
+        mean = (np.sum(sorted_values[np.isfinite(sorted_values)]) - own) / peer_count
+    mean = np.where(positive_inf > 0, np.inf, mean)
+    mean = np.where(negative_inf > 0, np.where(positive_inf > 0, np.nan, -np.inf), mean)
+    mean = np.where(has_peers, mean, np.nan)
+
+    beats = has_peers & (values > median)
+    return percentiles, median, mean, beats, peer_count
+
+
+def leave_one_out_ranks(latest: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Percentil y beats_peers de cada empresa contra el resto de la columna
+
+    Mismo resultado que PeerComparison con PeerGroup.excluding(ticker),
+    sin construir un grupo por empresa: con la columna ordenada una vez,
+    quitar la empresa sólo corre los índices de la mediana.
+
+    Args:
+        latest: (C × K) último valor por empresa y métrica (NaN = sin valor)
+
+    Returns:
+        (percentiles, beats): int64 (C × K) con -1 donde no hay peers
+        válidos, y bool (C × K) company_value > mediana de los peers
+    """
+    latest = np.asarray(latest, dtype=np.float64)
+    percentiles = np.full(latest.shape, -1, dtype=np.int64)
+    beats = np.zeros(latest.shape, dtype=bool)
+    for col in range(latest.shape[1]):
+        percentiles[:, col], _, _, beats[:, col], _ = _leave_one_out_column(latest[:, col])
+    return percentiles, beats
+
+
+@dataclass
+class LeaveOneOutPeers:
+    """
+    PeerBenchmark stats de cada empresa contra el resto del grupo
+
+    Se calculan una vez para todo el grupo (leave_one_out_ranks + mediana,
+    media y conteo de peers) en vez de un PeerGroup.excluding(ticker) y una
+    PeerDistribution por empresa. Mismo resultado que PeerComparison contra
+    el grupo sin la empresa (peer_mean salvo redondeo de la suma).
+
+    Attributes:
+        tickers: Row labels
+        keys: Column labels [(category, metric), ...]
+        percentiles: int64 (C × K), -1 sin peers válidos
+        medians: float64 (C × K) mediana de los peers válidos
+        means: float64 (C × K) media de los peers válidos
+        beats: bool (C × K) company_value > mediana
+        peer_counts: int64 (C × K) peers con la métrica (NaN incluido)
+        present: bool (C × K) la empresa tiene la métrica (array no vacío)
+        latest: float64 (C × K) último valor de cada empresa
+    """
+    tickers: List[str]
+    keys: List[Tuple[str, str]]
+    percentiles: np.ndarray
+    medians: np.ndarray
+    means: np.ndarray
+    beats: np.ndarray
+    peer_counts: np.ndarray
+    present: np.ndarray
+    latest: np.ndarray
+    _rows: Dict[str, int] = field(init=False, repr=False)
+    _columns: Dict[Tuple[str, str], int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._rows = {ticker: row for row, ticker in enumerate(self.tickers)}
+        self._columns = {tuple(key): col for col, key in enumerate(self.keys)}
+
+    @classmethod
+    def from_packed(cls, packed: PackedSectorData) -> 'LeaveOneOutPeers':
+        """
+        Example:
+            >>> peers = LeaveOneOutPeers.from_packed(pack_sector_data(sector_data))
+            >>> peers.compare_all('AAPL', sector_data['AAPL'], engine)
+        """
+        latest = packed.value_at(-1)
+        present = packed.lengths > 0
+        shape = latest.shape
+
+        percentiles = np.full(shape, -1, dtype=np.int64)
+        medians, means = np.full(shape, np.nan), np.full(shape, np.nan)
+        beats = np.zeros(shape, dtype=bool)
+        for col in range(shape[1]):
+            percentiles[:, col], medians[:, col], means[:, col], beats[:, col], _ = \
+                _leave_one_out_column(latest[:, col])
+        peer_counts = present.sum(axis=0) - present
+
+        return cls(
+            tickers=list(packed.tickers), keys=list(packed.keys),
+            percentiles=percentiles, medians=medians, means=means, beats=beats,
+            peer_counts=peer_counts.astype(np.int64), present=present, latest=latest
+        )
+
+    def compare_all(
+        self,
+        ticker: str,
+        company_metrics: Dict,
+        benchmark_engine: Optional[StatisticalBenchmarkEngine] = None,
+        metric_names: Optional[Iterable[str]] = None
+    ) -> Dict[str, List[PeerBenchmark]]:
+        """
+        Mismo resultado que PeerComparison(...).compare_all(metric_names)
+        contra el grupo sin `ticker`
+
+        Args:
+            ticker: Empresa (fila del grupo)
+            company_metrics: Métricas de la empresa (sólo define el orden)
+            benchmark_engine: Opcional - contexto del sector para interpretation
+            metric_names: Opcional - sólo estas métricas
+
+        Returns:
+            Dict of {category: [PeerBenchmark, ...]}
+        """
+        row = self._rows[ticker]
+        wanted = set(metric_names) if metric_names is not None else None
+
+        results = {}
+        for category, metrics_dict in company_metrics.items():
+            category_benchmarks = []
+            for metric_name in metrics_dict.keys():
+                if wanted is not None and metric_name not in wanted:
+                    continue
+                col = self._columns.get((category, metric_name))
+                if col is None or not self.present[row, col] or self.percentiles[row, col] < 0:
+                    continue
+
+                company_value = float(self.latest[row, col])
+                percentile = int(self.percentiles[row, col])
+                interpretation, sector_benchmark = _interpret(
+                    company_value, percentile, category, metric_name, benchmark_engine
+                )
+                category_benchmarks.append(PeerBenchmark(
+                    metric_name=metric_name,
+                    company_value=company_value,
+                    peer_median=float(self.medians[row, col]),
+                    peer_mean=float(self.means[row, col]),
+                    percentile=percentile,
+                    beats_peers=bool(self.beats[row, col]),
+                    peer_count=int(self.peer_counts[row, col]),
+                    interpretation=interpretation,
+                    sector_benchmark=sector_benchmark
+                ))
+            if category_benchmarks:
+                results[category] = category_benchmarks
+        return results
+
+
+def _interpret(
+    company_value: float,
+    percentile: int,
+    category: str,
+    metric_name: str,
+    benchmark_engine: Optional[StatisticalBenchmarkEngine]
+) -> Tuple[str, Optional[IndustryBenchmark]]:
+    """(interpretation, sector_benchmark) de un PeerBenchmark (Franklin Framework)."""
+    # Get sector benchmark if engine available
+    sector_benchmark = None
+    if benchmark_engine:
+        sector_benchmark = benchmark_engine.calculate_benchmarks(category, metric_name)
+
+    # Generate interpretation using Franklin Framework
+    if sector_benchmark:
+        # Use full sector context
+        zone = FranklinInterpretation.interpret_value(
+            value=company_value,
+            benchmark=sector_benchmark,
+            metric_name=metric_name
+        )
+    else:
+        # Fallback to percentile interpretation
+        zone = FranklinInterpretation.interpret_percentile(
+            percentile=percentile,
+            benchmark=None,  # Will use percentile-only logic
+            metric_name=metric_name
+        )
+    return f"{zone.name} {zone.icon}", sector_benchmark
+
+
 class PeerComparison:
     """
     Compare company metrics against peer group using Franklin Framework
@@ -91,7 +576,8 @@ class PeerComparison:
         company_metrics: Dict,
         peer_metrics: Dict[str, Dict],
         company_name: str,
-        benchmark_engine: Optional[StatisticalBenchmarkEngine] = None
+        benchmark_engine: Optional[StatisticalBenchmarkEngine] = None,
+        peer_group: Optional[PeerGroup] = None
     ):
         """
         Initialize peer comparison with optional sector benchmarks
@@ -101,6 +587,8 @@ class PeerComparison:
             peer_metrics: Dict of {ticker: metrics}
             company_name: Ticker symbol
             benchmark_engine: Optional StatisticalBenchmarkEngine for sector context
+            peer_group: Optional PeerGroup ya construido sobre peer_metrics
+                        (ej: sector.excluding(ticker) en reportes batch)
 
         Example:
             >>> # With sector benchmarks (Franklin Framework)
@@ -122,6 +610,7 @@ class PeerComparison:
         self.peer_metrics = peer_metrics
         self.company_name = company_name
         self.benchmark_engine = benchmark_engine
+        self.peers = peer_group if peer_group is not None else PeerGroup(peer_metrics)
 
     def compare_metric(
         self,
@@ -151,55 +640,21 @@ class PeerComparison:
 
         company_value = float(company_values[-1])  # Latest year
 
-        # Collect peer values (latest year for each peer)
-        peer_values_list = []
-        for peer_ticker, peer_metric_dict in self.peer_metrics.items():
-            if category in peer_metric_dict and metric_name in peer_metric_dict[category]:
-                peer_vals = peer_metric_dict[category][metric_name]
-                if len(peer_vals) > 0:
-                    peer_values_list.append(float(peer_vals[-1]))
-
-        if len(peer_values_list) == 0:
-            return None
-
-        peer_values = np.array(peer_values_list)
-
-        # Remove NaN values before calculating statistics
-        valid_peer_values = peer_values[~np.isnan(peer_values)]
-        if len(valid_peer_values) == 0:
+        # Peer distribution (latest year, sorted once per metric)
+        distribution = self.peers.distribution(category, metric_name)
+        if distribution is None:
             return None
 
         # Calculate peer statistics
-        peer_median = float(np.median(valid_peer_values))
-        peer_mean = float(np.mean(valid_peer_values))
-        percentile = calculate_percentile(company_value, peer_values)
+        peer_median = distribution.median
+        peer_mean = distribution.mean
+        percentile = distribution.percentile(company_value)
         beats_peers = company_value > peer_median
-        peer_count = len(peer_values_list)
-
-        # Get sector benchmark if engine available
-        sector_benchmark = None
-        if self.benchmark_engine:
-            sector_benchmark = self.benchmark_engine.calculate_benchmarks(
-                category, metric_name
-            )
-
-        # Generate interpretation using Franklin Framework
-        if sector_benchmark:
-            # Use full sector context
-            zone = FranklinInterpretation.interpret_value(
-                value=company_value,
-                benchmark=sector_benchmark,
-                metric_name=metric_name
-            )
-            interpretation = f"{zone.name} {zone.icon}"
-        else:
-            # Fallback to percentile interpretation
-            zone = FranklinInterpretation.interpret_percentile(
-                percentile=percentile,
-                benchmark=None,  # Will use percentile-only logic
-                metric_name=metric_name
-            )
-            interpretation = f"{zone.name} {zone.icon}"
+        peer_count = distribution.peer_count
+
+        interpretation, sector_benchmark = _interpret(
+            company_value, percentile, category, metric_name, self.benchmark_engine
+        )
 
         return PeerBenchmark(
             metric_name=metric_name,
@@ -213,19 +668,31 @@ class PeerComparison:
             sector_benchmark=sector_benchmark
         )
 
-    def compare_all(self) -> Dict[str, List[PeerBenchmark]]:
+    def compare_all(
+        self,
+        metric_names: Optional[Iterable[str]] = None
+    ) -> Dict[str, List[PeerBenchmark]]:
         """
         Compare all available metrics against peers
 
+        Args:
+            metric_names: Optional - sólo comparar estas métricas
+                          (e.g. SectorConfig.key_metrics). None = todas.
+                          Con LazyMetrics sólo se calculan éstas (empresa y peers)
+
         Returns:
             Dict of {category: [PeerBenchmark, ...]}
         """
         results = {}
+        wanted = set(metric_names) if metric_names is not None else None
 
         for category, metrics_dict in self.company_metrics.items():
             category_benchmarks = []
 
             for metric_name in metrics_dict.keys():
+                if wanted is not None and metric_name not in wanted:
+                    continue
+
                 benchmark = self.compare_metric(metric_name, category)
                 if benchmark is not None:
                     category_benchmarks.append(benchmark)
@@ -257,7 +724,8 @@ def compare_to_peers(
     company_metrics: Dict,
     peer_metrics: Dict[str, Dict],
     company_name: str,
-    benchmark_engine: Optional[StatisticalBenchmarkEngine] = None
+    benchmark_engine: Optional[StatisticalBenchmarkEngine] = None,
+    metric_names: Optional[Iterable[str]] = None
 ) -> Dict[str, List[PeerBenchmark]]:
     """
     High-level API for peer comparison with Franklin Framework
@@ -267,6 +735,7 @@ def compare_to_peers(
         peer_metrics: Dict of {ticker: metrics}
         company_name: Ticker symbol
         benchmark_engine: Optional StatisticalBenchmarkEngine for sector context
+        metric_names: Optional - restringir a estas métricas (None = todas)
 
     Returns:
         Dict of {category: [PeerBenchmark, ...]}
@@ -292,4 +761,4 @@ def compare_to_peers(
         company_name,
         benchmark_engine
     )
-    return comparison.compare_all()
+    return comparison.compare_all(metric_names)
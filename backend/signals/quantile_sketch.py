@@ -0,0 +1,436 @@
+"""
+Quantile Sketches - Mergeable sector benchmarks at universe scale
+
+StatisticalBenchmarkEngine y BenchmarkCalculator guardan el valor de cada
+empresa y calculan percentiles exactos: no pueden combinar resultados
+parciales de distintos workers/máquinas. Un sketch KLL (Karnin-Lang-Liberty)
+resume la distribución en O(k) floats y se puede mergear:
+
+    shard 1 ──▶ BenchmarkSketch ─┐
+    shard 2 ──▶ BenchmarkSketch ─┼─ merge() ──▶ IndustryBenchmark / MetricBenchmark
+    shard N ──▶ BenchmarkSketch ─┘               (p10, p25, p50, p75, p90)
+                 to_bytes() ⇅ from_bytes()
+
+Error bounds (KLL, c = 2/3):
+- n ≤ k: exacto (mismo resultado que np.percentile)
+- n > k: error de rango normalizado ε ∝ 1/k: ≲ 1.7% con k=200 (99% de
+  confianza por cuantil), ≲ 0.9% con k=400. Ej: el p90 reportado cae
+  entre los percentiles reales ~88.3 y ~91.7 (k=200)
+- count, min, max exactos; mean/std exactos salvo redondeo (Chan et al.)
+- Merge no degrada el bound: mismo error que un sketch sobre la unión
+
+Sketches son insert-only: sirven para agregar filings nuevos
+incrementalmente, no para corregir (restatements → reconstruir).
+
+Usage:
+    from backend.signals.quantile_sketch import BenchmarkSketch
+
+    # Cada worker
+    sketch = BenchmarkSketch(k=200).add_companies(shard_sector_data.values())
+    blob = sketch.to_bytes()
+
+    # Coordinador
+    sector = BenchmarkSketch.from_bytes(blobs[0])
+    for blob in blobs[1:]:
+        sector.merge(BenchmarkSketch.from_bytes(blob))
+    engine = StatisticalBenchmarkEngine.from_sketch(sector, sector_code='TECH')
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import math
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_K = 200
+
+# Factor de decaimiento de capacidad por nivel (paper KLL)
+_C = 2.0 / 3.0
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch (mergeable, tamaño O(k))
+
+    Attributes:
+        k: Capacidad del nivel superior (precisión)
+        n: Valores insertados (peso total)
+        min, max: Extremos exactos
+        mean: Media exacta (salvo redondeo)
+    """
+
+    _HEADER = struct.Struct('<4sIQddddI')
+    _MAGIC = b'KLL1'
+
+    def __init__(self, k: int = DEFAULT_K, seed: Optional[int] = None):
+        """
+        Args:
+            k: Precisión (≥ 8); error de rango ≈ 1.7% con k=200
+            seed: Semilla para el offset aleatorio de compactación
+        """
+        if k < 8:
+            raise ValueError(f"k must be >= 8, got {k}")
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._rng = np.random.default_rng(seed)
+
+    # ------------------------------------------------------------------
+    # Inserción / merge
+    # ------------------------------------------------------------------
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * _C ** depth)))
+
+    def _add_moments(self, n: int, mean: float, m2: float, lo: float, hi: float) -> None:
+        # Chan et al.: combinación paralela de media/varianza
+        total = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.n * n / total
+        self.n = total
+        self.min = min(self.min, lo)
+        self.max = max(self.max, hi)
+
+    def update(self, values) -> 'KLLSketch':
+        """
+        Inserta uno o varios valores (NaN se ignoran).
+
+        Returns:
+            self (encadenable)
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+
+        mean = float(np.mean(values))
+        self._add_moments(
+            values.size, mean, float(np.sum((values - mean) ** 2)),
+            float(values.min()), float(values.max())
+        )
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        """
+        Combina otro sketch (mismo k) en este.
+
+        Raises:
+            ValueError: Si los k difieren
+        """
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with k={self.k} and k={other.k}")
+        if other.n == 0:
+            return self
+
+        self._add_moments(other.n, other.mean, other._m2, other.min, other.max)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        """Compacta niveles sobre capacidad: ordena y promueve 1 de cada 2."""
+        while True:
+            for level, items in enumerate(self.levels):
+                if len(items) > self._capacity(level):
+                    break
+            else:
+                return
+
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+
+            items = np.sort(self.levels[level])
+            odd = len(items) % 2
+            offset = int(self._rng.integers(2))
+            promoted = items[odd:][offset::2]  # peso 2^(level+1) cada uno
+
+            self.levels[level] = items[:odd]
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def exact(self) -> bool:
+        """True si nunca compactó (percentiles == np.percentile)."""
+        return len(self.levels) == 1
+
+    @property
+    def std(self) -> float:
+        """Desviación estándar poblacional (ddof=0, como np.std)."""
+        return math.sqrt(self._m2 / self.n) if self.n else math.nan
+
+    def percentile(self, q):
+        """
+        Percentil(es) estimados, misma escala que np.percentile (0-100).
+
+        Returns:
+            float o np.ndarray (NaN si el sketch está vacío)
+        """
+        q_arr = np.asarray(q, dtype=np.float64)
+        if self.n == 0:
+            result = np.full(q_arr.shape, np.nan)
+        elif self.exact:
+            result = np.percentile(self.levels[0], q_arr)
+        else:
+            items = np.concatenate(self.levels)
+            weights = np.concatenate([
+                np.full(len(level_items), 2.0 ** level)
+                for level, level_items in enumerate(self.levels)
+            ])
+            order = np.argsort(items, kind='stable')
+            items = items[order]
+            cumulative = np.cumsum(weights[order])
+
+            index = np.searchsorted(cumulative, q_arr / 100.0 * self.n, side='left')
+            result = items[np.clip(index, 0, len(items) - 1)]
+            result = np.where(q_arr <= 0, self.min, np.where(q_arr >= 100, self.max, result))
+
+        return float(result) if np.ndim(result) == 0 else result
+
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def retained(self) -> int:
+        """Floats retenidos (tamaño real del sketch)."""
+        return sum(len(items) for items in self.levels)
+
+    # ------------------------------------------------------------------
+    # Serialización
+    # ------------------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        """Formato binario compacto: header + tamaños de nivel + float64."""
+        sizes = [len(items) for items in self.levels]
+        return b''.join([
+            self._HEADER.pack(self._MAGIC, self.k, self.n, self.mean, self._m2,
+                              self.min, self.max, len(sizes)),
+            struct.pack(f'<{len(sizes)}I', *sizes),
+            np.concatenate(self.levels).astype('<f8').tobytes(),
+        ])
+
+    @classmethod
+    def from_bytes(cls, data: bytes, seed: Optional[int] = None) -> 'KLLSketch':
+        """
+        Reconstruye un sketch de to_bytes().
+
+        Raises:
+            ValueError: Si el formato no es válido
+        """
+        try:
+            magic, k, n, mean, m2, lo, hi, n_levels = cls._HEADER.unpack_from(data)
+        except struct.error as e:
+            raise ValueError(f"Invalid KLL sketch: {e}") from None
+        if magic != cls._MAGIC:
+            raise ValueError("Invalid KLL sketch: bad magic")
+
+        sketch = cls(k, seed=seed)
+        sketch.n, sketch.mean, sketch._m2, sketch.min, sketch.max = n, mean, m2, lo, hi
+
+        offset = cls._HEADER.size
+        sizes = struct.unpack_from(f'<{n_levels}I', data, offset)
+        offset += 4 * n_levels
+        items = np.frombuffer(data, dtype='<f8', count=sum(sizes), offset=offset)
+
+        sketch.levels = []
+        for size in sizes:
+            sketch.levels.append(items[:size].astype(np.float64))
+            items = items[size:]
+        return sketch
+
+    def __repr__(self) -> str:
+        return f"KLLSketch(k={self.k}, n={self.n}, retained={self.retained})"
+
+
+class BenchmarkSketch:
+    """
+    Un KLLSketch por (category, metric) del sector
+
+    Attributes:
+        k: Precisión de cada sketch
+        position: Índice del año usado por empresa (-1: StatisticalBenchmarkEngine,
+                  0: BenchmarkCalculator)
+        sketches: {(category, metric): KLLSketch}
+    """
+
+    def __init__(self, k: int = DEFAULT_K, position: int = -1, seed: Optional[int] = None):
+        """
+        Args:
+            k: Precisión de cada sketch (ver error bounds del módulo)
+            position: Año por empresa dentro de cada array de métricas
+            seed: Semilla de compactación (reproducibilidad)
+        """
+        if k < 8:
+            raise ValueError(f"k must be >= 8, got {k}")
+        self.k = k
+        self.position = position
+        self.seed = seed
+        self.sketches: Dict[Tuple[str, str], KLLSketch] = {}
+
+    def _sketch(self, category: str, metric: str) -> KLLSketch:
+        key = (category, metric)
+        if key not in self.sketches:
+            self.sketches[key] = KLLSketch(self.k, seed=self.seed)
+        return self.sketches[key]
+
+    def update(self, category: str, metric: str, values) -> 'BenchmarkSketch':
+        """Agrega valores (ej: un filing nuevo) a una métrica."""
+        self._sketch(category, metric).update(values)
+        return self
+
+    def add_companies(self, companies: Iterable[Dict]) -> 'BenchmarkSketch':
+        """
+        Agrega empresas: {category: {metric: np.ndarray}} por empresa.
+
+        Un array por métrica para todo el lote (un update vectorizado por
+        métrica); empresas sin la métrica o sin años se omiten.
+        """
+        columns: Dict[Tuple[str, str], List[float]] = {}
+        for metrics in companies:
+            for category, category_metrics in metrics.items():
+                for metric, values in category_metrics.items():
+                    if len(values) > 0:
+                        columns.setdefault((category, metric), []).append(values[self.position])
+
+        for (category, metric), values in columns.items():
+            self.update(category, metric, values)
+        return self
+
+    def merge(self, other: 'BenchmarkSketch') -> 'BenchmarkSketch':
+        """
+        Combina el sketch de otro shard.
+
+        Raises:
+            ValueError: Si k o position difieren
+        """
+        if (other.k, other.position) != (self.k, self.position):
+            raise ValueError(
+                f"Cannot merge BenchmarkSketch(k={other.k}, position={other.position}) "
+                f"into BenchmarkSketch(k={self.k}, position={self.position})"
+            )
+        for (category, metric), sketch in other.sketches.items():
+            self._sketch(category, metric).merge(sketch)
+        return self
+
+    # ------------------------------------------------------------------
+    # Benchmarks
+    # ------------------------------------------------------------------
+
+    def industry_benchmarks(self, sector_code: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        {category: {metric: IndustryBenchmark}} (métricas con n ≥ 3)
+        """
+        from backend.signals.statistical_engine import (
+            IndustryBenchmark, MIN_SAMPLE_SIZE, PERCENTILES
+        )
+
+        benchmarks: Dict[str, Dict] = {}
+        for (category, metric), sketch in self.sketches.items():
+            category_benchmarks = benchmarks.setdefault(category, {})
+            if sketch.n < MIN_SAMPLE_SIZE:
+                continue
+            p10, p25, p50, p75, p90 = (float(p) for p in sketch.percentile(PERCENTILES))
+            category_benchmarks[metric] = IndustryBenchmark(
+                metric_name=metric,
+                p10=p10, p25=p25, p50=p50, p75=p75, p90=p90,
+                mean=sketch.mean,
+                std=sketch.std,
+                sample_size=sketch.n,
+                sector=sector_code
+            )
+        return benchmarks
+
+    def metric_benchmarks(self) -> Dict[str, 'MetricBenchmark']:
+        """
+        {metric: MetricBenchmark} (formato de BenchmarkCalculator, n ≥ 3)
+        """
+        from backend.benchmarks.benchmark_calculator import MetricBenchmark
+        from backend.signals.statistical_engine import MIN_SAMPLE_SIZE, PERCENTILES
+
+        benchmarks = {}
+        for (_, metric), sketch in self.sketches.items():
+            if sketch.n < MIN_SAMPLE_SIZE:
+                continue
+            p10, p25, p50, p75, p90 = (float(p) for p in sketch.percentile(PERCENTILES))
+            benchmarks[metric] = MetricBenchmark(
+                metric_name=metric,
+                avg=sketch.mean,
+                median=p50,
+                stddev=sketch.std,
+                p25=p25,
+                p75=p75,
+                p10=p10,
+                p90=p90,
+                sample_size=sketch.n,
+                min_value=sketch.min,
+                max_value=sketch.max
+            )
+        return benchmarks
+
+    # ------------------------------------------------------------------
+    # Serialización
+    # ------------------------------------------------------------------
+
+    _HEADER = struct.Struct('<4sIiI')
+    _MAGIC = b'BSK1'
+
+    def to_bytes(self) -> bytes:
+        """Header + (category, metric, KLLSketch.to_bytes()) por métrica."""
+        parts = [self._HEADER.pack(self._MAGIC, self.k, self.position, len(self.sketches))]
+        for (category, metric), sketch in self.sketches.items():
+            blob = sketch.to_bytes()
+            for text in (category.encode(), metric.encode()):
+                parts.append(struct.pack('<H', len(text)) + text)
+            parts.append(struct.pack('<I', len(blob)) + blob)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, seed: Optional[int] = None) -> 'BenchmarkSketch':
+        """
+        Reconstruye un BenchmarkSketch de to_bytes().
+
+        Raises:
+            ValueError: Si el formato no es válido
+        """
+        try:
+            magic, k, position, count = cls._HEADER.unpack_from(data)
+        except struct.error as e:
+            raise ValueError(f"Invalid BenchmarkSketch: {e}") from None
+        if magic != cls._MAGIC:
+            raise ValueError("Invalid BenchmarkSketch: bad magic")
+
+        sketch = cls(k, position=position, seed=seed)
+        offset = cls._HEADER.size
+        for _ in range(count):
+            names = []
+            for _ in range(2):
+                (size,) = struct.unpack_from('<H', data, offset)
+                names.append(data[offset + 2:offset + 2 + size].decode())
+                offset += 2 + size
+            (size,) = struct.unpack_from('<I', data, offset)
+            offset += 4
+            sketch.sketches[tuple(names)] = KLLSketch.from_bytes(
+                data[offset:offset + size], seed=seed
+            )
+            offset += size
+        return sketch
+
+    def __repr__(self) -> str:
+        return f"BenchmarkSketch(k={self.k}, metrics={len(self.sketches)})"
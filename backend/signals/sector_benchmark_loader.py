@@ -6,10 +6,18 @@ Converts XBRL pipeline output to sector_data format for StatisticalBenchmarkEngi
 Workflow:
 1. Auto-discover archivos XBRL por ticker (multi-file)
 2. Parse XBRL multi-año via MultiFileXBRLParser
-3. Calculate metrics (25 ratios via MetricsCalculator)
+3. Calculate metrics (25 ratios, un pase sobre el universo via UniverseFrame)
 4. Convert to sector_data format
 5. Initialize StatisticalBenchmarkEngine
 
+SPRINT 7 - Data Platform:
+- Discovery via FilingCatalog (query indexado por sector, sin glob)
+
+SPRINT 8 - Universe-Scale Metrics:
+- snapshot_path: si hay un snapshot binario válido (mismos filings,
+  definiciones de métricas y parámetros) se abre con memory-map en vez de
+  re-parsear el sector; si no, se re-ingesta y se reescribe
+
 FIX SPRINT 6:
 - Reemplazó SECDownloader + XBRLParser por MultiFileXBRLParser
 - MultiFileXBRLParser auto-discover todos los archivos del ticker
@@ -24,7 +32,11 @@ from typing import Dict, List, Optional
 import numpy as np
 from backend.config import get_sector_companies
 from backend.parsers.multi_file_xbrl_parser import MultiFileXBRLParser
-from backend.metrics import calculate_metrics
+from backend.parsers.filing_catalog import FilingCatalog
+from backend.metrics import calculate_universe_metrics
+from backend.metrics.definitions import default_plan
+from backend.metrics.result_cache import MetricsResultCache
+from backend.signals.benchmark_snapshot import BenchmarkSnapshot
 from backend.signals.statistical_engine import StatisticalBenchmarkEngine
 
 
@@ -32,35 +44,31 @@ from backend.signals.statistical_engine import StatisticalBenchmarkEngine
 # EMPRESA DISPONIBLE EN data/ - Auto-detectado del directorio
 # ============================================================================
 
-def discover_available_tickers(data_dir: str = 'data') -> List[str]:
+def discover_available_tickers(
+    data_dir: str = 'data',
+    universe: Optional[List[str]] = None
+) -> List[str]:
     """
     Descubre qué tickers tienen archivos XBRL en data/.
 
-    Busca patrones: {ticker}_10k_{year}_xbrl.xml
-    Retorna tickers únicos que tienen al menos 1 archivo.
+    Consulta el FilingCatalog (índice SQLite, refresh incremental) en vez
+    de hacer glob + regex sobre el directorio en cada llamada.
+    Retorna tickers únicos que tienen al menos 1 archivo con año fiscal
+    que no haya fallado al parsear.
 
     Args:
         data_dir: Directorio con archivos XBRL
+        universe: Opcional - restringir a estos tickers (e.g. un sector)
 
     Returns:
         Lista de tickers disponibles (uppercase)
     """
-    import re
     from pathlib import Path
 
-    data_path = Path(data_dir)
-    if not data_path.exists():
+    if not Path(data_dir).exists():
         return []
 
-    tickers = set()
-    pattern = re.compile(r'^([a-zA-Z]+)_10k_\d{4}_xbrl\.xml$')
-
-    for filepath in data_path.glob('*.xml'):
-        match = pattern.match(filepath.name)
-        if match:
-            tickers.add(match.group(1).upper())
-
-    return sorted(tickers)
+    return FilingCatalog.shared(data_dir).tickers(universe)
 
 
 def convert_metrics_to_sector_data(
@@ -82,12 +90,38 @@ def convert_metrics_to_sector_data(
     return metrics
 
 
+def snapshot_provenance(
+    sector_code: str,
+    companies: List[str],
+    min_years: int,
+    data_dir: str = 'data'
+) -> Dict:
+    """
+    Provenance que identifica el contenido de un snapshot de sector.
+
+    Cambia si cambia algún filing de las empresas (FilingCatalog), las
+    definiciones de métricas (EvaluationPlan) o los parámetros de carga.
+
+    Returns:
+        Dict JSON-serializable para write_snapshot / BenchmarkSnapshot.matches
+    """
+    return {
+        'sector_code': sector_code,
+        'companies': list(companies),
+        'min_years': min_years,
+        'plan_fingerprint': default_plan().fingerprint,
+        'source_fingerprint': FilingCatalog.shared(data_dir).fingerprint(companies),
+    }
+
+
 def load_sector_benchmarks(
     sector_code: str,
     year: int = 2024,
     max_companies: Optional[int] = None,
     verbose: bool = True,
-    min_years: int = 3
+    min_years: int = 3,
+    cache: Optional[MetricsResultCache] = None,
+    snapshot_path: Optional[str] = None
 ) -> StatisticalBenchmarkEngine:
     """
     Load sector benchmarks and create StatisticalBenchmarkEngine.
@@ -99,7 +133,7 @@ def load_sector_benchmarks(
     1. Get companies para el sector
     2. Filtrar por empresas que tienen archivos en data/
     3. Para cada empresa: MultiFileXBRLParser → timeseries completo
-    4. Calculate metrics (25 ratios)
+    4. Calculate metrics (25 ratios, todo el sector en un pase)
     5. Crear StatisticalBenchmarkEngine
 
     Args:
@@ -108,6 +142,11 @@ def load_sector_benchmarks(
         max_companies: Limit number of companies (for testing)
         verbose: Print progress
         min_years: Mínimo años requeridos para incluir empresa (default: 3)
+        cache: MetricsResultCache opcional (empresas ya calculadas no se
+               recalculan entre corridas)
+        snapshot_path: Snapshot binario opcional (ej: 'data/snapshots/TECH.sbs').
+                       Si es válido se usa sin re-parsear; si no existe o está
+                       desactualizado se re-ingesta y se reescribe
 
     Returns:
         Configured StatisticalBenchmarkEngine with sector benchmarks
@@ -121,7 +160,7 @@ def load_sector_benchmarks(
     sector_companies = get_sector_companies(sector_code)
 
     # Step 2: Filtrar por empresas que tienen archivos disponibles
-    available_tickers = discover_available_tickers('data')
+    available_tickers = set(discover_available_tickers('data', universe=sector_companies))
     companies = [t for t in sector_companies if t in available_tickers]
 
     # Empresas en el sector pero sin archivos
@@ -140,8 +179,33 @@ def load_sector_benchmarks(
         print(f"Processing: {len(companies)} companies")
         print()
 
+    # Step 2b: Snapshot válido → memory-map, sin re-parsear
+    # Provenance de los filings tal como están antes de la ingesta: es la que
+    # se guarda con el snapshot y la que se compara en el próximo arranque
+    provenance = snapshot_provenance(sector_code, companies, min_years) if snapshot_path else None
+    if snapshot_path and companies:
+        try:
+            snapshot = BenchmarkSnapshot(snapshot_path)
+        except FileNotFoundError:
+            snapshot = None
+        except ValueError as e:
+            if verbose:
+                print(f"⚠️  Ignoring snapshot: {e}")
+            snapshot = None
+
+        if snapshot is not None and snapshot.matches(provenance):
+            engine = snapshot.engine()
+            if verbose:
+                print(f"⚡ Loaded snapshot {snapshot_path} "
+                      f"({len(snapshot.tickers)} companies, created {snapshot.created_at})")
+                print(f"{'=' * 70}\n")
+            return engine
+
+        if verbose and snapshot is not None:
+            print(f"⚠️  Snapshot {snapshot_path} is stale, re-ingesting")
+
     # Step 3: Process each company con MultiFileXBRLParser
-    sector_data = {}
+    universe = {}
     failed = []
     skipped_insufficient_years = []
 
@@ -168,18 +232,11 @@ def load_sector_benchmarks(
                 skipped_insufficient_years.append((ticker, years_extracted))
                 continue
 
-            # 3c. Calculate metrics (25 ratios)
-            metrics = calculate_metrics(timeseries, parallel='never')
-
-            # 3d. Convert to sector_data format
-            company_data = convert_metrics_to_sector_data(ticker, metrics)
-
-            # 3e. Store
-            sector_data[ticker] = company_data
+            # 3c. Store timeseries (metrics se calculan para todo el universo)
+            universe[ticker] = timeseries
 
             if verbose:
-                metrics_count = sum(len(m) for m in metrics.values())
-                print(f"  ✓ {years_extracted} years, {metrics_count} metrics")
+                print(f"  ✓ {years_extracted} years")
 
         except Exception as e:
             if verbose:
@@ -187,6 +244,15 @@ def load_sector_benchmarks(
             failed.append(ticker)
             continue
 
+    # 3d. Calculate metrics (25 ratios) - un solo pase vectorizado
+    universe_metrics = calculate_universe_metrics(universe, cache=cache) if universe else {}
+
+    # 3e. Convert to sector_data format
+    sector_data = {
+        ticker: convert_metrics_to_sector_data(ticker, metrics)
+        for ticker, metrics in universe_metrics.items()
+    }
+
     # Step 4: Summary
     if verbose:
         print(f"\n{'=' * 70}")
@@ -203,6 +269,9 @@ def load_sector_benchmarks(
         if failed:
             print(f"Failed: {len(failed)} → {', '.join(failed)}")
 
+        if cache is not None:
+            print(f"Metrics cache: {cache.hits} hits / {cache.misses} misses")
+
     if not sector_data:
         raise ValueError(f"No data loaded for sector {sector_code}")
 
@@ -212,6 +281,13 @@ def load_sector_benchmarks(
         sector_code=sector_code
     )
 
+    if snapshot_path:
+        try:
+            engine.save_snapshot(snapshot_path, provenance)
+        except OSError as e:
+            if verbose:
+                print(f"⚠️  Could not write snapshot {snapshot_path}: {e}")
+
     if verbose:
         print(f"\n🎯 StatisticalBenchmarkEngine initialized")
         print(f"   Sector: {sector_code}")
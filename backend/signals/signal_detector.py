@@ -9,7 +9,7 @@ Sprint 5 - Franklin Framework Refactor
 """
 
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from backend.signals.signal_taxonomy import Signal, SignalType, SignalCategory
 from backend.signals.statistical_engine import StatisticalBenchmarkEngine
 from backend.signals.franklin_interpretation import FranklinInterpretation
@@ -20,6 +20,88 @@ INVERSE_METRICS = {
     'DebtToEquity', 'DebtToAssets', 'DSO'  # Lower debt/DSO is better
 }
 
+# Category string → SignalCategory (unknown categories map to PROFITABILITY)
+CATEGORY_ENUMS = {
+    'profitability': SignalCategory.PROFITABILITY,
+    'liquidity': SignalCategory.LIQUIDITY,
+    'efficiency': SignalCategory.EFFICIENCY,
+    'leverage': SignalCategory.LEVERAGE,
+}
+
+# Metrics formatted as percentages in signal messages
+PERCENT_METRICS = {'ROE', 'NetMargin', 'GrossMargin', 'OCFMargin', 'ROIC'}
+
+
+def format_trend(cagr: float) -> str:
+    """CAGR (%) → trend string, e.g. "+5.8% CAGR" or "-3.2% CAGR"."""
+    if cagr > 0:
+        return f"+{cagr:.1f}% CAGR"
+    else:
+        return f"{cagr:.1f}% CAGR"
+
+
+def generate_signal_message(
+    metric_name: str,
+    current_value: float,
+    benchmark,
+    signal_type: SignalType,
+    is_inverse: bool
+) -> str:
+    """
+    Generate human-readable signal message with sector context
+
+    Args:
+        metric_name: Name of metric
+        current_value: Company's value
+        benchmark: IndustryBenchmark with sector stats
+        signal_type: BUY/WATCH/RED_FLAG
+        is_inverse: Whether lower is better
+
+    Returns:
+        Contextualized message string
+    """
+    # Format percentage metrics
+    if metric_name in PERCENT_METRICS:
+        value_str = f"{current_value:.1f}%"
+        p50_str = f"{benchmark.p50:.1f}%"
+        p75_str = f"{benchmark.p75:.1f}%"
+        p25_str = f"{benchmark.p25:.1f}%"
+    else:
+        value_str = f"{current_value:.2f}"
+        p50_str = f"{benchmark.p50:.2f}"
+        p75_str = f"{benchmark.p75:.2f}"
+        p25_str = f"{benchmark.p25:.2f}"
+
+    if signal_type == SignalType.BUY:
+        if is_inverse:
+            return (
+                f"{metric_name} {value_str} < sector P25 ({p25_str}) - "
+                f"Top quartile (low is good), n={benchmark.sample_size}"
+            )
+        else:
+            return (
+                f"{metric_name} {value_str} > sector P75 ({p75_str}) - "
+                f"Top quartile, n={benchmark.sample_size}"
+            )
+
+    elif signal_type == SignalType.WATCH:
+        return (
+            f"{metric_name} {value_str} near sector median ({p50_str}) - "
+            f"Middle 50%, requires monitoring, n={benchmark.sample_size}"
+        )
+
+    else:  # RED_FLAG
+        if is_inverse:
+            return (
+                f"{metric_name} {value_str} > sector P75 ({p75_str}) - "
+                f"Bottom quartile (high is concerning), n={benchmark.sample_size}"
+            )
+        else:
+            return (
+                f"{metric_name} {value_str} < sector P25 ({p25_str}) - "
+                f"Bottom quartile, n={benchmark.sample_size}"
+            )
+
 
 class SignalDetector:
     """
@@ -40,15 +122,19 @@ class SignalDetector:
         self,
         metrics: Dict[str, Dict[str, np.ndarray]],
         company: str,
-        benchmark_engine: StatisticalBenchmarkEngine
+        benchmark_engine: StatisticalBenchmarkEngine,
+        metric_names: Optional[Iterable[str]] = None
     ):
         """
         Initialize signal detector with dynamic benchmarks
 
         Args:
             metrics: Nested dict of calculated metrics by category
+                     (dict o LazyMetrics de calculate_metrics(lazy=True))
             company: Company ticker (e.g., "AAPL")
             benchmark_engine: Initialized StatisticalBenchmarkEngine
+            metric_names: Optional - sólo detectar estas métricas
+                          (e.g. SectorConfig.key_metrics). None = todas
 
         Example:
             >>> from backend.parsers.sec_downloader import load_json
@@ -67,6 +153,7 @@ class SignalDetector:
         self.metrics = metrics
         self.company = company
         self.benchmark_engine = benchmark_engine
+        self.metric_names = set(metric_names) if metric_names is not None else None
         self._signals_cache: Optional[Dict[str, List[Signal]]] = None
 
     def detect_all(self) -> Dict[str, List[Signal]]:
@@ -87,12 +174,16 @@ class SignalDetector:
         }
 
         # Detect signals for each category
+        # (values se leen por nombre: con LazyMetrics sólo se calcula lo filtrado)
         for category, metrics_dict in self.metrics.items():
-            for metric_name, values in metrics_dict.items():
+            for metric_name in metrics_dict.keys():
+                if self.metric_names is not None and metric_name not in self.metric_names:
+                    continue
+
                 signals = self._detect_metric_signals(
                     category=category,
                     metric_name=metric_name,
-                    values=values
+                    values=metrics_dict[metric_name]
                 )
 
                 # Categorize signals by type
@@ -192,14 +283,8 @@ class SignalDetector:
 
     def _get_category_enum(self, category: str) -> SignalCategory:
         """Map category string to SignalCategory enum"""
-        mapping = {
-            'profitability': SignalCategory.PROFITABILITY,
-            'liquidity': SignalCategory.LIQUIDITY,
-            'efficiency': SignalCategory.EFFICIENCY,
-            'leverage': SignalCategory.LEVERAGE,
-        }
         # Default to PROFITABILITY if category not found
-        return mapping.get(category, SignalCategory.PROFITABILITY)
+        return CATEGORY_ENUMS.get(category, SignalCategory.PROFITABILITY)
 
     def _calculate_trend(self, values: np.ndarray) -> str:
         """
@@ -229,10 +314,7 @@ class SignalDetector:
 
         cagr = (np.power(most_recent / oldest, 1 / years) - 1) * 100
 
-        if cagr > 0:
-            return f"+{cagr:.1f}% CAGR"
-        else:
-            return f"{cagr:.1f}% CAGR"
+        return format_trend(cagr)
 
     def _generate_message(
         self,
@@ -245,57 +327,11 @@ class SignalDetector:
         """
         Generate human-readable signal message with sector context
 
-        Args:
-            metric_name: Name of metric
-            current_value: Company's value
-            benchmark: IndustryBenchmark with sector stats
-            signal_type: BUY/WATCH/RED_FLAG
-            is_inverse: Whether lower is better
-
-        Returns:
-            Contextualized message string
+        See generate_signal_message()
         """
-        # Format percentage metrics
-        if metric_name in ['ROE', 'NetMargin', 'GrossMargin', 'OCFMargin', 'ROIC']:
-            value_str = f"{current_value:.1f}%"
-            p50_str = f"{benchmark.p50:.1f}%"
-            p75_str = f"{benchmark.p75:.1f}%"
-            p25_str = f"{benchmark.p25:.1f}%"
-        else:
-            value_str = f"{current_value:.2f}"
-            p50_str = f"{benchmark.p50:.2f}"
-            p75_str = f"{benchmark.p75:.2f}"
-            p25_str = f"{benchmark.p25:.2f}"
-
-        if signal_type == SignalType.BUY:
-            if is_inverse:
-                return (
-                    f"{metric_name} {value_str} < sector P25 ({p25_str}) - "
-                    f"Top quartile (low is good), n={benchmark.sample_size}"
-                )
-            else:
-                return (
-                    f"{metric_name} {value_str} > sector P75 ({p75_str}) - "
-                    f"Top quartile, n={benchmark.sample_size}"
-                )
-
-        elif signal_type == SignalType.WATCH:
-            return (
-                f"{metric_name} {value_str} near sector median ({p50_str}) - "
-                f"Middle 50%, requires monitoring, n={benchmark.sample_size}"
-            )
-
-        else:  # RED_FLAG
-            if is_inverse:
-                return (
-                    f"{metric_name} {value_str} > sector P75 ({p75_str}) - "
-                    f"Bottom quartile (high is concerning), n={benchmark.sample_size}"
-                )
-            else:
-                return (
-                    f"{metric_name} {value_str} < sector P25 ({p25_str}) - "
-                    f"Bottom quartile, n={benchmark.sample_size}"
-                )
+        return generate_signal_message(
+            metric_name, current_value, benchmark, signal_type, is_inverse
+        )
 
     # Legacy methods (kept for backward compatibility, now use detect_all)
     def detect_profitability_signals(self, signal_type: SignalType) -> List[Signal]:
@@ -10,17 +10,30 @@ Features:
 - Sector-specific benchmarks
 - NaN-safe operations
 - Caching for performance
+- Matrix packing: latest values packed into a (company × metric) matrix,
+  all percentiles from one nanpercentile call (Sprint 8)
+- Optional sketch mode: mergeable KLL sketches (quantile_sketch.py) for
+  benchmarks built across shards/machines (Sprint 8)
+- Binary snapshots: memory-mapped engine state (benchmark_snapshot.py)
+  for millisecond startup (Sprint 8)
 
 Author: @franklin (CTO)
 Sprint 5 - Franklin Framework
 Sprint 6 - Multi-Sector Expansion (sector field added)
+Sprint 8 - Universe-Scale Metrics (vectorized benchmarks)
 """
 
+import warnings
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
 
+PERCENTILES = (10, 25, 50, 75, 90)
+
+MIN_SAMPLE_SIZE = 3
+
+
 @dataclass
 class IndustryBenchmark:
     """
@@ -68,6 +81,90 @@ class IndustryBenchmark:
         )
 
 
+@dataclass
+class PackedSectorData:
+    """
+    sector_data packed into dense arrays (company × metric × year)
+
+    Attributes:
+        tickers: Row labels
+        keys: Column labels [(category, metric), ...]
+        values: float64 (C × K × Y), each array left-aligned, NaN padding
+        lengths: int32 (C × K), array length (-1 = company lacks the metric)
+    """
+    tickers: List[str]
+    keys: List[Tuple[str, str]]
+    values: np.ndarray
+    lengths: np.ndarray
+
+    def value_at(self, position: int) -> np.ndarray:
+        """
+        (C × K) value at an array position, NaN if empty/absent
+
+        Args:
+            position: 0 (first element) or -1 (last element)
+        """
+        if position == -1:
+            index = np.maximum(self.lengths - 1, 0)
+        elif position == 0:
+            index = np.zeros_like(self.lengths)
+        else:
+            raise ValueError(f"position must be 0 or -1, got {position}")
+
+        if self.values.shape[2] == 0:      # todos los arrays vacíos / ausentes
+            return np.full(self.lengths.shape, np.nan)
+
+        values = np.take_along_axis(self.values, index[..., np.newaxis], axis=2)[..., 0]
+        values[self.lengths <= 0] = np.nan
+        return values
+
+
+def pack_sector_data(
+    sector_data: Dict[str, Dict],
+    keys: Optional[List[Tuple[str, str]]] = None
+) -> PackedSectorData:
+    """
+    Pack {ticker: {category: {metric: np.ndarray}}} into PackedSectorData
+
+    Args:
+        sector_data: sector_data (dict or lazy mapping)
+        keys: Columns to pack (default: union in first-seen order, so the
+              first company's structure is preserved)
+    """
+    if keys is None:
+        key_index: Dict[Tuple[str, str], int] = {}
+        for data in sector_data.values():
+            for category, metrics in data.items():
+                for metric in metrics.keys():
+                    key_index.setdefault((category, metric), len(key_index))
+    else:
+        key_index = {tuple(key): col for col, key in enumerate(keys)}
+
+    tickers = list(sector_data)
+    columns = []
+    max_years = 0
+    for data in sector_data.values():
+        company = []
+        for category, metric in key_index:
+            if category in data and metric in data[category]:
+                metric_values = np.asarray(data[category][metric], dtype=np.float64)
+                company.append(metric_values)
+                max_years = max(max_years, len(metric_values))
+            else:
+                company.append(None)
+        columns.append(company)
+
+    values = np.full((len(tickers), len(key_index), max_years), np.nan)
+    lengths = np.full((len(tickers), len(key_index)), -1, dtype=np.int32)
+    for row, company in enumerate(columns):
+        for col, metric_values in enumerate(company):
+            if metric_values is not None:
+                values[row, col, :len(metric_values)] = metric_values
+                lengths[row, col] = len(metric_values)
+
+    return PackedSectorData(tickers, list(key_index), values, lengths)
+
+
 class StatisticalBenchmarkEngine:
     """
     Calculate dynamic benchmarks from real sector data
@@ -122,6 +219,138 @@ class StatisticalBenchmarkEngine:
         self.sector_data = sector_data
         self.sector_code = sector_code  # NEW Sprint 6
         self._benchmarks_cache: Dict[str, IndustryBenchmark] = {}
+        self._sketch = None  # BenchmarkSketch (sketch mode, Sprint 8)
+
+    # ------------------------------------------------------------------
+    # Sketch mode (Sprint 8)
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_sketch(cls, sketch, sector_code: str = 'TECH') -> 'StatisticalBenchmarkEngine':
+        """
+        Engine whose benchmarks come from a merged BenchmarkSketch
+
+        Percentiles are approximate (see quantile_sketch error bounds);
+        no per-company sector_data is kept.
+
+        Args:
+            sketch: BenchmarkSketch (position=-1), e.g. merged from shards
+            sector_code: Sector identifier
+
+        Example:
+            >>> sketch = BenchmarkSketch().add_companies(shard.values())
+            >>> engine = StatisticalBenchmarkEngine.from_sketch(sketch, 'TECH')
+            >>> engine.get_signal_threshold('profitability', 'ROE', 'BUY')
+        """
+        engine = cls({}, sector_code=sector_code)
+        engine._sketch = sketch
+        for category, metrics in sketch.industry_benchmarks(sector_code).items():
+            for metric, benchmark in metrics.items():
+                engine._benchmarks_cache[f"{category}:{metric}"] = benchmark
+        return engine
+
+    def to_sketch(self, k: Optional[int] = None, seed: Optional[int] = None):
+        """
+        BenchmarkSketch of this engine's sector_data (latest year, index -1)
+
+        Args:
+            k: Sketch precision (None = quantile_sketch.DEFAULT_K)
+            seed: Compaction seed
+        """
+        from backend.signals.quantile_sketch import BenchmarkSketch, DEFAULT_K
+
+        sketch = BenchmarkSketch(k=k or DEFAULT_K, position=-1, seed=seed)
+        return sketch.add_companies(self.sector_data.values())
+
+    # ------------------------------------------------------------------
+    # Snapshots (Sprint 8)
+    # ------------------------------------------------------------------
+
+    def save_snapshot(self, path, provenance: Optional[Dict] = None):
+        """
+        Write sector matrix + benchmarks as a binary snapshot
+
+        Args:
+            path: Snapshot file (e.g. 'data/snapshots/TECH.sbs')
+            provenance: Metadata used to validate the snapshot on load
+
+        Returns:
+            Path of the snapshot
+        """
+        from backend.signals.benchmark_snapshot import write_snapshot
+
+        return write_snapshot(self, path, provenance)
+
+    @classmethod
+    def from_snapshot(cls, path) -> 'StatisticalBenchmarkEngine':
+        """
+        Engine from a binary snapshot (memory-mapped, benchmarks precomputed)
+
+        Example:
+            >>> engine = StatisticalBenchmarkEngine.from_snapshot('data/snapshots/TECH.sbs')
+            >>> engine.get_signal_threshold('profitability', 'ROE', 'BUY')
+        """
+        from backend.signals.benchmark_snapshot import BenchmarkSnapshot
+
+        return BenchmarkSnapshot(path).engine()
+
+    # ------------------------------------------------------------------
+    # Matrix packing (Sprint 8)
+    # ------------------------------------------------------------------
+
+    def latest_matrix(self, keys: List[Tuple[str, str]]) -> np.ndarray:
+        """
+        Pack latest-year values into a (company × metric) matrix
+
+        Args:
+            keys: [(category, metric), ...] columns to pack
+
+        Returns:
+            float64 array (n_companies × len(keys)), NaN where a company
+            lacks the metric or its latest value is NaN
+        """
+        matrix = np.full((len(self.sector_data), len(keys)), np.nan)
+        for row, data in enumerate(self.sector_data.values()):
+            for col, (category, metric) in enumerate(keys):
+                if category in data and metric in data[category]:
+                    metric_values = data[category][metric]
+                    if len(metric_values) > 0:
+                        matrix[row, col] = metric_values[-1]  # Latest year (index -1)
+        return matrix
+
+    def _benchmarks_from_matrix(
+        self,
+        keys: List[Tuple[str, str]],
+        matrix: np.ndarray
+    ) -> Dict[Tuple[str, str], IndustryBenchmark]:
+        """
+        Benchmarks for every column of a packed matrix in one pass
+
+        Columns with fewer than MIN_SAMPLE_SIZE values are omitted.
+        """
+        counts = np.count_nonzero(~np.isnan(matrix), axis=0)
+
+        with warnings.catch_warnings():
+            # Columnas all-NaN → NaN (se descartan por sample size)
+            warnings.simplefilter('ignore', RuntimeWarning)
+            percentiles = np.nanpercentile(matrix, PERCENTILES, axis=0)
+            means = np.nanmean(matrix, axis=0)
+            stds = np.nanstd(matrix, axis=0)
+
+        benchmarks = {}
+        for col, (category, metric) in enumerate(keys):
+            if counts[col] < MIN_SAMPLE_SIZE:
+                continue
+            p10, p25, p50, p75, p90 = (float(p) for p in percentiles[:, col])
+            benchmarks[(category, metric)] = IndustryBenchmark(
+                metric_name=metric,
+                p10=p10, p25=p25, p50=p50, p75=p75, p90=p90,
+                mean=float(means[col]),
+                std=float(stds[col]),
+                sample_size=int(counts[col]),
+                sector=self.sector_code  # NEW Sprint 6
+            )
+        return benchmarks
 
     def calculate_benchmarks(
         self,
@@ -153,36 +382,14 @@ class StatisticalBenchmarkEngine:
         if cache_key in self._benchmarks_cache:
             return self._benchmarks_cache[cache_key]
 
-        # Extract latest year values from all companies
-        values = []
-        for ticker, data in self.sector_data.items():
-            if category in data and metric in data[category]:
-                metric_values = data[category][metric]
-                if len(metric_values) > 0:
-                    latest = metric_values[-1]  # Latest year (index -1)
-                    if not np.isnan(latest):
-                        values.append(latest)
+        # Single column of the (company × metric) matrix
+        keys = [(category, metric)]
+        benchmark = self._benchmarks_from_matrix(keys, self.latest_matrix(keys)).get(keys[0])
 
         # Require minimum 3 companies for statistical validity
-        if len(values) < 3:
+        if benchmark is None:
             return None
 
-        values_arr = np.array(values)
-
-        # Calculate benchmark (NEW Sprint 6: includes sector)
-        benchmark = IndustryBenchmark(
-            metric_name=metric,
-            p10=float(np.percentile(values_arr, 10)),
-            p25=float(np.percentile(values_arr, 25)),
-            p50=float(np.percentile(values_arr, 50)),
-            p75=float(np.percentile(values_arr, 75)),
-            p90=float(np.percentile(values_arr, 90)),
-            mean=float(np.mean(values_arr)),
-            std=float(np.std(values_arr)),
-            sample_size=len(values),
-            sector=self.sector_code  # NEW Sprint 6
-        )
-
         # Cache result
         self._benchmarks_cache[cache_key] = benchmark
         return benchmark
@@ -204,20 +411,33 @@ class StatisticalBenchmarkEngine:
         """
         all_benchmarks = {}
 
+        if self._sketch is not None:
+            return self._sketch.industry_benchmarks(self.sector_code)
+
         # Iterate through first company to get structure
         if not self.sector_data:
             return all_benchmarks
 
-        sample_ticker = next(iter(self.sector_data.keys()))
-        sample_data = self.sector_data[sample_ticker]
-
-        for category, metrics_dict in sample_data.items():
+        sample_data = next(iter(self.sector_data.values()))
+        keys = [
+            (category, metric_name)
+            for category, metrics_dict in sample_data.items()
+            for metric_name in metrics_dict.keys()
+        ]
+
+        # Pack once, all percentiles in one vectorized pass (cached keys skipped)
+        missing = [key for key in keys if f"{key[0]}:{key[1]}" not in self._benchmarks_cache]
+        if missing:
+            computed = self._benchmarks_from_matrix(missing, self.latest_matrix(missing))
+            for (category, metric_name), benchmark in computed.items():
+                self._benchmarks_cache[f"{category}:{metric_name}"] = benchmark
+
+        for category in sample_data:
             all_benchmarks[category] = {}
-
-            for metric_name in metrics_dict.keys():
-                benchmark = self.calculate_benchmarks(category, metric_name)
-                if benchmark:
-                    all_benchmarks[category][metric_name] = benchmark
+        for category, metric_name in keys:
+            benchmark = self._benchmarks_cache.get(f"{category}:{metric_name}")
+            if benchmark:
+                all_benchmarks[category][metric_name] = benchmark
 
         return all_benchmarks
 
@@ -5,6 +5,12 @@ Converts multi-year financial trends into human-readable investment narratives.
 This module detects patterns in time-series data and generates contextual
 stories that help investors understand the "why" behind the numbers.
 
+Sprint 8 - Universe-Scale Metrics:
+- CAGR, slope y R² en forma cerrada sobre matrices (series × años) con
+  NumPy (sin scipy.stats.linregress ni import de scipy al arrancar)
+- detect_pattern / get_confidence como máscaras vectorizadas; los StoryArc
+  se construyen al final (generate_stories_matrix)
+
 Author: @franklin (CTO)
 Sprint 5 - Micro-Tarea 4: Story Arc Generator
 """
@@ -12,7 +18,6 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional, Dict
 import numpy as np
-from scipy import stats
 
 
 class StoryPattern(Enum):
@@ -220,6 +225,100 @@ STORY_TEMPLATES = {
 }
 
 
+def trend_statistics(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    CAGR, slope y R² de cada fila de una matriz (series × años).
+
+    Forma cerrada de la regresión lineal contra x = 0..n-1 (mismas
+    fórmulas que scipy.stats.linregress):
+
+        slope = Sxy / Sxx        r = Sxy / sqrt(Sxx · Syy)   (clip [-1, 1])
+
+    Serie constante → R² NaN (linregress retorna r = NaN). CAGR = 0.0 si
+    el valor inicial es <= 0 y NaN si es NaN (igual que calculate_cagr).
+
+    Args:
+        matrix: float64 (S × Y), cada fila de más antiguo a más reciente, Y >= 2
+
+    Returns:
+        {'cagr': (S,), 'slope': (S,), 'r_squared': (S,)}
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    n_years = matrix.shape[1]
+
+    x = np.arange(n_years, dtype=np.float64)
+    x_centered = x - x.mean()
+    y_centered = matrix - matrix.mean(axis=1, keepdims=True)
+
+    ssxm = np.dot(x_centered, x_centered) / n_years
+    ssxym = y_centered @ x_centered / n_years
+    ssym = np.einsum('ij,ij->i', y_centered, y_centered) / n_years
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = np.clip(ssxym / np.sqrt(ssxm * ssym), -1.0, 1.0)
+        degenerate = (ssxm == 0.0) | (ssym == 0.0)
+        r = np.where(degenerate, np.where(ssxym == 0, np.nan, 0.0), r)
+
+        # Misma regla que calculate_cagr: sólo start <= 0 da 0.0 (NaN se propaga)
+        start, end = matrix[:, 0], matrix[:, -1]
+        non_positive = start <= 0
+        ratio = end / np.where(non_positive, 1.0, start)
+        growth = np.power(ratio, 1 / (n_years - 1))
+        if n_years > 2:
+            # pow(-inf, 1/k) = +inf en Python; np.power(-inf, 0.5) usa sqrt → NaN
+            growth = np.where(np.isneginf(ratio), np.inf, growth)
+        cagr = np.where(non_positive, 0.0, (growth - 1) * 100)
+
+    return {'cagr': cagr, 'slope': ssxym / ssxm, 'r_squared': r ** 2}
+
+
+# Orden de evaluación de detect_pattern (la primera condición que se cumple gana)
+_PATTERN_CHOICES = [
+    StoryPattern.TURNAROUND,
+    StoryPattern.VOLATILE,
+    StoryPattern.ACCELERATION,
+    StoryPattern.DETERIORATION,
+]
+_PATTERNS = list(StoryPattern)
+_CONFIDENCES = list(ConfidenceLevel)
+
+
+def detect_patterns(
+    matrix: np.ndarray,
+    cagr: np.ndarray,
+    r_squared: np.ndarray
+) -> np.ndarray:
+    """
+    StoryGenerator.detect_pattern vectorizado.
+
+    Returns:
+        Índices en list(StoryPattern), shape (S,)
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    conditions = [
+        (matrix[:, 0] < 0) & (matrix[:, -1] > 0),
+        r_squared < 0.4,
+        cagr > 5.0,
+        cagr < -5.0,
+    ]
+    choices = [_PATTERNS.index(pattern) for pattern in _PATTERN_CHOICES]
+    return np.select(conditions, choices, default=_PATTERNS.index(StoryPattern.PLATEAU))
+
+
+def confidence_levels(r_squared: np.ndarray) -> np.ndarray:
+    """
+    StoryGenerator.get_confidence vectorizado.
+
+    Returns:
+        Índices en list(ConfidenceLevel), shape (S,)
+    """
+    return np.select(
+        [r_squared >= 0.7, r_squared >= 0.4],
+        [_CONFIDENCES.index(ConfidenceLevel.HIGH), _CONFIDENCES.index(ConfidenceLevel.MEDIUM)],
+        default=_CONFIDENCES.index(ConfidenceLevel.LOW)
+    )
+
+
 class StoryGenerator:
     """
     Generates investment narratives from multi-year financial trends.
@@ -286,14 +385,8 @@ class StoryGenerator:
         if len(values) < 2:
             return 0.0
 
-        x = np.arange(len(values))
-        y = np.array(values)
-
-        # Linear regression
-        slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
-        r_squared = r_value ** 2
-
-        return r_squared
+        # Closed-form linear regression (see trend_statistics)
+        return trend_statistics(np.array([values], dtype=np.float64))['r_squared'][0]
 
     def detect_pattern(
         self,
@@ -490,15 +583,84 @@ class StoryGenerator:
             >>> cats = {'ROE': 'profitability', 'NetMargin': 'profitability'}
             >>> stories = generator.generate_stories_batch(data, cats)
         """
-        stories = {}
         categories = categories or {}
 
+        # Series del mismo largo → una matriz (series × años) por largo
+        groups: Dict[int, List[str]] = {}
         for metric_name, values in metrics_data.items():
             if len(values) < 2:
                 continue  # Skip metrics with insufficient data
+            groups.setdefault(len(values), []).append(metric_name)
+
+        built = {}
+        for names in groups.values():
+            arcs = self.generate_stories_matrix(
+                names,
+                [metrics_data[name] for name in names],
+                [categories.get(name) for name in names]
+            )
+            built.update(zip(names, arcs))
+
+        # Mismo orden que metrics_data
+        return {name: built[name] for name in metrics_data if name in built}
+
+    def generate_stories_matrix(
+        self,
+        metric_names: List[str],
+        series: List[List[float]],
+        categories: Optional[List[Optional[str]]] = None
+    ) -> List[StoryArc]:
+        """
+        Generate stories for a (series × years) matrix in one vectorized pass.
 
-            category = categories.get(metric_name)
-            story = self.generate_story(metric_name, values, category)
-            stories[metric_name] = story
+        CAGR, R², pattern and confidence are computed for every row with
+        array operations; StoryArc objects are built at the end. Rows can
+        come from different companies (e.g. ROE of every ticker).
+
+        Args:
+            metric_names: Metric name per row
+            series: Rows of equal length (oldest to newest, >= 2 values)
+            categories: Optional category per row
+
+        Returns:
+            List of StoryArc (same order as rows)
+
+        Raises:
+            ValueError: If rows have fewer than 2 values or differ in length
+        """
+        matrix = np.array(series, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[1] < 2:
+            raise ValueError(f"Need a (series × years) matrix with >= 2 years, got shape {matrix.shape}")
+
+        stats = trend_statistics(matrix)
+        pattern_idx = detect_patterns(matrix, stats['cagr'], stats['r_squared'])
+        confidence_idx = confidence_levels(stats['r_squared'])
+        categories = categories or [None] * len(metric_names)
+
+        stories = []
+        for row, metric_name in enumerate(metric_names):
+            values = series[row]
+            pattern = _PATTERNS[pattern_idx[row]]
+            cagr = float(stats['cagr'][row])
+            narrative = self.generate_narrative(
+                metric_name=metric_name,
+                pattern=pattern,
+                cagr=cagr,
+                start_value=values[0],
+                end_value=values[-1],
+                category=categories[row]
+            )
+            stories.append(StoryArc(
+                metric_name=metric_name,
+                pattern=pattern,
+                cagr=cagr,
+                narrative=narrative,
+                confidence=_CONFIDENCES[confidence_idx[row]],
+                r_squared=stats['r_squared'][row],
+                start_value=values[0],
+                end_value=values[-1],
+                years=len(values),
+                context=categories[row]
+            ))
 
         return stories
@@ -0,0 +1,120 @@
+"""
+Shared pytest fixtures for the backend test suite.
+Synthetic extract_timeseries() data, synthetic universes (timeseries and
+calculate_universe_metrics() output with standard edge cases) and metric
+registry isolation, used by the universe-scale metric, benchmark, signal,
+report and pipeline tests.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from backend.engines.tracked_metric import SourceTrace
+from backend.metrics import calculate_universe_metrics, definitions
+from backend.metrics.definitions import default_plan
+
+
+CONCEPTS = [
+    'NetIncome', 'Equity', 'Assets', 'Revenue', 'GrossProfit', 'OperatingIncome',
+    'OperatingCashFlow', 'CurrentAssets', 'CurrentLiabilities', 'CashAndEquivalents', 'Inventory',
+    'AccountsReceivable', 'CostOfRevenue', 'LongTermDebt', 'Liabilities', 'InterestExpense',
+]
+
+
+@pytest.fixture
+def timeseries_concepts():
+    """Conceptos que make_timeseries genera por año."""
+    return list(CONCEPTS)
+
+
+@pytest.fixture
+def make_timeseries():
+    """
+    Factory de extract_timeseries() sintético
+
+    Usage:
+        def test_x(make_timeseries):
+            timeseries = make_timeseries(rng, [2023, 2024], drop={(2024, 'Inventory')})
+    """
+    def make(rng, years, drop=()):
+        timeseries = {}
+        for year in years:
+            timeseries[year] = {
+                concept: SourceTrace(
+                    xbrl_tag=f"us-gaap:{concept}",
+                    raw_value=float(rng.uniform(-1e9, 5e10)),
+                    context_id=f"FY{year}",
+                    extracted_at=datetime(2025, 1, 1),
+                    section="test"
+                )
+                for concept in CONCEPTS
+                if (year, concept) not in drop
+            }
+        return timeseries
+
+    return make
+
+
+@pytest.fixture
+def synthetic_universe(make_timeseries):
+    """
+    Factory de universos sintéticos {T00..T(n-1): timeseries}
+
+    Usage:
+        def test_x(synthetic_universe):
+            universe = synthetic_universe(10, [2023, 2024], seed=5)
+    """
+    def make(n, years, seed):
+        rng = np.random.default_rng(seed)
+        return {f"T{i:02d}": make_timeseries(rng, years) for i in range(n)}
+
+    return make
+
+
+@pytest.fixture
+def synthetic_universe_metrics(synthetic_universe, make_timeseries):
+    """
+    Factory de calculate_universe_metrics() sintético con edge cases estándar
+
+        T01: un solo año (el último de years)
+        T02: ROE sin ningún valor (todo NaN)
+        T03: sin DIO (métrica ausente)
+        T04: DebtToEquity vacío (array de largo 0)
+
+    Cada test agrega encima sus propias mutaciones (T05 en adelante).
+
+    Usage:
+        def test_x(synthetic_universe_metrics):
+            metrics = synthetic_universe_metrics(20, [2022, 2023, 2024], seed=48)
+    """
+    def make(n, years, seed, edge_cases=True):
+        universe = synthetic_universe(n, years, seed)
+        if not edge_cases:
+            return calculate_universe_metrics(universe)
+        if n < 5:
+            raise ValueError(f"edge cases need at least 5 companies, got {n}")
+
+        universe['T01'] = make_timeseries(np.random.default_rng(seed + 1), years[-1:])
+        metrics = calculate_universe_metrics(universe)
+        metrics['T02']['profitability']['ROE'][:] = np.nan
+        del metrics['T03']['efficiency']['DIO']
+        metrics['T04']['leverage']['DebtToEquity'] = np.array([])
+        return metrics
+
+    return make
+
+
+@pytest.fixture
+def restore_registry():
+    """Restaura METRIC_DEFINITIONS / METRICS tras tests que registran métricas."""
+    saved = list(definitions.METRIC_DEFINITIONS)
+    yield
+    definitions.METRIC_DEFINITIONS[:] = saved
+    definitions.METRICS.clear()
+    definitions.METRICS.update({d.name: d for d in saved})
+    default_plan.cache_clear()
@@ -0,0 +1,171 @@
+"""
+Unit tests for BatchReportRunner (sector reports in worker processes).
+Tests parity with per-company SignalDetector / PeerComparison /
+StoryGenerator + ReportBuilder, streaming JSONL + markdown output,
+leave-one-out peer groups and stats, and the shallow report serializer.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from backend.reports.batch_runner import BatchReportRunner, company_stories
+from backend.reports.report_builder import ReportBuilder, report_to_dict, report_to_json_line
+from backend.signals.benchmark_snapshot import BenchmarkSnapshot
+from backend.signals.peer_comparison import LeaveOneOutPeers, PeerComparison, PeerGroup
+from backend.signals.signal_detector import SignalDetector
+from backend.signals.statistical_engine import StatisticalBenchmarkEngine, pack_sector_data
+from backend.signals.story_generator import StoryGenerator
+
+
+@pytest.fixture
+def universe_metrics(synthetic_universe_metrics):
+    metrics = synthetic_universe_metrics(20, [2021, 2022, 2023, 2024], seed=48)
+    metrics['T05']['profitability']['ROE'][1] = np.nan
+    return metrics
+
+
+@pytest.fixture
+def snapshot_path(universe_metrics, tmp_path):
+    engine = StatisticalBenchmarkEngine(universe_metrics, sector_code='TECH')
+    return engine.save_snapshot(tmp_path / 'TECH.sbs')
+
+
+def reference_report(ticker, snapshot_path):
+    """Un reporte armado a mano con los componentes por empresa."""
+    engine = BenchmarkSnapshot(snapshot_path).engine()
+    sector_data = engine.sector_data
+    metrics = sector_data[ticker]
+
+    signals = SignalDetector(metrics, ticker, engine).detect_all()
+    peers = {t: m for t, m in sector_data.items() if t != ticker}
+    comparison = PeerComparison(metrics, peers, ticker, engine)
+    peer_benchmarks = {b.metric_name: b for bs in comparison.compare_all().values() for b in bs}
+
+    series, categories = {}, {}
+    for category, metrics_dict in metrics.items():
+        for metric, values in metrics_dict.items():
+            series[metric] = [float(v) for v in reversed(values) if not np.isnan(v)]
+            categories[metric] = category
+    stories = StoryGenerator().generate_stories_batch(series, categories)
+
+    return ReportBuilder().build_report(
+        ticker, signals['buy'] + signals['watch'] + signals['red_flag'], peer_benchmarks, stories
+    )
+
+
+def without_date(record):
+    record = dict(record)
+    record.pop('date')
+    record.pop('metadata')
+    return record
+
+
+class TestBatchReportRunner:
+    """Streaming reports equal the per-company pipeline."""
+
+    @pytest.mark.parametrize('max_workers', [1, 2])
+    def test_matches_per_company_reports(self, snapshot_path, tmp_path, max_workers):
+        runner = BatchReportRunner(snapshot_path, max_workers=max_workers, chunk_size=3, max_pending=2)
+        result = runner.run(tmp_path / 'out' / 'TECH.jsonl', markdown_dir=tmp_path / 'md')
+
+        assert result.failed == {}
+        assert sorted(result.written) == sorted(BenchmarkSnapshot(snapshot_path).tickers)
+
+        lines = (tmp_path / 'out' / 'TECH.jsonl').read_text(encoding='utf-8').splitlines()
+        records = {record['company']: record for record in map(json.loads, lines)}
+        assert list(records) == result.written
+
+        for ticker in ('T00', 'T01', 'T02', 'T05', 'T19'):
+            expected = report_to_dict(reference_report(ticker, snapshot_path))
+            assert without_date(records[ticker]) == json.loads(json.dumps(without_date(expected)))
+            assert records[ticker]['metadata']['sector'] == 'TECH'
+
+            markdown = (tmp_path / 'md' / f"{ticker}.md").read_text(encoding='utf-8')
+            assert markdown.startswith(f"# 📊 INVESTMENT DECISION REPORT - {ticker}")
+
+    def test_subset_and_progress(self, snapshot_path, tmp_path):
+        progress = []
+        runner = BatchReportRunner(snapshot_path, max_workers=1, chunk_size=2)
+        result = runner.run(
+            tmp_path / 'subset.jsonl', tickers=['T05', 'T03', 'T07'],
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        assert result.written == ['T05', 'T03', 'T07']
+        assert result.markdown_dir is None
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    def test_invalid_arguments(self, snapshot_path, tmp_path):
+        with pytest.raises(ValueError):
+            BatchReportRunner(snapshot_path, chunk_size=0)
+        with pytest.raises(ValueError):
+            BatchReportRunner(snapshot_path, max_workers=1).run(tmp_path / 'x.jsonl', tickers=['NOPE'])
+
+    def test_iter_records_is_lazy(self, snapshot_path):
+        records = BatchReportRunner(snapshot_path, max_workers=1, chunk_size=4).iter_records(markdown=False)
+        ticker, json_line, markdown, error = next(records)
+
+        assert (ticker, markdown, error) == ('T00', None, None)
+        assert '\n' not in json_line
+
+
+class TestPeerGroupExcluding:
+    """Leave-one-out groups match a PeerGroup built without the company."""
+
+    def test_matches_fresh_group(self, universe_metrics):
+        sector = PeerGroup(universe_metrics)
+        for ticker in ('T00', 'T02', 'T10'):
+            fresh = PeerGroup({t: m for t, m in universe_metrics.items() if t != ticker})
+            derived = sector.excluding(ticker)
+
+            assert list(derived.peer_metrics) == list(fresh.peer_metrics)
+            assert derived.peer_metrics == fresh.peer_metrics and len(derived.peer_metrics) == 19
+            assert ticker not in derived.peer_metrics and derived.peer_metrics.get(ticker) is None
+            for category, metrics in universe_metrics['T00'].items():
+                for metric in metrics:
+                    a, b = derived.distribution(category, metric), fresh.distribution(category, metric)
+                    np.testing.assert_array_equal(a.sorted_values, b.sorted_values)
+                    assert (a.peer_count, a.median, a.mean) == (b.peer_count, b.median, b.mean)
+
+
+class TestLeaveOneOutPeers:
+    """Closed-form peer stats match PeerComparison against the rest of the sector."""
+
+    def test_matches_peer_comparison(self, universe_metrics):
+        universe_metrics['T03']['profitability']['ROE'][-1] = np.inf
+        universe_metrics['T04']['profitability']['ROE'][-1] = np.nan
+        universe_metrics['T05']['liquidity']['CurrentRatio'] = np.array([])
+        engine = StatisticalBenchmarkEngine(universe_metrics, sector_code='TECH')
+        peers = LeaveOneOutPeers.from_packed(pack_sector_data(universe_metrics))
+
+        for ticker, metrics in universe_metrics.items():
+            others = {t: m for t, m in universe_metrics.items() if t != ticker}
+            expected = PeerComparison(metrics, others, ticker, engine).compare_all()
+            result = peers.compare_all(ticker, metrics, engine)
+
+            assert result.keys() == expected.keys(), ticker
+            for category, benchmarks in expected.items():
+                for got, want in zip(result[category], benchmarks, strict=True):
+                    assert got.peer_mean == pytest.approx(want.peer_mean, rel=1e-9, nan_ok=True)
+                    got.peer_mean = want.peer_mean
+                    np.testing.assert_equal(vars(got), vars(want))
+
+
+class TestReportSerializer:
+    """JSONL records carry the export_json schema on one line."""
+
+    def test_json_line_matches_export_json(self, universe_metrics):
+        metrics = universe_metrics['T00']
+        report = ReportBuilder().build_report(
+            'T00', [], {}, company_stories(metrics), metadata={'n': np.int64(3), 'x': np.float32(1.5)}
+        )
+
+        line = report_to_json_line(report)
+        assert '\n' not in line
+        assert json.loads(line) == json.loads(ReportBuilder().export_json(report))
+        assert json.loads(line)['metadata'] == {'n': 3, 'x': 1.5}
@@ -0,0 +1,124 @@
+"""
+Unit tests for ReportSite (incremental markdown report publishing).
+Tests leave-one-out peer ranks vs PeerComparison, first publish, no-op
+republish, single-company rebuild, removals, force and the index page.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from backend.reports.report_site import ReportSite, leave_one_out_ranks
+from backend.signals.peer_comparison import PeerComparison
+from backend.signals.statistical_engine import StatisticalBenchmarkEngine, pack_sector_data
+
+
+@pytest.fixture
+def universe_metrics(synthetic_universe_metrics):
+    metrics = synthetic_universe_metrics(16, [2021, 2022, 2023, 2024], seed=49)
+    metrics['T05']['profitability']['ROE'][-1] = np.nan
+    metrics['T07']['profitability']['ROE'][-1] = metrics['T08']['profitability']['ROE'][-1]  # tie
+    return metrics
+
+
+def write(metrics, path):
+    engine = StatisticalBenchmarkEngine(metrics, sector_code='TECH')
+    engine.save_snapshot(path, provenance={'plan_fingerprint': 'plan-v1'})
+    return path
+
+
+class TestLeaveOneOutRanks:
+    """Closed-form ranks equal PeerComparison against the rest of the sector."""
+
+    def test_matches_peer_comparison(self, universe_metrics):
+        packed = pack_sector_data(universe_metrics)
+        percentiles, beats = leave_one_out_ranks(packed.value_at(-1))
+
+        for row, ticker in enumerate(packed.tickers):
+            peers = {t: m for t, m in universe_metrics.items() if t != ticker}
+            comparison = PeerComparison(universe_metrics[ticker], peers, ticker)
+            for col, (category, metric) in enumerate(packed.keys):
+                expected = comparison.compare_metric(metric, category)
+                if expected is None:
+                    continue
+                assert percentiles[row, col] == expected.percentile, (ticker, metric)
+                assert beats[row, col] == expected.beats_peers, (ticker, metric)
+
+    def test_small_columns(self):
+        percentiles, beats = leave_one_out_ranks(np.array([[1.0, np.nan], [np.nan, np.nan]]))
+        assert percentiles.tolist() == [[-1, -1], [0, -1]]
+        assert not beats.any()
+
+
+class TestReportSite:
+    """Only reports whose inputs changed are rewritten."""
+
+    def test_publish_is_incremental(self, universe_metrics, tmp_path):
+        snapshot = write(universe_metrics, tmp_path / 'TECH.sbs')
+        site = ReportSite(tmp_path / 'site')
+
+        first = site.publish(snapshot)
+        assert sorted(first.built) == sorted(universe_metrics)
+        assert first.failed == {}
+
+        manifest = site.load_manifest()
+        assert set(manifest) == set(universe_metrics)
+        index = site.index_path.read_text(encoding='utf-8')
+        assert "[T07](reports/T07.md)" in index
+        assert index.count("| TECH |") == len(universe_metrics)
+
+        # Sin cambios: nada se re-escribe (ni el índice)
+        mtimes = {t: site.report_path(t).stat().st_mtime_ns for t in universe_metrics}
+        index_mtime = site.index_path.stat().st_mtime_ns
+        second = site.publish(snapshot)
+        assert second.built == [] and len(second.unchanged) == len(universe_metrics)
+        assert site.index_path.stat().st_mtime_ns == index_mtime
+
+        # Un filing nuevo de T06 (año previo) → sólo T06
+        universe_metrics['T06']['profitability']['ROE'][1] *= 1.5
+        write(universe_metrics, snapshot)
+        third = site.publish(snapshot)
+        assert third.built == ['T06']
+        assert all(site.report_path(t).stat().st_mtime_ns == mtimes[t]
+                   for t in universe_metrics if t != 'T06')
+
+    def test_removed_and_forced(self, universe_metrics, tmp_path):
+        snapshot = write(universe_metrics, tmp_path / 'TECH.sbs')
+        site = ReportSite(tmp_path / 'site')
+        site.publish(snapshot)
+
+        del universe_metrics['T09']
+        write(universe_metrics, snapshot)
+        result = site.publish(snapshot)
+        assert result.removed == ['T09']                  # peer counts change → others rebuild
+        assert not site.report_path('T09').exists()
+        assert 'T09' not in site.index_path.read_text(encoding='utf-8')
+
+        forced = site.publish(snapshot, tickers=['T00', 'T03'], force=True)
+        assert sorted(forced.built) == ['T00', 'T03']
+
+    def test_plan_change_rebuilds_all(self, universe_metrics, tmp_path):
+        site = ReportSite(tmp_path / 'site')
+        site.publish(write(universe_metrics, tmp_path / 'a.sbs'))
+
+        engine = StatisticalBenchmarkEngine(universe_metrics, sector_code='TECH')
+        engine.save_snapshot(tmp_path / 'b.sbs', provenance={'plan_fingerprint': 'plan-v2'})
+        assert len(site.publish(tmp_path / 'b.sbs').built) == len(universe_metrics)
+
+    def test_unknown_ticker(self, universe_metrics, tmp_path):
+        snapshot = write(universe_metrics, tmp_path / 'TECH.sbs')
+        with pytest.raises(ValueError):
+            ReportSite(tmp_path / 'site').publish(snapshot, tickers=['NOPE'])
+
+    def test_manifest_entries(self, universe_metrics, tmp_path):
+        site = ReportSite(tmp_path / 'site')
+        site.publish(write(universe_metrics, tmp_path / 'TECH.sbs'))
+
+        entry = json.loads(site.manifest_path.read_text(encoding='utf-8'))['T00']
+        assert entry['path'] == 'reports/T00.md'
+        assert entry['recommendation'] in ('BUY', 'HOLD', 'SELL')
+        assert len(entry['fingerprint']) == 64
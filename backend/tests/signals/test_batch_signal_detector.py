@@ -0,0 +1,101 @@
+"""
+Unit tests for BatchSignalDetector (universe-wide signal screening).
+Tests parity with per-company SignalDetector.detect_all(), screening,
+metric filters, trends and packed / snapshot inputs.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import numpy as np
+import pytest
+
+from backend.signals.batch_signal_detector import BUY, NO_SIGNAL, BatchSignalDetector
+from backend.signals.signal_detector import SignalDetector
+from backend.signals.signal_taxonomy import SignalType
+from backend.signals.statistical_engine import StatisticalBenchmarkEngine, pack_sector_data
+
+
+@pytest.fixture
+def universe_metrics(synthetic_universe_metrics):
+    metrics = synthetic_universe_metrics(30, [2021, 2022, 2023, 2024], seed=53)
+    metrics['T05']['profitability']['ROE'][0] = np.nan                   # no latest value
+    metrics['T06']['profitability']['NetMargin'][1:3] = np.nan           # gaps in trend
+    metrics['T07']['liquidity']['CurrentRatio'][-1] = -1.0               # oldest <= 0
+    return metrics
+
+
+@pytest.fixture
+def engine(universe_metrics):
+    return StatisticalBenchmarkEngine(universe_metrics, sector_code='TECH')
+
+
+class TestBatchSignalDetector:
+    """Same Signals as SignalDetector, computed for the whole universe."""
+
+    def test_matches_per_company_detector(self, universe_metrics, engine):
+        batch = BatchSignalDetector(engine).detect(universe_metrics)
+
+        assert list(batch) == list(universe_metrics)
+        for ticker, metrics in universe_metrics.items():
+            expected = SignalDetector(metrics, ticker, engine).detect_all()
+            assert batch[ticker] == expected, ticker
+
+    def test_company_metric_order(self, universe_metrics, engine):
+        """A company missing a metric first must not reorder the others' signals."""
+        subset = {t: universe_metrics[t] for t in ('T03', 'T00', 'T05')}   # T03 sin DIO
+        batch = BatchSignalDetector(engine).detect(subset)
+        watch = BatchSignalDetector(engine).screen(subset, 'WATCH')
+
+        for ticker, metrics in subset.items():
+            expected = SignalDetector(metrics, ticker, engine).detect_all()
+            assert batch[ticker] == expected, ticker
+            assert watch.get(ticker, []) == expected['watch'], ticker
+
+    def test_screen_only_returns_hits(self, universe_metrics, engine):
+        detector = BatchSignalDetector(engine)
+        red_flags = detector.screen(universe_metrics, 'RED_FLAG')
+
+        for ticker, metrics in universe_metrics.items():
+            expected = SignalDetector(metrics, ticker, engine).detect_all()['red_flag']
+            assert red_flags.get(ticker, []) == expected
+        assert all(signals for signals in red_flags.values())
+        assert all(s.type == SignalType.RED_FLAG for signals in red_flags.values() for s in signals)
+
+    def test_metric_filter(self, universe_metrics, engine):
+        detector = BatchSignalDetector(engine, metric_names=['ROE', 'DebtToEquity'])
+        batch = detector.detect(universe_metrics, signal_types=[SignalType.BUY])
+
+        for ticker, metrics in universe_metrics.items():
+            expected = SignalDetector(metrics, ticker, engine, metric_names=['ROE', 'DebtToEquity']).detect_all()
+            assert batch[ticker]['buy'] == expected['buy']
+            assert batch[ticker]['watch'] == [] and batch[ticker]['red_flag'] == []
+
+    def test_classify_matrix(self, universe_metrics, engine):
+        packed = pack_sector_data(universe_metrics)
+        codes = BatchSignalDetector(engine).classify(packed)
+
+        assert codes.shape == (len(universe_metrics), 25)
+        row, col = packed.tickers.index('T02'), packed.keys.index(('profitability', 'ROE'))
+        assert codes[row, col] == NO_SIGNAL
+        row, col = packed.tickers.index('T03'), packed.keys.index(('efficiency', 'DIO'))
+        assert codes[row, col] == NO_SIGNAL
+
+        buys = BatchSignalDetector(engine).screen(packed, SignalType.BUY)
+        assert sum(len(s) for s in buys.values()) == int(np.sum(codes == BUY))
+
+    def test_trends(self, universe_metrics, engine):
+        packed = pack_sector_data(universe_metrics)
+        cagr, has_trend = BatchSignalDetector.trends(packed)
+
+        detector = SignalDetector(universe_metrics['T00'], 'T00', engine)
+        for ticker in ('T00', 'T01', 'T05', 'T06', 'T07'):
+            for col, (category, metric) in enumerate(packed.keys):
+                row = packed.tickers.index(ticker)
+                values = universe_metrics[ticker][category][metric]
+                expected = detector._calculate_trend(values)
+                if has_trend[row, col]:
+                    assert expected == (f"+{cagr[row, col]:.1f}% CAGR" if cagr[row, col] > 0
+                                        else f"{cagr[row, col]:.1f}% CAGR")
+                else:
+                    assert expected == ""
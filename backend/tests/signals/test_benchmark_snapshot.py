@@ -0,0 +1,189 @@
+"""
+Unit tests for binary benchmark snapshots.
+Tests round-trip parity with the in-memory engine, memory-mapped lazy
+loading, format validation and snapshot reuse in load_sector_benchmarks.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from backend.parsers.filing_catalog import FilingCatalog
+from backend.signals import sector_benchmark_loader
+from backend.signals.benchmark_snapshot import BenchmarkSnapshot, SNAPSHOT_VERSION, write_snapshot
+from backend.signals.statistical_engine import StatisticalBenchmarkEngine
+
+
+@pytest.fixture
+def sector_data(synthetic_universe_metrics):
+    return synthetic_universe_metrics(12, [2021, 2022, 2023, 2024], seed=31)
+
+
+class TestBenchmarkSnapshot:
+    """Binary round-trip of StatisticalBenchmarkEngine state."""
+
+    def test_round_trip_matches_engine(self, tmp_path, sector_data):
+        engine = StatisticalBenchmarkEngine(sector_data, sector_code='MINING')
+        path = engine.save_snapshot(tmp_path / 'MINING.sbs', {'source': 'test'})
+
+        restored = StatisticalBenchmarkEngine.from_snapshot(path)
+        assert restored.sector_code == 'MINING'
+        assert restored.calculate_all_benchmarks() == engine.calculate_all_benchmarks()
+
+        assert list(restored.sector_data) == list(sector_data)
+        for ticker, data in sector_data.items():
+            assert restored.sector_data[ticker].keys() == data.keys()
+            for category, metrics in data.items():
+                assert restored.sector_data[ticker][category].keys() == metrics.keys()
+                for metric, values in metrics.items():
+                    np.testing.assert_array_equal(restored.sector_data[ticker][category][metric], values)
+
+    def test_memory_mapped_and_lazy(self, tmp_path, sector_data):
+        path = write_snapshot(StatisticalBenchmarkEngine(sector_data), tmp_path / 'TECH.sbs')
+        snapshot = BenchmarkSnapshot(path)
+        assert snapshot._arrays == {}
+
+        engine = snapshot.engine()
+        assert engine.sector_data._companies == {}
+        roe = engine.sector_data['T00']['profitability']['ROE']
+        assert isinstance(roe.base, np.memmap) or isinstance(roe.base.base, np.memmap)
+        assert not roe.flags['WRITEABLE']
+
+    def test_latest_matrix_matches_engine(self, tmp_path, sector_data):
+        engine = StatisticalBenchmarkEngine(sector_data)
+        snapshot = BenchmarkSnapshot(write_snapshot(engine, tmp_path / 'TECH.sbs'))
+
+        np.testing.assert_array_equal(snapshot.latest_matrix(), engine.latest_matrix(snapshot.keys))
+
+    def test_invalid_files(self, tmp_path, sector_data):
+        bad = tmp_path / 'bad.sbs'
+        bad.write_bytes(b'XXXX' + b'\0' * 32)
+        with pytest.raises(ValueError, match='magic'):
+            BenchmarkSnapshot(bad)
+
+        path = write_snapshot(StatisticalBenchmarkEngine(sector_data), tmp_path / 'TECH.sbs')
+        data = bytearray(path.read_bytes())
+        data[4] = SNAPSHOT_VERSION + 1
+        bad.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match='version'):
+            BenchmarkSnapshot(bad)
+
+        bad.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError, match='Truncated'):
+            BenchmarkSnapshot(bad)
+
+        with pytest.raises(ValueError):
+            write_snapshot(StatisticalBenchmarkEngine({}), tmp_path / 'empty.sbs')
+
+    def test_all_arrays_empty(self, tmp_path):
+        sector_data = {t: {'p': {'ROE': np.array([])}} for t in ('A', 'B', 'C')}
+        engine = StatisticalBenchmarkEngine(sector_data)
+        snapshot = BenchmarkSnapshot(write_snapshot(engine, tmp_path / 'EMPTY.sbs'))
+
+        latest = snapshot.latest_matrix()
+        assert latest.shape == (3, 1) and np.isnan(latest).all()
+        np.testing.assert_array_equal(snapshot.packed().value_at(0), latest)
+        assert snapshot.engine().calculate_all_benchmarks() == engine.calculate_all_benchmarks()
+
+    def test_matches_provenance(self, tmp_path, sector_data):
+        provenance = {'sector_code': 'TECH', 'companies': ['T00', 'T01'], 'min_years': 3}
+        snapshot = BenchmarkSnapshot(
+            write_snapshot(StatisticalBenchmarkEngine(sector_data), tmp_path / 'TECH.sbs', provenance)
+        )
+
+        assert snapshot.matches(provenance)
+        assert not snapshot.matches({**provenance, 'min_years': 2})
+
+
+class TestLoaderSnapshot:
+    """load_sector_benchmarks reuses a valid snapshot instead of re-parsing."""
+
+    @pytest.fixture
+    def loader(self, monkeypatch, make_timeseries):
+        rng = np.random.default_rng(7)
+        universe = {t: make_timeseries(rng, [2022, 2023, 2024]) for t in ('AAA', 'BBB', 'CCC', 'DDD')}
+        state = {'parsed': 0, 'fingerprint': 'v1'}
+
+        class FakeParser:
+            def __init__(self, ticker, data_dir):
+                self.ticker = ticker
+
+            def extract_timeseries(self, years):
+                state['parsed'] += 1
+                return universe[self.ticker]
+
+        class FakeCatalog:
+            def fingerprint(self, tickers):
+                return state['fingerprint']
+
+        monkeypatch.setattr(sector_benchmark_loader, 'get_sector_companies', lambda code: list(universe))
+        monkeypatch.setattr(sector_benchmark_loader, 'discover_available_tickers',
+                            lambda data_dir, universe=None: list(universe))
+        monkeypatch.setattr(sector_benchmark_loader, 'MultiFileXBRLParser', FakeParser)
+        monkeypatch.setattr(sector_benchmark_loader.FilingCatalog, 'shared',
+                            classmethod(lambda cls, data_dir='data': FakeCatalog()))
+        return state
+
+    def test_snapshot_skips_ingestion(self, tmp_path, loader):
+        path = str(tmp_path / 'TECH.sbs')
+        first = sector_benchmark_loader.load_sector_benchmarks('TECH', verbose=False, snapshot_path=path)
+        assert loader['parsed'] == 4
+
+        second = sector_benchmark_loader.load_sector_benchmarks('TECH', verbose=False, snapshot_path=path)
+        assert loader['parsed'] == 4
+        assert second.calculate_all_benchmarks() == first.calculate_all_benchmarks()
+
+    def test_stale_snapshot_is_rebuilt(self, tmp_path, loader):
+        path = str(tmp_path / 'TECH.sbs')
+        sector_benchmark_loader.load_sector_benchmarks('TECH', verbose=False, snapshot_path=path)
+
+        loader['fingerprint'] = 'v2'   # a filing changed
+        sector_benchmark_loader.load_sector_benchmarks('TECH', verbose=False, snapshot_path=path)
+        assert loader['parsed'] == 8
+        assert BenchmarkSnapshot(path).provenance['source_fingerprint'] == 'v2'
+
+        sector_benchmark_loader.load_sector_benchmarks('TECH', verbose=False, min_years=2, snapshot_path=path)
+        assert loader['parsed'] == 12
+
+    def test_failed_filing_keeps_snapshot_valid(self, tmp_path, monkeypatch, make_timeseries):
+        """An unparseable filing does not force re-ingestion with a fresh catalog."""
+        tickers = ('AAA', 'BBB', 'CCC', 'DDD')
+        (tmp_path / 'data').mkdir()
+        for ticker in tickers:
+            for year in (2022, 2023, 2024):
+                (tmp_path / 'data' / f"{ticker}_{year}_10K.xml").write_bytes(f"<xbrl>{ticker}{year}</xbrl>".encode())
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(FilingCatalog, '_shared', {})
+
+        rng = np.random.default_rng(43)
+        universe = {t: make_timeseries(rng, [2022, 2023, 2024]) for t in tickers}
+        parsed = []
+
+        class FailingParser:
+            def __init__(self, ticker, data_dir):
+                self.ticker, self.data_dir = ticker, data_dir
+
+            def extract_timeseries(self, years):
+                parsed.append(self.ticker)
+                if self.ticker == 'AAA':
+                    FilingCatalog.shared(self.data_dir).mark_parsed(
+                        Path(self.data_dir) / 'AAA_2022_10K.xml', ok=False, error='not XBRL'
+                    )
+                return universe[self.ticker]
+
+        monkeypatch.setattr(sector_benchmark_loader, 'get_sector_companies', lambda code: list(tickers))
+        monkeypatch.setattr(sector_benchmark_loader, 'MultiFileXBRLParser', FailingParser)
+
+        path = str(tmp_path / 'TECH.sbs')
+        sector_benchmark_loader.load_sector_benchmarks('TECH', verbose=False, snapshot_path=path)
+        assert len(parsed) == 4
+
+        # Nuevo proceso: catálogo fresco, el archivo fallido vuelve a 'pending'
+        monkeypatch.setattr(FilingCatalog, '_shared', {})
+        (tmp_path / 'data' / FilingCatalog.INDEX_FILENAME).unlink()
+        sector_benchmark_loader.load_sector_benchmarks('TECH', verbose=False, snapshot_path=path)
+        assert len(parsed) == 4
@@ -0,0 +1,111 @@
+"""
+Unit tests for sorted peer distributions and batch peer ranking.
+Tests parity with calculate_percentile / the per-metric loop, NaN and
+missing-metric handling, and that only queried metrics are read.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import numpy as np
+import pytest
+
+from backend.signals.peer_comparison import (
+    PeerComparison, PeerDistribution, PeerGroup, calculate_percentile, percentiles_from_sorted
+)
+
+
+@pytest.fixture
+def universe_metrics(synthetic_universe_metrics):
+    return synthetic_universe_metrics(25, [2022, 2023, 2024], seed=41)
+
+
+def reference_percentile(metrics, peers, category, metric):
+    """Loop original de compare_metric: valores de peers + calculate_percentile."""
+    values = metrics.get(category, {}).get(metric)
+    if values is None or len(values) == 0:
+        return None
+    peer_values = np.array([
+        float(p[category][metric][-1]) for p in peers.values()
+        if category in p and metric in p[category] and len(p[category][metric]) > 0
+    ])
+    if len(peer_values) == 0 or np.isnan(peer_values).all():
+        return None
+    return calculate_percentile(float(values[-1]), peer_values)
+
+
+class TestPercentilesFromSorted:
+    """searchsorted lookup keeps the calculate_percentile definition."""
+
+    def test_matches_calculate_percentile(self):
+        rng = np.random.default_rng(0)
+        peers = np.append(rng.normal(size=97), [np.nan, 0.5, 0.5])
+        queries = np.concatenate([rng.normal(size=200), peers[:20], [np.nan, np.inf, -np.inf, 0.5]])
+
+        sorted_peers = np.sort(peers[~np.isnan(peers)])
+        expected = [calculate_percentile(q, peers) for q in queries]
+        assert percentiles_from_sorted(queries, sorted_peers).tolist() == expected
+
+    def test_no_valid_peers(self):
+        assert percentiles_from_sorted([1.0, 2.0], np.array([])).tolist() == [50, 50]
+        assert PeerDistribution.from_values(np.array([np.nan])) is None
+
+    def test_distribution_stats(self):
+        peers = np.array([3.0, np.nan, 1.0, 2.0, 10.0])
+        distribution = PeerDistribution.from_values(peers)
+
+        assert distribution.peer_count == 5
+        assert distribution.median == 2.5
+        assert distribution.mean == 4.0
+        assert distribution.percentile(3.0) == calculate_percentile(3.0, peers)
+
+
+class TestPeerGroup:
+    """Lazy per-metric distributions and the (company × metric) matrix."""
+
+    def test_rank_matrix_matches_reference(self, universe_metrics):
+        tickers = sorted(universe_metrics)
+        peers = {t: universe_metrics[t] for t in tickers[:15]}
+        companies = {t: universe_metrics[t] for t in tickers[2:]}
+
+        ranks = PeerGroup(peers).rank_matrix(companies)
+
+        assert ranks.percentiles.shape == (len(companies), 25)
+        for ticker, metrics in companies.items():
+            for category, metric in ranks.keys:
+                expected = reference_percentile(metrics, peers, category, metric)
+                assert ranks.get(ticker, category, metric) == expected
+
+        assert 'DIO' not in ranks.to_dict()['T03'].get('efficiency', {})
+
+    def test_compare_metric_unchanged(self, universe_metrics):
+        company = universe_metrics.pop('T00')
+        comparison = PeerComparison(company, universe_metrics, 'T00')
+
+        for category, metrics in company.items():
+            for metric in metrics:
+                result = comparison.compare_metric(metric, category)
+                assert result.percentile == reference_percentile(company, universe_metrics, category, metric)
+
+                peer_values = np.array([float(p[category][metric][-1]) for p in universe_metrics.values()
+                                        if metric in p.get(category, {}) and len(p[category][metric])])
+                valid = peer_values[~np.isnan(peer_values)]
+                assert result.peer_median == float(np.median(valid))
+                assert result.peer_mean == float(np.mean(valid))
+                assert result.peer_count == len(peer_values)
+
+    def test_only_requested_keys_are_read(self, universe_metrics):
+        class Recording(dict):
+            reads = set()
+
+            def __getitem__(self, category):
+                Recording.reads.add(category)
+                return super().__getitem__(category)
+
+        peers = {t: Recording(m) for t, m in universe_metrics.items()}
+        group = PeerGroup(peers)
+        ranks = group.rank_matrix(universe_metrics, keys=[('profitability', 'ROE')])
+
+        assert Recording.reads == {'profitability'}
+        assert ranks.percentiles.shape == (25, 1)
+        assert list(group._distributions) == [('profitability', 'ROE')]
@@ -0,0 +1,134 @@
+"""
+Unit tests for KLL quantile sketches (mergeable sector benchmarks).
+Tests exactness below k, rank error after merging shards, serialization
+and the StatisticalBenchmarkEngine / BenchmarkCalculator integration.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import numpy as np
+import pytest
+
+from backend.benchmarks.benchmark_calculator import BenchmarkCalculator
+from backend.signals import BenchmarkSketch, KLLSketch, StatisticalBenchmarkEngine
+
+
+QUANTILES = [10, 25, 50, 75, 90]
+
+
+@pytest.fixture
+def sector_data(synthetic_universe_metrics):
+    return synthetic_universe_metrics(30, [2022, 2023, 2024], seed=23, edge_cases=False)
+
+
+class TestKLLSketch:
+    """Single-metric sketch: accuracy, merge and moments."""
+
+    def test_exact_below_k(self):
+        values = np.random.default_rng(1).normal(size=150)
+        sketch = KLLSketch(k=200).update(values)
+
+        assert sketch.exact
+        np.testing.assert_array_equal(sketch.percentile(QUANTILES), np.percentile(values, QUANTILES))
+
+    def test_exact_up_to_k(self):
+        assert KLLSketch(k=8).update(np.arange(8.0)).exact
+        assert not KLLSketch(k=8).update(np.arange(9.0)).exact
+
+    def test_merged_shards_rank_error(self):
+        rng = np.random.default_rng(2)
+        values = rng.lognormal(size=20_000)
+        shards = np.array_split(values, 8)
+
+        sketch = KLLSketch(k=200, seed=0).update(shards[0])
+        for shard in shards[1:]:
+            sketch.merge(KLLSketch(k=200, seed=0).update(shard))
+
+        assert len(sketch) == len(values)
+        assert not sketch.exact
+        assert sketch.retained < 2 * 200 + 100
+
+        ordered = np.sort(values)
+        estimates = sketch.percentile(QUANTILES)
+        ranks = np.searchsorted(ordered, estimates) / len(values)
+        np.testing.assert_array_less(np.abs(ranks - np.array(QUANTILES) / 100), 0.017)
+
+    def test_moments_and_extremes(self):
+        values = np.random.default_rng(3).normal(10, 4, size=5_000)
+        sketch = KLLSketch(k=100).update(values[:2_000]).merge(KLLSketch(k=100).update(values[2_000:]))
+
+        assert sketch.mean == pytest.approx(np.mean(values), rel=1e-12)
+        assert sketch.std == pytest.approx(np.std(values), rel=1e-9)
+        assert sketch.min == values.min()
+        assert sketch.max == values.max()
+
+    def test_nan_ignored(self):
+        sketch = KLLSketch().update([1.0, np.nan, 3.0])
+        assert len(sketch) == 2
+
+    def test_k_mismatch(self):
+        with pytest.raises(ValueError):
+            KLLSketch(k=100).merge(KLLSketch(k=200))
+
+    def test_bytes_round_trip(self):
+        values = np.random.default_rng(4).normal(size=3_000)
+        sketch = KLLSketch(k=64, seed=1).update(values)
+        restored = KLLSketch.from_bytes(sketch.to_bytes())
+
+        assert len(restored) == len(sketch)
+        np.testing.assert_array_equal(restored.percentile(QUANTILES), sketch.percentile(QUANTILES))
+        with pytest.raises(ValueError):
+            KLLSketch.from_bytes(b'nope')
+
+
+class TestBenchmarkSketch:
+    """Per-metric sketches feeding the existing benchmark formats."""
+
+    def test_engine_from_sketch_matches_exact(self, sector_data):
+        exact = StatisticalBenchmarkEngine(sector_data, sector_code='TECH').calculate_all_benchmarks()
+
+        tickers = sorted(sector_data)
+        shard_a = BenchmarkSketch().add_companies(sector_data[t] for t in tickers[:15])
+        shard_b = BenchmarkSketch().add_companies(sector_data[t] for t in tickers[15:])
+        engine = StatisticalBenchmarkEngine.from_sketch(shard_a.merge(shard_b), sector_code='TECH')
+        approx = engine.calculate_all_benchmarks()
+
+        for category, metrics in exact.items():
+            for metric, benchmark in metrics.items():
+                sketched = approx[category][metric]
+                assert [sketched.p10, sketched.p25, sketched.p50, sketched.p75, sketched.p90] == \
+                    pytest.approx([benchmark.p10, benchmark.p25, benchmark.p50,
+                                   benchmark.p75, benchmark.p90], rel=1e-12)
+                assert sketched.sample_size == benchmark.sample_size
+                assert sketched.sector == 'TECH'
+
+        assert engine.get_signal_threshold('profitability', 'ROE', 'BUY') == \
+            exact['profitability']['ROE'].p75
+
+    def test_to_sketch_round_trip(self, sector_data):
+        engine = StatisticalBenchmarkEngine(sector_data)
+        restored = BenchmarkSketch.from_bytes(engine.to_sketch().to_bytes())
+
+        assert restored.position == -1
+        roe = restored.industry_benchmarks()['profitability']['ROE']
+        assert roe.sample_size == len(sector_data)
+
+    def test_merge_mismatch(self):
+        with pytest.raises(ValueError):
+            BenchmarkSketch(k=100).merge(BenchmarkSketch(k=200))
+        with pytest.raises(ValueError):
+            BenchmarkSketch(position=0).merge(BenchmarkSketch(position=-1))
+
+    def test_calculator_sketch_mode(self, sector_data):
+        all_metrics = list(sector_data.values())
+        calculator = BenchmarkCalculator()
+
+        exact = calculator._aggregate_statistics(all_metrics)
+        sketched = calculator._aggregate_statistics(all_metrics, sketch_k=200)
+
+        assert set(sketched) == set(exact)
+        for metric, benchmark in exact.items():
+            assert sketched[metric].median == pytest.approx(benchmark.median, rel=1e-12)
+            assert sketched[metric].min_value == benchmark.min_value
+            assert sketched[metric].sample_size == benchmark.sample_size
@@ -1,11 +1,15 @@
 """
 Tests for StatisticalBenchmarkEngine - Franklin Framework Layer 2
 
-Tests dynamic benchmark calculation from real sector data.
+Tests dynamic benchmark calculation from real sector data, and (Sprint 8)
+parity of the matrix-based benchmarks with the per-ticker np.percentile
+reference, minimum sample size, NaN/missing handling, caching and lazy
+sector data.
 """
 
 import pytest
 import numpy as np
+from backend.metrics import calculate_metrics, calculate_universe_metrics
 from backend.signals.statistical_engine import (
     IndustryBenchmark,
     StatisticalBenchmarkEngine,
@@ -364,3 +368,92 @@ def test_benchmark_calculation_performance(mock_sector_data):
     # Should complete in < 100ms
     assert elapsed < 0.1
     assert len(all_benchmarks) > 0
+
+
+def reference_benchmark(sector_data, category, metric):
+    """Implementación original: loop por ticker + np.percentile por cuantil."""
+    values = []
+    for data in sector_data.values():
+        if category in data and metric in data[category]:
+            metric_values = data[category][metric]
+            if len(metric_values) > 0 and not np.isnan(metric_values[-1]):
+                values.append(metric_values[-1])
+    if len(values) < 3:
+        return None
+    values = np.array(values)
+    return (
+        [float(np.percentile(values, q)) for q in (10, 25, 50, 75, 90)],
+        float(np.mean(values)), float(np.std(values)), len(values)
+    )
+
+
+@pytest.fixture
+def sector_data(synthetic_universe):
+    universe = synthetic_universe(40, [2021, 2022, 2023, 2024], seed=17)
+    del universe['T05'][2021]['Inventory']     # latest (index -1) NaN
+    sector_data = calculate_universe_metrics(universe)
+    del sector_data['T07']['efficiency']['DIO']
+    sector_data['T08']['leverage']['DebtToEquity'] = np.array([])
+    return sector_data
+
+
+class TestMatrixBenchmarks:
+    """Same IndustryBenchmark values as the per-ticker loop."""
+
+    def test_all_benchmarks_match_reference(self, sector_data):
+        engine = StatisticalBenchmarkEngine(sector_data, sector_code='TECH')
+        all_benchmarks = engine.calculate_all_benchmarks()
+
+        assert sum(len(m) for m in all_benchmarks.values()) == 25
+        for category, metrics in all_benchmarks.items():
+            for metric, benchmark in metrics.items():
+                percentiles, mean, std, n = reference_benchmark(sector_data, category, metric)
+                assert [benchmark.p10, benchmark.p25, benchmark.p50,
+                        benchmark.p75, benchmark.p90] == percentiles
+                assert benchmark.mean == pytest.approx(mean, rel=1e-12)
+                assert benchmark.std == pytest.approx(std, rel=1e-12)
+                assert benchmark.sample_size == n
+                assert benchmark.sector == 'TECH'
+
+        assert all_benchmarks['efficiency']['InventoryTurnover'].sample_size == 39
+        assert all_benchmarks['efficiency']['DIO'].sample_size == 38
+        assert all_benchmarks['leverage']['DebtToEquity'].sample_size == 39
+
+    def test_single_metric_matches_all(self, sector_data):
+        single = StatisticalBenchmarkEngine(sector_data).calculate_benchmarks('profitability', 'ROE')
+        batch = StatisticalBenchmarkEngine(sector_data).calculate_all_benchmarks()
+        assert single == batch['profitability']['ROE']
+
+    def test_cache_shared_between_paths(self, sector_data):
+        engine = StatisticalBenchmarkEngine(sector_data)
+        roe = engine.calculate_benchmarks('profitability', 'ROE')
+        assert engine.calculate_all_benchmarks()['profitability']['ROE'] is roe
+        assert engine.calculate_benchmarks('liquidity', 'CurrentRatio') is \
+            engine.calculate_all_benchmarks()['liquidity']['CurrentRatio']
+
+    def test_minimum_sample_size(self, sector_data):
+        small = dict(list(sector_data.items())[:2])
+        engine = StatisticalBenchmarkEngine(small)
+
+        assert engine.calculate_benchmarks('profitability', 'ROE') is None
+        assert engine.calculate_all_benchmarks() == {
+            'profitability': {}, 'liquidity': {}, 'efficiency': {}, 'leverage': {}
+        }
+        assert StatisticalBenchmarkEngine({}).calculate_all_benchmarks() == {}
+
+    def test_latest_matrix(self, sector_data):
+        engine = StatisticalBenchmarkEngine(sector_data)
+        matrix = engine.latest_matrix([('profitability', 'ROE'), ('efficiency', 'DIO')])
+
+        assert matrix.shape == (40, 2)
+        assert matrix[0, 0] == sector_data['T00']['profitability']['ROE'][-1]
+        assert np.isnan(matrix[7, 1]) and np.isnan(matrix[5, 1])
+
+    def test_lazy_single_metric_stays_narrow(self, make_timeseries):
+        rng = np.random.default_rng(2)
+        sector_data = {
+            f"T{i}": calculate_metrics(make_timeseries(rng, [2023, 2024]), lazy=True)
+            for i in range(5)
+        }
+        StatisticalBenchmarkEngine(sector_data).calculate_benchmarks('profitability', 'ROE')
+        assert all(m.computed == ['ROE'] for m in sector_data.values())
@@ -0,0 +1,139 @@
+"""
+Unit tests for the vectorized story engine (closed-form CAGR / R²).
+Tests parity with scipy.stats.linregress and per-metric generate_story,
+edge cases (constant, turnaround, non-positive or non-finite start) and
+that scipy is no longer imported by the report path.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from backend.signals.story_generator import (
+    ConfidenceLevel, StoryGenerator, StoryPattern, trend_statistics
+)
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(61)
+    rows = [list(rng.lognormal(2, 0.3) * np.cumprod(rng.normal(1.03, 0.08, size=5))) for _ in range(300)]
+    rows += [
+        [5.0, 5.0, 5.0, 5.0, 5.0],              # constant → R² NaN
+        [-3.0, -1.0, 0.5, 2.0, 4.0],            # turnaround
+        [0.0, 1.0, 2.0, 3.0, 4.0],              # start <= 0 → CAGR 0 → PLATEAU
+        [10.0, 9.0, 7.5, 6.0, 4.0],             # deterioration
+        [10.0, 10.1, 10.0, 10.1, 10.2],         # plateau
+    ]
+    return rows
+
+
+class TestTrendStatistics:
+    """Closed-form statistics match the scalar implementations."""
+
+    def test_matches_linregress(self, series):
+        stats = pytest.importorskip('scipy.stats')
+        result = trend_statistics(np.array(series))
+
+        for row, values in enumerate(series):
+            fit = stats.linregress(np.arange(len(values)), values)
+            if np.isnan(fit.rvalue):
+                assert np.isnan(result['r_squared'][row])
+                continue
+            assert result['r_squared'][row] == pytest.approx(fit.rvalue ** 2, rel=1e-9, abs=1e-12)
+            assert result['slope'][row] == pytest.approx(fit.slope, rel=1e-9, abs=1e-12)
+
+    def test_cagr_matches_scalar(self, series):
+        generator = StoryGenerator()
+        cagr = trend_statistics(np.array(series))['cagr']
+
+        for row, values in enumerate(series):
+            assert cagr[row] == pytest.approx(generator.calculate_cagr(values), rel=1e-12, abs=1e-12)
+
+    def test_two_points(self):
+        result = trend_statistics(np.array([[1.0, 2.0], [2.0, 1.0]]))
+        np.testing.assert_array_equal(result['r_squared'], [1.0, 1.0])
+        np.testing.assert_array_equal(result['slope'], [1.0, -1.0])
+
+
+class TestStoriesMatrix:
+    """Batch stories equal generate_story() per metric."""
+
+    def test_matches_generate_story(self, series):
+        generator = StoryGenerator()
+        names = [f"M{i}" for i in range(len(series))]
+        categories = ['profitability', 'liquidity', 'efficiency', 'leverage', None] * (len(series) // 5)
+
+        batch = generator.generate_stories_matrix(names, series, categories)
+
+        for arc, name, values, category in zip(batch, names, series, categories):
+            expected = generator.generate_story(name, values, category)
+            assert arc.pattern == expected.pattern
+            assert arc.confidence == expected.confidence
+            assert arc.narrative == expected.narrative
+            assert arc.cagr == pytest.approx(expected.cagr, rel=1e-12, abs=1e-12)
+            assert (arc.start_value, arc.end_value, arc.years) == \
+                (expected.start_value, expected.end_value, expected.years)
+
+        patterns = {arc.metric_name: arc.pattern for arc in batch[-5:]}
+        assert list(patterns.values()) == [
+            StoryPattern.PLATEAU, StoryPattern.TURNAROUND, StoryPattern.PLATEAU,
+            StoryPattern.DETERIORATION, StoryPattern.PLATEAU
+        ]
+        assert batch[-5].confidence == ConfidenceLevel.LOW
+
+    def test_non_finite_values_match_generate_story(self):
+        """NaN / ±inf start or end: CAGR and narrative follow calculate_cagr."""
+        generator = StoryGenerator()
+        rng = np.random.default_rng(46)
+        pool = [np.nan, np.inf, -np.inf, 0.0, 0.5, 1.0, 2.5, 10.0]
+        data = {'NaNStart': [np.nan, np.nan, 1.0, np.nan]}
+        data.update({
+            f"M{i}": [float(v) for v in rng.choice(pool, size=rng.integers(2, 6))]
+            for i in range(2000)
+        })
+
+        with np.errstate(all='ignore'):
+            stories = generator.generate_stories_batch(data)
+            expected_stories = {name: generator.generate_story(name, data[name]) for name in stories}
+
+        assert 'nan% CAGR' in stories['NaNStart'].narrative
+        for name, story in stories.items():
+            expected = expected_stories[name]
+            assert (story.pattern, story.confidence, story.narrative) == \
+                (expected.pattern, expected.confidence, expected.narrative)
+            np.testing.assert_equal(story.cagr, expected.cagr)
+
+    def test_batch_groups_by_length(self):
+        generator = StoryGenerator()
+        data = {
+            'ROE': [151.9, 164.6, 156.1, 197.0],
+            'NetMargin': [26.9, 24.0, 25.3, 25.3],
+            'CurrentRatio': [1.1, 0.9, 1.3],
+            'Short': [1.0],
+        }
+        stories = generator.generate_stories_batch(data, {'ROE': 'profitability'})
+
+        assert list(stories) == ['ROE', 'NetMargin', 'CurrentRatio']
+        for name, story in stories.items():
+            expected = generator.generate_story(name, data[name], 'profitability' if name == 'ROE' else None)
+            assert (story.pattern, story.confidence, story.narrative) == \
+                (expected.pattern, expected.confidence, expected.narrative)
+
+    def test_invalid_matrix(self):
+        with pytest.raises(ValueError):
+            StoryGenerator().generate_stories_matrix(['A'], [[1.0]])
+
+    def test_scipy_not_imported(self):
+        code = (
+            "import sys\n"
+            "import backend.signals.story_generator\n"
+            "assert 'scipy' not in sys.modules, 'scipy imported'\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,90 @@
+"""
+Unit tests for batch zone classification (np.searchsorted breakpoints).
+Tests parity with interpret_value / interpret_percentile, exact
+breakpoints, NaN / inf, array shapes and shared pre-built zones.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import numpy as np
+import pytest
+
+from backend.signals.franklin_interpretation import (
+    FranklinInterpretation, ZoneClassification, zone_indices
+)
+from backend.signals.statistical_engine import IndustryBenchmark
+
+
+@pytest.fixture
+def benchmark():
+    return IndustryBenchmark(
+        metric_name='ROE', sector='TECH',
+        p10=5.0, p25=10.0, p50=18.5, p75=30.0, p90=55.0,
+        mean=24.0, std=15.0, sample_size=40
+    )
+
+
+@pytest.fixture
+def values(benchmark):
+    rng = np.random.default_rng(47)
+    breakpoints = [benchmark.p10, benchmark.p25, benchmark.p50, benchmark.p75, benchmark.p90]
+    return np.concatenate([
+        rng.normal(25, 20, size=500),
+        breakpoints,
+        np.nextafter(breakpoints, -np.inf),
+        [np.nan, np.inf, -np.inf, 0.0],
+    ])
+
+
+class TestInterpretValues:
+    """Batch zones equal interpret_value() for every value."""
+
+    def test_matches_interpret_value(self, values, benchmark):
+        result = FranklinInterpretation.interpret_values(values, benchmark, 'ROE')
+
+        assert isinstance(result, ZoneClassification)
+        assert result.indices.shape == values.shape
+        for i, value in enumerate(values):
+            assert result[i] == FranklinInterpretation.interpret_value(value, benchmark, 'ROE')
+
+    def test_nan_is_underperformance(self, benchmark):
+        result = FranklinInterpretation.interpret_values([np.nan, 55.0], benchmark)
+        assert result.indices.tolist() == [0, 4]
+        assert result[0].name == FranklinInterpretation.interpret_value(np.nan, benchmark).name
+
+    def test_matrix_shape_and_shared_zones(self, values, benchmark):
+        matrix = values[:500].reshape(100, 5)
+        result = FranklinInterpretation.interpret_values(matrix, benchmark, 'ROE')
+
+        assert result.indices.shape == (100, 5)
+        assert result.names().shape == (100, 5)
+        assert len(result.zones) == 5
+        assert sum(result.counts().values()) == 500
+
+        elite = [result[i, j] for i, j in zip(*np.nonzero(result.indices == 4))]
+        assert elite and all(zone is result.zones[4] for zone in elite)
+
+    def test_benchmark_zones_order(self, benchmark):
+        zones = FranklinInterpretation.benchmark_zones(benchmark, 'ROE')
+        assert [z.relative_position for z in zones] == ['bottom', 'below_avg', 'avg', 'above_avg', 'top']
+        assert zones[4].description == "ROE in top 10% of sector (P90: 55.0, n=40)"
+
+
+class TestPercentileZones:
+    """Percentile cuts (25, 50, 75, 90) match interpret_percentile()."""
+
+    def test_matches_interpret_percentile(self, benchmark):
+        percentiles = np.arange(0, 101)
+        indices = FranklinInterpretation.percentile_zone_indices(percentiles)
+        zones = FranklinInterpretation.benchmark_zones(benchmark)
+
+        for percentile, index in zip(percentiles.tolist(), indices.tolist()):
+            expected = FranklinInterpretation.interpret_percentile(percentile, benchmark)
+            assert (zones[index].name, zones[index].percentile_range) == \
+                (expected.name, expected.percentile_range)
+
+    def test_zone_indices_dtype(self):
+        indices = zone_indices([[1.0, 2.0], [3.0, 4.0]], np.array([1.5, 2.5, 3.5, 3.9]))
+        assert indices.dtype == np.int8
+        assert indices.tolist() == [[0, 1], [2, 4]]
@@ -0,0 +1,37 @@
+"""
+Unit tests for atomic_write (temp file + os.replace).
+Tests binary/text writes, parent directory creation and that a failing
+writer keeps the previous file and leaves no temp file behind.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import pytest
+
+from backend.utils import atomic_write
+
+
+class TestAtomicWrite:
+    """All-or-nothing file writes."""
+
+    def test_writes_binary_and_text(self, tmp_path):
+        path = atomic_write(tmp_path / 'sub' / 'blob.bin', lambda f: f.write(b'\x00\x01'))
+        assert path.read_bytes() == b'\x00\x01'
+
+        atomic_write(path, lambda f: f.write('ñ'), mode='w')
+        assert path.read_text(encoding='utf-8') == 'ñ'
+
+    def test_failed_writer_keeps_previous(self, tmp_path):
+        path = tmp_path / 'manifest.json'
+        path.write_text('old', encoding='utf-8')
+
+        def writer(f):
+            f.write(b'partial')
+            raise OSError("disk full")
+
+        with pytest.raises(OSError, match='disk full'):
+            atomic_write(path, writer)
+
+        assert path.read_text(encoding='utf-8') == 'old'
+        assert list(tmp_path.iterdir()) == [path]
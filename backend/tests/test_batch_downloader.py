@@ -0,0 +1,189 @@
+"""
+Unit tests for batch download primitives.
+Tests token-bucket rate limiting, circuit breaker transitions,
+bounded worker pool progress and concurrent sector downloads.
+
+Author: @franklin
+Sprint: 7 - Data Platform
+"""
+
+import time
+import threading
+
+import pytest
+import requests
+
+from backend.parsers.batch_downloader import (
+    RateLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    guarded_request,
+    is_endpoint_failure,
+    run_batch,
+)
+from backend.parsers.sec_downloader import SECDownloader
+
+
+class FakeResponse:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}", response=self)
+
+
+class FakeSession:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return FakeResponse(self.status_code)
+
+
+class TestRateLimiter:
+    """Token bucket keeps the global request rate under budget."""
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+
+    def test_concurrent_acquires_respect_rate(self):
+        """20 acquires from 8 threads at 100 req/s take at least ~0.19s."""
+        limiter = RateLimiter(rate=100, burst=1)
+
+        start = time.monotonic()
+        threads = [
+            threading.Thread(target=lambda: [limiter.acquire() for _ in range(5)])
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.18
+
+    def test_for_host_is_shared(self):
+        """Same host returns the same limiter (one budget per host)."""
+        a = RateLimiter.for_host('test.example', rate=5)
+        b = RateLimiter.for_host('test.example', rate=50)
+        assert a is b
+
+
+class TestCircuitBreaker:
+    """Per-endpoint breaker opens, half-opens and closes."""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        for _ in range(3):
+            breaker.record_failure('archives')
+
+        assert breaker.state('archives') == CircuitBreaker.OPEN
+        assert breaker.state('browse-edgar') == CircuitBreaker.CLOSED
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request('archives')
+
+    def test_half_open_allows_single_trial(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure('archives')
+        time.sleep(0.02)
+
+        breaker.before_request('archives')          # trial allowed
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request('archives')      # second caller rejected
+
+        breaker.record_success('archives')
+        assert breaker.state('archives') == CircuitBreaker.CLOSED
+
+    def test_not_found_is_not_endpoint_failure(self):
+        assert not is_endpoint_failure(requests.HTTPError(response=FakeResponse(404)))
+        assert is_endpoint_failure(requests.HTTPError(response=FakeResponse(503)))
+        assert is_endpoint_failure(requests.HTTPError(response=FakeResponse(429)))
+        assert is_endpoint_failure(requests.ConnectionError())
+
+    def test_guarded_request_trips_breaker(self):
+        """Repeated 5xx stop reaching the session once the circuit opens."""
+        session = FakeSession(status_code=500)
+        limiter = RateLimiter(rate=1000)
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                guarded_request(session, 'http://x', 'archives', limiter, breaker)
+
+        with pytest.raises(CircuitOpenError):
+            guarded_request(session, 'http://x', 'archives', limiter, breaker)
+        assert session.calls == 2
+
+
+class TestRunBatch:
+    """Bounded worker pool with progress/ETA reporting."""
+
+    def test_results_and_progress(self):
+        progress = []
+
+        def callback(label, done, total, eta):
+            progress.append((label, done, total, eta))
+
+        results = run_batch(range(5), lambda x: x * 2, max_workers=3,
+                            progress_callback=callback)
+
+        assert results == {0: 0, 1: 2, 2: 4, 3: 6, 4: 8}
+        assert [p[1] for p in progress] == [1, 2, 3, 4, 5]
+        assert all(p[2] == 5 for p in progress)
+        assert progress[-1][3] == 0
+
+    def test_worker_errors_do_not_stop_batch(self):
+        def worker(x):
+            if x == 2:
+                raise RuntimeError("boom")
+            return x
+
+        results = run_batch([1, 2, 3], worker, max_workers=2)
+        assert results == {1: 1, 2: None, 3: 3}
+
+    def test_runs_concurrently(self):
+        """Latency-bound work overlaps across workers."""
+        start = time.monotonic()
+        run_batch(range(8), lambda x: time.sleep(0.05), max_workers=8)
+        assert time.monotonic() - start < 0.3
+
+
+class TestSECDownloaderBatch:
+    """SECDownloader concurrent batch mode."""
+
+    def test_download_batch_groups_by_ticker(self, tmp_path, monkeypatch):
+        downloader = SECDownloader(data_dir=str(tmp_path), verbose=False)
+
+        def fake_get_or_download(ticker, year):
+            return None if ticker == 'BAD' else f"{ticker}_{year}.xml"
+
+        monkeypatch.setattr(downloader, 'get_or_download', fake_get_or_download)
+
+        calls = []
+        files = downloader.download_batch(
+            ['AAPL', 'MSFT', 'BAD'], [2024, 2023], max_workers=4,
+            progress_callback=lambda *args: calls.append(args)
+        )
+
+        assert files == {
+            'AAPL': {2024: 'AAPL_2024.xml', 2023: 'AAPL_2023.xml'},
+            'MSFT': {2024: 'MSFT_2024.xml', 2023: 'MSFT_2023.xml'},
+        }
+        assert len(calls) == 6
+
+    def test_sector_batch_concurrent_matches_sequential(self, tmp_path, monkeypatch):
+        downloader = SECDownloader(data_dir=str(tmp_path), verbose=False)
+        monkeypatch.setattr(downloader, 'get_or_download',
+                            lambda ticker, year: f"{ticker}.xml")
+
+        sequential = downloader.download_sector_batch('TECH', 2024, max_companies=5)
+        concurrent = downloader.download_sector_batch('TECH', 2024, max_companies=5,
+                                                      max_workers=4)
+
+        assert sequential == concurrent
+        assert len(concurrent) == 5
@@ -0,0 +1,77 @@
+"""
+Unit tests for CompactFinancialDataFrame (pandas-free backend).
+Tests parity with FinancialDataFrame, zero-copy column views and that
+pandas is only imported on get_dataframe().
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from backend.metrics import calculate_metrics, CompactFinancialDataFrame, FinancialDataFrame
+from backend.metrics import MetricsCalculator, ParallelMetricsEngine
+
+
+@pytest.fixture
+def timeseries(make_timeseries):
+    rng = np.random.default_rng(5)
+    timeseries = make_timeseries(rng, [2021, 2022, 2023, 2024])
+    del timeseries[2022]['Inventory']
+    return timeseries
+
+
+class TestCompactFinancialDataFrame:
+    """Same contract as FinancialDataFrame without pandas."""
+
+    def test_matches_pandas_backend(self, timeseries, timeseries_concepts):
+        compact = CompactFinancialDataFrame(timeseries)
+        pandas_df = FinancialDataFrame(timeseries)
+
+        np.testing.assert_array_equal(compact.years, pandas_df.years)
+        assert compact.concepts == pandas_df.concepts
+        assert len(compact) == len(pandas_df.get_dataframe())
+        for concept in timeseries_concepts + ['Missing']:
+            np.testing.assert_array_equal(compact[concept], pandas_df[concept])
+        assert compact.get_dataframe().equals(pandas_df.get_dataframe())
+
+    def test_metrics_bitwise_equal(self, timeseries):
+        compact = ParallelMetricsEngine(
+            MetricsCalculator(CompactFinancialDataFrame(timeseries))
+        ).calculate_all()
+        expected = ParallelMetricsEngine(
+            MetricsCalculator(FinancialDataFrame(timeseries))
+        ).calculate_all()
+
+        for category, metrics in expected.items():
+            for metric, values in metrics.items():
+                np.testing.assert_array_equal(compact[category][metric], values)
+
+        result = calculate_metrics(timeseries, parallel='never')
+        np.testing.assert_array_equal(result['profitability']['ROE'], expected['profitability']['ROE'])
+
+    def test_column_is_contiguous_view(self, timeseries):
+        compact = CompactFinancialDataFrame(timeseries)
+        revenue = compact['Revenue']
+
+        assert revenue.flags['C_CONTIGUOUS']
+        assert np.shares_memory(revenue, compact['Equity']) is False
+        assert np.shares_memory(revenue, compact._values)
+
+    def test_slots(self, timeseries):
+        compact = CompactFinancialDataFrame(timeseries)
+        with pytest.raises(AttributeError):
+            compact.extra = 1
+
+    def test_pandas_not_imported(self):
+        code = (
+            "import sys\n"
+            "from backend.metrics import calculate_metrics\n"
+            "assert 'pandas' not in sys.modules, 'pandas imported'\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
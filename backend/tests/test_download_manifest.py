@@ -0,0 +1,140 @@
+"""
+Unit tests for DownloadManifest.
+Tests single-row writes, legacy JSON import (both formats),
+multi-process concurrent recording and SECDownloader integration.
+
+Author: @franklin
+Sprint: 7 - Data Platform
+"""
+
+import json
+import multiprocessing
+
+import pytest
+
+from backend.parsers.download_manifest import DownloadManifest
+from backend.parsers.sec_downloader import SECDownloader
+
+
+def _record_many(db_path, prefix, n):
+    manifest = DownloadManifest(db_path)
+    for i in range(n):
+        manifest.record_download(f"{prefix}{i}", 2024, f"/tmp/{prefix}{i}.xml")
+    manifest.close()
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    manifest = DownloadManifest(tmp_path / 'manifest.sqlite')
+    yield manifest
+    manifest.close()
+
+
+class TestDownloadManifest:
+    """Test suite for the SQLite-backed download manifest."""
+
+    def test_wal_mode(self, manifest):
+        mode = manifest._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == 'wal'
+
+    def test_record_and_lookup(self, manifest):
+        manifest.record_download('aapl', 2024, 'data/a.xml', download_time=1.234,
+                                 cik='0000320193', accession='A-1')
+
+        assert manifest.lookup('AAPL', 2024) == 'data/a.xml'
+        assert manifest.lookup('AAPL', 2023) is None
+        assert manifest.as_dict()['downloads']['AAPL']['download_time_seconds'] == 1.23
+
+    def test_success_clears_failure(self, manifest):
+        manifest.record_failure('MSFT', 'CIK not found')
+        assert manifest.get_failure('MSFT') == 'CIK not found'
+
+        manifest.record_download('MSFT', 2024, 'data/m.xml')
+        assert manifest.get_failure('MSFT') is None
+        assert manifest.count() == {'downloads': 1, 'failed': 0}
+
+    def test_import_sec_downloader_json(self, tmp_path, manifest):
+        legacy = tmp_path / 'legacy.json'
+        legacy.write_text(json.dumps({
+            'downloads': {'AAPL': {'year': 2024, 'filepath': 'data/a.xml',
+                                   'source': 'sec_edgar', 'cik': '0000320193'}},
+            'failed': {'XYZ': 'CIK not found'},
+            'metadata': {'version': '1.0'}
+        }))
+
+        assert manifest.import_json(legacy) == 1
+        assert manifest.lookup('AAPL', 2024) == 'data/a.xml'
+        assert manifest.get_failure('XYZ') == 'CIK not found'
+
+    def test_import_tech_universe_json(self, tmp_path, manifest):
+        legacy = tmp_path / 'fixed.json'
+        legacy.write_text(json.dumps({
+            'downloaded_at': '2026-01-29T14:25:13',
+            'files': {'MSFT': {'2025': 'data/m25.xml', '2024': 'data/m24.xml'}},
+            'stats': {'success': 2}
+        }))
+
+        assert manifest.import_json(legacy) == 2
+        assert manifest.lookup('MSFT', 2025) == 'data/m25.xml'
+
+    def test_for_data_dir_migrates_legacy_once(self, tmp_path):
+        (tmp_path / 'download_manifest.json').write_text(json.dumps({
+            'files': {'NVDA': {'2024': 'data/n.xml'}}
+        }))
+
+        first = DownloadManifest.for_data_dir(tmp_path)
+        assert first.lookup('NVDA', 2024) == 'data/n.xml'
+        first.record_download('NVDA', 2024, 'data/new.xml')
+        first.close()
+
+        reopened = DownloadManifest.for_data_dir(tmp_path)
+        assert reopened.lookup('NVDA', 2024) == 'data/new.xml'
+        reopened.close()
+
+    def test_concurrent_processes(self, tmp_path):
+        """Two processes writing at once lose no records."""
+        db_path = tmp_path / 'shared.sqlite'
+        DownloadManifest(db_path).close()
+
+        ctx = multiprocessing.get_context('spawn')
+        procs = [ctx.Process(target=_record_many, args=(db_path, p, 50)) for p in ('A', 'B')]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(timeout=60)
+
+        manifest = DownloadManifest(db_path)
+        assert manifest.count()['downloads'] == 100
+        manifest.close()
+
+    def test_export_json_roundtrip(self, tmp_path, manifest):
+        manifest.record_download('AAPL', 2024, 'data/a.xml')
+        out = tmp_path / 'export.json'
+        manifest.export_json(out)
+
+        other = DownloadManifest(tmp_path / 'other.sqlite')
+        other.import_json(out)
+        assert other.lookup('AAPL', 2024) == 'data/a.xml'
+        other.close()
+
+
+class TestSECDownloaderManifest:
+    """SECDownloader answers local lookups from the manifest."""
+
+    def test_get_local_file_uses_manifest(self, tmp_path):
+        filing = tmp_path / 'custom_name.xml'
+        filing.write_text('<xbrl/>')
+
+        downloader = SECDownloader(data_dir=str(tmp_path), verbose=False)
+        downloader.manifest.record_download('AAPL', 2024, filing)
+
+        assert downloader.get_local_file('AAPL', 2024) == str(filing)
+        assert downloader.get_local_file('AAPL', 2023) is None
+
+    def test_failures_recorded_without_json_rewrite(self, tmp_path, monkeypatch):
+        downloader = SECDownloader(data_dir=str(tmp_path), verbose=False)
+        monkeypatch.setattr(downloader, '_get_cik_number', lambda ticker: None)
+
+        assert downloader.download_from_sec('ZZZ', 2024) is None
+        assert downloader.manifest.get_failure('ZZZ') == 'CIK not found'
+        assert not (tmp_path / 'download_manifest.json').exists()
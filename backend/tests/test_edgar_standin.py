@@ -0,0 +1,152 @@
+"""
+Unit tests for the EDGAR stand-in server.
+Tests EDGAR-shaped routes, fault injection and every downloader
+running offline through its base_url override.
+
+Author: @franklin
+Sprint: 7 - Data Platform
+"""
+
+from datetime import datetime
+
+import pytest
+import requests
+
+from backend.parsers.batch_downloader import RateLimiter, CircuitBreaker
+from backend.parsers.edgar_standin import EdgarFixtures, EdgarStandIn
+from backend.parsers.sec_downloader import SECDownloader
+from backend.parsers.download_historical_xbrl import HistoricalXBRLDownloader
+from backend.benchmarks.download_tech_universe import SECDownloader as TechUniverseDownloader
+
+
+CURRENT_YEAR = datetime.now().year
+
+
+@pytest.fixture
+def fixtures():
+    return EdgarFixtures.synthetic(['AAPL', 'MSFT'], years=[CURRENT_YEAR, CURRENT_YEAR - 1], ixbrl=True)
+
+
+@pytest.fixture
+def server(fixtures):
+    with EdgarStandIn(fixtures) as server:
+        yield server
+
+
+def make_downloader(tmp_path, server, **kwargs):
+    return SECDownloader(
+        data_dir=str(tmp_path), verbose=False, base_url=server.base_url,
+        rate_limiter=RateLimiter(1000), **kwargs
+    )
+
+
+class TestRoutes:
+    """Responses have the shapes the downloaders parse."""
+
+    def test_company_page_has_cik(self, server, fixtures):
+        html = requests.get(f"{server.base_url}/cgi-bin/browse-edgar",
+                            params={'action': 'getcompany', 'company': 'AAPL'}).text
+        assert 'class="companyName"' in html
+        assert "CIK#: " in html and fixtures.companies['AAPL']['cik'] in html
+
+    def test_submissions_json(self, server, fixtures):
+        cik = fixtures.companies['MSFT']['cik']
+        data = requests.get(f"{server.base_url}/submissions/CIK{cik}.json").json()
+        recent = data['filings']['recent']
+        assert recent['form'] == ['10-K', '10-K']
+        assert recent['primaryDocument'][0].endswith('.htm')
+
+    def test_instance_and_ixbrl_documents(self, server, fixtures):
+        filing = fixtures.filings[0]
+        xml = requests.get(f"{server.base_url}{filing.folder}/{filing.instance_document}")
+        htm = requests.get(f"{server.base_url}{filing.folder}/{filing.primary_document}")
+
+        assert xml.status_code == 200 and xml.content.startswith(b'<?xml')
+        assert b'DocumentFiscalYearFocus' in xml.content
+        assert htm.status_code == 200 and b'ix:nonNumeric' in htm.content
+
+    def test_unknown_path_404(self, server):
+        assert requests.get(f"{server.base_url}/nope").status_code == 404
+
+    def test_static_dir(self, tmp_path, fixtures):
+        (tmp_path / 'files').mkdir()
+        (tmp_path / 'files' / 'company_tickers.json').write_text('{"0": {}}')
+        with EdgarStandIn(fixtures, static_dir=tmp_path) as server:
+            assert requests.get(f"{server.base_url}/files/company_tickers.json").text == '{"0": {}}'
+
+
+class TestFaultInjection:
+    """Latency, errors and rate limiting are configurable."""
+
+    def test_rate_limit_answers_429(self, fixtures):
+        with EdgarStandIn(fixtures, rate_limit=3) as server:
+            codes = [requests.get(f"{server.base_url}/nope").status_code for _ in range(6)]
+        assert codes.count(429) >= 2
+        assert server.stats['status'][429] == codes.count(429)
+
+    def test_error_injection_trips_breaker(self, tmp_path, fixtures):
+        with EdgarStandIn(fixtures, error_rate=1.0, error_status=503) as server:
+            breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+            downloader = make_downloader(tmp_path, server, circuit_breaker=breaker)
+
+            for _ in range(4):
+                assert downloader.get_or_download('AAPL', CURRENT_YEAR) is None
+
+        assert breaker.state('browse-edgar') == CircuitBreaker.OPEN
+        assert server.stats['requests'] == 2  # later calls failed fast
+
+    def test_stats_count_bytes(self, server, fixtures):
+        filing = fixtures.filings[0]
+        requests.get(f"{server.base_url}{filing.folder}/{filing.instance_document}")
+        assert server.stats['bytes'] == len(filing.instance)
+
+
+class TestDownloadersOffline:
+    """All downloaders run against the stand-in via base_url."""
+
+    def test_sec_downloader_end_to_end(self, tmp_path, server, fixtures):
+        downloader = make_downloader(tmp_path, server)
+        path = downloader.get_or_download('AAPL', CURRENT_YEAR)
+
+        expected = next(f for f in fixtures.filings
+                        if f.ticker == 'AAPL' and f.fiscal_year == CURRENT_YEAR)
+        assert open(path, 'rb').read() == expected.instance
+
+        # Second call is served locally (no new requests)
+        before = server.stats['requests']
+        assert downloader.get_or_download('AAPL', CURRENT_YEAR) == path
+        assert server.stats['requests'] == before
+
+    def test_sec_downloader_batch(self, tmp_path, server):
+        files = make_downloader(tmp_path, server).download_batch(
+            ['AAPL', 'MSFT'], [CURRENT_YEAR, CURRENT_YEAR - 1], max_workers=4
+        )
+        assert {t: sorted(y) for t, y in files.items()} == {
+            'AAPL': [CURRENT_YEAR - 1, CURRENT_YEAR],
+            'MSFT': [CURRENT_YEAR - 1, CURRENT_YEAR],
+        }
+
+    def test_historical_downloader(self, tmp_path):
+        filing = HistoricalXBRLDownloader.APPLE_FILINGS[2024]
+        fixtures = EdgarFixtures()
+        fixtures.add_company('AAPL', HistoricalXBRLDownloader.APPLE_CIK, 'Apple Inc.')
+        fixtures.add_filing('AAPL', 2024, accession=filing['accession'],
+                            period_end=filing['fiscal_year_end'])
+
+        with EdgarStandIn(fixtures) as server:
+            downloader = HistoricalXBRLDownloader(output_dir=str(tmp_path), base_url=server.base_url)
+            assert downloader.download_year(2024) is True
+
+        assert downloader.store.find('AAPL', 2024) is not None
+
+    def test_tech_universe_downloader(self, tmp_path, server, fixtures):
+        downloader = TechUniverseDownloader(
+            output_dir=str(tmp_path), base_url=server.base_url,
+            rate_limiter=RateLimiter(1000)
+        )
+        downloader.CIK_MAP = {'MSFT': fixtures.companies['MSFT']['cik']}
+
+        files = downloader.download_company_filings('MSFT', years=1)
+
+        assert list(files) == [str(CURRENT_YEAR)]
+        assert downloader.stats['success'] == 1
@@ -0,0 +1,210 @@
+"""
+Unit tests for FilingCatalog.
+Tests indexing of every naming convention, incremental refresh,
+precedence, parse-status tracking and sector/ticker queries.
+
+Author: @franklin
+Sprint: 7 - Data Platform
+"""
+
+import os
+
+import pytest
+
+from backend.parsers.filing_catalog import FilingCatalog
+from backend.parsers.filing_store import FilingStore
+from backend.signals.sector_benchmark_loader import discover_available_tickers
+
+
+DEI_XML = (
+    b'<?xml version="1.0"?><xbrli:xbrl xmlns:xbrli="x" xmlns:dei="d">'
+    b'<dei:DocumentType contextRef="c">10-K</dei:DocumentType>'
+    b'<dei:DocumentPeriodEndDate contextRef="c">2024-09-28</dei:DocumentPeriodEndDate>'
+    b'<dei:DocumentFiscalYearFocus contextRef="c">2024</dei:DocumentFiscalYearFocus>'
+    b'<dei:EntityCentralIndexKey contextRef="c">320193</dei:EntityCentralIndexKey>'
+    b'</xbrli:xbrl>'
+)
+PLAIN_XML = b'<?xml version="1.0"?><xbrli:xbrl xmlns:xbrli="x">2023</xbrli:xbrl>'
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    store = FilingStore.for_data_dir(tmp_path)
+    catalog = FilingCatalog(tmp_path, store=store)
+    yield catalog
+    catalog.close()
+    store.close()
+
+
+class TestFilingCatalog:
+    """Test suite for the indexed filing catalog."""
+
+    def test_indexes_all_naming_conventions(self, tmp_path, catalog):
+        """Subdir, flat and legacy names resolve to {year: path}."""
+        (tmp_path / 'MSFT').mkdir()
+        sub = tmp_path / 'MSFT' / 'MSFT_2024_10K.xml'
+        flat = tmp_path / 'MSFT_2023_10K.xml'
+        legacy = tmp_path / 'msft_10k_2022_xbrl.xml'
+        for path in (sub, flat, legacy):
+            path.write_bytes(PLAIN_XML)
+        (tmp_path / 'notes.txt').write_text('ignored')
+
+        result = catalog.refresh()
+
+        assert result['indexed'] == 3
+        assert catalog.files_for_ticker('msft') == {2024: sub, 2023: flat, 2022: legacy}
+
+    def test_sniffs_dei_metadata(self, tmp_path, catalog):
+        """CIK, period end and form come from the instance document."""
+        path = tmp_path / 'aapl_10k_2024_xbrl.xml'
+        path.write_bytes(DEI_XML)
+        catalog.refresh()
+
+        record = catalog.get_record(path)
+        assert record['cik'] == '0000320193'
+        assert record['period_end'] == '2024-09-28'
+        assert record['form'] == '10-K'
+        assert record['hash'] == FilingStore.hash_content(DEI_XML)
+        assert record['parse_status'] == 'pending'
+
+    def test_undated_file_uses_fiscal_year_focus(self, tmp_path, catalog):
+        """Year-less legacy files take the sniffed fiscal year if free."""
+        path = tmp_path / 'aapl_10k_xbrl.xml'
+        path.write_bytes(DEI_XML)
+        catalog.refresh()
+
+        assert catalog.files_for_ticker('AAPL') == {2024: path}
+
+    def test_refresh_is_incremental(self, tmp_path, catalog):
+        """Unchanged files are not re-read; removed files are dropped."""
+        keep = tmp_path / 'AAPL_2024_10K.xml'
+        drop = tmp_path / 'AAPL_2023_10K.xml'
+        keep.write_bytes(PLAIN_XML)
+        drop.write_bytes(PLAIN_XML)
+        catalog.refresh()
+
+        drop.unlink()
+        result = catalog.refresh()
+
+        assert result == {'indexed': 0, 'unchanged': 1, 'removed': 1}
+        assert catalog.files_for_ticker('AAPL') == {2024: keep}
+
+    def test_store_takes_precedence(self, tmp_path, catalog):
+        """FilingStore blobs win over legacy names for the same year."""
+        legacy = tmp_path / 'AAPL_2024_10K.xml'
+        legacy.write_bytes(PLAIN_XML)
+        blob = catalog.store.put(DEI_XML, cik='320193', fiscal_year=2024,
+                                 accession='A', ticker='AAPL')
+        catalog.refresh()
+
+        assert catalog.files_for_ticker('AAPL')[2024] == blob
+
+    def test_failed_files_are_skipped_until_changed(self, tmp_path, catalog):
+        """Parse failures are remembered; new content resets status."""
+        path = tmp_path / 'AAPL_2024_10K.xml'
+        path.write_bytes(PLAIN_XML)
+        catalog.refresh()
+
+        catalog.mark_parsed(path, ok=False, error='not XBRL')
+        assert catalog.files_for_ticker('AAPL') == {}
+        assert catalog.files_for_ticker('AAPL', include_failed=True) == {2024: path}
+        assert catalog.tickers() == []
+
+        path.write_bytes(DEI_XML)
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        catalog.refresh()
+
+        assert catalog.files_for_ticker('AAPL') == {2024: path}
+
+    def test_tickers_filtered_by_universe(self, tmp_path, catalog):
+        """Sector queries intersect with the indexed tickers."""
+        for name in ('AAPL_2024_10K.xml', 'msft_10k_2024_xbrl.xml', 'nvda_10k_xbrl.xml'):
+            (tmp_path / name).write_bytes(PLAIN_XML)
+        catalog.refresh()
+
+        assert catalog.tickers() == ['AAPL', 'MSFT']
+        assert catalog.tickers(['MSFT', 'GOOGL']) == ['MSFT']
+
+    def test_catalog_persists(self, tmp_path):
+        """Index survives reopening; nothing is re-read."""
+        (tmp_path / 'AAPL_2024_10K.xml').write_bytes(PLAIN_XML)
+        store = FilingStore.for_data_dir(tmp_path)
+        first = FilingCatalog(tmp_path, store=store)
+        first.refresh()
+        first.close()
+        store.close()
+
+        second = FilingCatalog(tmp_path)
+        assert second.refresh()['unchanged'] == 1
+        second.close()
+
+    def test_index_persists_without_store(self, tmp_path):
+        """Legacy layout: sidecar index survives reopening, failures too."""
+        path = tmp_path / 'AAPL_2024_10K.xml'
+        path.write_bytes(PLAIN_XML)
+        first = FilingCatalog(tmp_path)
+        first.refresh()
+        first.mark_parsed(path, ok=False, error='not XBRL')
+        first.close()
+
+        second = FilingCatalog(tmp_path)
+        assert second.refresh() == {'indexed': 0, 'unchanged': 1, 'removed': 0}
+        assert second.files_for_ticker('AAPL') == {}
+        assert (tmp_path / FilingCatalog.INDEX_FILENAME).exists()
+        assert not (tmp_path / FilingStore.DEFAULT_DIRNAME).exists()
+        second.close()
+
+    def test_discover_available_tickers_uses_catalog(self, tmp_path):
+        """Sector loader discovery returns catalog tickers."""
+        (tmp_path / 'aapl_10k_2024_xbrl.xml').write_bytes(PLAIN_XML)
+        (tmp_path / 'MSFT_2023_10K.xml').write_bytes(PLAIN_XML)
+
+        assert discover_available_tickers(str(tmp_path)) == ['AAPL', 'MSFT']
+        assert discover_available_tickers(str(tmp_path), universe=['AAPL']) == ['AAPL']
+
+    def test_discovery_does_not_create_store(self, tmp_path):
+        """Read-only discovery keeps an in-memory index, no catalog.sqlite."""
+        (tmp_path / 'AAPL_2024_10K.xml').write_bytes(PLAIN_XML)
+
+        catalog = FilingCatalog(tmp_path)
+        catalog.refresh()
+
+        assert catalog.store is None
+        assert catalog.tickers() == ['AAPL']
+        assert discover_available_tickers(str(tmp_path)) == ['AAPL']
+        assert not (tmp_path / FilingStore.DEFAULT_DIRNAME).exists()
+        catalog.close()
+
+    def test_shared_sees_subdir_and_in_place_changes(self, tmp_path):
+        """New files under data/{TICKER}/ and rewrites are not served stale."""
+        (tmp_path / 'MSFT').mkdir()
+        (tmp_path / 'MSFT' / 'MSFT_2023_10K.xml').write_bytes(PLAIN_XML)
+        catalog = FilingCatalog.shared(tmp_path)
+        before = catalog.fingerprint(['MSFT'])
+
+        added = tmp_path / 'MSFT' / 'MSFT_2024_10K.xml'
+        added.write_bytes(PLAIN_XML)
+        stat = (tmp_path / 'MSFT').stat()
+        os.utime(tmp_path / 'MSFT', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert set(FilingCatalog.shared(tmp_path).files_for_ticker('MSFT')) == {2023, 2024}
+        after_add = FilingCatalog.shared(tmp_path).fingerprint(['MSFT'])
+        assert after_add != before
+
+        added.write_bytes(DEI_XML)
+        stat = added.stat()
+        os.utime(added, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert FilingCatalog.shared(tmp_path).fingerprint(['MSFT']) != after_add
+
+    def test_shared_attaches_store_created_later(self, tmp_path):
+        """A store created after discovery is picked up by shared()."""
+        assert FilingCatalog.shared(tmp_path).store is None
+
+        store = FilingStore.for_data_dir(tmp_path)
+        blob = store.put(DEI_XML, cik='320193', fiscal_year=2024, accession='A', ticker='AAPL')
+
+        catalog = FilingCatalog.shared(tmp_path)
+        assert catalog.store is not None
+        assert catalog.files_for_ticker('AAPL') == {2024: blob}
+        store.close()
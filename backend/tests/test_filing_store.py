@@ -0,0 +1,123 @@
+"""
+Unit tests for FilingStore.
+Tests content addressing, deduplication, catalog lookups and
+integration with downloaders / MultiFileXBRLParser discovery.
+
+Author: @franklin
+Sprint: 7 - Data Platform
+"""
+
+import pytest
+
+from backend.parsers.filing_store import FilingStore, normalize_cik
+from backend.parsers.download_historical_xbrl import HistoricalXBRLDownloader
+from backend.parsers.multi_file_xbrl_parser import MultiFileXBRLParser
+
+
+SAMPLE_XML = b'<?xml version="1.0"?><xbrli:xbrl xmlns:xbrli="x">2024</xbrli:xbrl>'
+OTHER_XML = b'<?xml version="1.0"?><xbrli:xbrl xmlns:xbrli="x">2023</xbrli:xbrl>'
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FilingStore(tmp_path / 'filings')
+    yield store
+    store.close()
+
+
+class TestFilingStore:
+    """Test suite for the content-addressed filing store."""
+
+    def test_normalize_cik(self):
+        """CIKs are zero-padded to 10 digits regardless of input padding."""
+        assert normalize_cik('320193') == '0000320193'
+        assert normalize_cik(320193) == '0000320193'
+        assert normalize_cik('0000320193') == '0000320193'
+
+    def test_put_and_lookup(self, store):
+        """Stored filing is retrievable by CIK, year and accession."""
+        path = store.put(SAMPLE_XML, cik='320193', fiscal_year=2024,
+                         accession='0000320193-24-000123', ticker='aapl')
+
+        assert path.read_bytes() == SAMPLE_XML
+        assert path.name == f"{FilingStore.hash_content(SAMPLE_XML)}.xml"
+        assert store.lookup('0000320193', 2024) == path
+        assert store.lookup(320193, 2024, accession='0000320193-24-000123') == path
+        assert store.lookup('320193', 2023) is None
+
+    def test_identical_documents_deduplicated(self, store):
+        """Same bytes under two catalog keys share a single blob."""
+        first = store.put(SAMPLE_XML, cik='1', fiscal_year=2024, accession='A-1')
+        second = store.put(SAMPLE_XML, cik='2', fiscal_year=2024, accession='B-1')
+
+        assert first == second
+        blobs = list(store.blobs_dir.rglob('*.xml'))
+        assert len(blobs) == 1
+
+        stats = store.stats()
+        assert stats['filings'] == 2
+        assert stats['blobs'] == 1
+        assert stats['deduplicated'] == 1
+
+    def test_find_by_ticker(self, store):
+        """Ticker lookups are case-insensitive."""
+        path = store.put(SAMPLE_XML, cik='320193', fiscal_year=2024,
+                         accession='X', ticker='AAPL')
+        assert store.find('aapl', 2024) == path
+        assert store.find('MSFT', 2024) is None
+
+    def test_files_for_ticker(self, store):
+        """All fiscal years for a ticker are returned as {year: path}."""
+        p24 = store.put(SAMPLE_XML, cik='320193', fiscal_year=2024, accession='A', ticker='AAPL')
+        p23 = store.put(OTHER_XML, cik='320193', fiscal_year=2023, accession='B', ticker='AAPL')
+
+        assert store.files_for_ticker('AAPL') == {2024: p24, 2023: p23}
+
+    def test_catalog_persists(self, tmp_path):
+        """Catalog survives reopening the store."""
+        root = tmp_path / 'filings'
+        store = FilingStore(root)
+        path = store.put(SAMPLE_XML, cik='320193', fiscal_year=2024, accession='A', ticker='AAPL')
+        store.close()
+
+        reopened = FilingStore(root)
+        assert reopened.lookup('320193', 2024) == path
+        reopened.close()
+
+    def test_open_existing_does_not_create(self, tmp_path):
+        """Read-only consumers never create an empty store."""
+        assert FilingStore.open_existing(tmp_path) is None
+        assert not (tmp_path / 'filings').exists()
+
+
+class TestFilingStoreIntegration:
+    """Downloaders and parsers share the same catalog."""
+
+    def test_historical_downloader_skips_stored_accession(self, tmp_path, monkeypatch):
+        """A filing stored by any tool is not fetched again."""
+        store = FilingStore.for_data_dir(tmp_path)
+        filing = HistoricalXBRLDownloader.APPLE_FILINGS[2024]
+        store.put(SAMPLE_XML, cik=HistoricalXBRLDownloader.APPLE_CIK,
+                  fiscal_year=2024, accession=filing['accession'], ticker='AAPL')
+
+        def fail_get(*args, **kwargs):
+            raise AssertionError("network must not be used for stored filings")
+
+        monkeypatch.setattr('backend.parsers.download_historical_xbrl.requests.get', fail_get)
+
+        downloader = HistoricalXBRLDownloader(output_dir=str(tmp_path), store=store)
+        assert downloader.download_year(2024) is True
+
+    def test_multi_file_parser_discovers_store(self, tmp_path):
+        """MultiFileXBRLParser finds years from the catalog before legacy names."""
+        store = FilingStore.for_data_dir(tmp_path)
+        p24 = store.put(SAMPLE_XML, cik='320193', fiscal_year=2024, accession='A', ticker='AAPL')
+        store.close()
+
+        legacy = tmp_path / 'aapl_10k_2023_xbrl.xml'
+        legacy.write_bytes(OTHER_XML)
+
+        parser = MultiFileXBRLParser(ticker='AAPL', data_dir=str(tmp_path))
+
+        assert parser.files[2024] == p24
+        assert parser.files[2023] == legacy
@@ -0,0 +1,115 @@
+"""
+Unit tests for dependency-tracked incremental recomputation.
+Tests the concept → metric graph, MetricsCalculator.update_inputs and
+IncrementalMetrics restatements with CalculatedMetric audit records.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from backend.engines.tracked_metric import SourceTrace
+from backend.metrics import calculate_metrics
+from backend.metrics.definitions import default_plan
+from backend.metrics.incremental import IncrementalMetrics
+
+
+@pytest.fixture
+def timeseries(make_timeseries):
+    return make_timeseries(np.random.default_rng(21), [2022, 2023, 2024])
+
+
+def assert_matches_full_recalculation(inc):
+    expected = calculate_metrics(inc.timeseries, parallel='never')
+    actual = inc.metrics()
+    for category, metrics in expected.items():
+        for metric, values in metrics.items():
+            np.testing.assert_array_equal(actual[category][metric], values, err_msg=metric)
+
+
+class TestDependencyGraph:
+    """Concept → metric dependencies come from the evaluation plan."""
+
+    def test_concept_dependents(self):
+        dependents = default_plan().concept_dependents
+        assert dependents['Equity'] == ['ROE', 'ROIC', 'DebtToEquity', 'EquityMultiplier']
+        assert dependents['Inventory'] == ['QuickRatio', 'InventoryTurnover', 'DIO', 'CCC']
+        assert dependents['NetIncome'] == ['ROE', 'ROA', 'NetMargin', 'EPS']
+
+    def test_metric_concepts_transitive(self):
+        assert sorted(default_plan().metric_concepts('CCC')) == [
+            'AccountsReceivable', 'CostOfRevenue', 'Inventory', 'Revenue'
+        ]
+
+    def test_invalidate_keeps_unaffected_slots(self, timeseries):
+        plan = default_plan()
+        slots = {}
+        plan.evaluate(calculate_metrics(timeseries, lazy=True).calculator.df, slots=slots)
+
+        affected = plan.invalidate(slots, ['Inventory'])
+
+        assert affected == ['QuickRatio', 'InventoryTurnover', 'DIO', 'CCC']
+        assert plan.outputs['ROE'] in slots and plan.outputs['DSO'] in slots
+        assert plan.outputs['CCC'] not in slots
+
+
+class TestIncrementalMetrics:
+    """Updates recompute only affected metrics and audit records."""
+
+    def test_update_recomputes_only_affected(self, timeseries):
+        inc = IncrementalMetrics(timeseries)
+        inc.metrics()
+        untouched = inc.value('CurrentRatio')
+
+        affected = inc.update(2024, 'Equity', 1.0e10)
+
+        assert affected == ['ROE', 'ROIC', 'DebtToEquity', 'EquityMultiplier']
+        assert inc.value('CurrentRatio') is untouched  # no recalculado
+        assert_matches_full_recalculation(inc)
+
+    def test_caller_timeseries_not_mutated(self, timeseries):
+        original = timeseries[2024]['Revenue'].raw_value
+        IncrementalMetrics(timeseries).update(2024, 'Revenue', 1.0)
+        assert timeseries[2024]['Revenue'].raw_value == original
+
+    def test_audit_records_invalidated_per_year(self, timeseries):
+        inc = IncrementalMetrics(timeseries)
+        roe_2024 = inc.record('ROE', 2024)
+        roe_2023 = inc.record('ROE', 2023)
+        roa_2024 = inc.record('ROA', 2024)
+
+        inc.update(2024, 'Equity', 2.5e10)
+
+        new_roe = inc.record('ROE', 2024)
+        assert new_roe is not roe_2024
+        assert new_roe.value == pytest.approx(timeseries[2024]['NetIncome'].raw_value / 2.5e10 * 100)
+        assert new_roe.inputs['Equity'].section == 'adjustment'
+        assert new_roe.inputs['Equity'].xbrl_tag == 'us-gaap:Equity'
+        assert inc.record('ROE', 2023) is roe_2023
+        assert inc.record('ROA', 2024) is roa_2024
+
+    def test_restatement_with_source_trace(self, timeseries):
+        inc = IncrementalMetrics(timeseries)
+        restated = SourceTrace("us-gaap:InventoryNet", 4.2e9, "FY2023_Restated",
+                               datetime(2026, 1, 1), "balance_sheet")
+
+        affected = inc.update_many({(2023, 'Inventory'): restated, (2023, 'Revenue'): 9.9e10})
+
+        assert 'DIO' in affected and 'NetMargin' in affected and 'ROE' not in affected
+        assert inc.record('DIO', 2023).inputs['Inventory'] == restated
+        assert_matches_full_recalculation(inc)
+
+    def test_missing_input_and_unknown_year(self, timeseries):
+        del timeseries[2022]['Inventory']
+        inc = IncrementalMetrics(timeseries)
+
+        assert inc.record('DIO', 2022) is None
+        inc.update(2022, 'Inventory', 3.0e9)
+        assert inc.record('DIO', 2022).inputs['Inventory'].section == 'adjustment'
+
+        with pytest.raises(ValueError):
+            inc.update(2030, 'Revenue', 1.0)
@@ -0,0 +1,92 @@
+"""
+Unit tests for LazyMetrics (calculate_metrics(lazy=True)).
+Tests dict interface, on-demand evaluation, equality with the eager path
+and narrow queries through SignalDetector / PeerComparison.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import numpy as np
+import pytest
+
+from backend.metrics import calculate_metrics, LazyMetrics
+from backend.signals.peer_comparison import compare_to_peers
+from backend.signals.signal_detector import SignalDetector
+from backend.signals.statistical_engine import StatisticalBenchmarkEngine
+
+
+@pytest.fixture
+def universe(synthetic_universe):
+    universe = synthetic_universe(6, [2022, 2023, 2024], seed=11)
+    del universe['T01'][2024]['Inventory']
+    return universe
+
+
+class TestLazyMetrics:
+    """Nested dict interface with first-access evaluation."""
+
+    def test_nothing_computed_until_access(self, universe):
+        metrics = calculate_metrics(universe['T00'], lazy=True)
+
+        assert isinstance(metrics, LazyMetrics)
+        assert list(metrics) == ['profitability', 'liquidity', 'efficiency', 'leverage']
+        assert 'ROE' in metrics['profitability'] and 'Foo' not in metrics['profitability']
+        assert len(metrics['efficiency']) == 6
+        assert metrics.computed == []
+
+    def test_only_required_inputs(self, universe):
+        metrics = calculate_metrics(universe['T00'], lazy=True)
+        metrics['efficiency']['DIO']
+
+        assert metrics.computed == ['DIO']
+        loaded = [step[1] for i, step in enumerate(metrics.calculator.plan.steps)
+                  if step[0] == 'load' and i in metrics.calculator._cache]
+        assert sorted(loaded) == ['CostOfRevenue', 'Inventory']
+
+    def test_equal_to_eager(self, universe):
+        for timeseries in universe.values():
+            eager = calculate_metrics(timeseries, parallel='never')
+            lazy = calculate_metrics(timeseries, lazy=True).materialize()
+
+            assert lazy.keys() == eager.keys()
+            for category in eager:
+                assert list(lazy[category]) == list(eager[category])
+                for metric, values in eager[category].items():
+                    np.testing.assert_array_equal(lazy[category][metric], values)
+
+    def test_unknown_metric_raises_key_error(self, universe):
+        metrics = calculate_metrics(universe['T00'], lazy=True)
+        with pytest.raises(KeyError):
+            metrics['profitability']['RevenueGrowth']
+
+
+class TestNarrowQueries:
+    """Signal detection and peer comparison pull only what they consume."""
+
+    def test_signal_detector_key_metrics(self, universe):
+        sector_data = {t: calculate_metrics(ts, lazy=True) for t, ts in universe.items()}
+        engine = StatisticalBenchmarkEngine(sector_data)
+        company = calculate_metrics(universe['T00'], lazy=True)
+
+        detector = SignalDetector(company, 'T00', engine, metric_names=['ROE', 'CurrentRatio'])
+        signals = detector.detect_all()
+
+        assert set(company.computed) == {'ROE', 'CurrentRatio'}
+        assert {s.metric for group in signals.values() for s in group} <= {'ROE', 'CurrentRatio'}
+        assert all(set(m.computed) <= {'ROE', 'CurrentRatio'} for m in sector_data.values())
+
+    def test_compare_to_peers_filter(self, universe):
+        lazy = {t: calculate_metrics(ts, lazy=True) for t, ts in universe.items()}
+        eager = {t: calculate_metrics(ts) for t, ts in universe.items()}
+
+        peers_lazy = {t: m for t, m in lazy.items() if t != 'T00'}
+        result = compare_to_peers(lazy['T00'], peers_lazy, 'T00', metric_names=['NetMargin'])
+
+        assert [b.metric_name for b in result['profitability']] == ['NetMargin']
+        assert all(m.computed == ['NetMargin'] for m in lazy.values())
+
+        expected = compare_to_peers(
+            eager['T00'], {t: m for t, m in eager.items() if t != 'T00'}, 'T00'
+        )['profitability']
+        assert result['profitability'][0] == next(b for b in expected if b.metric_name == 'NetMargin')
@@ -0,0 +1,127 @@
+"""
+Unit tests for BaseMetric.calculate_batch (audited batch evaluation).
+Tests parity with the scalar calculate() path, vectorized range checks,
+on-demand CalculatedMetric records and the default element-wise fallback.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from backend.engines.trace_store import FactInputs, TraceStore
+from backend.engines.tracked_metric import SourceTrace
+from backend.metrics.base import BaseMetric
+from backend.metrics.profitability.roe import ROE
+
+
+def trace(tag, value):
+    return SourceTrace(tag, value, 'c-1', datetime(2025, 1, 31), 'balance_sheet')
+
+
+@pytest.fixture
+def observations():
+    rng = np.random.default_rng(9)
+    obs = [
+        {
+            'NetIncomeLoss': trace('NetIncomeLoss', float(rng.uniform(-5e9, 3e10))),
+            'StockholdersEquity': trace('StockholdersEquity', float(rng.uniform(1e10, 8e10))),
+        }
+        for _ in range(40)
+    ]
+    del obs[3]['NetIncomeLoss']                                           # input faltante
+    obs[5]['StockholdersEquity'] = trace('StockholdersEquity', 0.0)       # división por cero
+    obs[7]['StockholdersEquity'] = trace('StockholdersEquity', 1e9)       # ROE fuera de rango
+    obs[7]['NetIncomeLoss'] = trace('NetIncomeLoss', 9e10)
+    return obs
+
+
+class TestCalculateBatch:
+    """Vectorized ROE with the same results as the scalar path."""
+
+    def test_matches_scalar_calculate(self, observations):
+        batch = ROE.batch_from_traces(observations)
+
+        for i, financial_data in enumerate(observations):
+            scalar = ROE(financial_data).calculate()
+            record = batch.record(i)
+            if scalar is None:
+                assert record is None and not batch.valid[i]
+                continue
+            assert record.value == scalar.value
+            assert record.to_dict()['inputs'] == scalar.to_dict()['inputs']
+            assert record.formula == scalar.formula and record.unit == scalar.unit
+            assert batch.in_range[i] == ROE({}).validate_range(scalar.value)
+
+        assert not batch.valid[3] and not batch.valid[5]
+        assert batch.valid[7] and not batch.in_range[7]
+
+    def test_records_only_requested(self, observations):
+        batch = ROE.batch_from_traces(observations)
+
+        outliers = batch.records(where=~batch.in_range)
+        assert list(outliers) == [(7,)]
+        assert isinstance(outliers[(7,)].inputs, FactInputs)
+        assert len(batch.records()) == int(batch.valid.sum())
+
+    def test_universe_shaped_arrays(self):
+        store = TraceStore()
+        filing = store.add_filing()
+        net_income = np.array([[10.0, 20.0], [30.0, np.nan]])
+        equity = np.array([[100.0, 50.0], [0.0, 10.0]])
+        fact_ids = {
+            'NetIncomeLoss': np.array([[store.append(filing, 'NI', v, 'c', 's').fact_id
+                                        if not np.isnan(v) else -1 for v in row]
+                                       for row in net_income]),
+            'StockholdersEquity': np.array([[store.append(filing, 'EQ', v, 'c', 's').fact_id
+                                             for v in row] for row in equity]),
+        }
+
+        batch = ROE.calculate_batch(
+            {'NetIncomeLoss': net_income, 'StockholdersEquity': equity}, fact_ids, store
+        )
+        np.testing.assert_array_equal(batch.values, [[10.0, 40.0], [np.nan, np.nan]])
+        assert batch.record((0, 1)).get_input_value('StockholdersEquity') == 50.0
+        assert batch.record((1, 0)) is None
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            ROE.calculate_batch({'NetIncomeLoss': np.ones(2)})
+        with pytest.raises(ValueError):
+            ROE.calculate_batch({'NetIncomeLoss': np.ones(2), 'StockholdersEquity': np.ones(2)},
+                                fact_ids={})
+        batch = ROE.calculate_batch({'NetIncomeLoss': np.ones(2), 'StockholdersEquity': np.ones(2)})
+        np.testing.assert_array_equal(batch.values, [100.0, 100.0])
+        with pytest.raises(ValueError):
+            batch.record(0)
+
+
+class TestDefaultVectorization:
+    """Metrics without calculate_values fall back to calculate_value."""
+
+    class Margin(BaseMetric):
+        def get_required_fields(self):
+            return ['NetIncome', 'Revenue']
+
+        def get_formula(self):
+            return "NetIncome / Revenue * 100"
+
+        def calculate_value(self, inputs):
+            if inputs['Revenue'] == 0:
+                raise ValueError("Revenue cannot be zero")
+            return inputs['NetIncome'] / inputs['Revenue'] * 100
+
+        def validate_range(self, value):
+            return -100 <= value <= 100
+
+    def test_fallback(self):
+        batch = self.Margin.calculate_batch({
+            'NetIncome': np.array([10.0, 5.0, 300.0, 1.0]),
+            'Revenue': np.array([100.0, 0.0, 100.0, np.nan]),
+        })
+        np.testing.assert_array_equal(batch.values, [10.0, np.nan, 300.0, np.nan])
+        np.testing.assert_array_equal(batch.valid, [True, False, True, False])
+        np.testing.assert_array_equal(batch.in_range, [True, False, False, False])
@@ -0,0 +1,128 @@
+"""
+Unit tests for declarative metric definitions and the EvaluationPlan.
+Tests CSE (each intermediate computed once), metric-to-metric references,
+any-shape evaluation, register_metric and compile errors.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import numpy as np
+import pytest
+
+from backend.metrics import MetricsCalculator, ParallelMetricsEngine, MetricDefinition
+from backend.metrics import definitions
+from backend.metrics.definitions import METRICS, compile_plan, default_plan, register_metric
+from backend.metrics.profitability.roe import ROE
+
+
+class CountingFrame:
+    """Frame mínimo que cuenta accesos por concepto."""
+
+    def __init__(self, data):
+        self.data = data
+        self.loads = {}
+
+    def __getitem__(self, concept):
+        self.loads[concept] = self.loads.get(concept, 0) + 1
+        return self.data.get(concept, np.full(next(iter(self.data.values())).shape, np.nan))
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(3)
+    concepts = default_plan().concepts
+    return CountingFrame({c: rng.uniform(1, 100, size=(3, 4)) for c in concepts})
+
+
+class TestEvaluationPlan:
+    """Compilation and evaluation of the default registry."""
+
+    def test_registry_has_25_ratios_in_4_categories(self):
+        plan = default_plan()
+        assert len(plan.outputs) == 25
+        assert {c: len(m) for c, m in plan.categories.items()} == {
+            'profitability': 8, 'liquidity': 5, 'efficiency': 6, 'leverage': 6
+        }
+
+    def test_each_concept_loaded_once(self, frame):
+        default_plan().evaluate(frame)
+        assert frame.loads and set(frame.loads.values()) == {1}
+
+    def test_shared_intermediates(self):
+        plan = default_plan()
+        # DIO reusa InventoryTurnover, CCC reusa DIO y DSO, EPS es el concepto
+        assert plan.steps[plan.outputs['DIO']][2] == plan.outputs['InventoryTurnover']
+        assert plan.steps[plan.outputs['CCC']][1:] == tuple(sorted(
+            (plan.outputs['DIO'], plan.outputs['DSO'])
+        ))
+        assert plan.steps[plan.outputs['EPS']] == ('load', 'NetIncome', None)
+
+    def test_matches_explicit_formulas_any_shape(self, frame):
+        d = frame.data
+        values = default_plan().evaluate(frame)
+
+        assert values['ROE'].shape == (3, 4)
+        np.testing.assert_array_equal(values['ROE'], (d['NetIncome'] / d['Equity']) * 100)
+        np.testing.assert_array_equal(
+            values['ROIC'], (d['OperatingIncome'] / (d['Equity'] + d['LongTermDebt'])) * 100
+        )
+        np.testing.assert_array_equal(
+            values['CCC'],
+            365 / (d['CostOfRevenue'] / d['Inventory']) + 365 / (d['Revenue'] / d['AccountsReceivable'])
+        )
+
+    def test_subset_plan_and_slot_reuse(self, frame):
+        plan = default_plan()
+        slots = {}
+        plan.evaluate(frame, metrics=['DIO'], slots=slots)
+        computed = len(slots)
+        plan.evaluate(frame, metrics=['InventoryTurnover'], slots=slots)
+        assert len(slots) == computed  # ya estaba calculado
+
+        subset = compile_plan(definitions.METRIC_DEFINITIONS, metrics=['CCC'])
+        assert list(subset.outputs) == ['CCC']
+        assert len(subset) < len(plan)
+
+
+class TestDefinitions:
+    """Registry, validation ranges and compile errors."""
+
+    def test_roe_range_shared_with_base_metric(self):
+        assert METRICS['ROE'].valid_range == (-200.0, 500.0)
+        assert ROE({}).validate_range(150.0) and not ROE({}).validate_range(900.0)
+        np.testing.assert_array_equal(
+            METRICS['ROE'].in_range(np.array([150.0, 900.0, np.nan])), [True, False, False]
+        )
+
+    def test_register_metric_one_line(self, frame, restore_registry):
+        register_metric(MetricDefinition(
+            'NetDebtToEquity', 'leverage', '(LongTermDebt - CashAndEquivalents) / Equity'
+        ))
+
+        results = ParallelMetricsEngine(MetricsCalculator(frame)).calculate_all()
+        d = frame.data
+        np.testing.assert_array_equal(
+            results['leverage']['NetDebtToEquity'],
+            (d['LongTermDebt'] - d['CashAndEquivalents']) / d['Equity']
+        )
+
+    def test_register_rejects_bad_definitions(self, restore_registry):
+        with pytest.raises(ValueError):
+            register_metric(MetricDefinition('X', 'valuation', 'Revenue / Assets'))
+        with pytest.raises(ValueError):
+            register_metric(MetricDefinition('X', 'leverage', 'Revenue ** 2'))
+        assert 'X' not in METRICS
+
+    def test_circular_reference(self):
+        with pytest.raises(ValueError, match='Circular'):
+            compile_plan([
+                MetricDefinition('A', 'leverage', 'B + 1'),
+                MetricDefinition('B', 'leverage', 'A * 2'),
+            ])
+
+    def test_division_by_zero_is_nan_safe(self):
+        plan = compile_plan([MetricDefinition('R', 'liquidity', 'X / Y')])
+        with np.errstate(all='raise'):
+            result = plan.evaluate({'X': np.array([0.0, 1.0]), 'Y': np.array([0.0, 0.0])})
+        assert np.isnan(result['R'][0]) and np.isinf(result['R'][1])
@@ -0,0 +1,238 @@
+"""
+Unit tests for the pipeline orchestrator (DAG + stage cache) and the
+end-to-end report pipeline.
+Tests fingerprint keys, cache hits that skip upstream stages, concurrent
+independent stages, DAG validation, failures and parity of the report
+pipeline with the per-component calls.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from backend.metrics import calculate_metrics
+from backend.pipeline import Pipeline, Stage, StageStore, build_report_pipeline
+from backend.pipeline import report_pipeline
+from backend.reports.report_builder import report_to_dict
+from backend.signals.peer_comparison import PeerComparison
+from backend.signals.signal_detector import SignalDetector
+from backend.signals.statistical_engine import StatisticalBenchmarkEngine
+
+
+def counting_pipeline(store, calls, source='v1', barrier=None):
+    """a → (b, c) → d, registrando cuántas veces corre cada stage."""
+    def stage(name, value):
+        def func(**inputs):
+            calls[name] = calls.get(name, 0) + 1
+            if barrier is not None and name in ('b', 'c'):
+                barrier.wait(timeout=5)
+            return value + sum(inputs.values())
+        return func
+
+    return Pipeline([
+        Stage('d', stage('d', 1000), deps=('b', 'c')),
+        Stage('b', stage('b', 10), deps=('a',)),
+        Stage('c', stage('c', 100), deps=('a',), params={'k': 1}),
+        Stage('a', stage('a', 1), fingerprint=lambda: source),
+    ], store=store)
+
+
+class TestPipeline:
+    """DAG execution, keys and stage cache."""
+
+    def test_runs_in_dependency_order(self):
+        calls = {}
+        run = counting_pipeline(None, calls).run()
+
+        assert run.outputs['d'] == 1000 + (10 + 1) + (100 + 1)
+        assert list(counting_pipeline(None, {}).stages) == ['a', 'b', 'c', 'd']
+        assert {t.name for t in run.timings} == {'a', 'b', 'c', 'd'}
+        assert not any(t.cached for t in run.timings)
+
+    def test_cached_target_skips_upstream(self, tmp_path):
+        store, calls = StageStore(tmp_path), {}
+        counting_pipeline(store, calls).run()
+        run = counting_pipeline(store, calls).run()
+
+        assert calls == {'a': 1, 'b': 1, 'c': 1, 'd': 1}
+        assert [t.name for t in run.timings] == ['d'] and run.timing('d').cached
+        assert run.outputs['d'] == 1112
+
+    def test_source_change_invalidates_downstream(self, tmp_path):
+        store, calls = StageStore(tmp_path), {}
+        first = counting_pipeline(store, calls).keys()
+        counting_pipeline(store, calls).run()
+        second = counting_pipeline(store, calls, source='v2').keys()
+
+        assert all(first[name] != second[name] for name in 'abcd')
+        counting_pipeline(store, calls, source='v2').run()
+        assert calls == {'a': 2, 'b': 2, 'c': 2, 'd': 2}
+
+    def test_force_and_targets(self, tmp_path):
+        store, calls = StageStore(tmp_path), {}
+        counting_pipeline(store, calls).run()
+
+        run = counting_pipeline(store, calls).run(targets=['b'], force=['b'])
+        assert calls['b'] == 2 and calls['a'] == 1
+        assert run.timing('a').cached and not run.timing('b').cached
+
+    def test_independent_stages_run_concurrently(self):
+        barrier = threading.Barrier(2)
+        run = counting_pipeline(None, {}, barrier=barrier).run()   # b y c se esperan entre sí
+        assert run.outputs['d'] == 1112
+
+    def test_invalid_dag(self):
+        with pytest.raises(ValueError, match='Cycle'):
+            Pipeline([Stage('a', lambda b: b, deps=('b',)), Stage('b', lambda a: a, deps=('a',))])
+        with pytest.raises(ValueError, match='unknown'):
+            Pipeline([Stage('a', lambda x: x, deps=('x',))])
+        with pytest.raises(ValueError, match='Duplicate'):
+            Pipeline([Stage('a', lambda: 1), Stage('a', lambda: 2)])
+
+    def test_stage_failure(self):
+        def boom(a):
+            raise ZeroDivisionError("bad input")
+
+        pipeline = Pipeline([Stage('a', lambda: 1), Stage('b', boom, deps=('a',))])
+        with pytest.raises(RuntimeError, match="Stage 'b' failed") as info:
+            pipeline.run()
+        assert isinstance(info.value.__cause__, ZeroDivisionError)
+
+    def test_corrupt_cache_entry(self, tmp_path):
+        store, calls = StageStore(tmp_path), {}
+        keys = counting_pipeline(store, calls).keys()
+        counting_pipeline(store, calls).run()
+        store._path('a', keys['a']).write_bytes(b'not a pickle')
+
+        run = counting_pipeline(store, calls).run(targets=['a'])
+        assert run.outputs['a'] == 1 and calls['a'] == 2
+
+    def test_store_evicts_least_recently_used(self, tmp_path):
+        store = StageStore(tmp_path, max_bytes=3000)
+        payload = b'x' * 1000
+        for key in ('aa01', 'bb02'):
+            store.save('a', key, payload)
+        store.load('a', 'aa01')               # bb02 pasa a ser la menos usada
+        os.utime(store._path('a', 'bb02'), (0, 0))
+        store.save('a', 'cc03', payload)
+
+        assert store.has('a', 'aa01') and store.has('a', 'cc03')
+        assert not store.has('a', 'bb02')
+        assert store.evictions == 1
+        assert store._bytes == sum(p.stat().st_size for p in store._entries()) <= 3000
+
+        with pytest.raises(ValueError, match='max_bytes'):
+            StageStore(tmp_path, max_bytes=0)
+
+    def test_entry_removed_after_plan_replans(self, tmp_path, monkeypatch):
+        store, calls = StageStore(tmp_path), {}
+        pipeline = Pipeline([
+            Stage('a', lambda: calls.setdefault('a', 1)),
+            Stage('b', lambda a: calls.setdefault('b', a + 1), deps=('a',)),
+        ], store=store)
+        keys = pipeline.keys()
+        pipeline.run()
+        calls.clear()
+
+        plan = pipeline.plan
+        def plan_then_clear(targets=None, force=()):
+            result = plan(targets, force)
+            if 'b' not in force:       # otro proceso borra la entrada de b
+                store._path('b', keys['b']).unlink()
+            return result
+        monkeypatch.setattr(pipeline, 'plan', plan_then_clear)
+
+        result = {}
+        worker = threading.Thread(target=lambda: result.setdefault('run', pipeline.run()), daemon=True)
+        worker.start()
+        worker.join(timeout=10)
+
+        assert not worker.is_alive(), "pipeline hung after a planned cache hit disappeared"
+        run = result['run']
+        assert run.outputs['b'] == 2 and calls == {'b': 2}
+        assert run.timing('a').cached and not run.timing('b').cached
+        assert store.has('b', keys['b'])
+
+    def test_stalled_plan_raises(self, monkeypatch):
+        pipeline = counting_pipeline(None, {})
+        monkeypatch.setattr(pipeline, 'plan', lambda targets=None, force=(): (pipeline.keys(), ['b'], set()))
+
+        with pytest.raises(RuntimeError, match='stalled'):
+            pipeline.run()
+
+
+class TestReportPipeline:
+    """Real components wired as a DAG, cached by filing fingerprint."""
+
+    @pytest.fixture
+    def sources(self, monkeypatch, make_timeseries):
+        rng = np.random.default_rng(50)
+        universe = {t: make_timeseries(rng, [2021, 2022, 2023, 2024]) for t in ('AAA', 'BBB', 'CCC', 'DDD', 'EEE')}
+        universe['FFF'] = make_timeseries(rng, [2024])     # < min_years → excluido
+        state = {'parsed': 0, 'fingerprint': 'v1', 'universe': universe}
+
+        class FakeParser:
+            def __init__(self, ticker, data_dir):
+                self.ticker = ticker
+
+            def extract_timeseries(self, years):
+                state['parsed'] += 1
+                return universe[self.ticker]
+
+        class FakeCatalog:
+            def fingerprint(self, tickers):
+                return state['fingerprint']
+
+        monkeypatch.setattr(report_pipeline, 'MultiFileXBRLParser', FakeParser)
+        monkeypatch.setattr(report_pipeline.FilingCatalog, 'shared',
+                            classmethod(lambda cls, data_dir='data': FakeCatalog()))
+        return state
+
+    def test_matches_component_calls(self, sources, tmp_path):
+        pipeline = build_report_pipeline(
+            'AAA', ['BBB', 'CCC', 'DDD', 'EEE', 'FFF'], output_dir=tmp_path / 'out'
+        )
+        run = pipeline.run()
+
+        metrics = {t: calculate_metrics(ts) for t, ts in sources['universe'].items() if t != 'FFF'}
+        engine = StatisticalBenchmarkEngine(metrics, sector_code='TECH')
+        detected = SignalDetector(metrics['AAA'], 'AAA', engine).detect_all()
+        comparison = PeerComparison(metrics['AAA'], {t: m for t, m in metrics.items() if t != 'AAA'}, 'AAA', engine)
+
+        assert set(run.outputs['metrics']) == set(metrics)
+        assert run.outputs['signals'] == detected['buy'] + detected['watch'] + detected['red_flag']
+        assert run.outputs['peers'] == {b.metric_name: b for bs in comparison.compare_all().values() for b in bs}
+        assert run.outputs['report'].company == 'AAA'
+        assert run.outputs['export'].read_text(encoding='utf-8').startswith(
+            "# 📊 INVESTMENT DECISION REPORT - AAA"
+        )
+        assert {t.name for t in run.timings} == {
+            'parse', 'metrics', 'benchmarks', 'signals', 'peers', 'stories', 'report', 'export'
+        }
+
+    def test_second_run_uses_cache(self, sources, tmp_path):
+        store = StageStore(tmp_path / 'cache')
+        build = lambda: build_report_pipeline('AAA', ['BBB', 'CCC', 'DDD'], store=store)
+
+        first = build().run()
+        assert sources['parsed'] == 4
+
+        second = build().run()
+        assert sources['parsed'] == 4
+        assert [t.name for t in second.timings] == ['report'] and second.timing('report').cached
+        assert report_to_dict(second.outputs['report']) == report_to_dict(first.outputs['report'])
+
+        sources['fingerprint'] = 'v2'      # nuevo filing
+        third = build().run()
+        assert sources['parsed'] == 8
+        assert not third.timing('parse').cached
+
+    def test_missing_company(self, sources):
+        sources['universe']['AAA'] = {}
+        with pytest.raises(RuntimeError, match="Stage 'parse' failed"):
+            build_report_pipeline('AAA', ['BBB']).run()
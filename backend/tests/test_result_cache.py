@@ -0,0 +1,126 @@
+"""
+Unit tests for MetricsResultCache (on-disk calculate_metrics memoization).
+Tests fingerprint stability, hit/miss accounting, skipped recomputation,
+definition-version invalidation, LRU eviction and universe integration.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import os
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from backend.metrics import calculate_metrics, calculate_universe_metrics, MetricsResultCache
+from backend.metrics.definitions import MetricDefinition, register_metric
+from backend.metrics.result_cache import timeseries_fingerprint
+
+
+@pytest.fixture
+def universe(synthetic_universe):
+    return synthetic_universe(5, [2022, 2023, 2024], seed=21)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MetricsResultCache(tmp_path / 'metrics_cache')
+
+
+def assert_metrics_equal(left, right):
+    assert list(left) == list(right)
+    for category in right:
+        assert list(left[category]) == list(right[category])
+        for metric, values in right[category].items():
+            np.testing.assert_array_equal(left[category][metric], values)
+
+
+class TestFingerprint:
+    """Content-addressed key over (year, concept, value) + definitions."""
+
+    def test_ignores_metadata_and_order(self, universe):
+        ts = universe['T00']
+        reordered = {
+            year: {c: replace(t, context_id='other') for c, t in reversed(list(data.items()))}
+            for year, data in reversed(list(ts.items()))
+        }
+        assert timeseries_fingerprint(reordered) == timeseries_fingerprint(ts)
+
+    def test_value_changes_key(self, universe):
+        ts = universe['T00']
+        changed = {year: dict(data) for year, data in ts.items()}
+        changed[2023]['Equity'] = replace(ts[2023]['Equity'], raw_value=ts[2023]['Equity'].raw_value + 1)
+        assert timeseries_fingerprint(changed) != timeseries_fingerprint(ts)
+
+
+class TestMetricsResultCache:
+    """Hits skip the frame and ratio evaluation entirely."""
+
+    def test_hit_returns_identical_metrics(self, universe, cache, monkeypatch):
+        ts = universe['T01']
+        first = calculate_metrics(ts, cache=cache)
+        assert cache.stats()['misses'] == 1 and cache.stats()['entries'] == 1
+
+        import backend.metrics as metrics_module
+        monkeypatch.setattr(metrics_module, 'CompactFinancialDataFrame', None)  # un hit no lo usa
+        second = calculate_metrics(ts, cache=cache)
+
+        assert_metrics_equal(second, first)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_survives_new_instance(self, universe, cache):
+        calculate_metrics(universe['T02'], cache=cache)
+        reopened = MetricsResultCache(cache.root)
+
+        assert reopened.get(universe['T02']) is not None
+        assert reopened.stats()['bytes'] == cache.stats()['bytes'] > 0
+
+    def test_register_metric_invalidates(self, universe, cache, restore_registry):
+        calculate_metrics(universe['T00'], cache=cache)
+        register_metric(MetricDefinition('NetDebt', 'leverage', 'LongTermDebt - CashAndEquivalents'))
+
+        metrics = calculate_metrics(universe['T00'], cache=cache)
+        assert 'NetDebt' in metrics['leverage']
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_lru_eviction(self, universe, cache):
+        keys = [cache.put(ts, calculate_metrics(ts)) for ts in list(universe.values())[:3]]
+        entry_size = cache.stats()['bytes'] // 3
+        for i, key in enumerate(keys):
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+
+        cache.get(universe['T00'])                # T00 pasa a ser la más reciente
+        cache.max_bytes = entry_size * 3
+        cache.put(universe['T03'], calculate_metrics(universe['T03']))
+
+        assert cache.evictions == 1
+        assert not cache._path(keys[1]).exists()  # T01: la menos usada
+        assert cache._path(keys[0]).exists()
+
+    def test_corrupt_entry_is_a_miss(self, universe, cache):
+        key = cache.put(universe['T00'], calculate_metrics(universe['T00']))
+        cache._path(key).write_bytes(b'not a zip')
+
+        assert cache.get(universe['T00']) is None
+        assert not cache._path(key).exists()
+
+    def test_invalid_max_bytes(self, tmp_path):
+        with pytest.raises(ValueError):
+            MetricsResultCache(tmp_path, max_bytes=0)
+
+
+class TestUniverseCache:
+    """calculate_universe_metrics only evaluates the misses."""
+
+    def test_partial_hits(self, universe, cache):
+        calculate_metrics(universe['T03'], cache=cache)
+
+        sector_data = calculate_universe_metrics(universe, cache=cache)
+        assert list(sector_data) == list(universe)
+        assert (cache.hits, cache.misses) == (1, 5)
+
+        again = calculate_universe_metrics(universe, cache=cache)
+        assert cache.hits == 6
+        for ticker, ts in universe.items():
+            assert_metrics_equal(again[ticker], calculate_metrics(ts))
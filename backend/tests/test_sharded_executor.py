@@ -0,0 +1,97 @@
+"""
+Unit tests for ShardedUniverseExecutor.
+Tests sharding, process-pool results identical to the in-process
+universe pass, custom registry metrics reaching spawned workers and
+calculate_metrics / calculate_universe_metrics parallel modes.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from backend.metrics import calculate_metrics, calculate_universe_metrics, MetricDefinition, register_metric
+from backend.metrics import definitions
+from backend.metrics.definitions import default_plan
+from backend.metrics.sharded_executor import ShardedUniverseExecutor
+
+
+@pytest.fixture
+def universe(synthetic_universe, make_timeseries):
+    universe = synthetic_universe(10, [2021, 2022, 2023, 2024], seed=5)
+    universe['RAG'] = make_timeseries(np.random.default_rng(6), [2024, 2025])
+    universe['NONE'] = {}
+    return universe
+
+
+def assert_same(actual, expected):
+    assert list(actual) == list(expected)
+    for ticker in expected:
+        for category, metrics in expected[ticker].items():
+            assert list(actual[ticker][category]) == list(metrics)
+            for metric, values in metrics.items():
+                np.testing.assert_array_equal(actual[ticker][category][metric], values)
+
+
+class TestShardedUniverseExecutor:
+    """Process-sharded evaluation is identical to the in-process pass."""
+
+    def test_shards_cover_tickers(self):
+        executor = ShardedUniverseExecutor(max_workers=2)
+        tickers = [f"T{i}" for i in range(19)]
+        shards = executor.shards(tickers)
+
+        assert len(shards) == 7  # ceil(19 / (2 workers × 4 shards))
+        assert [t for shard in shards for t in shard] == tickers
+        assert ShardedUniverseExecutor(shard_size=50).shards([]) == []
+
+    def test_process_pool_matches_inline(self, universe):
+        expected = calculate_universe_metrics(universe, parallel='never')
+
+        with ShardedUniverseExecutor(max_workers=2, shard_size=3) as executor:
+            assert_same(executor.calculate(universe), expected)
+            assert executor._pool is not None
+        assert executor._pool is None
+
+    def test_single_worker_runs_inline(self, universe):
+        executor = ShardedUniverseExecutor(max_workers=1, shard_size=2)
+        assert_same(executor.calculate(universe), calculate_universe_metrics(universe))
+        assert executor._pool is None
+
+    def test_registered_metric_reaches_spawned_workers(self, universe):
+        saved = list(definitions.METRIC_DEFINITIONS)
+        try:
+            register_metric(MetricDefinition('NetDebt', 'leverage', 'LongTermDebt - CashAndEquivalents', 'USD'))
+            ctx = multiprocessing.get_context('spawn')
+            with ShardedUniverseExecutor(max_workers=2, shard_size=4, mp_context=ctx) as executor:
+                result = executor.calculate(universe)
+        finally:
+            definitions.METRIC_DEFINITIONS[:] = saved
+            definitions.METRICS.clear()
+            definitions.METRICS.update({d.name: d for d in saved})
+            default_plan.cache_clear()
+
+        ts = universe['T03']
+        expected = np.array([
+            ts[y]['LongTermDebt'].raw_value - ts[y]['CashAndEquivalents'].raw_value
+            for y in sorted(ts, reverse=True)
+        ])
+        np.testing.assert_array_equal(result['T03']['leverage']['NetDebt'], expected)
+
+    def test_universe_metrics_force_mode(self, universe):
+        assert_same(
+            calculate_universe_metrics(universe, parallel='force', max_workers=2),
+            calculate_universe_metrics(universe, parallel='never')
+        )
+
+    def test_calculate_metrics_modes(self, universe):
+        timeseries = universe['T00']
+        assert_same(
+            {'T00': calculate_metrics(timeseries, parallel='force')},
+            {'T00': calculate_metrics(timeseries, parallel='auto')}
+        )
+        with pytest.raises(ValueError, match='Invalid parallel mode'):
+            calculate_metrics(timeseries, parallel='threads')
@@ -0,0 +1,165 @@
+"""
+Unit tests for TraceStore / TraceView (compact SourceTrace storage).
+Tests attribute parity with SourceTrace, string interning, one timestamp
+per filing, pickling, compatibility with CalculatedMetric/TrackedMetric
+and fact-reference audit trails (FactInputs, export_audit_trail).
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import copy
+import json
+import pickle
+from datetime import datetime
+
+import pytest
+
+from backend.engines.calculated_metric import CalculatedMetric, expand_audit_trail, export_audit_trail
+from backend.engines.trace_store import FactInputs, TraceStore, TraceView, compact_inputs
+from backend.engines.tracked_metric import SourceTrace, TrackedMetric
+from backend.metrics import IncrementalMetrics
+from backend.metrics.profitability.roe import ROE
+
+
+@pytest.fixture
+def store():
+    return TraceStore()
+
+
+class TestTraceStore:
+    """Struct-of-arrays storage with interned strings."""
+
+    def test_view_matches_source_trace(self, store):
+        filing = store.add_filing(datetime(2025, 1, 31, 12, 0))
+        view = store.append(filing, 'NetIncomeLoss', 93736000000.0, 'c-20', 'income_statement')
+        trace = SourceTrace('NetIncomeLoss', 93736000000.0, 'c-20',
+                            datetime(2025, 1, 31, 12, 0), 'income_statement')
+
+        assert isinstance(view, SourceTrace) and isinstance(view, TraceView)
+        assert view == trace and trace == view
+        assert view.to_dict() == trace.to_dict()
+        assert not hasattr(view, '__dict__') and not hasattr(trace, '__dict__')
+
+    def test_strings_interned_and_one_timestamp_per_filing(self, store):
+        filing = store.add_filing()
+        views = [
+            store.append(filing, ''.join(['Net', 'IncomeLoss']), float(i), 'c-20', 'income_statement')
+            for i in range(1000, 1010)
+        ]
+
+        assert len(store) == 10 and len(store._strings) == 3
+        assert all(v.xbrl_tag is views[0].xbrl_tag for v in views)
+        assert len({id(v.extracted_at) for v in views}) == 1
+        assert store.nbytes == 10 * (8 + 4 * 4)
+
+        other = store.add_filing()
+        assert store.append(other, 'Assets', 1e9, 'c-1', 'balance_sheet').extracted_at \
+            is store.filings[other]
+
+    def test_unknown_filing_raises(self, store):
+        with pytest.raises(ValueError):
+            store.append(0, 'Assets', 1.0, 'c-1', 'balance_sheet')
+
+    def test_pickle_and_copy_materialize(self, store):
+        view = store.append(store.add_filing(), 'Assets', 1e9, 'c-1', 'balance_sheet')
+
+        for clone in (pickle.loads(pickle.dumps(view)), copy.deepcopy(view)):
+            assert type(clone) is SourceTrace
+            assert clone == view
+
+
+class TestTraceViewCompatibility:
+    """Views drop into the existing audit-trail classes."""
+
+    @pytest.fixture
+    def timeseries(self):
+        ts = datetime(2025, 1, 31)
+        return {
+            year: {
+                'NetIncome': SourceTrace('NetIncomeLoss', 1000.0 * year, f'FY{year}', ts, 'income_statement'),
+                'Equity': SourceTrace('StockholdersEquity', 5000.0 * year, f'FY{year}', ts, 'balance_sheet'),
+            }
+            for year in (2023, 2024)
+        }
+
+    def test_add_timeseries(self, store, timeseries):
+        compact = store.add_timeseries(timeseries)
+
+        assert len(store) == 4 and len(store.filings) == 1
+        for year, year_data in timeseries.items():
+            assert compact[year] == year_data
+            assert all(isinstance(t, TraceView) for t in compact[year].values())
+
+    def test_calculated_and_tracked_metric(self, store, timeseries):
+        inputs = store.add_timeseries(timeseries)[2024]
+
+        calculated = CalculatedMetric('ROE', 20.0, '(NetIncome / Equity) * 100', inputs, unit='%')
+        assert calculated.to_dict()['inputs']['NetIncome']['xbrl_tag'] == 'NetIncomeLoss'
+
+        tracked = TrackedMetric('ROE', 20.0, '%', '(NetIncome / Equity) * 100', inputs, datetime.now())
+        assert tracked.to_dict()['inputs'] == {k: v.to_dict() for k, v in timeseries[2024].items()}
+        assert 'StockholdersEquity' in tracked.explain()
+
+    def test_incremental_adjustment_on_view(self, store, timeseries):
+        inc = IncrementalMetrics(store.add_timeseries(timeseries))
+        inc.update(2024, 'Equity', 1e6)
+
+        record = inc.record('ROE', 2024)
+        assert record.inputs['Equity'].section == 'adjustment'
+        assert record.inputs['Equity'].xbrl_tag == 'StockholdersEquity'
+
+
+class TestFactReferenceAuditTrail:
+    """CalculatedMetric inputs as fact ids, materialized on demand."""
+
+    @pytest.fixture
+    def records(self, store):
+        ts = datetime(2025, 1, 31)
+        timeseries = store.add_timeseries({
+            year: {
+                'NetIncomeLoss': SourceTrace('NetIncomeLoss', 1000.0 * year, f'D{year}', ts, 'income_statement'),
+                'StockholdersEquity': SourceTrace('StockholdersEquity', 5000.0 * year, f'I{year}', ts, 'balance_sheet'),
+            }
+            for year in (2022, 2023, 2024)
+        })
+        return {year: ROE(data).calculate() for year, data in timeseries.items()}
+
+    def test_inputs_are_fact_ids(self, records):
+        record = records[2024]
+
+        assert isinstance(record.inputs, FactInputs)
+        assert record.inputs.refs() == {'NetIncomeLoss': 4, 'StockholdersEquity': 5}
+        assert record.list_input_tags() == {
+            'NetIncomeLoss': 'NetIncomeLoss', 'StockholdersEquity': 'StockholdersEquity'
+        }
+        assert record.get_input_source('StockholdersEquity').context_id == 'I2024'
+        assert record.get_input_source('Missing') is None
+
+    def test_export_reconstructs_exactly(self, records):
+        export = export_audit_trail(records)
+
+        assert sorted(export['facts']) == list(range(6))
+        assert export['metrics'][2023]['inputs'] == {'NetIncomeLoss': 2, 'StockholdersEquity': 3}
+
+        # Round-trip por JSON (fact ids como str)
+        restored = expand_audit_trail(json.loads(json.dumps(export)))
+        assert restored == {str(year): json.loads(json.dumps(r.to_dict()))
+                            for year, r in records.items()}
+
+    def test_export_rejects_plain_inputs(self, records):
+        plain = CalculatedMetric('X', 1.0, 'A', {'A': records[2024].inputs['NetIncomeLoss'].to_source_trace()})
+        with pytest.raises(ValueError):
+            export_audit_trail({'x': plain})
+
+    def test_mixed_inputs_stay_plain(self, store):
+        view = store.append(store.add_filing(), 'Assets', 1e9, 'c-1', 'balance_sheet')
+        loose = SourceTrace('Revenue', 2e9, 'c-2', datetime.now(), 'income_statement')
+
+        assert isinstance(compact_inputs({'A': view}), FactInputs)
+        assert compact_inputs({'A': view, 'R': loose}) == {'A': view, 'R': loose}
+
+    def test_pickle_materializes(self, records):
+        clone = pickle.loads(pickle.dumps(records[2024]))
+        assert type(clone.inputs) is dict
+        assert clone.inputs == dict(records[2024].inputs)
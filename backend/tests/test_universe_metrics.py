@@ -0,0 +1,91 @@
+"""
+Unit tests for UniverseFrame / calculate_universe_metrics.
+Tests tensor layout, bitwise equality with per-company calculate_metrics
+(ragged years, missing concepts, zero denominators) and direct
+consumption by StatisticalBenchmarkEngine.
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from backend.engines.tracked_metric import SourceTrace
+from backend.metrics import calculate_metrics, calculate_universe_metrics, UniverseFrame
+from backend.signals.statistical_engine import StatisticalBenchmarkEngine
+
+
+@pytest.fixture
+def universe(make_timeseries):
+    rng = np.random.default_rng(7)
+    universe = {
+        f"T{i:02d}": make_timeseries(rng, [2021, 2022, 2023, 2024])
+        for i in range(12)
+    }
+    # Ragged years + conceptos faltantes + denominador cero
+    universe['RAG'] = make_timeseries(rng, [2023, 2024, 2025])
+    universe['GAP'] = make_timeseries(rng, [2022, 2024], drop={(2024, 'Inventory'), (2022, 'Equity')})
+    universe['T00'][2024]['Equity'] = SourceTrace("us-gaap:Equity", 0.0, "FY2024", datetime(2025, 1, 1), "test")
+    return universe
+
+
+class TestUniverseFrame:
+    """Tensor layout and FinancialDataFrame-compatible access."""
+
+    def test_tensor_shape_and_masks(self, universe, timeseries_concepts):
+        frame = UniverseFrame.from_timeseries(universe)
+
+        assert frame.tensor.shape == (len(universe), 5, len(timeseries_concepts))
+        assert list(frame.years) == [2025, 2024, 2023, 2022, 2021]
+        assert frame.company_slice('RAG').tolist() == [True, True, True, False, False]
+
+        c = frame.tickers.index('GAP')
+        k = frame.concepts.index('Inventory')
+        assert not frame.mask[c, 1, k] and np.isnan(frame.tensor[c, 1, k])
+
+    def test_missing_concept_is_nan_matrix(self, universe):
+        frame = UniverseFrame.from_timeseries(universe)
+        assert frame['DoesNotExist'].shape == (len(universe), 5)
+        assert np.isnan(frame['DoesNotExist']).all()
+
+
+class TestCalculateUniverseMetrics:
+    """Universe pass is numerically identical to per-company calculate_metrics."""
+
+    @pytest.mark.parametrize('parallel', ['never', 'force'])
+    def test_bitwise_equal_to_per_company(self, universe, parallel):
+        result = calculate_universe_metrics(universe, parallel=parallel)
+
+        assert set(result) == set(universe)
+        for ticker, timeseries in universe.items():
+            expected = calculate_metrics(timeseries, parallel='never')
+            assert result[ticker].keys() == expected.keys()
+            for category, metrics in expected.items():
+                assert result[ticker][category].keys() == metrics.keys()
+                for metric, values in metrics.items():
+                    np.testing.assert_array_equal(
+                        result[ticker][category][metric], values,
+                        err_msg=f"{ticker} {category}.{metric}"
+                    )
+
+    def test_empty_timeseries_skipped(self, universe):
+        universe['EMPTY'] = {}
+        assert 'EMPTY' not in calculate_universe_metrics(universe)
+
+    def test_invalid_parallel_mode(self, universe):
+        with pytest.raises(ValueError):
+            calculate_universe_metrics(universe, parallel='threads')
+
+    def test_feeds_statistical_engine(self, universe):
+        per_company = {t: calculate_metrics(ts, parallel='never') for t, ts in universe.items()}
+
+        expected = StatisticalBenchmarkEngine(per_company).calculate_all_benchmarks()
+        actual = StatisticalBenchmarkEngine(calculate_universe_metrics(universe)).calculate_all_benchmarks()
+
+        assert actual.keys() == expected.keys()
+        for category in expected:
+            for metric, bench in expected[category].items():
+                assert actual[category][metric] == bench
@@ -0,0 +1,8 @@
+"""
+Utils Module - Helpers compartidos
+"""
+from backend.utils.atomic_io import atomic_write
+
+__all__ = [
+    'atomic_write',
+]
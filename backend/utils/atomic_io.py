@@ -0,0 +1,58 @@
+"""
+Atomic file writes (temp file + os.replace)
+
+Los caches en disco (MetricsResultCache, StageStore), los snapshots de
+benchmarks, el manifest del report site y los blobs de FilingStore se
+escriben igual: a un archivo temporal en el mismo directorio y luego
+os.replace. Un lector concurrente ve el archivo viejo o el nuevo, nunca
+uno a medias; si la escritura falla, el temporal se borra.
+
+Usage:
+    from backend.utils.atomic_io import atomic_write
+
+    atomic_write(path, lambda f: pickle.dump(output, f))
+    atomic_write(path, lambda f: json.dump(manifest, f), mode='w')
+
+Author: @franklin
+Sprint: 8 - Universe-Scale Metrics
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Callable, Optional, Union
+
+
+def atomic_write(
+    path: Union[str, Path],
+    writer: Callable[[IO], Any],
+    mode: str = 'wb',
+    encoding: Optional[str] = None
+) -> Path:
+    """
+    Escribe path de forma atómica
+
+    Args:
+        path: Archivo destino (el directorio padre se crea si no existe)
+        writer: Recibe el file object abierto y escribe el contenido
+        mode: 'wb' (binario) o 'w' (texto)
+        encoding: Encoding para modo texto (default: utf-8)
+
+    Returns:
+        path como Path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if 'b' not in mode and encoding is None:
+        encoding = 'utf-8'
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            writer(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return path